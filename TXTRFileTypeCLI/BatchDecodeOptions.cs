@@ -0,0 +1,160 @@
+﻿/*
+TXTRFileType
+Copyright (C) 2021 xchellx
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+*/
+
+using CommandLine.Text;
+using CommandLine;
+using System.Collections.Generic;
+using System;
+
+namespace TXTRFileTypeCLI
+{
+    [Verb("batch-decode", HelpText = "Decode many TXTR files to a directory in one process.")]
+    internal class BatchDecodeOptions
+    {
+        [Value(0,
+            Required = true,
+            HelpText = "The TXTR files to decode: a directory, a wildcard pattern (such as paks/*.TXTR), or @ followed by a manifest file with one path per line.",
+            MetaName = nameof(Input))]
+        public string Input { get; set; } = string.Empty;
+
+        [Option('o', "output",
+            Default = "out",
+            HelpText = "The output folder where all the decoded mipmaps of all the TXTRs will be saved to.")]
+        public string Output { get; set; } = "out";
+
+        [Option('e', "pattern",
+            Default = "*.TXTR",
+            HelpText = "The file name pattern of the TXTR files to decode when the input is a directory.")]
+        public string SearchPattern { get; set; } = "*.TXTR";
+
+        [Option('r', "recursive",
+            Default = false,
+            HelpText = "Search the subfolders of the input too. The subfolders are recreated in the output folder.")]
+        public bool Recursive { get; set; } = false;
+
+        [Option('j', "jobs",
+            Default = 0,
+            HelpText = "The maximum count of files to decode at the same time (0 for the count of processors).")]
+        public int Jobs { get; set; } = 0;
+
+        [Option('y', "yes",
+            Default = false,
+            HelpText = "Do not ask if want to create the output folder.")]
+        public bool DontAsk { get; set; } = false;
+
+        [Option('f', "force",
+            Default = false,
+            HelpText = "Overwrite existing files (else they are skipped).")]
+        public bool ForceOverwrite { get; set; } = false;
+
+        [Option('m', "mipmaps",
+            Default = false,
+            HelpText = "Decode all mipmaps from the TXTRs.")]
+        public bool DecodeMipmaps { get; set; } = false;
+
+        [Option('p', "prefix",
+            Default = "txtr_",
+            HelpText = "The prefix for each output file name.")]
+        public string OutputPrefix { get; set; } = "txtr_";
+
+        [Option('s', "suffix",
+            Default = "_mipmap",
+            HelpText = "The suffix for each output file name.")]
+        public string OutputSuffix { get; set; } = "_mipmap";
+
+        [Option('v', "verbose",
+            Default = false,
+            HelpText = "Output extra verbose information.")]
+        public bool Verbose { get; set; } = false;
+
+        [Option('w', "nowarn",
+            Default = false,
+            HelpText = "Disable warning messages.")]
+        public bool NoWarn { get; set; } = false;
+
+        [Option('q', "quiet",
+            Default = false,
+            HelpText = "Be quiet (do not output any information).")]
+        public bool Quiet { get; set; } = false;
+
+        [Option('c', "color",
+            Default = false,
+            HelpText = "Output to console with colors (for console logging only).")]
+        public bool CliColors { get; set; } = false;
+
+        [Usage(ApplicationAlias = "txtrtool")]
+        public static IEnumerable<Example> Examples
+        {
+            get
+            {
+                return new List<Example>() {
+                        new Example("Decode the first mipmap of every TXTR in the folder NoARAM-pak to the folder NoARAM-png",
+                        new UnParserSettings() { SkipDefault = true },
+                        new BatchDecodeOptions {
+                            Input = @"NoARAM-pak",
+                            Output = @"NoARAM-png"
+                        }),
+                        new Example("Decode all mipmaps of every TXTR in the folder paks and its subfolders to the folder png with 8 jobs",
+                        new UnParserSettings() { SkipDefault = true },
+                        new BatchDecodeOptions {
+                            Input = @"paks",
+                            Output = @"png",
+                            Recursive = true,
+                            Jobs = 8,
+                            DecodeMipmaps = true
+                        }),
+                        new Example("Decode every TXTR listed in the manifest file list.txt to the folder png",
+                        new UnParserSettings() { SkipDefault = true },
+                        new BatchDecodeOptions {
+                            Input = @"@list.txt",
+                            Output = @"png"
+                        })
+                    };
+            }
+        }
+
+        public override string ToString()
+            => $"{nameof(BatchDecodeOptions)}{{{nameof(Input)}={Input},{nameof(Output)}={Output}," +
+            $"{nameof(SearchPattern)}={SearchPattern},{nameof(Recursive)}={Recursive},{nameof(Jobs)}={Jobs}," +
+            $"{nameof(DontAsk)}={DontAsk},{nameof(ForceOverwrite)}={ForceOverwrite}," +
+            $"{nameof(DecodeMipmaps)}={DecodeMipmaps},{nameof(OutputPrefix)}={OutputPrefix}," +
+            $"{nameof(OutputSuffix)}={OutputSuffix},{nameof(Verbose)}={Verbose}," +
+            $"{nameof(NoWarn)}={NoWarn},{nameof(Quiet)}={Quiet}," +
+            $"{nameof(CliColors)}={CliColors}}}#{GetHashCode()}";
+
+        public override int GetHashCode()
+        {
+            HashCode hash = new();
+            hash.Add(Input);
+            hash.Add(Output);
+            hash.Add(SearchPattern);
+            hash.Add(Recursive);
+            hash.Add(Jobs);
+            hash.Add(DontAsk);
+            hash.Add(ForceOverwrite);
+            hash.Add(DecodeMipmaps);
+            hash.Add(OutputPrefix);
+            hash.Add(OutputSuffix);
+            hash.Add(Verbose);
+            hash.Add(NoWarn);
+            hash.Add(Quiet);
+            hash.Add(CliColors);
+            return hash.ToHashCode();
+        }
+    }
+}
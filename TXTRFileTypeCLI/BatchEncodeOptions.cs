@@ -0,0 +1,176 @@
+﻿/*
+TXTRFileType
+Copyright (C) 2021 xchellx
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+*/
+
+using CommandLine.Text;
+using CommandLine;
+using System.Collections.Generic;
+using System;
+using libWiiSharp.Formats;
+using libWiiSharp;
+
+namespace TXTRFileTypeCLI
+{
+    [Verb("batch-encode", HelpText = "Encode many image files to TXTR files in one process.")]
+    internal class BatchEncodeOptions
+    {
+        [Value(0,
+            Required = true,
+            HelpText = "The image files to encode: a directory, a wildcard pattern (such as png/*.png), or @ followed by a manifest file with one path per line.",
+            MetaName = nameof(Input))]
+        public string Input { get; set; } = string.Empty;
+
+        [Option('o', "output",
+            Default = "out",
+            HelpText = "The output folder where all the encoded TXTRs will be saved to.")]
+        public string Output { get; set; } = "out";
+
+        [Option('e', "pattern",
+            Default = "*.png",
+            HelpText = "The file name pattern of the image files to encode when the input is a directory.")]
+        public string SearchPattern { get; set; } = "*.png";
+
+        [Option('r', "recursive",
+            Default = false,
+            HelpText = "Search the subfolders of the input too. The subfolders are recreated in the output folder.")]
+        public bool Recursive { get; set; } = false;
+
+        [Option('j', "jobs",
+            Default = 0,
+            HelpText = "The maximum count of files to encode at the same time (0 for the count of processors).")]
+        public int Jobs { get; set; } = 0;
+
+        [Option('y', "yes",
+            Default = false,
+            HelpText = "Do not ask if want to create the output folder.")]
+        public bool DontAsk { get; set; } = false;
+
+        [Option('f', "force",
+            Default = false,
+            HelpText = "Overwrite existing files (else they are skipped).")]
+        public bool ForceOverwrite { get; set; } = false;
+
+        [Option('t', "texformat",
+            Default = TextureFormat.I4,
+            HelpText = "The TXTR texture format to encode with.")]
+        public TextureFormat TextureFormat { get; set; } = TextureFormat.I4;
+
+        [Option('p', "palformat",
+            Default = PaletteFormat.IA8,
+            HelpText = "The TXTR palette format to encode with.")]
+        public PaletteFormat PaletteFormat { get; set; } = PaletteFormat.IA8;
+
+        [Option('C', "cpypalsize",
+            Default = CopyPaletteSize.ToWidth,
+            HelpText = "Whether the palette length should be copied to the palette width or palette height.")]
+        public CopyPaletteSize CopyPaletteSize { get; set; } = CopyPaletteSize.ToWidth;
+
+        [Option('m', "mipmaps",
+            Default = false,
+            HelpText = "Generate mipmaps.")]
+        public bool GenerateMipmaps { get; set; } = false;
+
+        [Option('W', "wlimit",
+            Default = 4,
+            HelpText = "The width limit for mipmap generation.")]
+        public int MipmapWidthLimit { get; set; } = 4;
+
+        [Option('H', "hlimit",
+            Default = 4,
+            HelpText = "The height limit for mipmap generation.")]
+        public int MipmapHeightLimit { get; set; } = 4;
+
+        [Option('v', "verbose",
+            Default = false,
+            HelpText = "Output extra verbose information.")]
+        public bool Verbose { get; set; } = false;
+
+        [Option('w', "nowarn",
+            Default = false,
+            HelpText = "Disable warning messages.")]
+        public bool NoWarn { get; set; } = false;
+
+        [Option('q', "quiet",
+            Default = false,
+            HelpText = "Be quiet (do not output any information).")]
+        public bool Quiet { get; set; } = false;
+
+        [Option('c', "color",
+            Default = false,
+            HelpText = "Output to console with colors (for console logging only).")]
+        public bool CliColors { get; set; } = false;
+
+        [Usage(ApplicationAlias = "txtrtool")]
+        public static IEnumerable<Example> Examples
+        {
+            get
+            {
+                return new List<Example>() {
+                        new Example("Encode every png in the folder png to the folder txtr with the texture format RGB5A3",
+                        new UnParserSettings() { SkipDefault = true },
+                        new BatchEncodeOptions {
+                            Input = @"png",
+                            Output = @"txtr",
+                            TextureFormat = TextureFormat.RGB5A3
+                        }),
+                        new Example("Encode every png matching test*.png to the folder txtr with mipmap generation, the texture format CMPR, and 4 jobs",
+                        new UnParserSettings() { SkipDefault = true },
+                        new BatchEncodeOptions {
+                            Input = @"test*.png",
+                            Output = @"txtr",
+                            Jobs = 4,
+                            TextureFormat = TextureFormat.CMPR,
+                            GenerateMipmaps = true
+                        })
+                    };
+            }
+        }
+
+        public override string ToString()
+            => $"{nameof(BatchEncodeOptions)}{{{nameof(Input)}={Input},{nameof(Output)}={Output}," +
+            $"{nameof(SearchPattern)}={SearchPattern},{nameof(Recursive)}={Recursive},{nameof(Jobs)}={Jobs}," +
+            $"{nameof(DontAsk)}={DontAsk},{nameof(ForceOverwrite)}={ForceOverwrite}," +
+            $"{nameof(TextureFormat)}={TextureFormat},{nameof(PaletteFormat)}={PaletteFormat}," +
+            $"{nameof(CopyPaletteSize)}={CopyPaletteSize},{nameof(GenerateMipmaps)}={GenerateMipmaps}," +
+            $"{nameof(MipmapWidthLimit)}={MipmapWidthLimit},{nameof(MipmapHeightLimit)}={MipmapHeightLimit}," +
+            $"{nameof(Verbose)}={Verbose},{nameof(NoWarn)}={NoWarn},{nameof(Quiet)}={Quiet}," +
+            $"{nameof(CliColors)}={CliColors}}}#{GetHashCode()}";
+
+        public override int GetHashCode()
+        {
+            HashCode hash = new();
+            hash.Add(Input);
+            hash.Add(Output);
+            hash.Add(SearchPattern);
+            hash.Add(Recursive);
+            hash.Add(Jobs);
+            hash.Add(DontAsk);
+            hash.Add(ForceOverwrite);
+            hash.Add(TextureFormat);
+            hash.Add(PaletteFormat);
+            hash.Add(CopyPaletteSize);
+            hash.Add(GenerateMipmaps);
+            hash.Add(MipmapWidthLimit);
+            hash.Add(MipmapHeightLimit);
+            hash.Add(Verbose);
+            hash.Add(NoWarn);
+            hash.Add(Quiet);
+            hash.Add(CliColors);
+            return hash.ToHashCode();
+        }
+    }
+}
@@ -0,0 +1,42 @@
+﻿/*
+TXTRFileType
+Copyright (C) 2021 xchellx
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+*/
+
+namespace TXTRFileTypeCLI
+{
+    internal sealed class BatchFileResult
+    {
+        public BatchFileResult(string filePath, BatchFileStatus status, string message, long length)
+        {
+            FilePath = filePath;
+            Status = status;
+            Message = message;
+            Length = length;
+        }
+
+        public string FilePath { get; }
+
+        public BatchFileStatus Status { get; }
+
+        public string Message { get; }
+
+        /// <summary>
+        /// The length of the input file in bytes (for throughput).
+        /// </summary>
+        public long Length { get; }
+    }
+}
@@ -104,83 +104,87 @@ namespace TXTRFileTypeCLI.Logging
 
             if ((int)severity >= (int)Severity && ((consoleEnabled || debugEnabled) && !quietEnabled))
             {
-                ConsoleColor previousConsoleColor = Console.ForegroundColor;
-
-                if (consoleColorsEnabled && consoleEnabled)
+                // The batch verbs log from multiple threads and the message builder is shared
+                lock (logMsgBuilder)
                 {
+                    ConsoleColor previousConsoleColor = Console.ForegroundColor;
+
+                    if (consoleColorsEnabled && consoleEnabled)
+                    {
+                        switch (severity)
+                        {
+                            case LoggerSeverity.VERB:
+                                Console.ForegroundColor = ConsoleColor.DarkGray;
+                                break;
+                            case LoggerSeverity.INFO:
+                                Console.ForegroundColor = ConsoleColor.Blue;
+                                break;
+                            case LoggerSeverity.WARN:
+                                Console.ForegroundColor = ConsoleColor.Yellow;
+                                break;
+                            case LoggerSeverity.ERROR:
+                                Console.ForegroundColor = ConsoleColor.Red;
+                                break;
+                        }
+                    }
+
+                    string severityStr = string.Empty;
                     switch (severity)
                     {
                         case LoggerSeverity.VERB:
-                            Console.ForegroundColor = ConsoleColor.DarkGray;
+                            severityStr = nameof(LoggerSeverity.VERB);
                             break;
                         case LoggerSeverity.INFO:
-                            Console.ForegroundColor = ConsoleColor.Blue;
+                            severityStr = nameof(LoggerSeverity.INFO);
                             break;
                         case LoggerSeverity.WARN:
-                            Console.ForegroundColor = ConsoleColor.Yellow;
+                            severityStr = nameof(LoggerSeverity.WARN);
                             break;
                         case LoggerSeverity.ERROR:
-                            Console.ForegroundColor = ConsoleColor.Red;
+                            severityStr = nameof(LoggerSeverity.ERROR);
                             break;
                     }
-                }
 
-                string severityStr = string.Empty;
-                switch (severity)
-                {
-                    case LoggerSeverity.VERB:
-                        severityStr = nameof(LoggerSeverity.VERB);
-                        break;
-                    case LoggerSeverity.INFO:
-                        severityStr = nameof(LoggerSeverity.INFO);
-                        break;
-                    case LoggerSeverity.WARN:
-                        severityStr = nameof(LoggerSeverity.WARN);
-                        break;
-                    case LoggerSeverity.ERROR:
-                        severityStr = nameof(LoggerSeverity.ERROR);
-                        break;
-                }
-
-                // Format: yyyy-MM-ddThh:mm:ss.SSS-zzz TAG Severity value
-                logMsgBuilder.Clear();
-                if (!noTagEnabled)
-                {
-                    logMsgBuilder.Append(DateTime.SpecifyKind(DateTime.Now, DateTimeKind.Utc).ToString("o"))
-                        .Append(' ')
-                        .Append(Tag)
-                        .Append(' ')
-                        .Append(severityStr)
-                        .Append(' ');
-                }
-                string logMsg = logMsgBuilder.Append(value).ToString();
+                    // Format: yyyy-MM-ddThh:mm:ss.SSS-zzz TAG Severity value
+                    logMsgBuilder.Clear();
+                    if (!noTagEnabled)
+                    {
+                        logMsgBuilder.Append(DateTime.SpecifyKind(DateTime.Now, DateTimeKind.Utc).ToString("o"))
+                            .Append(' ')
+                            .Append(Tag)
+                            .Append(' ')
+                            .Append(severityStr)
+                            .Append(' ');
+                    }
+                    string logMsg = logMsgBuilder.Append(value).ToString();
 
-                if (consoleEnabled)
-                {
-                    if (severity == LoggerSeverity.WARN || severity == LoggerSeverity.ERROR)
+                    if (consoleEnabled)
                     {
-                        if (newLine)
-                            Console.Error.WriteLine(logMsg);
+                        if (severity == LoggerSeverity.WARN || severity == LoggerSeverity.ERROR)
+                        {
+                            if (newLine)
+                                Console.Error.WriteLine(logMsg);
+                            else
+                                Console.Error.Write(logMsg);
+                        }
                         else
-                            Console.Error.Write(logMsg);
+                        {
+                            if (newLine)
+                                Console.Out.WriteLine(logMsg);
+                            else
+                                Console.Out.Write(logMsg);
+                        }
                     }
-                    else
+                    if (debugEnabled)
                     {
                         if (newLine)
-                            Console.Out.WriteLine(logMsg);
+                            Debug.WriteLine(logMsg);
                         else
-                            Console.Out.Write(logMsg);
+                            Debug.Write(logMsg);
                     }
-                }
-                if (debugEnabled)
-                {
-                    if (newLine)
-                        Debug.WriteLine(logMsg);
-                    else
-                        Debug.Write(logMsg);
-                }
 
-                Console.ForegroundColor = previousConsoleColor;
+                    Console.ForegroundColor = previousConsoleColor;
+                }
             }
         }
     }
@@ -25,8 +25,10 @@ using SixLabors.ImageSharp.PixelFormats;
 using SixLabors.ImageSharp.Processing.Processors.Quantization;
 using System;
 using System.Collections.Generic;
+using System.Diagnostics;
 using System.Globalization;
 using System.IO;
+using System.Threading.Tasks;
 using TXTRFileTypeCLI.Logging;
 using TXTRFileTypeCLI.Util;
 using TXTRFileTypeLib;
@@ -44,8 +46,28 @@ namespace TXTRFileTypeCLI
                 config.MaximumDisplayWidth = Console.BufferWidth;
                 config.ParsingCulture = CultureInfo.CurrentCulture;
             })
-            .ParseArguments<DecodeOptions, EncodeOptions>(args)
-            .MapResult<DecodeOptions, EncodeOptions, int>(OnDecode, OnEncode, OnError);
+            .ParseArguments<DecodeOptions, EncodeOptions, BatchDecodeOptions, BatchEncodeOptions, TranscodeOptions>(args)
+            .MapResult<DecodeOptions, EncodeOptions, BatchDecodeOptions, BatchEncodeOptions, TranscodeOptions, int>(OnDecode,
+                OnEncode, OnBatchDecode, OnBatchEncode, OnTranscode, OnError);
+
+        private static readonly PngEncoder mipmapEncoder = new()
+        {
+            BitDepth = PngBitDepth.Bit16,
+            ChunkFilter = PngChunkFilter.None,
+            ColorType = PngColorType.RgbWithAlpha,
+            CompressionLevel = PngCompressionLevel.NoCompression,
+            FilterMethod = PngFilterMethod.None,
+            Gamma = 0.45f, // https://en.wikipedia.org/wiki/Gamma_correction
+            IgnoreMetadata = false,
+            InterlaceMethod = PngInterlaceMode.None,
+            Quantizer = new WuQuantizer(new QuantizerOptions()
+            {
+                Dither = null,
+                DitherScale = 0,
+                MaxColors = 256
+            }),
+            TransparentColorMode = PngTransparentColorMode.Preserve
+        };
 
         private static int OnDecode(DecodeOptions options)
         {
@@ -119,24 +141,7 @@ namespace TXTRFileTypeCLI
                             {
                                 logger.VerbLine("images[i] = {0}", images[i]);
                                 logger.InfoLine("Saving mipmap {0} to \"{1}\"", i + 1, filePath);
-                                images[i].SaveAsPng(filePath, new PngEncoder()
-                                {
-                                    BitDepth = PngBitDepth.Bit16,
-                                    ChunkFilter = PngChunkFilter.None,
-                                    ColorType = PngColorType.RgbWithAlpha,
-                                    CompressionLevel = PngCompressionLevel.NoCompression,
-                                    FilterMethod = PngFilterMethod.None,
-                                    Gamma = 0.45f, // https://en.wikipedia.org/wiki/Gamma_correction
-                                    IgnoreMetadata = false,
-                                    InterlaceMethod = PngInterlaceMode.None,
-                                    Quantizer = new WuQuantizer(new QuantizerOptions()
-                                    {
-                                        Dither = null,
-                                        DitherScale = 0,
-                                        MaxColors = 256
-                                    }),
-                                    TransparentColorMode = PngTransparentColorMode.Preserve
-                                });
+                                images[i].SaveAsPng(filePath, mipmapEncoder);
                             }
                             else
                                 dontWrite = false;
@@ -176,39 +181,10 @@ namespace TXTRFileTypeCLI
 
             if (IOUtil.FileExists(options.Input, out string fileExistsFailReason))
             {
-                bool isIndex = options.TextureFormat == TextureFormat.CI4
-                    && options.TextureFormat == TextureFormat.CI8
-                    && options.TextureFormat == TextureFormat.CI14X2;
-                if (!options.TextureFormat.IsDefined())
-                {
-                    logger.VerbLine("Valid TextureFormat - Failed");
-                    logger.Error("Invalid texture format specified");
-                    return HRESULT.E_INVALIDARG;
-                }
-                else if (!options.PaletteFormat.IsDefined())
-                {
-                    logger.VerbLine("Valid PaletteFormat - Failed");
-                    logger.Error("Invalid palette format specified");
-                    return HRESULT.E_INVALIDARG;
-                }
-                else if (!options.CopyPaletteSize.IsDefined())
-                {
-                    logger.VerbLine("Valid CopyPaletteSize - Failed");
-                    logger.Error("Invalid copy palette size specified");
-                    return HRESULT.E_INVALIDARG;
-                }
-                else if (isIndex && options.GenerateMipmaps)
-                {
-                    logger.VerbLine("Indexed Without Mipmaps - Failed");
-                    logger.Error("Indexed formats cannot have mipmaps");
-                    return HRESULT.E_INVALIDARG;
-                }
-                else if (!isIndex && (options.MipmapWidthLimit < 1 || options.MipmapHeightLimit < 1))
-                {
-                    logger.VerbLine("Mipmap Width/Height Limit Minimum - Failed");
-                    logger.Error($"Mipmap {(options.MipmapWidthLimit < 1 ? "width" : "height")} limit subceeds minimum value 0");
-                    return HRESULT.E_INVALIDARG;
-                }
+                int validateResult = ValidateEncodeOptions(options.TextureFormat, options.PaletteFormat,
+                    options.CopyPaletteSize, options.GenerateMipmaps, options.MipmapWidthLimit, options.MipmapHeightLimit);
+                if (validateResult != HRESULT.S_OK)
+                    return validateResult;
 
                 string outputDirectory = Path.GetDirectoryName(options.Output) ?? string.Empty;
                 if (outputDirectory.Trim() == string.Empty)
@@ -276,6 +252,358 @@ namespace TXTRFileTypeCLI
             }
         }
 
+        private static int ValidateEncodeOptions(TextureFormat textureFormat, PaletteFormat paletteFormat,
+            CopyPaletteSize copyPaletteSize, bool generateMipmaps, int mipmapWidthLimit, int mipmapHeightLimit)
+        {
+            bool isIndex = textureFormat == TextureFormat.CI4
+                || textureFormat == TextureFormat.CI8
+                || textureFormat == TextureFormat.CI14X2;
+            if (!textureFormat.IsDefined())
+            {
+                logger.VerbLine("Valid TextureFormat - Failed");
+                logger.ErrorLine("Invalid texture format specified");
+                return HRESULT.E_INVALIDARG;
+            }
+            else if (!paletteFormat.IsDefined())
+            {
+                logger.VerbLine("Valid PaletteFormat - Failed");
+                logger.ErrorLine("Invalid palette format specified");
+                return HRESULT.E_INVALIDARG;
+            }
+            else if (!copyPaletteSize.IsDefined())
+            {
+                logger.VerbLine("Valid CopyPaletteSize - Failed");
+                logger.ErrorLine("Invalid copy palette size specified");
+                return HRESULT.E_INVALIDARG;
+            }
+            else if (isIndex && generateMipmaps)
+            {
+                logger.VerbLine("Indexed Without Mipmaps - Failed");
+                logger.ErrorLine("Indexed formats cannot have mipmaps");
+                return HRESULT.E_INVALIDARG;
+            }
+            else if (!isIndex && (mipmapWidthLimit < 1 || mipmapHeightLimit < 1))
+            {
+                logger.VerbLine("Mipmap Width/Height Limit Minimum - Failed");
+                logger.ErrorLine($"Mipmap {(mipmapWidthLimit < 1 ? "width" : "height")} limit subceeds minimum value 0");
+                return HRESULT.E_INVALIDARG;
+            }
+            return HRESULT.S_OK;
+        }
+
+        private static int OnBatchDecode(BatchDecodeOptions options)
+        {
+            if (options.NoWarn)
+                logger.Severity = LoggerSeverity.ERROR;
+            else if (options.Verbose)
+                logger.Severity = LoggerSeverity.VERB;
+            if (options.Quiet)
+                logger.Flags |= ConsoleLoggerFlags.QUIET;
+            if (options.CliColors)
+                logger.Flags |= ConsoleLoggerFlags.COLORS;
+
+            logger.VerbLine("options = {0}", options);
+
+            if (options.Jobs < 0)
+            {
+                logger.VerbLine("Jobs Minimum - Failed");
+                logger.ErrorLine("Job count subceeds minimum value 0");
+                return HRESULT.E_INVALIDARG;
+            }
+            if (!IOUtil.GetBatchFiles(options.Input, options.SearchPattern, options.Recursive,
+                out List<(string FilePath, string RelativeDirectory)> batchFiles, out string batchFilesFailReason))
+            {
+                logger.VerbLine("Input Files Exist - Failed");
+                logger.ErrorLine(batchFilesFailReason);
+                return HRESULT.E_INVALIDARG;
+            }
+            if (!IOUtil.BatchOutputsAreUnique(batchFiles, out string batchOutputsFailReason))
+            {
+                logger.VerbLine("Unique Output Files - Failed");
+                logger.ErrorLine(batchOutputsFailReason);
+                return HRESULT.E_INVALIDARG;
+            }
+            // Ask everything before the batch starts so no job waits for input
+            if (!CreateBatchOutputDirectory(options.Output, options.DontAsk))
+                return HRESULT.E_INVALIDARG;
+
+            logger.InfoLine("Decoding {0} TXTR(s) to \"{1}\"", batchFiles.Count, options.Output);
+            return RunBatch(batchFiles, options.Jobs, batchFile => DecodeBatchFile(batchFile.FilePath,
+                Path.Combine(options.Output, batchFile.RelativeDirectory), options));
+        }
+
+        private static int OnBatchEncode(BatchEncodeOptions options)
+        {
+            if (options.NoWarn)
+                logger.Severity = LoggerSeverity.ERROR;
+            else if (options.Verbose)
+                logger.Severity = LoggerSeverity.VERB;
+            if (options.Quiet)
+                logger.Flags |= ConsoleLoggerFlags.QUIET;
+            if (options.CliColors)
+                logger.Flags |= ConsoleLoggerFlags.COLORS;
+
+            logger.VerbLine("options = {0}", options);
+
+            int validateResult = ValidateEncodeOptions(options.TextureFormat, options.PaletteFormat,
+                options.CopyPaletteSize, options.GenerateMipmaps, options.MipmapWidthLimit, options.MipmapHeightLimit);
+            if (validateResult != HRESULT.S_OK)
+                return validateResult;
+            if (options.Jobs < 0)
+            {
+                logger.VerbLine("Jobs Minimum - Failed");
+                logger.ErrorLine("Job count subceeds minimum value 0");
+                return HRESULT.E_INVALIDARG;
+            }
+            if (!IOUtil.GetBatchFiles(options.Input, options.SearchPattern, options.Recursive,
+                out List<(string FilePath, string RelativeDirectory)> batchFiles, out string batchFilesFailReason))
+            {
+                logger.VerbLine("Input Files Exist - Failed");
+                logger.ErrorLine(batchFilesFailReason);
+                return HRESULT.E_INVALIDARG;
+            }
+            if (!IOUtil.BatchOutputsAreUnique(batchFiles, out string batchOutputsFailReason))
+            {
+                logger.VerbLine("Unique Output Files - Failed");
+                logger.ErrorLine(batchOutputsFailReason);
+                return HRESULT.E_INVALIDARG;
+            }
+            // Ask everything before the batch starts so no job waits for input
+            if (!CreateBatchOutputDirectory(options.Output, options.DontAsk))
+                return HRESULT.E_INVALIDARG;
+
+            logger.InfoLine("Encoding {0} image(s) to \"{1}\"", batchFiles.Count, options.Output);
+            return RunBatch(batchFiles, options.Jobs, batchFile => EncodeBatchFile(batchFile.FilePath,
+                Path.Combine(options.Output, batchFile.RelativeDirectory), options));
+        }
+
+        private static bool CreateBatchOutputDirectory(string outputDirectory, bool dontAsk)
+        {
+            if (!IOUtil.DirectoryExists(outputDirectory, out _))
+            {
+                if (AskYesNo($"The directory \"{outputDirectory}\" does not exist. Do you want to create it? [y/n]", dontAsk))
+                    Directory.CreateDirectory(outputDirectory);
+
+                if (!IOUtil.DirectoryExists(outputDirectory, out string directoryExistsFailReason))
+                {
+                    logger.VerbLine("Output Directory Exists - Failed");
+                    logger.ErrorLine(directoryExistsFailReason);
+                    return false;
+                }
+            }
+            return true;
+        }
+
+        private static int RunBatch(List<(string FilePath, string RelativeDirectory)> batchFiles, int jobs,
+            Func<(string FilePath, string RelativeDirectory), BatchFileResult> processBatchFile)
+        {
+            BatchFileResult[] results = new BatchFileResult[batchFiles.Count];
+            Stopwatch stopwatch = Stopwatch.StartNew();
+            Parallel.For(0, batchFiles.Count,
+                new ParallelOptions() { MaxDegreeOfParallelism = jobs > 0 ? jobs : Environment.ProcessorCount },
+                i => {
+                    results[i] = processBatchFile(batchFiles[i]);
+                    logger.VerbLine("{0} \"{1}\"", results[i].Status, results[i].FilePath);
+                });
+            stopwatch.Stop();
+
+            int succeeded = 0, skipped = 0, failed = 0;
+            long length = 0;
+            foreach (BatchFileResult result in results)
+            {
+                length += result.Length;
+                switch (result.Status)
+                {
+                    case BatchFileStatus.Succeeded:
+                        succeeded++;
+                        logger.InfoLine("{0,-9} \"{1}\" {2}", result.Status, result.FilePath, result.Message);
+                        break;
+                    case BatchFileStatus.Skipped:
+                        skipped++;
+                        logger.WarnLine("{0,-9} \"{1}\" {2}", result.Status, result.FilePath, result.Message);
+                        break;
+                    case BatchFileStatus.Failed:
+                        failed++;
+                        logger.ErrorLine("{0,-9} \"{1}\" {2}", result.Status, result.FilePath, result.Message);
+                        break;
+                }
+            }
+
+            double seconds = Math.Max(stopwatch.Elapsed.TotalSeconds, double.Epsilon);
+            logger.InfoLine("Batch finished: {0} succeeded, {1} skipped, {2} failed", succeeded, skipped, failed);
+            logger.InfoLine("Processed {0} file(s) ({1:F2} MiB) in {2:F2} s ({3:F1} files/s, {4:F2} MiB/s)",
+                results.Length, length / 1048576.0d, seconds, results.Length / seconds, length / 1048576.0d / seconds);
+            return failed == 0 ? HRESULT.S_OK : HRESULT.E_FAIL;
+        }
+
+        private static BatchFileResult DecodeBatchFile(string inputFile, string outputDirectory, BatchDecodeOptions options)
+        {
+            long length = 0;
+            try
+            {
+                length = new FileInfo(inputFile).Length;
+                Image<Bgra32>[] images = TXTRFileTypeLibAPI.Read(inputFile, options.DecodeMipmaps);
+                try
+                {
+                    if (images.Length == 0)
+                        return new BatchFileResult(inputFile, BatchFileStatus.Failed, "No images were loaded", length);
+
+                    Directory.CreateDirectory(outputDirectory);
+                    string fileName = $"{options.OutputPrefix}{Path.GetFileNameWithoutExtension(inputFile)}{options.OutputSuffix}";
+                    int existing = 0;
+                    for (int i = 0; i < images.Length; i++)
+                    {
+                        string filePath = Path.Combine(outputDirectory, $"{fileName}{i + 1}.png");
+                        Image<Bgra32> mipmap = images[i];
+                        if (!TryWriteBatchOutputFile(filePath, options.ForceOverwrite,
+                            outputStream => mipmap.SaveAsPng(outputStream, mipmapEncoder)))
+                            existing++;
+                    }
+
+                    if (existing == images.Length)
+                        return new BatchFileResult(inputFile, BatchFileStatus.Skipped, "All mipmap files already exist", length);
+                    else if (existing != 0)
+                        return new BatchFileResult(inputFile, BatchFileStatus.Succeeded,
+                            $"{images.Length - existing} of {images.Length} mipmap(s) written, the others already exist", length);
+                    else
+                        return new BatchFileResult(inputFile, BatchFileStatus.Succeeded, $"{images.Length} mipmap(s) written", length);
+                }
+                finally
+                {
+                    foreach (Image<Bgra32> image in images)
+                        image.Dispose();
+                }
+            }
+            catch (Exception e)
+            {
+                return new BatchFileResult(inputFile, BatchFileStatus.Failed, e.Message, length);
+            }
+        }
+
+        private static BatchFileResult EncodeBatchFile(string inputFile, string outputDirectory, BatchEncodeOptions options)
+        {
+            long length = 0;
+            try
+            {
+                length = new FileInfo(inputFile).Length;
+                string filePath = Path.Combine(outputDirectory, $"{Path.GetFileNameWithoutExtension(inputFile)}.TXTR");
+                using (Image<Bgra32> image = Image.Load<Bgra32>(inputFile, new PngDecoder() { IgnoreMetadata = false }))
+                {
+                    Directory.CreateDirectory(outputDirectory);
+                    if (!TryWriteBatchOutputFile(filePath, options.ForceOverwrite,
+                        outputStream => TXTRFileTypeLibAPI.Write(image, outputStream, options.TextureFormat,
+                            options.PaletteFormat, options.CopyPaletteSize, options.GenerateMipmaps,
+                            options.MipmapWidthLimit, options.MipmapHeightLimit, true)))
+                        return new BatchFileResult(inputFile, BatchFileStatus.Skipped, $"\"{filePath}\" already exists", length);
+                }
+                return new BatchFileResult(inputFile, BatchFileStatus.Succeeded, $"written to \"{filePath}\"", length);
+            }
+            catch (Exception e)
+            {
+                return new BatchFileResult(inputFile, BatchFileStatus.Failed, e.Message, length);
+            }
+        }
+
+        /// <summary>
+        /// Write an output file of a batch. Without <paramref name="forceOverwrite"/> the file is created only if it
+        /// does not exist yet, in one step so that no other job or process can create it in between.<br/>
+        /// If <paramref name="write"/> throws, the file is deleted so a later batch does not skip it as already written.
+        /// </summary>
+        /// <returns><see langword="false"/> if the file already exists and <paramref name="forceOverwrite"/> is not set</returns>
+        private static bool TryWriteBatchOutputFile(string filePath, bool forceOverwrite, Action<Stream> write)
+        {
+            FileStream outputStream;
+            try
+            {
+                outputStream = new FileStream(filePath, forceOverwrite ? FileMode.Create : FileMode.CreateNew, FileAccess.Write);
+            }
+            catch (IOException) when (!forceOverwrite && File.Exists(filePath))
+            {
+                return false;
+            }
+
+            try
+            {
+                using (outputStream)
+                    write(outputStream);
+                return true;
+            }
+            catch
+            {
+                File.Delete(filePath);
+                throw;
+            }
+        }
+
+        private static int OnTranscode(TranscodeOptions options)
+        {
+            if (options.NoWarn)
+                logger.Severity = LoggerSeverity.ERROR;
+            else if (options.Verbose)
+                logger.Severity = LoggerSeverity.VERB;
+            if (options.Quiet)
+                logger.Flags |= ConsoleLoggerFlags.QUIET;
+            if (options.CliColors)
+                logger.Flags |= ConsoleLoggerFlags.COLORS;
+
+            logger.VerbLine("options = {0}", options);
+
+            if (IOUtil.FileExists(options.Input, out string fileExistsFailReason))
+            {
+                bool fromDDS = Path.GetExtension(options.Input).Equals(".dds", StringComparison.OrdinalIgnoreCase);
+                logger.VerbLine("fromDDS = {0}", fromDDS);
+
+                string outputDirectory = Path.GetDirectoryName(options.Output) ?? string.Empty;
+                if (outputDirectory.Trim() == string.Empty)
+                    outputDirectory = Directory.GetCurrentDirectory();
+                logger.VerbLine("outputDirectory = {0}", outputDirectory);
+                if (!IOUtil.DirectoryExists(outputDirectory, out _))
+                {
+                    if (AskYesNo($"The directory \"{outputDirectory}\" does not exist. Do you want to create it? [y/n]", options.DontAsk))
+                        Directory.CreateDirectory(outputDirectory);
+
+                    if (!IOUtil.DirectoryExists(outputDirectory, out string directoryExistsFailReason))
+                    {
+                        logger.VerbLine("Input Directory Exists - Failed");
+                        logger.ErrorLine(directoryExistsFailReason);
+                        return HRESULT.E_INVALIDARG;
+                    }
+                }
+                if (IOUtil.FileExists(options.Output, out _))
+                {
+                    if (!AskYesNo($"The file \"{options.Output}\" already exists, do you want to overwrite it? [y/n]", options.ForceOverwrite))
+                    {
+                        logger.ErrorLine("The file \"{0}\" already exists, nothing will be written.", options.Output);
+                        return HRESULT.E_ABORT;
+                    }
+                }
+
+                try
+                {
+                    logger.InfoLine("Transcoding \"{0}\" to \"{1}\"", options.Input, options.Output);
+                    if (fromDDS)
+                        TXTRFileTypeLibAPI.TranscodeFromDDS(options.Input, options.Output);
+                    else
+                        TXTRFileTypeLibAPI.TranscodeToDDS(options.Input, options.Output, !options.NoMipmaps);
+                }
+                catch (Exception e)
+                {
+                    logger.VerbLine("Transcode - Failed");
+                    logger.ErrorLine("Failed to transcode {0}.{1}{2}", fromDDS ? "DDS" : "TXTR", Environment.NewLine, e);
+                    return HRESULT.E_FAIL;
+                }
+
+                logger.InfoLine("Transcode finished");
+                return HRESULT.S_OK;
+            }
+            else
+            {
+                logger.VerbLine("Input Exists - Failed");
+                logger.ErrorLine(fileExistsFailReason);
+                return HRESULT.E_INVALIDARG;
+            }
+        }
+
         private static int OnError(IEnumerable<Error> errors)
         {
             bool errorsExist = false;
@@ -295,6 +623,7 @@ namespace TXTRFileTypeCLI
                 Console.WriteLine(
                     "Notes:"
                     + $"{n}    - Odd texture sizes might cause weird results and/or errors."
+                    + $"{n}    - Transcoding only supports CMPR TXTRs and DXT1 DDSs with a height under 4 or divisible by 4."
 
                     + $"{n}{n}Texture Formats:"
                     + $"{n}    - I4       = 4-bit greyscale intensity values. Two pixels per byte."
@@ -0,0 +1,127 @@
+﻿/*
+TXTRFileType
+Copyright (C) 2021 xchellx
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+*/
+
+using CommandLine.Text;
+using CommandLine;
+using System.Collections.Generic;
+using System;
+
+namespace TXTRFileTypeCLI
+{
+    [Verb("transcode", HelpText = "Transcode a CMPR TXTR file to a DXT1 DDS file or back without decoding the pixels.")]
+    internal class TranscodeOptions
+    {
+        [Value(0,
+            Required = true,
+            HelpText = "The CMPR TXTR or DXT1 DDS file to transcode. A file with the .dds extension is transcoded to a TXTR.",
+            MetaName = nameof(Input))]
+        public string Input { get; set; } = string.Empty;
+
+        [Value(1,
+            Required = true,
+            HelpText = "The output DDS or TXTR to transcode the input to.",
+            MetaName = nameof(Output))]
+        public string Output { get; set; } = string.Empty;
+
+        [Option('y', "yes",
+            Default = false,
+            HelpText = "Do not ask if want to create the folder(s) leading to the output.")]
+        public bool DontAsk { get; set; } = false;
+
+        [Option('f', "force",
+            Default = false,
+            HelpText = "Do not ask if want to overwrite files.")]
+        public bool ForceOverwrite { get; set; } = false;
+
+        [Option('n', "nomipmaps",
+            Default = false,
+            HelpText = "Only transcode the first mipmap of a TXTR to the DDS.")]
+        public bool NoMipmaps { get; set; } = false;
+
+        [Option('v', "verbose",
+            Default = false,
+            HelpText = "Output extra verbose information.")]
+        public bool Verbose { get; set; } = false;
+
+        [Option('w', "nowarn",
+            Default = false,
+            HelpText = "Disable warning messages.")]
+        public bool NoWarn { get; set; } = false;
+
+        [Option('q', "quiet",
+            Default = false,
+            HelpText = "Be quiet (do not output any information).")]
+        public bool Quiet { get; set; } = false;
+
+        [Option('c', "color",
+            Default = false,
+            HelpText = "Output to console with colors (for console logging only).")]
+        public bool CliColors { get; set; } = false;
+
+        [Usage(ApplicationAlias = "txtrtool")]
+        public static IEnumerable<Example> Examples
+        {
+            get
+            {
+                return new List<Example>() {
+                        new Example("Transcode the CMPR test.TXTR into test.dds with all of its mipmaps",
+                        new UnParserSettings() { SkipDefault = true },
+                        new TranscodeOptions {
+                            Input = @"test.TXTR",
+                            Output = @"test.dds"
+                        }),
+                        new Example("Transcode the CMPR test.TXTR into test.dds with only the first mipmap",
+                        new UnParserSettings() { SkipDefault = true },
+                        new TranscodeOptions {
+                            Input = @"test.TXTR",
+                            Output = @"test.dds",
+                            NoMipmaps = true
+                        }),
+                        new Example("Transcode the DXT1 test.dds into the CMPR test.TXTR",
+                        new UnParserSettings() { SkipDefault = true },
+                        new TranscodeOptions {
+                            Input = @"test.dds",
+                            Output = @"test.TXTR"
+                        })
+                    };
+            }
+        }
+
+        public override string ToString()
+            => $"{nameof(TranscodeOptions)}{{{nameof(Input)}={Input},{nameof(Output)}={Output}," +
+            $"{nameof(DontAsk)}={DontAsk},{nameof(ForceOverwrite)}={ForceOverwrite}," +
+            $"{nameof(NoMipmaps)}={NoMipmaps},{nameof(Verbose)}={Verbose}," +
+            $"{nameof(NoWarn)}={NoWarn},{nameof(Quiet)}={Quiet}," +
+            $"{nameof(CliColors)}={CliColors}}}#{GetHashCode()}";
+
+        public override int GetHashCode()
+        {
+            HashCode hash = new();
+            hash.Add(Input);
+            hash.Add(Output);
+            hash.Add(DontAsk);
+            hash.Add(ForceOverwrite);
+            hash.Add(NoMipmaps);
+            hash.Add(Verbose);
+            hash.Add(NoWarn);
+            hash.Add(Quiet);
+            hash.Add(CliColors);
+            return hash.ToHashCode();
+        }
+    }
+}
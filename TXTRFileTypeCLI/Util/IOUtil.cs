@@ -16,6 +16,8 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 */
 
+using System;
+using System.Collections.Generic;
 using System.IO;
 
 namespace TXTRFileTypeCLI.Util
@@ -84,5 +86,116 @@ namespace TXTRFileTypeCLI.Util
 
         public static bool IsDirectory(string path)
             => string.IsNullOrEmpty(Path.GetFileName(path)) || Directory.Exists(path);
+
+        /// <summary>
+        /// Get the input files of a batch.<br/>
+        /// <paramref name="input"/> can be a directory (searched with <paramref name="searchPattern"/>), a wildcard pattern
+        /// in the file name (such as <c>paks/*.TXTR</c>), @ followed by a manifest file with one path per line (relative
+        /// paths are relative to the manifest, empty lines and lines starting with # are ignored), or a single file.<br/>
+        /// The relative directory of each file is the subdirectory it was found in when searching a directory, or the
+        /// subdirectory of the manifest directory it is in for a manifest (else it is empty).
+        /// </summary>
+        public static bool GetBatchFiles(string input, string searchPattern, bool recursive,
+            out List<(string FilePath, string RelativeDirectory)> batchFiles, out string failReason)
+        {
+            batchFiles = new List<(string FilePath, string RelativeDirectory)>();
+            if (string.IsNullOrWhiteSpace(input))
+            {
+                failReason = input == null ? "Input is null" : "Input is empty.";
+                return false;
+            }
+
+            SearchOption searchOption = recursive ? SearchOption.AllDirectories : SearchOption.TopDirectoryOnly;
+            if (input.StartsWith('@'))
+            {
+                string manifestPath = input[1..];
+                if (!FileExists(manifestPath, out failReason))
+                    return false;
+                string manifestDirectory = Path.GetDirectoryName(Path.GetFullPath(manifestPath)) ?? string.Empty;
+                HashSet<string> manifestFiles = new HashSet<string>();
+                foreach (string line in File.ReadLines(manifestPath))
+                {
+                    string filePath = line.Trim();
+                    if (filePath.Length == 0 || filePath.StartsWith('#'))
+                        continue;
+                    filePath = Path.GetFullPath(Path.Combine(manifestDirectory, filePath));
+                    if (!manifestFiles.Add(filePath))
+                        continue;
+                    string relativeDirectory = Path.GetRelativePath(manifestDirectory, Path.GetDirectoryName(filePath) ?? manifestDirectory);
+                    // Files outside of the manifest directory are written to the top of the output directory
+                    if (relativeDirectory == "." || relativeDirectory == ".." || Path.IsPathRooted(relativeDirectory)
+                        || relativeDirectory.StartsWith(".." + Path.DirectorySeparatorChar))
+                        relativeDirectory = string.Empty;
+                    batchFiles.Add((filePath, relativeDirectory));
+                }
+            }
+            else if (Directory.Exists(input))
+                AddBatchFiles(input, searchPattern, searchOption, batchFiles);
+            else if (input.IndexOfAny(wildcards) >= 0)
+            {
+                string directory = Path.GetDirectoryName(input) ?? string.Empty;
+                if (directory.Trim() == string.Empty)
+                    directory = Directory.GetCurrentDirectory();
+                if (directory.IndexOfAny(wildcards) >= 0)
+                {
+                    failReason = $"Wildcards are only supported in the file name: \"{input}\"";
+                    return false;
+                }
+                if (!DirectoryExists(directory, out failReason))
+                    return false;
+                AddBatchFiles(directory, Path.GetFileName(input), searchOption, batchFiles);
+            }
+            else if (FileExists(input, out failReason))
+                batchFiles.Add((input, string.Empty));
+            else
+                return false;
+
+            if (batchFiles.Count != 0)
+            {
+                failReason = string.Empty;
+                return true;
+            }
+            else
+            {
+                failReason = $"No input files found: \"{input}\"";
+                return false;
+            }
+        }
+
+        /// <summary>
+        /// Check that no two files of a batch are written to the same output file, which is named after the relative
+        /// directory and the file name without its extension of the input file (compared case insensitively, as on
+        /// Windows).
+        /// </summary>
+        public static bool BatchOutputsAreUnique(List<(string FilePath, string RelativeDirectory)> batchFiles, out string failReason)
+        {
+            Dictionary<string, string> outputs = new Dictionary<string, string>(StringComparer.OrdinalIgnoreCase);
+            foreach ((string filePath, string relativeDirectory) in batchFiles)
+            {
+                string output = Path.Combine(relativeDirectory, Path.GetFileNameWithoutExtension(filePath));
+                if (outputs.TryGetValue(output, out string? otherFilePath))
+                {
+                    failReason = $"\"{otherFilePath}\" and \"{filePath}\" would be written to the same output file";
+                    return false;
+                }
+                outputs.Add(output, filePath);
+            }
+            failReason = string.Empty;
+            return true;
+        }
+
+        private static readonly char[] wildcards = new[] { '*', '?' };
+
+        private static void AddBatchFiles(string directory, string searchPattern, SearchOption searchOption,
+            List<(string FilePath, string RelativeDirectory)> batchFiles)
+        {
+            foreach (string filePath in Directory.EnumerateFiles(directory, searchPattern, searchOption))
+            {
+                string relativeDirectory = Path.GetRelativePath(directory, Path.GetDirectoryName(filePath) ?? directory);
+                batchFiles.Add((filePath, relativeDirectory == "." ? string.Empty : relativeDirectory));
+            }
+            // Same order on every run and platform
+            batchFiles.Sort((left, right) => string.CompareOrdinal(left.FilePath, right.FilePath));
+        }
     }
 }
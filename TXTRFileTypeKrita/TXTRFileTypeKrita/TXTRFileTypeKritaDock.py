@@ -42,7 +42,7 @@ CWD = os.fspath(Path(CWD).resolve().parent)
 if (CWD not in sys.path):
     sys.path.append(CWD)
 
-from libtxtrPython import libtxtr, TextureFormat, PaletteFormat, CopyPaletteSize
+from libtxtrPython import libtxtr, TextureFormat, PaletteFormat, CopyPaletteSize, ChannelOrder
 
 from krita import *
 
@@ -178,14 +178,8 @@ class TXTRFileTypeKritaDock(DockWidget):
                 layer = document.createNode(f'Mipmap {i + 1}', 'paintlayer')
                 layer.setLocked(True)
                 
-                layerData = QImage(layer.pixelData(0, 0, width, height), width, height, QImage.Format_RGBA8888)
-                for x in range(0, width):
-                    for y in range(0, height):
-                        pixel: bytearray
-                        pixel = libtxtr.GetPixel(i, x, y)
-                        # BGRA -> RGBA
-                        layerData.setPixelColor(x, y, QColor.fromRgba(qRgba(pixel[2], pixel[1], pixel[0], pixel[3])))
-                layer.setPixelData(bytes(layerData.constBits().asarray(layerData.byteCount())), 0, 0, width, height)
+                # Krita stores RGBA U8 layer pixel data as BGRA, the same as the loaded images
+                layer.setPixelData(bytes(libtxtr.GetImageBuffer(i)), 0, 0, width, height)
                 
                 layer.setLocked(False)
                 document.rootNode().addChildNode(layer, None)
@@ -259,16 +253,10 @@ class TXTRFileTypeKritaDock(DockWidget):
             layer: Node
             layer = document.topLevelNodes()[0]
             layer.setLocked(True)
-            layerData = QImage(layer.pixelData(0, 0, document.width(), document.height()), document.width(), document.height(), QImage.Format_RGBA8888)
+            layerData = layer.pixelData(0, 0, document.width(), document.height())
             layer.setLocked(False)
 
-            libtxtr.InitializeSaveImage(document.width(), document.height())
-            for x in range(0, document.width()):
-                for y in range(0, document.height()):
-                    pixel: QColor
-                    pixel = layerData.pixelColor(x, y)
-                    # RGBA -> BGRA
-                    libtxtr.SetPixel(x, y, bytearray((pixel.blue(), pixel.green(), pixel.red(), pixel.alpha())))
+            libtxtr.SetImageBuffer(document.width(), document.height(), bytes(layerData), 0, ChannelOrder.BGRA)
 
             isIndexed: bool
             isIndexed = (self.textureFormat == TextureFormat.CI4
@@ -17,6 +17,7 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 */
 
 using System;
+using System.Buffers.Binary;
 using System.IO;
 using System.Text;
 
@@ -63,12 +64,17 @@ namespace TXTRFileTypeLib.IO
             IsLittleEndian = isLittleEndian;
         }
 
-        private byte[] ReadForEndianness(int bytesToRead, bool isLittleEndian)
+        // Fills all of buffer, unlike Read which may read less
+        public void ReadBytes(Span<byte> buffer)
         {
-            byte[] bytesRead = ReadBytes(bytesToRead);
-            if (isLittleEndian != BitConverter.IsLittleEndian)
-                Array.Reverse(bytesRead);
-            return bytesRead;
+            int bytesRead = 0;
+            while (bytesRead < buffer.Length)
+            {
+                int read = Read(buffer.Slice(bytesRead));
+                if (read == 0)
+                    throw new EndOfStreamException();
+                bytesRead += read;
+            }
         }
 
         public override byte[] ReadBytes(int count)
@@ -98,22 +104,63 @@ namespace TXTRFileTypeLib.IO
 
         public override double ReadDouble() => ReadDouble(IsLittleEndian);
 
-        public bool ReadBoolean(bool isLittleEndian) => BitConverter.ToBoolean(ReadForEndianness(sizeof(bool), isLittleEndian), 0);
+        // A single byte has no endianness
+        public bool ReadBoolean(bool isLittleEndian) => ReadByte() != 0;
 
-        public ushort ReadUInt16(bool isLittleEndian) => BitConverter.ToUInt16(ReadForEndianness(sizeof(ushort), isLittleEndian), 0);
+        public ushort ReadUInt16(bool isLittleEndian)
+        {
+            Span<byte> buffer = stackalloc byte[sizeof(ushort)];
+            ReadBytes(buffer);
+            return isLittleEndian ? BinaryPrimitives.ReadUInt16LittleEndian(buffer) : BinaryPrimitives.ReadUInt16BigEndian(buffer);
+        }
 
-        public short ReadInt16(bool isLittleEndian) => BitConverter.ToInt16(ReadForEndianness(sizeof(short), isLittleEndian), 0);
+        public short ReadInt16(bool isLittleEndian)
+        {
+            Span<byte> buffer = stackalloc byte[sizeof(short)];
+            ReadBytes(buffer);
+            return isLittleEndian ? BinaryPrimitives.ReadInt16LittleEndian(buffer) : BinaryPrimitives.ReadInt16BigEndian(buffer);
+        }
 
-        public uint ReadUInt32(bool isLittleEndian) => BitConverter.ToUInt32(ReadForEndianness(sizeof(uint), isLittleEndian), 0);
+        public uint ReadUInt32(bool isLittleEndian)
+        {
+            Span<byte> buffer = stackalloc byte[sizeof(uint)];
+            ReadBytes(buffer);
+            return isLittleEndian ? BinaryPrimitives.ReadUInt32LittleEndian(buffer) : BinaryPrimitives.ReadUInt32BigEndian(buffer);
+        }
 
-        public int ReadInt32(bool isLittleEndian) => BitConverter.ToInt32(ReadForEndianness(sizeof(int), isLittleEndian), 0);
+        public int ReadInt32(bool isLittleEndian)
+        {
+            Span<byte> buffer = stackalloc byte[sizeof(int)];
+            ReadBytes(buffer);
+            return isLittleEndian ? BinaryPrimitives.ReadInt32LittleEndian(buffer) : BinaryPrimitives.ReadInt32BigEndian(buffer);
+        }
 
-        public ulong ReadUInt64(bool isLittleEndian) => BitConverter.ToUInt64(ReadForEndianness(sizeof(ulong), isLittleEndian), 0);
+        public ulong ReadUInt64(bool isLittleEndian)
+        {
+            Span<byte> buffer = stackalloc byte[sizeof(ulong)];
+            ReadBytes(buffer);
+            return isLittleEndian ? BinaryPrimitives.ReadUInt64LittleEndian(buffer) : BinaryPrimitives.ReadUInt64BigEndian(buffer);
+        }
 
-        public long ReadInt64(bool isLittleEndian) => BitConverter.ToInt64(ReadForEndianness(sizeof(long), isLittleEndian), 0);
+        public long ReadInt64(bool isLittleEndian)
+        {
+            Span<byte> buffer = stackalloc byte[sizeof(long)];
+            ReadBytes(buffer);
+            return isLittleEndian ? BinaryPrimitives.ReadInt64LittleEndian(buffer) : BinaryPrimitives.ReadInt64BigEndian(buffer);
+        }
 
-        public float ReadSingle(bool isLittleEndian) => BitConverter.ToSingle(ReadForEndianness(sizeof(float), isLittleEndian), 0);
+        public float ReadSingle(bool isLittleEndian)
+        {
+            Span<byte> buffer = stackalloc byte[sizeof(float)];
+            ReadBytes(buffer);
+            return isLittleEndian ? BinaryPrimitives.ReadSingleLittleEndian(buffer) : BinaryPrimitives.ReadSingleBigEndian(buffer);
+        }
 
-        public double ReadDouble(bool isLittleEndian) => BitConverter.ToDouble(ReadForEndianness(sizeof(double), isLittleEndian), 0);
+        public double ReadDouble(bool isLittleEndian)
+        {
+            Span<byte> buffer = stackalloc byte[sizeof(double)];
+            ReadBytes(buffer);
+            return isLittleEndian ? BinaryPrimitives.ReadDoubleLittleEndian(buffer) : BinaryPrimitives.ReadDoubleBigEndian(buffer);
+        }
     }
 }
@@ -17,6 +17,7 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 */
 
 using System;
+using System.Buffers.Binary;
 using System.IO;
 using System.Text;
 
@@ -63,13 +64,6 @@ namespace TXTRFileTypeLib.IO
             IsLittleEndian = isLittleEndian;
         }
 
-        private void WriteForEndianness(byte[] buffer, bool isLittleEndian)
-        {
-            if (isLittleEndian != BitConverter.IsLittleEndian)
-                Array.Reverse(buffer);
-            Write(buffer);
-        }
-
         public override void Write(bool value) => Write(value, IsLittleEndian);
 
         public override void Write(ushort value) => Write(value, IsLittleEndian);
@@ -88,22 +82,87 @@ namespace TXTRFileTypeLib.IO
 
         public override void Write(double value) => Write(value, IsLittleEndian);
 
-        public void Write(bool value, bool endianness) => WriteForEndianness(BitConverter.GetBytes(value), endianness);
+        // A single byte has no endianness
+        public void Write(bool value, bool endianness) => Write((byte)(value ? 1 : 0));
 
-        public void Write(ushort value, bool endianness) => WriteForEndianness(BitConverter.GetBytes(value), endianness);
+        public void Write(ushort value, bool endianness)
+        {
+            Span<byte> buffer = stackalloc byte[sizeof(ushort)];
+            if (endianness)
+                BinaryPrimitives.WriteUInt16LittleEndian(buffer, value);
+            else
+                BinaryPrimitives.WriteUInt16BigEndian(buffer, value);
+            Write(buffer);
+        }
 
-        public void Write(short value, bool endianness) => WriteForEndianness(BitConverter.GetBytes(value), endianness);
+        public void Write(short value, bool endianness)
+        {
+            Span<byte> buffer = stackalloc byte[sizeof(short)];
+            if (endianness)
+                BinaryPrimitives.WriteInt16LittleEndian(buffer, value);
+            else
+                BinaryPrimitives.WriteInt16BigEndian(buffer, value);
+            Write(buffer);
+        }
 
-        public void Write(uint value, bool endianness) => WriteForEndianness(BitConverter.GetBytes(value), endianness);
+        public void Write(uint value, bool endianness)
+        {
+            Span<byte> buffer = stackalloc byte[sizeof(uint)];
+            if (endianness)
+                BinaryPrimitives.WriteUInt32LittleEndian(buffer, value);
+            else
+                BinaryPrimitives.WriteUInt32BigEndian(buffer, value);
+            Write(buffer);
+        }
 
-        public void Write(int value, bool endianness) => WriteForEndianness(BitConverter.GetBytes(value), endianness);
+        public void Write(int value, bool endianness)
+        {
+            Span<byte> buffer = stackalloc byte[sizeof(int)];
+            if (endianness)
+                BinaryPrimitives.WriteInt32LittleEndian(buffer, value);
+            else
+                BinaryPrimitives.WriteInt32BigEndian(buffer, value);
+            Write(buffer);
+        }
 
-        public void Write(ulong value, bool endianness) => WriteForEndianness(BitConverter.GetBytes(value), endianness);
+        public void Write(ulong value, bool endianness)
+        {
+            Span<byte> buffer = stackalloc byte[sizeof(ulong)];
+            if (endianness)
+                BinaryPrimitives.WriteUInt64LittleEndian(buffer, value);
+            else
+                BinaryPrimitives.WriteUInt64BigEndian(buffer, value);
+            Write(buffer);
+        }
 
-        public void Write(long value, bool endianness) => WriteForEndianness(BitConverter.GetBytes(value), endianness);
+        public void Write(long value, bool endianness)
+        {
+            Span<byte> buffer = stackalloc byte[sizeof(long)];
+            if (endianness)
+                BinaryPrimitives.WriteInt64LittleEndian(buffer, value);
+            else
+                BinaryPrimitives.WriteInt64BigEndian(buffer, value);
+            Write(buffer);
+        }
 
-        public void Write(float value, bool endianness) => WriteForEndianness(BitConverter.GetBytes(value), endianness);
+        public void Write(float value, bool endianness)
+        {
+            Span<byte> buffer = stackalloc byte[sizeof(float)];
+            if (endianness)
+                BinaryPrimitives.WriteSingleLittleEndian(buffer, value);
+            else
+                BinaryPrimitives.WriteSingleBigEndian(buffer, value);
+            Write(buffer);
+        }
 
-        public void Write(double value, bool endianness) => WriteForEndianness(BitConverter.GetBytes(value), endianness);
+        public void Write(double value, bool endianness)
+        {
+            Span<byte> buffer = stackalloc byte[sizeof(double)];
+            if (endianness)
+                BinaryPrimitives.WriteDoubleLittleEndian(buffer, value);
+            else
+                BinaryPrimitives.WriteDoubleBigEndian(buffer, value);
+            Write(buffer);
+        }
     }
 }
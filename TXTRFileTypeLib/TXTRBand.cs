@@ -0,0 +1,58 @@
+﻿/*
+TXTRFileType
+Copyright (C) 2021 xchellx
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+*/
+using SixLabors.ImageSharp;
+using SixLabors.ImageSharp.PixelFormats;
+using System;
+using System.ComponentModel;
+
+namespace TXTRFileTypeLib
+{
+    /// <summary>
+    /// A horizontal band of decoded rows of a mipmap of a TXTR.<br/>
+    /// The band owns its image, dispose it once it is processed.<br/>
+    /// See: <see cref="TXTRFileTypeLibAPI.ReadBands(string, int, int)"/>
+    /// </summary>
+    [Description("A horizontal band of decoded rows of a mipmap of a TXTR")]
+    public sealed class TXTRBand : IDisposable
+    {
+        internal TXTRBand(int y, Image<Bgra32> image)
+        {
+            Y = y;
+            Image = image;
+        }
+
+        /// <summary>
+        /// The row of the mipmap where the first row of the band is, the same row as in the image read by
+        /// <see cref="TXTRFileTypeLibAPI.ReadMipmap(string, int, TXTRFileTypeLibAPI.UpdateProgressDelegate?)"/>
+        /// </summary>
+        [Description("The row of the mipmap where the first row of the band is")]
+        public int Y { get; }
+
+        /// <summary>
+        /// The decoded rows of the band, as wide as the mipmap
+        /// </summary>
+        [Description("The decoded rows of the band")]
+        public Image<Bgra32> Image { get; }
+
+        /// <summary>
+        /// Dispose the image of the band
+        /// </summary>
+        [Description("Dispose the image of the band")]
+        public void Dispose() => Image.Dispose();
+    }
+}
@@ -21,7 +21,11 @@ using libWiiSharp;
 using SixLabors.ImageSharp.PixelFormats;
 using SixLabors.ImageSharp;
 using System;
+using System.Buffers;
+using System.Collections.Generic;
 using System.IO;
+using System.Runtime.ExceptionServices;
+using System.Threading.Tasks;
 using TXTRFileTypeLib.Util;
 using SixLabors.ImageSharp.Processing;
 using TXTRFileTypeLib.IO;
@@ -35,12 +39,202 @@ namespace TXTRFileTypeLib
         private static Image<Bgra32>[] ReadCore(Stream input,
             bool readMipmaps,
             bool keepStreamOpen,
-            UpdateProgressDelegate? progressCallback)
+            UpdateProgressDelegate? progressCallback,
+            bool decodeInParallel = false)
         {
             void UpdateProgress(double progress, double max) => progressCallback?.Invoke(progress, max);
             double maxProgress = 0,
                 currentProgress = 0;
 
+            using (EndianBinaryReader inputReader = new(input, false, Encoding.ASCII, keepStreamOpen))
+            {
+                // The header is checked by ReadHeaderCore, which leaves the stream at the palette (or the first mipmap),
+                // so the palette and the mipmaps are read in order after it
+                TXTRHeader header = ReadHeaderCore(input, true, readMipmaps);
+                TextureFormat textureFormat = header.TextureFormat;
+                int mipmapCount = header.Mipmaps.Count;
+                maxProgress = mipmapCount;
+
+                var mipmaps = new Image<Bgra32>[mipmapCount];
+                try
+                {
+                    if (header.PaletteFormat is PaletteFormat paletteFormat)
+                    {
+                        TXTRMipmapInfo mipmap = header.Mipmaps[0];
+                        byte[] paletteData = RentAndReadBytes(inputReader, header.PaletteSize);
+                        try
+                        {
+                            byte[] mipmapData = RentAndReadBytes(inputReader, mipmap.Size);
+                            try
+                            {
+                                mipmaps[0] = TextureConverter.DecodeIndexedTexture(mipmapData.AsMemory(0, mipmap.Size),
+                                    paletteData.AsSpan(0, header.PaletteSize), mipmap.Width, mipmap.Height, textureFormat,
+                                    paletteFormat);
+                            }
+                            finally
+                            {
+                                ArrayPool<byte>.Shared.Return(mipmapData);
+                            }
+                        }
+                        finally
+                        {
+                            ArrayPool<byte>.Shared.Return(paletteData);
+                        }
+                        // Do not flip indexed formats, the texture converter does the flipping for us
+                        UpdateProgress(++currentProgress, maxProgress);
+                    }
+                    else if (decodeInParallel && mipmapCount > 1)
+                    {
+                        // The size of every mipmap is known from the header, so all mipmaps are read first
+                        // and then decoded at the same time
+                        var mipmapData = new byte[mipmapCount][];
+
+                        try
+                        {
+                            for (int mipmapLevel = 0; mipmapLevel < mipmapCount; mipmapLevel++)
+                                mipmapData[mipmapLevel] = RentAndReadBytes(inputReader, header.Mipmaps[mipmapLevel].Size);
+
+                            object progressLock = new();
+                            try
+                            {
+                                Parallel.For(0, mipmapCount, TextureConverter.ParallelOptions, mipmapLevel =>
+                                {
+                                    TXTRMipmapInfo mipmap = header.Mipmaps[mipmapLevel];
+                                    mipmaps[mipmapLevel] = TextureConverter.DecodeTexture(
+                                        mipmapData[mipmapLevel].AsMemory(0, mipmap.Size),
+                                        mipmap.Width, mipmap.Height, textureFormat);
+                                    mipmaps[mipmapLevel].Mutate(ctx => ctx.Flip(FlipMode.Vertical));
+                                    // Progress is reported in the order the mipmaps finish, one report at a time
+                                    lock (progressLock)
+                                        UpdateProgress(++currentProgress, maxProgress);
+                                });
+                            }
+                            catch (AggregateException e)
+                            {
+                                ExceptionDispatchInfo.Capture(e.Flatten().InnerExceptions[0]).Throw();
+                            }
+                        }
+                        finally
+                        {
+                            foreach (byte[] data in mipmapData)
+                                if (data != null)
+                                    ArrayPool<byte>.Shared.Return(data);
+                        }
+                    }
+                    else
+                    {
+                        for (int mipmapLevel = 0; mipmapLevel < mipmapCount; mipmapLevel++)
+                        {
+                            TXTRMipmapInfo mipmap = header.Mipmaps[mipmapLevel];
+                            byte[] mipmapData = RentAndReadBytes(inputReader, mipmap.Size);
+                            try
+                            {
+                                mipmaps[mipmapLevel] = TextureConverter.DecodeTexture(mipmapData.AsMemory(0, mipmap.Size),
+                                    mipmap.Width, mipmap.Height, textureFormat);
+                            }
+                            finally
+                            {
+                                ArrayPool<byte>.Shared.Return(mipmapData);
+                            }
+                            mipmaps[mipmapLevel].Mutate(ctx => ctx.Flip(FlipMode.Vertical));
+                            UpdateProgress(++currentProgress, maxProgress);
+                        }
+                    }
+
+                    return mipmaps;
+                }
+                catch
+                {
+                    foreach (Image<Bgra32> mipmap in mipmaps)
+                        mipmap?.Dispose();
+
+                    throw;
+                }
+            }
+        }
+
+        private static Image<Bgra32>[] ReadCore(ReadOnlyMemory<byte> input,
+            bool readMipmaps,
+            UpdateProgressDelegate? progressCallback,
+            bool decodeInParallel = false)
+        {
+            void UpdateProgress(double progress, double max) => progressCallback?.Invoke(progress, max);
+            double maxProgress = 0,
+                currentProgress = 0;
+
+            // Only the header (12 bytes, plus 8 bytes for indexed formats) is copied, the palette and the mipmaps
+            // are decoded from slices of the input itself
+            TXTRHeader header;
+            using (var headerStream = new MemoryStream(input.Slice(0, Math.Min(input.Length, 20)).ToArray(), false))
+                header = ReadHeaderCore(headerStream, false, readMipmaps);
+            maxProgress = header.Mipmaps.Count;
+
+            ReadOnlyMemory<byte> Slice(long offset, int size)
+                => offset + size <= input.Length ? input.Slice((int)offset, size) : throw new EndOfStreamException();
+
+            var mipmaps = new Image<Bgra32>[header.Mipmaps.Count];
+            try
+            {
+                if (header.IsIndexed)
+                {
+                    TXTRMipmapInfo mipmap = header.Mipmaps[0];
+                    mipmaps[0] = TextureConverter.DecodeIndexedTexture(Slice(mipmap.Offset, mipmap.Size),
+                        Slice(header.PaletteOffset, header.PaletteSize).Span, mipmap.Width, mipmap.Height,
+                        header.TextureFormat, header.PaletteFormat!.Value);
+                    // Do not flip indexed formats, the texture converter does the flipping for us
+                    UpdateProgress(++currentProgress, maxProgress);
+                }
+                else
+                {
+                    void DecodeMipmap(int mipmapLevel)
+                    {
+                        TXTRMipmapInfo mipmap = header.Mipmaps[mipmapLevel];
+                        mipmaps[mipmapLevel] = TextureConverter.DecodeTexture(Slice(mipmap.Offset, mipmap.Size),
+                            mipmap.Width, mipmap.Height, header.TextureFormat);
+                        mipmaps[mipmapLevel].Mutate(ctx => ctx.Flip(FlipMode.Vertical));
+                    }
+
+                    if (decodeInParallel && mipmaps.Length > 1)
+                    {
+                        object progressLock = new();
+                        try
+                        {
+                            Parallel.For(0, mipmaps.Length, TextureConverter.ParallelOptions, mipmapLevel =>
+                            {
+                                DecodeMipmap(mipmapLevel);
+                                // Progress is reported in the order the mipmaps finish, one report at a time
+                                lock (progressLock)
+                                    UpdateProgress(++currentProgress, maxProgress);
+                            });
+                        }
+                        catch (AggregateException e)
+                        {
+                            ExceptionDispatchInfo.Capture(e.Flatten().InnerExceptions[0]).Throw();
+                        }
+                    }
+                    else
+                    {
+                        for (int mipmapLevel = 0; mipmapLevel < mipmaps.Length; mipmapLevel++)
+                        {
+                            DecodeMipmap(mipmapLevel);
+                            UpdateProgress(++currentProgress, maxProgress);
+                        }
+                    }
+                }
+
+                return mipmaps;
+            }
+            catch
+            {
+                foreach (Image<Bgra32> mipmap in mipmaps)
+                    mipmap?.Dispose();
+
+                throw;
+            }
+        }
+
+        private static TXTRHeader ReadHeaderCore(Stream input, bool keepStreamOpen, bool locateMipmaps = true)
+        {
             using (EndianBinaryReader inputReader = new(input, false, Encoding.ASCII, keepStreamOpen))
             {
                 TextureFormat textureFormat = (TextureFormat)inputReader.ReadUInt32();
@@ -64,93 +258,365 @@ namespace TXTRFileTypeLib
                 else if (mipmapCount > 1 && isIndexed)
                     throw new InvalidDataException(
                         $"Mipmap count must not be greater than 1 on indexed formats: {mipmapCount}");
-                if (!readMipmaps)
-                    mipmapCount = 1;
-                maxProgress = mipmapCount;
+                // Offsets are counted from the start of the TXTR (the header is 12 bytes)
+                long offset = 12L;
 
-                var mipmaps = new Image<Bgra32>[mipmapCount];
-                try
+                PaletteFormat? paletteFormat = null;
+                ushort paletteWidth = 0,
+                    paletteHeight = 0;
+                long paletteOffset = 0L;
+                int paletteSize = 0;
+                if (isIndexed)
                 {
-                    if (isIndexed)
-                    {
-                        PaletteFormat paletteFormat = (PaletteFormat)inputReader.ReadUInt32();
-                        if (!paletteFormat.IsDefined())
-                            throw new InvalidDataException(
-                                $"Palette format '{paletteFormat}' (0x{paletteFormat.AsUInt32():X8}) is not supported");
+                    paletteFormat = (PaletteFormat)inputReader.ReadUInt32();
+                    if (!paletteFormat.Value.IsDefined())
+                        throw new InvalidDataException(
+                            $"Palette format '{paletteFormat}' (0x{paletteFormat.Value.AsUInt32():X8}) is not supported");
 
-                        ushort paletteWidth = inputReader.ReadUInt16();
-                        if (paletteWidth < 1)
-                            throw new InvalidDataException($"Palette width must be greater than 0: {paletteWidth}");
+                    paletteWidth = inputReader.ReadUInt16();
+                    if (paletteWidth < 1)
+                        throw new InvalidDataException($"Palette width must be greater than 0: {paletteWidth}");
 
-                        ushort paletteHeight = inputReader.ReadUInt16();
-                        if (paletteHeight < 1)
-                            throw new InvalidDataException($"Palette height must be greater than 0: {paletteHeight}");
+                    paletteHeight = inputReader.ReadUInt16();
+                    if (paletteHeight < 1)
+                        throw new InvalidDataException($"Palette height must be greater than 0: {paletteHeight}");
 
-                        int paletteSize = TextureConverter.GetPaletteSize(paletteFormat, paletteWidth, paletteHeight);
-                        int maxCI4PaletteSize = TextureConverter.GetPaletteSize(paletteFormat, 16, 1);
-                        int maxCI8PaletteSize = TextureConverter.GetPaletteSize(paletteFormat, 256, 1);
-                        int maxCI14X2PaletteSize = TextureConverter.GetPaletteSize(paletteFormat, 16384, 1);
-                        // Palette size is actually determined by the palette width and height.
-                        // The assumption of CI14X2 = 16384, CI8 = 256, and CI4 = 16 is that of the maximum size. However, the
-                        // actual size can be smaller than the maximum size depending on how much of the colors were converted.
-                        if (paletteSize < 1)
-                            throw new InvalidDataException("Palette data is empty");
-                        else if (paletteSize > maxCI4PaletteSize && textureFormat == TextureFormat.CI4)
-                            throw new InvalidDataException(
-                                $"Palette size exceeds maximum palette size: {paletteSize} > {maxCI4PaletteSize}");
-                        else if (paletteSize > maxCI8PaletteSize && textureFormat == TextureFormat.CI8)
-                            throw new InvalidDataException(
-                                $"Palette size exceeds maximum palette size: {paletteSize} > {maxCI8PaletteSize}");
-                        else if (paletteSize > maxCI14X2PaletteSize && textureFormat == TextureFormat.CI14X2)
-                            throw new InvalidDataException(
-                                $"Palette size exceeds maximum palette size: {paletteSize} > {maxCI14X2PaletteSize}");
-                        byte[] paletteData = inputReader.ReadBytes(paletteSize);
+                    paletteSize = TextureConverter.GetPaletteSize(paletteFormat.Value, paletteWidth, paletteHeight);
+                    int maxCI4PaletteSize = TextureConverter.GetPaletteSize(paletteFormat.Value, 16, 1);
+                    int maxCI8PaletteSize = TextureConverter.GetPaletteSize(paletteFormat.Value, 256, 1);
+                    int maxCI14X2PaletteSize = TextureConverter.GetPaletteSize(paletteFormat.Value, 16384, 1);
+                    // Palette size is actually determined by the palette width and height.
+                    // The assumption of CI14X2 = 16384, CI8 = 256, and CI4 = 16 is that of the maximum size. However, the
+                    // actual size can be smaller than the maximum size depending on how much of the colors were converted.
+                    if (paletteSize < 1)
+                        throw new InvalidDataException("Palette data is empty");
+                    else if (paletteSize > maxCI4PaletteSize && textureFormat == TextureFormat.CI4)
+                        throw new InvalidDataException(
+                            $"Palette size exceeds maximum palette size: {paletteSize} > {maxCI4PaletteSize}");
+                    else if (paletteSize > maxCI8PaletteSize && textureFormat == TextureFormat.CI8)
+                        throw new InvalidDataException(
+                            $"Palette size exceeds maximum palette size: {paletteSize} > {maxCI8PaletteSize}");
+                    else if (paletteSize > maxCI14X2PaletteSize && textureFormat == TextureFormat.CI14X2)
+                        throw new InvalidDataException(
+                            $"Palette size exceeds maximum palette size: {paletteSize} > {maxCI14X2PaletteSize}");
 
-                        int mipmapSize = TextureConverter.GetTextureSize(textureFormat, textureWidth, textureHeight);
-                        if (mipmapSize <= 0)
-                            throw new InvalidDataException($"Mipmap 1 data is empty");
+                    // The palette follows the 8 bytes of the palette header
+                    paletteOffset = offset + 8L;
+                    offset = paletteOffset + paletteSize;
+                }
 
-                        mipmaps[0] = TextureConverter.DecodeIndexedTexture(inputReader.ReadBytes(mipmapSize),
-                            paletteData, textureWidth, textureHeight, textureFormat, paletteFormat);
-                        // Do not flip indexed formats, the texture converter does the flipping for us
-                        UpdateProgress(++currentProgress, maxProgress);
+                // Only the header is read, the mipmaps are located with the sizes of their texture format. The
+                // dimensions halve on every mipmap, so a (corrupt) mipmap count cannot be larger than 16 here.
+                // Without locateMipmaps only the first mipmap is located (and checked), like ReadCore without readMipmaps.
+                var mipmaps = new List<TXTRMipmapInfo>();
+                ushort mipmapWidth = textureWidth,
+                    mipmapHeight = textureHeight;
+                for (int mipmapLevel = 0; mipmapLevel < (locateMipmaps ? mipmapCount : 1); mipmapLevel++)
+                {
+                    int mipmapSize = GetMipmapSize(textureFormat, mipmapLevel, mipmapWidth, mipmapHeight);
+
+                    mipmaps.Add(new TXTRMipmapInfo(mipmapWidth, mipmapHeight, offset, mipmapSize));
+                    offset += mipmapSize;
+
+                    mipmapWidth = (ushort)(mipmapWidth / 2);
+                    mipmapHeight = (ushort)(mipmapHeight / 2);
+                }
+
+                return new TXTRHeader(textureFormat, textureWidth, textureHeight, mipmapCount, paletteFormat,
+                    paletteWidth, paletteHeight, paletteOffset, paletteSize, mipmaps.ToArray());
+            }
+        }
+
+        private static Image<Bgra32> ReadMipmapCore(Stream input,
+            Func<TXTRHeader, int> getMipmapLevel,
+            bool keepStreamOpen,
+            UpdateProgressDelegate? progressCallback)
+        {
+            void UpdateProgress(double progress, double max) => progressCallback?.Invoke(progress, max);
+
+            using (EndianBinaryReader inputReader = new(input, false, Encoding.ASCII, keepStreamOpen))
+            {
+                long startPosition = input.CanSeek ? input.Position : 0L;
+                TXTRHeader header = ReadHeaderCore(input, true);
+                int mipmapLevel = getMipmapLevel(header);
+                if (mipmapLevel < 0 || mipmapLevel >= header.Mipmaps.Count)
+                    throw new ArgumentOutOfRangeException(nameof(mipmapLevel), mipmapLevel,
+                        $"Must be 0 or greater and less than the mipmap count ({header.Mipmaps.Count})");
+                TXTRMipmapInfo mipmap = header.Mipmaps[mipmapLevel];
+
+                if (header.IsIndexed)
+                {
+                    // Indexed formats only have one mipmap, and it directly follows the palette
+                    Image<Bgra32> image;
+                    byte[] paletteData = RentAndReadBytes(inputReader, header.PaletteSize);
+                    try
+                    {
+                        byte[] mipmapData = RentAndReadBytes(inputReader, mipmap.Size);
+                        try
+                        {
+                            image = TextureConverter.DecodeIndexedTexture(mipmapData.AsMemory(0, mipmap.Size),
+                                paletteData.AsSpan(0, header.PaletteSize), mipmap.Width, mipmap.Height, header.TextureFormat,
+                                header.PaletteFormat!.Value);
+                        }
+                        finally
+                        {
+                            ArrayPool<byte>.Shared.Return(mipmapData);
+                        }
+                    }
+                    finally
+                    {
+                        ArrayPool<byte>.Shared.Return(paletteData);
                     }
+                    // Do not flip indexed formats, the texture converter does the flipping for us
+                    UpdateProgress(1, 1);
+                    return image;
+                }
+                else
+                {
+                    // Go past the mipmaps before this mipmap without reading them. The header is 12 bytes.
+                    if (input.CanSeek)
+                        input.Seek(startPosition + mipmap.Offset, SeekOrigin.Begin);
                     else
+                        SkipBytes(input, mipmap.Offset - 12L);
+
+                    Image<Bgra32> image;
+                    byte[] mipmapData = RentAndReadBytes(inputReader, mipmap.Size);
+                    try
+                    {
+                        image = TextureConverter.DecodeTexture(mipmapData.AsMemory(0, mipmap.Size), mipmap.Width,
+                            mipmap.Height, header.TextureFormat);
+                    }
+                    finally
                     {
-                        ushort mipmapWidth = textureWidth,
-                            mipmapHeight = textureHeight;
+                        ArrayPool<byte>.Shared.Return(mipmapData);
+                    }
+                    image.Mutate(ctx => ctx.Flip(FlipMode.Vertical));
+                    UpdateProgress(1, 1);
+                    return image;
+                }
+            }
+        }
 
-                        for (int mipmapLevel = 0; mipmapLevel < mipmapCount; mipmapLevel++)
-                        {
-                            int mipmapSize = TextureConverter.GetTextureSize(textureFormat, mipmapWidth, mipmapHeight);
-                            if (mipmapSize <= 0)
-                                throw new InvalidDataException($"Mipmap {mipmapLevel + 1} data is empty");
+        private static IEnumerable<TXTRBand> ReadBandsCore(Stream input,
+            int mipmapLevel,
+            int tileRowsPerBand,
+            bool keepStreamOpen)
+        {
+            using (EndianBinaryReader inputReader = new(input, false, Encoding.ASCII, keepStreamOpen))
+            {
+                long startPosition = input.CanSeek ? input.Position : 0L;
+                TXTRHeader header = ReadHeaderCore(input, true);
+                if (mipmapLevel < 0 || mipmapLevel >= header.Mipmaps.Count)
+                    throw new ArgumentOutOfRangeException(nameof(mipmapLevel), mipmapLevel,
+                        $"Must be 0 or greater and less than the mipmap count ({header.Mipmaps.Count})");
+                TXTRMipmapInfo mipmap = header.Mipmaps[mipmapLevel];
+                int bandHeight = (int)Math.Min((long)TextureConverter.GetTileHeight(header.TextureFormat) * tileRowsPerBand,
+                    mipmap.Height);
 
-                            mipmaps[mipmapLevel] = TextureConverter.DecodeTexture(inputReader.ReadBytes(mipmapSize),
-                                mipmapWidth, mipmapHeight, textureFormat);
-                            mipmaps[mipmapLevel].Mutate(ctx => ctx.Flip(FlipMode.Vertical));
-                            UpdateProgress(++currentProgress, maxProgress);
+                byte[]? paletteData = null;
+                try
+                {
+                    if (header.IsIndexed)
+                    {
+                        // Indexed formats only have one mipmap, and it directly follows the palette
+                        paletteData = RentAndReadBytes(inputReader, header.PaletteSize);
+                    }
+                    else
+                    {
+                        // Go past the mipmaps before this mipmap without reading them. The header is 12 bytes.
+                        if (input.CanSeek)
+                            input.Seek(startPosition + mipmap.Offset, SeekOrigin.Begin);
+                        else
+                            SkipBytes(input, mipmap.Offset - 12L);
+                    }
 
-                            mipmapWidth = (ushort)(mipmapWidth / 2);
-                            if (mipmapWidth < 1)
-                                throw new InvalidDataException($"Mipmap {mipmapLevel + 1} width must be greater than 0: {mipmapWidth}");
+                    // Bands are decoded in the order they are stored. Non-indexed formats are stored upside down, so
+                    // their bands go from the bottom of the mipmap to the top and are flipped like a whole mipmap.
+                    for (int storedY = 0; storedY < mipmap.Height; storedY += bandHeight)
+                    {
+                        int rows = Math.Min(bandHeight, mipmap.Height - storedY);
+                        // Only CMPR is decoded by whole tiles, the other decoders skip the padding of the tiles
+                        int bandSize = header.TextureFormat == TextureFormat.CMPR
+                            ? TextureConverter.GetTileRowCount(header.TextureFormat, rows)
+                                * TextureConverter.GetTileRowSize(header.TextureFormat, mipmap.Width)
+                            : rows * TextureConverter.GetDecodedRowSize(header.TextureFormat, mipmap.Width);
 
-                            mipmapHeight = (ushort)Math.Max(mipmapHeight / 2, 0);
-                            if (mipmapHeight < 1)
-                                throw new InvalidDataException($"Mipmap {mipmapLevel + 1} height must be greater than 0: {mipmapHeight}");
+                        Image<Bgra32> image;
+                        byte[] bandData = RentAndReadBytes(inputReader, bandSize);
+                        try
+                        {
+                            image = DecodeBand(header, bandData.AsMemory(0, bandSize), paletteData, mipmap.Width, rows);
+                        }
+                        finally
+                        {
+                            ArrayPool<byte>.Shared.Return(bandData);
                         }
+                        yield return new TXTRBand(header.IsIndexed ? storedY : mipmap.Height - storedY - rows, image);
                     }
-
-                    return mipmaps;
                 }
-                catch
+                finally
                 {
-                    foreach (Image<Bgra32> mipmap in mipmaps)
-                        mipmap?.Dispose();
+                    if (paletteData != null)
+                        ArrayPool<byte>.Shared.Return(paletteData);
+                }
+            }
+        }
 
-                    throw;
+        // Spans cannot be used in the iterator itself
+        private static Image<Bgra32> DecodeBand(TXTRHeader header,
+            ReadOnlyMemory<byte> bandData,
+            byte[]? paletteData,
+            int width,
+            int rows)
+        {
+            if (header.IsIndexed)
+            {
+                // Do not flip indexed formats, the texture converter does the flipping for us
+                return TextureConverter.DecodeIndexedTexture(bandData, paletteData.AsSpan(0, header.PaletteSize), width,
+                    rows, header.TextureFormat, header.PaletteFormat!.Value);
+            }
+
+            Image<Bgra32> image = TextureConverter.DecodeTexture(bandData, width, rows, header.TextureFormat);
+            try
+            {
+                image.Mutate(ctx => ctx.Flip(FlipMode.Vertical));
+                return image;
+            }
+            catch
+            {
+                image.Dispose();
+                throw;
+            }
+        }
+
+        private static IEnumerable<TXTRBand> ReadBandsCore(string inputFilePath,
+            int mipmapLevel,
+            int tileRowsPerBand)
+        {
+            // Only opened once enumerated and closed with the enumerator, so an unused enumerable holds no file open
+            using (FileStream inputStream = File.OpenRead(inputFilePath))
+            {
+                foreach (TXTRBand band in ReadBandsCore(inputStream, mipmapLevel, tileRowsPerBand, true))
+                    yield return band;
+            }
+        }
+
+        private static void SkipBytes(Stream input, long count)
+        {
+            byte[] buffer = ArrayPool<byte>.Shared.Rent((int)Math.Min(count, 81920L));
+            try
+            {
+                while (count > 0)
+                {
+                    int bytesRead = input.Read(buffer, 0, (int)Math.Min(count, buffer.Length));
+                    if (bytesRead < 1)
+                        throw new EndOfStreamException();
+                    count -= bytesRead;
                 }
             }
+            finally
+            {
+                ArrayPool<byte>.Shared.Return(buffer);
+            }
+        }
+
+        // Checks a mipmap before it is read and returns its size. Every read checks the mipmaps with this, so they all
+        // accept the same TXTRs (a last mipmap that is 1 pixel wide or high included).
+        private static int GetMipmapSize(TextureFormat textureFormat, int mipmapLevel, ushort mipmapWidth, ushort mipmapHeight)
+        {
+            if (mipmapWidth < 1)
+                throw new InvalidDataException($"Mipmap {mipmapLevel + 1} width must be greater than 0: {mipmapWidth}");
+            else if (mipmapHeight < 1)
+                throw new InvalidDataException($"Mipmap {mipmapLevel + 1} height must be greater than 0: {mipmapHeight}");
+
+            int mipmapSize = TextureConverter.GetTextureSize(textureFormat, mipmapWidth, mipmapHeight);
+            if (mipmapSize <= 0)
+                throw new InvalidDataException($"Mipmap {mipmapLevel + 1} data is empty");
+            return mipmapSize;
+        }
+
+        // Writes a file to a temporary file next to it that replaces the file once it is complete, so a write that fails
+        // (such as for an input that cannot be transcoded) neither creates nor truncates the file
+        private static void WriteFileReplacing(string filePath, Action<Stream> write)
+        {
+            string tempFilePath = Path.Combine(Path.GetDirectoryName(Path.GetFullPath(filePath)) ?? string.Empty,
+                $"{Path.GetFileName(filePath)}.{Guid.NewGuid():N}.tmp");
+            try
+            {
+                using (FileStream outputStream = new(tempFilePath, FileMode.CreateNew, FileAccess.Write))
+                    write(outputStream);
+                File.Move(tempFilePath, filePath, true);
+            }
+            catch
+            {
+                File.Delete(tempFilePath);
+                throw;
+            }
+        }
+
+        // Reads count bytes into a buffer rented from ArrayPool<byte>.Shared, the caller returns it once it is decoded
+        private static byte[] RentAndReadBytes(EndianBinaryReader inputReader, int count)
+        {
+            byte[] buffer = ArrayPool<byte>.Shared.Rent(count);
+            try
+            {
+                inputReader.ReadBytes(buffer.AsSpan(0, count));
+                return buffer;
+            }
+            catch
+            {
+                ArrayPool<byte>.Shared.Return(buffer);
+                throw;
+            }
+        }
+
+        private static uint CountWriteMipmaps(int width, int height, int mipmapWidthLimit, int mipmapHeightLimit)
+        {
+            // Mipmap count is of the base texture + all the mipmaps
+            uint mipmapCount = (uint)Math.Clamp(ImageUtil.CountMipmaps(width, height,
+                mipmapWidthLimit, mipmapHeightLimit, true), uint.MinValue, uint.MaxValue);
+            // Make sure mipcount does not exceed minsize
+            uint maxMipCount = (uint)Math.Clamp(ImageUtil.CountMipmaps(width, height,
+                1, 1, true), uint.MinValue, uint.MaxValue);
+            return Math.Min(mipmapCount, maxMipCount);
+        }
+
+        // The size of the TXTR WriteCore writes, using the largest palette for indexed formats. 0 if it is not known.
+        private static int GetWriteSize(Image<Bgra32> input,
+            TextureFormat textureFormat,
+            PaletteFormat paletteFormat,
+            bool generateMipmaps,
+            int mipmapWidthLimit,
+            int mipmapHeightLimit)
+        {
+            if (!textureFormat.IsDefined() || !paletteFormat.IsDefined() || input.Width < 1 || input.Height < 1
+                || input.Width > ushort.MaxValue || input.Height > ushort.MaxValue)
+                return 0;
+
+            long size;
+            if (textureFormat == TextureFormat.CI4 || textureFormat == TextureFormat.CI8
+                || textureFormat == TextureFormat.CI14X2)
+            {
+                int maxPaletteLength = textureFormat == TextureFormat.CI4 ? 16
+                    : textureFormat == TextureFormat.CI8 ? 256 : 16384;
+                size = 20L + TextureConverter.GetPaletteSize(paletteFormat, maxPaletteLength, 1)
+                    + TextureConverter.GetTextureSize(textureFormat, input.Width, input.Height);
+            }
+            else
+            {
+                uint mipmapCount = generateMipmaps
+                    ? CountWriteMipmaps(input.Width, input.Height, mipmapWidthLimit, mipmapHeightLimit) : 1;
+                size = 12L;
+                int mipmapWidth = input.Width,
+                    mipmapHeight = input.Height;
+                for (uint mipmapLevel = 0; mipmapLevel < mipmapCount; mipmapLevel++)
+                {
+                    size += TextureConverter.GetTextureSize(textureFormat, mipmapWidth, mipmapHeight);
+                    mipmapWidth = Math.Max(mipmapWidth / 2, 1);
+                    mipmapHeight = Math.Max(mipmapHeight / 2, 1);
+                }
+            }
+            return size <= Array.MaxLength ? (int)size : 0;
         }
 
         private static void WriteCore(Image<Bgra32> input,
@@ -195,16 +661,7 @@ namespace TXTRFileTypeLib
                 // a single example of a TXTR with an indexed format that includes mipmaps.
                 uint mipmapCount = 1;
                 if (generateMipmaps && !isIndexed)
-                {
-                    // Mipmap count is of the base texture + all the mipmaps
-                    mipmapCount = (uint)Math.Clamp(ImageUtil.CountMipmaps(input.Width, input.Height,
-                        mipmapWidthLimit, mipmapHeightLimit, true), uint.MinValue, uint.MaxValue);
-                    // Make sure mipcount does not exceed minsize
-                    uint maxMipCount = (uint)Math.Clamp(ImageUtil.CountMipmaps(input.Width, input.Height,
-                        1, 1, true), uint.MinValue, uint.MaxValue);
-                    if (mipmapCount > maxMipCount)
-                        mipmapCount = maxMipCount;
-                }
+                    mipmapCount = CountWriteMipmaps(input.Width, input.Height, mipmapWidthLimit, mipmapHeightLimit);
                 if (mipmapCount < 1)
                     throw new InvalidDataException($"Mipmap count must be greater than 0: {mipmapCount}");
                 else if (mipmapCount > 1 && isIndexed)
@@ -224,63 +681,407 @@ namespace TXTRFileTypeLib
                     (ushort paletteWidth, ushort paletteHeight) = TextureConverter.EncodeIndexedTexture(input,
                         out byte[] mipmapData, out byte[] paletteData, textureFormat, paletteFormat, copyPaletteSize);
 
-                    if (paletteWidth < 1)
-                        throw new InvalidDataException($"Palette width must be greater than 0: {paletteWidth}");
-                    outputWriter.Write((ushort)paletteWidth);
+                    try
+                    {
+                        if (paletteWidth < 1)
+                            throw new InvalidDataException($"Palette width must be greater than 0: {paletteWidth}");
+                        outputWriter.Write((ushort)paletteWidth);
 
-                    if (paletteHeight < 1)
-                        throw new InvalidDataException($"Palette height must be greater than 0: {paletteHeight}");
-                    outputWriter.Write((ushort)paletteHeight);
+                        if (paletteHeight < 1)
+                            throw new InvalidDataException($"Palette height must be greater than 0: {paletteHeight}");
+                        outputWriter.Write((ushort)paletteHeight);
 
-                    int paletteSize = TextureConverter.GetPaletteSize(paletteFormat, paletteWidth, paletteHeight);
-                    int maxCI4PaletteSize = TextureConverter.GetPaletteSize(paletteFormat, 16, 1);
-                    int maxCI8PaletteSize = TextureConverter.GetPaletteSize(paletteFormat, 256, 1);
-                    int maxCI14X2PaletteSize = TextureConverter.GetPaletteSize(paletteFormat, 16384, 1);
-                    // Palette size is actually determined by the palette width and height.
-                    // The assumption of CI14X2 = 16384, CI8 = 256, and CI4 = 16 is that of the maximum size. However, the
-                    // actual size can be smaller than the maximum size depending on how much of the colors were converted.
-                    if (paletteSize < 1)
-                        throw new InvalidDataException("Palette data is empty");
-                    else if (paletteSize > maxCI4PaletteSize && textureFormat == TextureFormat.CI4)
-                        throw new InvalidDataException(
-                            $"Palette size exceeds maximum palette size: {paletteSize} > {maxCI4PaletteSize}");
-                    else if (paletteSize > maxCI8PaletteSize && textureFormat == TextureFormat.CI8)
-                        throw new InvalidDataException(
-                            $"Palette size exceeds maximum palette size: {paletteSize} > {maxCI8PaletteSize}");
-                    else if (paletteSize > maxCI14X2PaletteSize && textureFormat == TextureFormat.CI14X2)
-                        throw new InvalidDataException(
-                            $"Palette size exceeds maximum palette size: {paletteSize} > {maxCI14X2PaletteSize}");
-                    outputWriter.Write(paletteData);
+                        int paletteSize = TextureConverter.GetPaletteSize(paletteFormat, paletteWidth, paletteHeight);
+                        int maxCI4PaletteSize = TextureConverter.GetPaletteSize(paletteFormat, 16, 1);
+                        int maxCI8PaletteSize = TextureConverter.GetPaletteSize(paletteFormat, 256, 1);
+                        int maxCI14X2PaletteSize = TextureConverter.GetPaletteSize(paletteFormat, 16384, 1);
+                        // Palette size is actually determined by the palette width and height.
+                        // The assumption of CI14X2 = 16384, CI8 = 256, and CI4 = 16 is that of the maximum size. However, the
+                        // actual size can be smaller than the maximum size depending on how much of the colors were converted.
+                        if (paletteSize < 1)
+                            throw new InvalidDataException("Palette data is empty");
+                        else if (paletteSize > maxCI4PaletteSize && textureFormat == TextureFormat.CI4)
+                            throw new InvalidDataException(
+                                $"Palette size exceeds maximum palette size: {paletteSize} > {maxCI4PaletteSize}");
+                        else if (paletteSize > maxCI8PaletteSize && textureFormat == TextureFormat.CI8)
+                            throw new InvalidDataException(
+                                $"Palette size exceeds maximum palette size: {paletteSize} > {maxCI8PaletteSize}");
+                        else if (paletteSize > maxCI14X2PaletteSize && textureFormat == TextureFormat.CI14X2)
+                            throw new InvalidDataException(
+                                $"Palette size exceeds maximum palette size: {paletteSize} > {maxCI14X2PaletteSize}");
+                        outputWriter.Write(paletteData);
 
-                    outputWriter.Write(mipmapData);
+                        outputWriter.Write(mipmapData, 0,
+                            TextureConverter.GetTextureSize(textureFormat, input.Width, input.Height));
+                    }
+                    finally
+                    {
+                        ArrayPool<byte>.Shared.Return(mipmapData);
+                    }
                     UpdateProgress(++currentProgress, maxProgress);
                 }
                 else
                 {
-                    input.Mutate(ctx => ctx.Flip(FlipMode.Vertical));
+                    // The first mipmap is the input, which is encoded and downsampled flipped without a flipped copy of
+                    // it, so the input is left untouched. The downsampled mipmaps are already flipped. Each mipmap is
+                    // streamed to the output a few tile rows at a time while the next one is downsampled in the
+                    // background, so only two mipmaps are held at once.
+                    Image<Bgra32>? mipmap = null;
+                    Task<Image<Bgra32>>? downsampleTask = null;
+                    try
+                    {
+                        for (int mipmapLevel = 0; mipmapLevel < mipmapCount; mipmapLevel++)
+                        {
+                            Image<Bgra32> currentMipmap = mipmap ?? input;
+                            bool flipVertically = mipmap == null;
+                            if (mipmapLevel + 1 < mipmapCount)
+                                downsampleTask = Task.Run(() => ImageUtil.DownsampleMipmap(currentMipmap, flipVertically));
 
-                    ushort mipmapWidth = (ushort)input.Width,
-                        mipmapHeight = (ushort)input.Height;
-                    for (int mipmapLevel = 0; mipmapLevel < mipmapCount; mipmapLevel++)
+                            TextureConverter.EncodeTexture(currentMipmap, outputWriter.BaseStream, textureFormat,
+                                flipVertically);
+                            UpdateProgress(++currentProgress, maxProgress);
+
+                            if (downsampleTask != null)
+                            {
+                                Task<Image<Bgra32>> nextMipmapTask = downsampleTask;
+                                downsampleTask = null;
+                                Image<Bgra32> nextMipmap = nextMipmapTask.GetAwaiter().GetResult();
+                                mipmap?.Dispose();
+                                mipmap = nextMipmap;
+                            }
+                        }
+                    }
+                    finally
                     {
-                        if (mipmapLevel > 0)
+                        // Downsampling still reads the mipmap, so wait for it before disposing it
+                        if (downsampleTask != null)
                         {
-                            mipmapWidth = (ushort)(mipmapWidth / 2);
-                            mipmapHeight = (ushort)(mipmapHeight / 2);
-                            input.Mutate(x => x.Resize(new ResizeOptions()
+                            try
+                            {
+                                downsampleTask.GetAwaiter().GetResult().Dispose();
+                            }
+                            catch
                             {
-                                Mode = ResizeMode.Min,
-                                Size = new Size(mipmapWidth, mipmapHeight),
-                                Sampler = KnownResamplers.Box,
-                                Compand = true,
-                                PremultiplyAlpha = false // This is handled by the texture converter
-                            }));
+                                // Superseded by the exception that is already being thrown
+                            }
+                        }
+                        mipmap?.Dispose();
+                    }
+                }
+            }
+        }
+
+        // Writes the TXTR WriteCore would write for input, reusing the encoded tiles of previousData (the TXTR written
+        // for previousInput with the same options) where the pixels of input are the same as the ones of previousInput
+        private static void WriteIncrementalCore(Image<Bgra32> input,
+            Image<Bgra32> previousInput,
+            byte[] previousData,
+            Stream output,
+            TextureFormat textureFormat,
+            PaletteFormat paletteFormat,
+            CopyPaletteSize copyPaletteSize,
+            bool generateMipmaps,
+            int mipmapWidthLimit,
+            int mipmapHeightLimit,
+            bool keepStreamOpen,
+            UpdateProgressDelegate? progressCallback)
+        {
+            void UpdateProgress(double progress, double max) => progressCallback?.Invoke(progress, max);
+
+            TXTRHeader? previousHeader = FindReusableHeader(input, previousInput, previousData, textureFormat,
+                generateMipmaps, mipmapWidthLimit, mipmapHeightLimit);
+            if (previousHeader == null)
+            {
+                // Nothing can be reused
+                WriteCore(input, output, textureFormat, paletteFormat, copyPaletteSize, generateMipmaps,
+                    mipmapWidthLimit, mipmapHeightLimit, keepStreamOpen, progressCallback);
+                return;
+            }
+
+            using (EndianBinaryWriter outputWriter = new(output, false, Encoding.ASCII, keepStreamOpen))
+            {
+                // The header is the same as the one of previousData
+                outputWriter.Write(previousData, 0, (int)previousHeader.Mipmaps[0].Offset);
+                double maxProgress = previousHeader.Mipmaps.Count,
+                    currentProgress = 0;
+
+                // Only the mipmaps are downsampled, the tiles that did not change are copied from previousData. A mipmap
+                // only changes where the mipmap before it changed, so once one did not change the rest are copied as is.
+                // Like WriteCore, the input is encoded and downsampled flipped without a flipped copy of it.
+                bool[] changedTiles = TextureConverter.FindChangedTiles(input, previousInput, textureFormat);
+                Image<Bgra32>? mipmap = null;
+                Task<Image<Bgra32>>? downsampleTask = null;
+                try
+                {
+                    for (int mipmapLevel = 0; mipmapLevel < previousHeader.Mipmaps.Count; mipmapLevel++)
+                    {
+                        TXTRMipmapInfo mipmapInfo = previousHeader.Mipmaps[mipmapLevel];
+                        if (Array.IndexOf(changedTiles, true) < 0)
+                        {
+                            TXTRMipmapInfo lastMipmapInfo = previousHeader.Mipmaps[previousHeader.Mipmaps.Count - 1];
+                            outputWriter.Write(previousData, (int)mipmapInfo.Offset,
+                                (int)(lastMipmapInfo.Offset + lastMipmapInfo.Size - mipmapInfo.Offset));
+                            UpdateProgress(maxProgress, maxProgress);
+                            break;
                         }
 
-                        TextureConverter.EncodeTexture(input, out byte[] mipmapData, textureFormat);
-                        outputWriter.Write(mipmapData);
+                        Image<Bgra32> currentMipmap = mipmap ?? input;
+                        bool flipVertically = mipmap == null;
+                        if (mipmapLevel + 1 < previousHeader.Mipmaps.Count)
+                            downsampleTask = Task.Run(() => ImageUtil.DownsampleMipmap(currentMipmap, flipVertically));
+
+                        byte[] mipmapData = ArrayPool<byte>.Shared.Rent(mipmapInfo.Size);
+                        try
+                        {
+                            Array.Copy(previousData, mipmapInfo.Offset, mipmapData, 0, mipmapInfo.Size);
+                            TextureConverter.EncodeChangedTiles(currentMipmap, mipmapData, textureFormat, changedTiles,
+                                flipVertically);
+                            outputWriter.Write(mipmapData, 0, mipmapInfo.Size);
+                        }
+                        finally
+                        {
+                            ArrayPool<byte>.Shared.Return(mipmapData);
+                        }
                         UpdateProgress(++currentProgress, maxProgress);
+
+                        if (downsampleTask != null)
+                        {
+                            TXTRMipmapInfo nextMipmapInfo = previousHeader.Mipmaps[mipmapLevel + 1];
+                            changedTiles = TextureConverter.GetMipmapChangedTiles(changedTiles, textureFormat,
+                                mipmapInfo.Width, mipmapInfo.Height, nextMipmapInfo.Width, nextMipmapInfo.Height);
+                            Task<Image<Bgra32>> nextMipmapTask = downsampleTask;
+                            downsampleTask = null;
+                            Image<Bgra32> nextMipmap = nextMipmapTask.GetAwaiter().GetResult();
+                            mipmap?.Dispose();
+                            mipmap = nextMipmap;
+                        }
+                    }
+                }
+                finally
+                {
+                    // Downsampling still reads the mipmap, so wait for it before disposing it
+                    if (downsampleTask != null)
+                    {
+                        try
+                        {
+                            downsampleTask.GetAwaiter().GetResult().Dispose();
+                        }
+                        catch
+                        {
+                            // Superseded by the exception that is already being thrown
+                        }
                     }
+                    mipmap?.Dispose();
+                }
+            }
+        }
+
+        // The header of previousData if its tiles can be reused to write input, else null. Indexed formats are never
+        // reused since their palette is made from the whole image.
+        private static TXTRHeader? FindReusableHeader(Image<Bgra32> input,
+            Image<Bgra32> previousInput,
+            byte[] previousData,
+            TextureFormat textureFormat,
+            bool generateMipmaps,
+            int mipmapWidthLimit,
+            int mipmapHeightLimit)
+        {
+            if (!textureFormat.IsDefined() || textureFormat == TextureFormat.CI4 || textureFormat == TextureFormat.CI8
+                || textureFormat == TextureFormat.CI14X2 || input.Width != previousInput.Width
+                || input.Height != previousInput.Height)
+                return null;
+
+            TXTRHeader previousHeader;
+            try
+            {
+                previousHeader = ReadHeaderCore(new MemoryStream(previousData, false), false);
+            }
+            catch (Exception ex) when (ex is InvalidDataException || ex is EndOfStreamException)
+            {
+                return null;
+            }
+
+            uint mipmapCount = generateMipmaps
+                ? CountWriteMipmaps(input.Width, input.Height, mipmapWidthLimit, mipmapHeightLimit) : 1;
+            TXTRMipmapInfo lastMipmapInfo = previousHeader.Mipmaps[previousHeader.Mipmaps.Count - 1];
+            return previousHeader.TextureFormat == textureFormat && previousHeader.Width == input.Width
+                && previousHeader.Height == input.Height && previousHeader.MipmapCount == mipmapCount
+                && previousHeader.Mipmaps.Count == mipmapCount
+                && lastMipmapInfo.Offset + lastMipmapInfo.Size <= previousData.Length
+                    ? previousHeader : null;
+        }
+
+        // DDS_HEADER and DDS_PIXELFORMAT values used by BC1 (DXT1) DDS files
+        private const uint DDS_MAGIC = 0x20534444; // "DDS "
+        private const uint DDS_HEADERSIZE = 124;
+        private const uint DDS_PIXELFORMATSIZE = 32;
+        private const uint DDSD_CAPS = 0x1, DDSD_HEIGHT = 0x2, DDSD_WIDTH = 0x4, DDSD_PIXELFORMAT = 0x1000,
+            DDSD_MIPMAPCOUNT = 0x20000, DDSD_LINEARSIZE = 0x80000;
+        private const uint DDPF_FOURCC = 0x4;
+        private const uint FOURCC_DXT1 = 0x31545844; // "DXT1"
+        private const uint DDSCAPS_COMPLEX = 0x8, DDSCAPS_TEXTURE = 0x1000, DDSCAPS_MIPMAP = 0x400000;
+        private const uint DDSCAPS2_CUBEMAP = 0x200, DDSCAPS2_VOLUME = 0x200000;
+
+        private static void TranscodeToDDSCore(Stream input,
+            Stream output,
+            bool includeMipmaps,
+            bool keepStreamsOpen)
+        {
+            try
+            {
+                TXTRHeader header = ReadHeaderCore(input, true);
+                if (header.TextureFormat != TextureFormat.CMPR)
+                    throw new InvalidDataException(
+                        $"Only CMPR can be transcoded to DDS: '{header.TextureFormat}' (0x{header.TextureFormat.AsUInt32():X8})");
+                int mipmapCount = includeMipmaps ? header.Mipmaps.Count : 1;
+                for (int mipmapLevel = 0; mipmapLevel < mipmapCount; mipmapLevel++)
+                    if (!TextureConverter.CanTranscodeCMPR(header.Mipmaps[mipmapLevel].Height))
+                        throw new InvalidDataException(
+                            $"Mipmap {mipmapLevel + 1} height must be less than 4 or a multiple of 4 to be transcoded: {header.Mipmaps[mipmapLevel].Height}");
+
+                using (EndianBinaryReader inputReader = new(input, false, Encoding.ASCII, true))
+                using (EndianBinaryWriter outputWriter = new(output, true, Encoding.ASCII, true))
+                {
+                    outputWriter.Write(DDS_MAGIC);
+                    outputWriter.Write(DDS_HEADERSIZE);
+                    outputWriter.Write(DDSD_CAPS | DDSD_HEIGHT | DDSD_WIDTH | DDSD_PIXELFORMAT | DDSD_LINEARSIZE
+                        | (mipmapCount > 1 ? DDSD_MIPMAPCOUNT : 0));
+                    outputWriter.Write((uint)header.Height);
+                    outputWriter.Write((uint)header.Width);
+                    outputWriter.Write((uint)TextureConverter.GetBC1Size(header.Width, header.Height));
+                    outputWriter.Write(0U); // Depth
+                    outputWriter.Write((uint)mipmapCount);
+                    for (int i = 0; i < 11; i++)
+                        outputWriter.Write(0U); // Reserved
+                    outputWriter.Write(DDS_PIXELFORMATSIZE);
+                    outputWriter.Write(DDPF_FOURCC);
+                    outputWriter.Write(FOURCC_DXT1);
+                    for (int i = 0; i < 5; i++)
+                        outputWriter.Write(0U); // RGB bit count and masks
+                    outputWriter.Write(DDSCAPS_TEXTURE | (mipmapCount > 1 ? DDSCAPS_COMPLEX | DDSCAPS_MIPMAP : 0));
+                    for (int i = 0; i < 4; i++)
+                        outputWriter.Write(0U); // Caps 2 to 4 and reserved
+
+                    // The mipmaps directly follow the header
+                    for (int mipmapLevel = 0; mipmapLevel < mipmapCount; mipmapLevel++)
+                    {
+                        TXTRMipmapInfo mipmap = header.Mipmaps[mipmapLevel];
+                        int bc1Size = TextureConverter.GetBC1Size(mipmap.Width, mipmap.Height);
+                        byte[] mipmapData = RentAndReadBytes(inputReader, mipmap.Size);
+                        byte[] bc1Data = ArrayPool<byte>.Shared.Rent(bc1Size);
+                        try
+                        {
+                            TextureConverter.CMPRToBC1(mipmapData.AsSpan(0, mipmap.Size), bc1Data.AsSpan(0, bc1Size),
+                                mipmap.Width, mipmap.Height);
+                            outputWriter.Write(bc1Data, 0, bc1Size);
+                        }
+                        finally
+                        {
+                            ArrayPool<byte>.Shared.Return(bc1Data);
+                            ArrayPool<byte>.Shared.Return(mipmapData);
+                        }
+                    }
+                }
+            }
+            finally
+            {
+                if (!keepStreamsOpen)
+                {
+                    input.Dispose();
+                    output.Dispose();
+                }
+            }
+        }
+
+        private static void TranscodeFromDDSCore(Stream input,
+            Stream output,
+            bool keepStreamsOpen)
+        {
+            try
+            {
+                using (EndianBinaryReader inputReader = new(input, true, Encoding.ASCII, true))
+                using (EndianBinaryWriter outputWriter = new(output, false, Encoding.ASCII, true))
+                {
+                    if (inputReader.ReadUInt32() != DDS_MAGIC)
+                        throw new InvalidDataException("Not a DDS file");
+                    uint headerSize = inputReader.ReadUInt32();
+                    if (headerSize != DDS_HEADERSIZE)
+                        throw new InvalidDataException($"DDS header size must be {DDS_HEADERSIZE}: {headerSize}");
+                    uint flags = inputReader.ReadUInt32();
+                    uint height = inputReader.ReadUInt32();
+                    if (height < 1 || height > ushort.MaxValue)
+                        throw new InvalidDataException($"DDS height must be greater than 0 and at most {ushort.MaxValue}: {height}");
+                    uint width = inputReader.ReadUInt32();
+                    if (width < 1 || width > ushort.MaxValue)
+                        throw new InvalidDataException($"DDS width must be greater than 0 and at most {ushort.MaxValue}: {width}");
+                    inputReader.ReadUInt32(); // Pitch or linear size
+                    inputReader.ReadUInt32(); // Depth
+                    uint ddsMipmapCount = inputReader.ReadUInt32();
+                    if ((flags & DDSD_MIPMAPCOUNT) == 0 || ddsMipmapCount < 1)
+                        ddsMipmapCount = 1;
+                    for (int i = 0; i < 11; i++)
+                        inputReader.ReadUInt32(); // Reserved
+                    uint pixelFormatSize = inputReader.ReadUInt32();
+                    if (pixelFormatSize != DDS_PIXELFORMATSIZE)
+                        throw new InvalidDataException($"DDS pixel format size must be {DDS_PIXELFORMATSIZE}: {pixelFormatSize}");
+                    uint pixelFormatFlags = inputReader.ReadUInt32();
+                    uint fourCC = inputReader.ReadUInt32();
+                    if ((pixelFormatFlags & DDPF_FOURCC) == 0 || fourCC != FOURCC_DXT1)
+                        throw new InvalidDataException("Only BC1 (DXT1) DDS files can be transcoded to CMPR");
+                    for (int i = 0; i < 5; i++)
+                        inputReader.ReadUInt32(); // RGB bit count and masks
+                    inputReader.ReadUInt32(); // Caps
+                    if ((inputReader.ReadUInt32() & (DDSCAPS2_CUBEMAP | DDSCAPS2_VOLUME)) != 0)
+                        throw new InvalidDataException("Cube map and volume DDS files cannot be transcoded to CMPR");
+                    for (int i = 0; i < 3; i++)
+                        inputReader.ReadUInt32(); // Caps 3 and 4 and reserved
+
+                    // Mipmaps halve until either side would be 0 in a TXTR, while a DDS keeps that side at 1. Those
+                    // mipmaps of the DDS cannot be stored in a TXTR and are left out.
+                    uint mipmapCount = 0;
+                    while (mipmapCount < ddsMipmapCount && (width >> (int)mipmapCount) > 0 && (height >> (int)mipmapCount) > 0)
+                    {
+                        int mipmapHeight = (int)(height >> (int)mipmapCount);
+                        if (!TextureConverter.CanTranscodeCMPR(mipmapHeight))
+                            throw new InvalidDataException(
+                                $"Mipmap {mipmapCount + 1} height must be less than 4 or a multiple of 4 to be transcoded: {mipmapHeight}");
+                        mipmapCount++;
+                    }
+
+                    outputWriter.Write(TextureFormat.CMPR.AsUInt32());
+                    outputWriter.Write((ushort)width);
+                    outputWriter.Write((ushort)height);
+                    outputWriter.Write(mipmapCount);
+
+                    for (int mipmapLevel = 0; mipmapLevel < mipmapCount; mipmapLevel++)
+                    {
+                        int mipmapWidth = (int)(width >> mipmapLevel),
+                            mipmapHeight = (int)(height >> mipmapLevel);
+                        int bc1Size = TextureConverter.GetBC1Size(mipmapWidth, mipmapHeight);
+                        int mipmapSize = TextureConverter.GetTextureSize(TextureFormat.CMPR, mipmapWidth, mipmapHeight);
+                        byte[] bc1Data = RentAndReadBytes(inputReader, bc1Size);
+                        // Cleared so the blocks of the tiles outside of the image are empty
+                        byte[] mipmapData = TextureConverter.RentTextureBuffer(TextureFormat.CMPR, mipmapWidth, mipmapHeight);
+                        try
+                        {
+                            TextureConverter.BC1ToCMPR(bc1Data.AsSpan(0, bc1Size), mipmapData.AsSpan(0, mipmapSize),
+                                mipmapWidth, mipmapHeight);
+                            outputWriter.Write(mipmapData, 0, mipmapSize);
+                        }
+                        finally
+                        {
+                            ArrayPool<byte>.Shared.Return(mipmapData);
+                            ArrayPool<byte>.Shared.Return(bc1Data);
+                        }
+                    }
+                }
+            }
+            finally
+            {
+                if (!keepStreamsOpen)
+                {
+                    input.Dispose();
+                    output.Dispose();
                 }
             }
         }
@@ -19,6 +19,7 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 using SixLabors.ImageSharp.PixelFormats;
 using SixLabors.ImageSharp;
 using System;
+using System.Collections.Generic;
 using System.IO;
 using libWiiSharp.Formats;
 using libWiiSharp;
@@ -41,6 +42,24 @@ namespace TXTRFileTypeLib
         [Description("Progress method contract for this API")]
         public delegate void UpdateProgressDelegate(double progress, double max);
 
+        /// <summary>
+        /// The maximum count of threads used at the same time to convert a texture (and to decode mipmaps in parallel).<br/>
+        /// -1 (the default) lets the thread pool decide, 1 converts on the calling thread only.
+        /// </summary>
+        /// <exception cref="ArgumentOutOfRangeException">If the value is 0 or less than -1</exception>
+        [Description("The maximum count of threads used at the same time to convert a texture")]
+        public static int MaxDegreeOfParallelism
+        {
+            get => TextureConverter.ParallelOptions.MaxDegreeOfParallelism;
+            set
+            {
+                if (value == 0 || value < -1)
+                    throw new ArgumentOutOfRangeException(nameof(value), value, "Must be -1 or greater than 0");
+                // Replaced instead of modified so a conversion already running keeps its options
+                TextureConverter.ParallelOptions = new() { MaxDegreeOfParallelism = value };
+            }
+        }
+
         /// <summary>
         /// Read a TXTR from a byte array.<br/>
         /// The returned image array will always be of a count of 1 unless <paramref name="readMipmaps"/> is <see langword="true"/>.<br/>
@@ -49,25 +68,47 @@ namespace TXTRFileTypeLib
         /// <param name="inputData">The input byte array</param>
         /// <param name="readMipmaps">Read all mipmaps from the TXTR (else only read the first)</param>
         /// <param name="progressCallback">Callback where mipmap read progress will be reported to</param>
+        /// <param name="decodeInParallel">
+        /// Decode all mipmaps at the same time on the thread pool (progress is reported as each mipmap finishes, in any order)
+        /// </param>
         /// <returns>A <see cref="Image{Bgra32}"/> array of all mipmaps read</returns>
         /// <exception cref="ArgumentNullException">If <paramref name="inputData"/> is <see langword="null"/></exception>
         [Description("Read a TXTR from a byte array")]
         public static Image<Bgra32>[] Read(byte[] inputData,
             bool readMipmaps = false,
-            UpdateProgressDelegate? progressCallback = null)
+            UpdateProgressDelegate? progressCallback = null,
+            bool decodeInParallel = false)
         {
             if (inputData != null)
             {
-                using (var inputStream = new MemoryStream())
-                {
-                    inputStream.Write(inputData);
-                    return ReadCore(inputStream, readMipmaps, false, progressCallback);
-                }
+                return ReadCore(inputData.AsMemory(), readMipmaps, progressCallback, decodeInParallel);
             }
             else
                 throw new ArgumentNullException(nameof(inputData));
         }
 
+        /// <summary>
+        /// Read a TXTR from memory (such as a slice of an archive or a memory-mapped file).<br/>
+        /// The mipmaps are decoded directly from <paramref name="inputData"/> without being copied.<br/>
+        /// The returned image array will always be of a count of 1 unless <paramref name="readMipmaps"/> is <see langword="true"/>.<br/>
+        /// Strange image sizes and high mipmap counts might create invalid textures and/or throw exceptions.
+        /// </summary>
+        /// <param name="inputData">The input memory</param>
+        /// <param name="readMipmaps">Read all mipmaps from the TXTR (else only read the first)</param>
+        /// <param name="progressCallback">Callback where mipmap read progress will be reported to</param>
+        /// <param name="decodeInParallel">
+        /// Decode all mipmaps at the same time on the thread pool (progress is reported as each mipmap finishes, in any order)
+        /// </param>
+        /// <returns>A <see cref="Image{Bgra32}"/> array of all mipmaps read</returns>
+        [Description("Read a TXTR from memory")]
+        public static Image<Bgra32>[] Read(ReadOnlyMemory<byte> inputData,
+            bool readMipmaps = false,
+            UpdateProgressDelegate? progressCallback = null,
+            bool decodeInParallel = false)
+        {
+            return ReadCore(inputData, readMipmaps, progressCallback, decodeInParallel);
+        }
+
         /// <summary>
         /// Read a TXTR from a file.<br/>
         /// The returned image array will always be of a count of 1 unless <paramref name="readMipmaps"/> is <see langword="true"/>.<br/>
@@ -76,19 +117,23 @@ namespace TXTRFileTypeLib
         /// <param name="inputFilePath">The input file path</param>
         /// <param name="readMipmaps">Read all mipmaps from the TXTR (else only read the first)</param>
         /// <param name="progressCallback">Callback where mipmap read progress will be reported to</param>
+        /// <param name="decodeInParallel">
+        /// Decode all mipmaps at the same time on the thread pool (progress is reported as each mipmap finishes, in any order)
+        /// </param>
         /// <returns>A <see cref="Image{Bgra32}"/> array of all mipmaps read</returns>
         /// <exception cref="ArgumentNullException">If <paramref name="inputFilePath"/> is <see langword="null"/></exception>
         /// <exception cref="ArgumentException">If <paramref name="inputFilePath"/> is empty</exception>
         [Description("Read a TXTR from a file")]
         public static Image<Bgra32>[] Read(string inputFilePath,
             bool readMipmaps = false,
-            UpdateProgressDelegate? progressCallback = null)
+            UpdateProgressDelegate? progressCallback = null,
+            bool decodeInParallel = false)
         {
             if (!string.IsNullOrWhiteSpace(inputFilePath))
             {
                 using (FileStream inputStream = File.OpenRead(inputFilePath))
                 {
-                    return ReadCore(inputStream, readMipmaps, false, progressCallback);
+                    return ReadCore(inputStream, readMipmaps, false, progressCallback, decodeInParallel);
                 }
             }
             else
@@ -107,29 +152,344 @@ namespace TXTRFileTypeLib
         /// <param name="readMipmaps">Read all mipmaps from the TXTR (else only read the first)</param>
         /// <param name="keepStreamOpen">Keep the stream open (do not auto close stream)</param>
         /// <param name="progressCallback">Callback where mipmap read progress will be reported to</param>
+        /// <param name="decodeInParallel">
+        /// Decode all mipmaps at the same time on the thread pool (progress is reported as each mipmap finishes, in any order)
+        /// </param>
         /// <returns>A <see cref="Image{Bgra32}"/> array of all mipmaps read</returns>
         /// <exception cref="ArgumentNullException">If <paramref name="inputSream"/> is <see langword="null"/></exception>
         [Description("Read a TXTR from a stream")]
         public static Image<Bgra32>[] Read(Stream inputSream,
             bool readMipmaps = false,
             bool keepStreamOpen = false,
+            UpdateProgressDelegate? progressCallback = null,
+            bool decodeInParallel = false)
+        {
+            if (inputSream != null)
+            {
+                return ReadCore(inputSream, readMipmaps, keepStreamOpen, progressCallback, decodeInParallel);
+            }
+            else
+                throw new ArgumentNullException(nameof(inputSream));
+        }
+
+        /// <summary>
+        /// Read the header of a TXTR from a byte array.<br/>
+        /// Only the header is read and validated (the same as <see cref="Read(byte[], bool, UpdateProgressDelegate?, bool)"/>),
+        /// the palette and mipmaps are located by their sizes and are not decoded.
+        /// </summary>
+        /// <param name="inputData">The input byte array</param>
+        /// <returns>The header of the TXTR</returns>
+        /// <exception cref="ArgumentNullException">If <paramref name="inputData"/> is <see langword="null"/></exception>
+        [Description("Read the header of a TXTR from a byte array")]
+        public static TXTRHeader ReadHeader(byte[] inputData)
+        {
+            if (inputData != null)
+            {
+                using (var inputStream = new MemoryStream(inputData, false))
+                {
+                    return ReadHeaderCore(inputStream, false);
+                }
+            }
+            else
+                throw new ArgumentNullException(nameof(inputData));
+        }
+
+        /// <summary>
+        /// Read the header of a TXTR from a file.<br/>
+        /// Only the header is read and validated (the same as <see cref="Read(string, bool, UpdateProgressDelegate?, bool)"/>),
+        /// the palette and mipmaps are located by their sizes and are not decoded.
+        /// </summary>
+        /// <param name="inputFilePath">The input file path</param>
+        /// <returns>The header of the TXTR</returns>
+        /// <exception cref="ArgumentNullException">If <paramref name="inputFilePath"/> is <see langword="null"/></exception>
+        /// <exception cref="ArgumentException">If <paramref name="inputFilePath"/> is empty</exception>
+        [Description("Read the header of a TXTR from a file")]
+        public static TXTRHeader ReadHeader(string inputFilePath)
+        {
+            if (!string.IsNullOrWhiteSpace(inputFilePath))
+            {
+                using (FileStream inputStream = File.OpenRead(inputFilePath))
+                {
+                    return ReadHeaderCore(inputStream, false);
+                }
+            }
+            else
+                throw inputFilePath == null
+                    ? new ArgumentNullException(nameof(inputFilePath))
+                    : new ArgumentException("Path is empty", nameof(inputFilePath));
+        }
+
+        /// <summary>
+        /// Read the header of a TXTR from a stream.<br/>
+        /// Only the header is read and validated (the same as <see cref="Read(Stream, bool, bool, UpdateProgressDelegate?, bool)"/>),
+        /// the palette and mipmaps are located by their sizes and are not decoded. The offsets are counted from the
+        /// position of <paramref name="inputSream"/> when this method is called.<br/>
+        /// <paramref name="inputSream"/> will be automatically closed unless <paramref name="keepStreamOpen"/> is <see langword="true"/>.
+        /// </summary>
+        /// <param name="inputSream">The input stream</param>
+        /// <param name="keepStreamOpen">Keep the stream open (do not auto close stream)</param>
+        /// <returns>The header of the TXTR</returns>
+        /// <exception cref="ArgumentNullException">If <paramref name="inputSream"/> is <see langword="null"/></exception>
+        [Description("Read the header of a TXTR from a stream")]
+        public static TXTRHeader ReadHeader(Stream inputSream, bool keepStreamOpen = false)
+        {
+            if (inputSream != null)
+            {
+                return ReadHeaderCore(inputSream, keepStreamOpen);
+            }
+            else
+                throw new ArgumentNullException(nameof(inputSream));
+        }
+
+        /// <summary>
+        /// Read one mipmap of a TXTR from a byte array.<br/>
+        /// The mipmaps before it are skipped without being read or decoded.
+        /// </summary>
+        /// <param name="inputData">The input byte array</param>
+        /// <param name="mipmapLevel">The index of the mipmap to read (0 is the first mipmap)</param>
+        /// <param name="progressCallback">Callback where mipmap read progress will be reported to</param>
+        /// <returns>A <see cref="Image{Bgra32}"/> of the mipmap read</returns>
+        /// <exception cref="ArgumentNullException">If <paramref name="inputData"/> is <see langword="null"/></exception>
+        /// <exception cref="ArgumentOutOfRangeException">If <paramref name="mipmapLevel"/> is not a mipmap of the TXTR</exception>
+        [Description("Read one mipmap of a TXTR from a byte array")]
+        public static Image<Bgra32> ReadMipmap(byte[] inputData,
+            int mipmapLevel,
+            UpdateProgressDelegate? progressCallback = null)
+        {
+            if (inputData != null)
+            {
+                using (var inputStream = new MemoryStream(inputData, false))
+                {
+                    return ReadMipmapCore(inputStream, _ => mipmapLevel, false, progressCallback);
+                }
+            }
+            else
+                throw new ArgumentNullException(nameof(inputData));
+        }
+
+        /// <summary>
+        /// Read one mipmap of a TXTR from a file.<br/>
+        /// The mipmaps before it are skipped without being read or decoded.
+        /// </summary>
+        /// <param name="inputFilePath">The input file path</param>
+        /// <param name="mipmapLevel">The index of the mipmap to read (0 is the first mipmap)</param>
+        /// <param name="progressCallback">Callback where mipmap read progress will be reported to</param>
+        /// <returns>A <see cref="Image{Bgra32}"/> of the mipmap read</returns>
+        /// <exception cref="ArgumentNullException">If <paramref name="inputFilePath"/> is <see langword="null"/></exception>
+        /// <exception cref="ArgumentException">If <paramref name="inputFilePath"/> is empty</exception>
+        /// <exception cref="ArgumentOutOfRangeException">If <paramref name="mipmapLevel"/> is not a mipmap of the TXTR</exception>
+        [Description("Read one mipmap of a TXTR from a file")]
+        public static Image<Bgra32> ReadMipmap(string inputFilePath,
+            int mipmapLevel,
+            UpdateProgressDelegate? progressCallback = null)
+        {
+            if (!string.IsNullOrWhiteSpace(inputFilePath))
+            {
+                using (FileStream inputStream = File.OpenRead(inputFilePath))
+                {
+                    return ReadMipmapCore(inputStream, _ => mipmapLevel, false, progressCallback);
+                }
+            }
+            else
+                throw inputFilePath == null
+                    ? new ArgumentNullException(nameof(inputFilePath))
+                    : new ArgumentException("Path is empty", nameof(inputFilePath));
+        }
+
+        /// <summary>
+        /// Read one mipmap of a TXTR from a stream.<br/>
+        /// The mipmaps before it are skipped without being read or decoded (by seeking if <paramref name="inputSream"/> can seek).<br/>
+        /// <paramref name="inputSream"/> will be automatically closed unless <paramref name="keepStreamOpen"/> is <see langword="true"/>.
+        /// </summary>
+        /// <param name="inputSream">The input stream</param>
+        /// <param name="mipmapLevel">The index of the mipmap to read (0 is the first mipmap)</param>
+        /// <param name="keepStreamOpen">Keep the stream open (do not auto close stream)</param>
+        /// <param name="progressCallback">Callback where mipmap read progress will be reported to</param>
+        /// <returns>A <see cref="Image{Bgra32}"/> of the mipmap read</returns>
+        /// <exception cref="ArgumentNullException">If <paramref name="inputSream"/> is <see langword="null"/></exception>
+        /// <exception cref="ArgumentOutOfRangeException">If <paramref name="mipmapLevel"/> is not a mipmap of the TXTR</exception>
+        [Description("Read one mipmap of a TXTR from a stream")]
+        public static Image<Bgra32> ReadMipmap(Stream inputSream,
+            int mipmapLevel,
+            bool keepStreamOpen = false,
             UpdateProgressDelegate? progressCallback = null)
         {
             if (inputSream != null)
             {
-                return ReadCore(inputSream, readMipmaps, keepStreamOpen, progressCallback);
+                return ReadMipmapCore(inputSream, _ => mipmapLevel, keepStreamOpen, progressCallback);
             }
             else
                 throw new ArgumentNullException(nameof(inputSream));
         }
 
+        /// <summary>
+        /// Read the smallest mipmap of a TXTR that is at least of the specified dimensions from a byte array.<br/>
+        /// If even the first mipmap is smaller, the first mipmap is read. See: <see cref="TXTRHeader.FindMipmapLevel(int, int)"/><br/>
+        /// The mipmaps before it are skipped without being read or decoded.
+        /// </summary>
+        /// <param name="inputData">The input byte array</param>
+        /// <param name="minWidth">The minimum width of the mipmap</param>
+        /// <param name="minHeight">The minimum height of the mipmap</param>
+        /// <param name="progressCallback">Callback where mipmap read progress will be reported to</param>
+        /// <returns>A <see cref="Image{Bgra32}"/> of the mipmap read</returns>
+        /// <exception cref="ArgumentNullException">If <paramref name="inputData"/> is <see langword="null"/></exception>
+        /// <exception cref="ArgumentOutOfRangeException">If <paramref name="minWidth"/> or <paramref name="minHeight"/> is less than 0</exception>
+        [Description("Read the smallest mipmap of a TXTR that is at least of the specified dimensions from a byte array")]
+        public static Image<Bgra32> ReadMipmapForSize(byte[] inputData,
+            int minWidth,
+            int minHeight,
+            UpdateProgressDelegate? progressCallback = null)
+        {
+            if (inputData != null)
+            {
+                using (var inputStream = new MemoryStream(inputData, false))
+                {
+                    return ReadMipmapCore(inputStream, header => header.FindMipmapLevel(minWidth, minHeight),
+                        false, progressCallback);
+                }
+            }
+            else
+                throw new ArgumentNullException(nameof(inputData));
+        }
+
+        /// <summary>
+        /// Read the smallest mipmap of a TXTR that is at least of the specified dimensions from a file.<br/>
+        /// If even the first mipmap is smaller, the first mipmap is read. See: <see cref="TXTRHeader.FindMipmapLevel(int, int)"/><br/>
+        /// The mipmaps before it are skipped without being read or decoded.
+        /// </summary>
+        /// <param name="inputFilePath">The input file path</param>
+        /// <param name="minWidth">The minimum width of the mipmap</param>
+        /// <param name="minHeight">The minimum height of the mipmap</param>
+        /// <param name="progressCallback">Callback where mipmap read progress will be reported to</param>
+        /// <returns>A <see cref="Image{Bgra32}"/> of the mipmap read</returns>
+        /// <exception cref="ArgumentNullException">If <paramref name="inputFilePath"/> is <see langword="null"/></exception>
+        /// <exception cref="ArgumentException">If <paramref name="inputFilePath"/> is empty</exception>
+        /// <exception cref="ArgumentOutOfRangeException">If <paramref name="minWidth"/> or <paramref name="minHeight"/> is less than 0</exception>
+        [Description("Read the smallest mipmap of a TXTR that is at least of the specified dimensions from a file")]
+        public static Image<Bgra32> ReadMipmapForSize(string inputFilePath,
+            int minWidth,
+            int minHeight,
+            UpdateProgressDelegate? progressCallback = null)
+        {
+            if (!string.IsNullOrWhiteSpace(inputFilePath))
+            {
+                using (FileStream inputStream = File.OpenRead(inputFilePath))
+                {
+                    return ReadMipmapCore(inputStream, header => header.FindMipmapLevel(minWidth, minHeight),
+                        false, progressCallback);
+                }
+            }
+            else
+                throw inputFilePath == null
+                    ? new ArgumentNullException(nameof(inputFilePath))
+                    : new ArgumentException("Path is empty", nameof(inputFilePath));
+        }
+
+        /// <summary>
+        /// Read the smallest mipmap of a TXTR that is at least of the specified dimensions from a stream.<br/>
+        /// If even the first mipmap is smaller, the first mipmap is read. See: <see cref="TXTRHeader.FindMipmapLevel(int, int)"/><br/>
+        /// The mipmaps before it are skipped without being read or decoded (by seeking if <paramref name="inputSream"/> can seek).<br/>
+        /// <paramref name="inputSream"/> will be automatically closed unless <paramref name="keepStreamOpen"/> is <see langword="true"/>.
+        /// </summary>
+        /// <param name="inputSream">The input stream</param>
+        /// <param name="minWidth">The minimum width of the mipmap</param>
+        /// <param name="minHeight">The minimum height of the mipmap</param>
+        /// <param name="keepStreamOpen">Keep the stream open (do not auto close stream)</param>
+        /// <param name="progressCallback">Callback where mipmap read progress will be reported to</param>
+        /// <returns>A <see cref="Image{Bgra32}"/> of the mipmap read</returns>
+        /// <exception cref="ArgumentNullException">If <paramref name="inputSream"/> is <see langword="null"/></exception>
+        /// <exception cref="ArgumentOutOfRangeException">If <paramref name="minWidth"/> or <paramref name="minHeight"/> is less than 0</exception>
+        [Description("Read the smallest mipmap of a TXTR that is at least of the specified dimensions from a stream")]
+        public static Image<Bgra32> ReadMipmapForSize(Stream inputSream,
+            int minWidth,
+            int minHeight,
+            bool keepStreamOpen = false,
+            UpdateProgressDelegate? progressCallback = null)
+        {
+            if (inputSream != null)
+            {
+                return ReadMipmapCore(inputSream, header => header.FindMipmapLevel(minWidth, minHeight),
+                    keepStreamOpen, progressCallback);
+            }
+            else
+                throw new ArgumentNullException(nameof(inputSream));
+        }
+
+        /// <summary>
+        /// Read one mipmap of a TXTR from a file as horizontal bands of decoded rows, one band at a time.<br/>
+        /// Only one band is decoded and held at a time, so a mipmap of any size can be processed in constant memory.
+        /// The bands are read in the order they are stored in: from the bottom of the mipmap to the top for non-indexed formats,
+        /// and from the top to the bottom for indexed formats. See: <see cref="TXTRBand.Y"/><br/>
+        /// The file is opened when the enumeration starts and closed when it ends or its enumerator is disposed.
+        /// Every band must be disposed by the caller.
+        /// </summary>
+        /// <param name="inputFilePath">The input file path</param>
+        /// <param name="mipmapLevel">The index of the mipmap to read (0 is the first mipmap)</param>
+        /// <param name="tileRowsPerBand">The count of GX tile rows (4 or 8 pixel rows depending on the texture format) in a band</param>
+        /// <returns>The bands of the mipmap, read and decoded as they are enumerated</returns>
+        /// <exception cref="ArgumentNullException">If <paramref name="inputFilePath"/> is <see langword="null"/></exception>
+        /// <exception cref="ArgumentException">If <paramref name="inputFilePath"/> is empty</exception>
+        /// <exception cref="ArgumentOutOfRangeException">
+        /// If <paramref name="tileRowsPerBand"/> is less than 1, or (once enumerated) if <paramref name="mipmapLevel"/> is not a mipmap of the TXTR
+        /// </exception>
+        [Description("Read one mipmap of a TXTR from a file as horizontal bands of decoded rows, one band at a time")]
+        public static IEnumerable<TXTRBand> ReadBands(string inputFilePath,
+            int mipmapLevel = 0,
+            int tileRowsPerBand = 1)
+        {
+            if (!string.IsNullOrWhiteSpace(inputFilePath) && tileRowsPerBand >= 1)
+            {
+                return ReadBandsCore(inputFilePath, mipmapLevel, tileRowsPerBand);
+            }
+            else if (tileRowsPerBand < 1)
+                throw new ArgumentOutOfRangeException(nameof(tileRowsPerBand), tileRowsPerBand, "Must be 1 or greater");
+            else
+                throw inputFilePath == null
+                    ? new ArgumentNullException(nameof(inputFilePath))
+                    : new ArgumentException("Path is empty", nameof(inputFilePath));
+        }
+
+        /// <summary>
+        /// Read one mipmap of a TXTR from a stream as horizontal bands of decoded rows, one band at a time.<br/>
+        /// Only one band is decoded and held at a time, so a mipmap of any size can be processed in constant memory.
+        /// The bands are read in the order they are stored in: from the bottom of the mipmap to the top for non-indexed formats,
+        /// and from the top to the bottom for indexed formats. See: <see cref="TXTRBand.Y"/><br/>
+        /// The mipmaps before it are skipped without being read or decoded (by seeking if <paramref name="inputSream"/> can seek).<br/>
+        /// <paramref name="inputSream"/> will be automatically closed when the enumeration ends or its enumerator is disposed unless
+        /// <paramref name="keepStreamOpen"/> is <see langword="true"/>. Every band must be disposed by the caller.
+        /// </summary>
+        /// <param name="inputSream">The input stream</param>
+        /// <param name="mipmapLevel">The index of the mipmap to read (0 is the first mipmap)</param>
+        /// <param name="tileRowsPerBand">The count of GX tile rows (4 or 8 pixel rows depending on the texture format) in a band</param>
+        /// <param name="keepStreamOpen">Keep the stream open (do not auto close stream)</param>
+        /// <returns>The bands of the mipmap, read and decoded as they are enumerated</returns>
+        /// <exception cref="ArgumentNullException">If <paramref name="inputSream"/> is <see langword="null"/></exception>
+        /// <exception cref="ArgumentOutOfRangeException">
+        /// If <paramref name="tileRowsPerBand"/> is less than 1, or (once enumerated) if <paramref name="mipmapLevel"/> is not a mipmap of the TXTR
+        /// </exception>
+        [Description("Read one mipmap of a TXTR from a stream as horizontal bands of decoded rows, one band at a time")]
+        public static IEnumerable<TXTRBand> ReadBands(Stream inputSream,
+            int mipmapLevel = 0,
+            int tileRowsPerBand = 1,
+            bool keepStreamOpen = false)
+        {
+            if (inputSream != null && tileRowsPerBand >= 1)
+            {
+                return ReadBandsCore(inputSream, mipmapLevel, tileRowsPerBand, keepStreamOpen);
+            }
+            else if (tileRowsPerBand < 1)
+                throw new ArgumentOutOfRangeException(nameof(tileRowsPerBand), tileRowsPerBand, "Must be 1 or greater");
+            else
+                throw new ArgumentNullException(nameof(inputSream));
+        }
+
         /// <summary>
         /// Write a TXTR to a byte array.<br/>
         /// Indexed formats (<see cref="TextureFormat.CI4"/>, <see cref="TextureFormat.CI8"/>, and <see cref="TextureFormat.CI14X2"/>)
         /// cannot have mipmaps.<br/>
         /// Strange image sizes and high mipmap counts might create invalid textures and/or throw exceptions.
         /// </summary>
-        /// <param name="input">The input image</param>
+        /// <param name="input">The input image, which is not modified</param>
         /// <param name="textureFormat">The texture format to write the TXTR in</param>
         /// <param name="paletteFormat">The palette format to write the TXTR in if it's written in an indexed texture format</param>
         /// <param name="copyPaletteSize">The location to write the palette length to in the TXTR if it's written in an indexed texture format</param>
@@ -166,13 +526,17 @@ namespace TXTRFileTypeLib
                     || textureFormat == TextureFormat.CI8
                     || textureFormat == TextureFormat.CI14X2)))
                 {
-                    using (var outputStream = new MemoryStream())
+                    // Sized up front so the TXTR is not copied while the stream grows, and its buffer is returned as
+                    // is when the size was exact (always for non-indexed formats)
+                    using (var outputStream = new MemoryStream(GetWriteSize(input, textureFormat, paletteFormat,
+                        generateMipmaps, mipmapWidthLimit, mipmapHeightLimit)))
                     {
                         WriteCore(input, outputStream, textureFormat,
                             paletteFormat, copyPaletteSize, generateMipmaps,
-                            mipmapWidthLimit, mipmapHeightLimit, false,
+                            mipmapWidthLimit, mipmapHeightLimit, true,
                             progressCallback);
-                        return outputStream.ToArray();
+                        byte[] outputBuffer = outputStream.GetBuffer();
+                        return outputBuffer.Length == outputStream.Length ? outputBuffer : outputStream.ToArray();
                     }
                 }
                 else
@@ -202,7 +566,7 @@ namespace TXTRFileTypeLib
         /// cannot have mipmaps.<br/>
         /// Strange image sizes and high mipmap counts might create invalid textures and/or throw exceptions.
         /// </summary>
-        /// <param name="input">The input image</param>
+        /// <param name="input">The input image, which is not modified</param>
         /// <param name="outputFilePath">The output file path</param>
         /// <param name="textureFormat">The texture format to write the TXTR in</param>
         /// <param name="paletteFormat">The palette format to write the TXTR in if it's written in an indexed texture format</param>
@@ -281,7 +645,7 @@ namespace TXTRFileTypeLib
         /// Strange image sizes and high mipmap counts might create invalid textures and/or throw exceptions.<br/>
         /// <paramref name="outputStream"/> will be automatically closed unless <paramref name="keepStreamOpen"/> is <see langword="true"/>.
         /// </summary>
-        /// <param name="input">The input image</param>
+        /// <param name="input">The input image, which is not modified</param>
         /// <param name="outputStream">The output stream</param>
         /// <param name="textureFormat">The texture format to write the TXTR in</param>
         /// <param name="paletteFormat">The palette format to write the TXTR in if it's written in an indexed texture format</param>
@@ -349,5 +713,409 @@ namespace TXTRFileTypeLib
                         nameof(copyPaletteSize));
             }
         }
+
+        /// <summary>
+        /// Write a TXTR to a byte array, reusing the encoded tiles of the previous TXTR written for the image.<br/>
+        /// Only the tiles whose pixels differ between <paramref name="input"/> and <paramref name="previousInput"/> (and the mipmap
+        /// tiles downsampled from them) are encoded again, the other tiles are copied from the previous TXTR as is.
+        /// The previous TXTR must have been written from <paramref name="previousInput"/> with the same options, else the copied
+        /// tiles are wrong. A full write is done instead if the previous TXTR has another texture format, size or mipmap count,
+        /// or if <paramref name="textureFormat"/> is indexed (the palette is made from the whole image).<br/>
+        /// Indexed formats (<see cref="TextureFormat.CI4"/>, <see cref="TextureFormat.CI8"/>, and <see cref="TextureFormat.CI14X2"/>)
+        /// cannot have mipmaps.<br/>
+        /// Strange image sizes and high mipmap counts might create invalid textures and/or throw exceptions.
+        /// </summary>
+        /// <param name="input">The input image, which is not modified</param>
+        /// <param name="previousInput">The image <paramref name="previousData"/> was written from, which is not modified</param>
+        /// <param name="previousData">The previous TXTR</param>
+        /// <param name="textureFormat">The texture format to write the TXTR in</param>
+        /// <param name="paletteFormat">The palette format to write the TXTR in if it's written in an indexed texture format</param>
+        /// <param name="copyPaletteSize">The location to write the palette length to in the TXTR if it's written in an indexed texture format</param>
+        /// <param name="generateMipmaps">Whether mipmaps should be generated</param>
+        /// <param name="mipmapWidthLimit">The mipmap width limit for mipmap generation</param>
+        /// <param name="mipmapHeightLimit">The mipmap height limit for mipmap generation</param>
+        /// <param name="progressCallback">Callback where mipmap write progress will be reported to</param>
+        /// <returns>A byte array filled with the TXTR data</returns>
+        /// <exception cref="InvalidOperationException">
+        /// If <paramref name="textureFormat"/> is <see cref="TextureFormat.CI4"/>, <see cref="TextureFormat.CI8"/>, or <see cref="TextureFormat.CI14X2"/>
+        /// and <paramref name="generateMipmaps"/> is <see langword="true"/>
+        /// </exception>
+        /// <exception cref="ArgumentNullException">
+        /// If <paramref name="input"/>, <paramref name="previousInput"/>, or <paramref name="previousData"/> is <see langword="null"/>
+        /// </exception>
+        /// <exception cref="ArgumentException">
+        /// If <paramref name="textureFormat"/>, <paramref name="paletteFormat"/>, or <paramref name="copyPaletteSize"/> is an invalid enum
+        /// </exception>
+        [Description("Write a TXTR to a byte array, reusing the encoded tiles of the previous TXTR")]
+        public static byte[] WriteIncremental(Image<Bgra32> input,
+            Image<Bgra32> previousInput,
+            byte[] previousData,
+            TextureFormat textureFormat,
+            PaletteFormat paletteFormat,
+            CopyPaletteSize copyPaletteSize = CopyPaletteSize.ToWidth,
+            bool generateMipmaps = false,
+            int mipmapWidthLimit = 4,
+            int mipmapHeightLimit = 4,
+            UpdateProgressDelegate? progressCallback = null)
+        {
+            if (input != null
+                && previousInput != null
+                && previousData != null
+                && textureFormat.IsDefined()
+                && paletteFormat.IsDefined()
+                && copyPaletteSize.IsDefined())
+            {
+                if (!(generateMipmaps &&
+                    (textureFormat == TextureFormat.CI4
+                    || textureFormat == TextureFormat.CI8
+                    || textureFormat == TextureFormat.CI14X2)))
+                {
+                    using (var outputStream = new MemoryStream(GetWriteSize(input, textureFormat, paletteFormat,
+                        generateMipmaps, mipmapWidthLimit, mipmapHeightLimit)))
+                    {
+                        WriteIncrementalCore(input, previousInput, previousData, outputStream, textureFormat,
+                            paletteFormat, copyPaletteSize, generateMipmaps,
+                            mipmapWidthLimit, mipmapHeightLimit, true,
+                            progressCallback);
+                        byte[] outputBuffer = outputStream.GetBuffer();
+                        return outputBuffer.Length == outputStream.Length ? outputBuffer : outputStream.ToArray();
+                    }
+                }
+                else
+                    throw new InvalidOperationException("Indexed formats should not have mipmaps");
+            }
+            else
+            {
+                if (input == null)
+                    throw new ArgumentNullException(nameof(input));
+                else if (previousInput == null)
+                    throw new ArgumentNullException(nameof(previousInput));
+                else if (previousData == null)
+                    throw new ArgumentNullException(nameof(previousData));
+                else if (!textureFormat.IsDefined())
+                    throw new ArgumentException(
+                        $"Invalid texture format: 0x{textureFormat.AsUInt32():X8}",
+                        nameof(textureFormat));
+                else if (!paletteFormat.IsDefined())
+                    throw new ArgumentException(
+                        $"Invalid texture format: 0x{paletteFormat.AsUInt32():X8}",
+                        nameof(paletteFormat));
+                else
+                    throw new ArgumentException("Invalid location for copying the palette size",
+                        nameof(copyPaletteSize));
+            }
+        }
+
+        /// <summary>
+        /// Write a TXTR to a file, reusing the encoded tiles of the TXTR that is already in the file.<br/>
+        /// Only the tiles whose pixels differ between <paramref name="input"/> and <paramref name="previousInput"/> (and the mipmap
+        /// tiles downsampled from them) are encoded again, the other tiles are copied from the previous TXTR as is.
+        /// The previous TXTR must have been written from <paramref name="previousInput"/> with the same options, else the copied
+        /// tiles are wrong. A full write is done instead if the previous TXTR has another texture format, size or mipmap count,
+        /// or if <paramref name="textureFormat"/> is indexed (the palette is made from the whole image).<br/>
+        /// Indexed formats (<see cref="TextureFormat.CI4"/>, <see cref="TextureFormat.CI8"/>, and <see cref="TextureFormat.CI14X2"/>)
+        /// cannot have mipmaps.<br/>
+        /// A full write is also done if the file does not exist yet.<br/>
+        /// Strange image sizes and high mipmap counts might create invalid textures and/or throw exceptions.
+        /// </summary>
+        /// <param name="input">The input image, which is not modified</param>
+        /// <param name="previousInput">The image the TXTR in <paramref name="outputFilePath"/> was written from, which is not modified</param>
+        /// <param name="outputFilePath">The output file path, which is read before it is replaced (only once the new TXTR is written)</param>
+        /// <param name="textureFormat">The texture format to write the TXTR in</param>
+        /// <param name="paletteFormat">The palette format to write the TXTR in if it's written in an indexed texture format</param>
+        /// <param name="copyPaletteSize">The location to write the palette length to in the TXTR if it's written in an indexed texture format</param>
+        /// <param name="generateMipmaps">Whether mipmaps should be generated</param>
+        /// <param name="mipmapWidthLimit">The mipmap width limit for mipmap generation</param>
+        /// <param name="mipmapHeightLimit">The mipmap height limit for mipmap generation</param>
+        /// <param name="progressCallback">Callback where mipmap write progress will be reported to</param>
+        /// <exception cref="InvalidOperationException">
+        /// If <paramref name="textureFormat"/> is <see cref="TextureFormat.CI4"/>, <see cref="TextureFormat.CI8"/>, or <see cref="TextureFormat.CI14X2"/>
+        /// and <paramref name="generateMipmaps"/> is <see langword="true"/>
+        /// </exception>
+        /// <exception cref="ArgumentNullException">
+        /// If <paramref name="input"/>, <paramref name="previousInput"/>, or <paramref name="outputFilePath"/> is <see langword="null"/>
+        /// </exception>
+        /// <exception cref="ArgumentException">
+        /// If <paramref name="textureFormat"/>, <paramref name="paletteFormat"/>, or <paramref name="copyPaletteSize"/> is an invalid enum
+        /// </exception>
+        [Description("Write a TXTR to a file, reusing the encoded tiles of the TXTR already in the file")]
+        public static void WriteIncremental(Image<Bgra32> input,
+            Image<Bgra32> previousInput,
+            string outputFilePath,
+            TextureFormat textureFormat,
+            PaletteFormat paletteFormat,
+            CopyPaletteSize copyPaletteSize = CopyPaletteSize.ToWidth,
+            bool generateMipmaps = false,
+            int mipmapWidthLimit = 4,
+            int mipmapHeightLimit = 4,
+            UpdateProgressDelegate? progressCallback = null)
+        {
+            if (input != null
+                && previousInput != null
+                && !string.IsNullOrWhiteSpace(outputFilePath)
+                && textureFormat.IsDefined()
+                && paletteFormat.IsDefined()
+                && copyPaletteSize.IsDefined())
+            {
+                if (!(generateMipmaps &&
+                    (textureFormat == TextureFormat.CI4
+                    || textureFormat == TextureFormat.CI8
+                    || textureFormat == TextureFormat.CI14X2)))
+                {
+                    // Read as a whole first since the same file is written. The file is only replaced once the
+                    // texture is written, so a failed write keeps the previous texture.
+                    byte[] previousData = File.Exists(outputFilePath) ? File.ReadAllBytes(outputFilePath) : Array.Empty<byte>();
+                    WriteFileReplacing(outputFilePath,
+                        outputStream => WriteIncrementalCore(input, previousInput, previousData, outputStream, textureFormat,
+                            paletteFormat, copyPaletteSize, generateMipmaps,
+                            mipmapWidthLimit, mipmapHeightLimit, false,
+                            progressCallback));
+                }
+                else
+                    throw new InvalidOperationException("Indexed formats should not have mipmaps");
+            }
+            else
+            {
+                if (input == null)
+                    throw new ArgumentNullException(nameof(input));
+                else if (previousInput == null)
+                    throw new ArgumentNullException(nameof(previousInput));
+                else if (string.IsNullOrEmpty(outputFilePath))
+                    throw outputFilePath == null
+                        ? new ArgumentNullException(nameof(outputFilePath))
+                        : new ArgumentException("Path is empty", nameof(outputFilePath));
+                else if (!textureFormat.IsDefined())
+                    throw new ArgumentException(
+                        $"Invalid texture format: 0x{textureFormat.AsUInt32():X8}",
+                        nameof(textureFormat));
+                else if (!paletteFormat.IsDefined())
+                    throw new ArgumentException(
+                        $"Invalid texture format: 0x{paletteFormat.AsUInt32():X8}",
+                        nameof(paletteFormat));
+                else
+                    throw new ArgumentException("Invalid location for copying the palette size",
+                        nameof(copyPaletteSize));
+            }
+        }
+
+        /// <summary>
+        /// Write a TXTR to a stream, reusing the encoded tiles of the previous TXTR written for the image.<br/>
+        /// Only the tiles whose pixels differ between <paramref name="input"/> and <paramref name="previousInput"/> (and the mipmap
+        /// tiles downsampled from them) are encoded again, the other tiles are copied from the previous TXTR as is.
+        /// The previous TXTR must have been written from <paramref name="previousInput"/> with the same options, else the copied
+        /// tiles are wrong. A full write is done instead if the previous TXTR has another texture format, size or mipmap count,
+        /// or if <paramref name="textureFormat"/> is indexed (the palette is made from the whole image).<br/>
+        /// Indexed formats (<see cref="TextureFormat.CI4"/>, <see cref="TextureFormat.CI8"/>, and <see cref="TextureFormat.CI14X2"/>)
+        /// cannot have mipmaps.<br/>
+        /// Strange image sizes and high mipmap counts might create invalid textures and/or throw exceptions.<br/>
+        /// <paramref name="outputStream"/> will be automatically closed unless <paramref name="keepStreamOpen"/> is <see langword="true"/>.
+        /// </summary>
+        /// <param name="input">The input image, which is not modified</param>
+        /// <param name="previousInput">The image <paramref name="previousData"/> was written from, which is not modified</param>
+        /// <param name="previousData">The previous TXTR</param>
+        /// <param name="outputStream">The output stream</param>
+        /// <param name="textureFormat">The texture format to write the TXTR in</param>
+        /// <param name="paletteFormat">The palette format to write the TXTR in if it's written in an indexed texture format</param>
+        /// <param name="copyPaletteSize">The location to write the palette length to in the TXTR if it's written in an indexed texture format</param>
+        /// <param name="generateMipmaps">Whether mipmaps should be generated</param>
+        /// <param name="mipmapWidthLimit">The mipmap width limit for mipmap generation</param>
+        /// <param name="mipmapHeightLimit">The mipmap height limit for mipmap generation</param>
+        /// <param name="keepStreamOpen">Keep the stream open (do not auto close stream)</param>
+        /// <param name="progressCallback">Callback where mipmap write progress will be reported to</param>
+        /// <exception cref="InvalidOperationException">
+        /// If <paramref name="textureFormat"/> is <see cref="TextureFormat.CI4"/>, <see cref="TextureFormat.CI8"/>, or <see cref="TextureFormat.CI14X2"/>
+        /// and <paramref name="generateMipmaps"/> is <see langword="true"/>
+        /// </exception>
+        /// <exception cref="ArgumentNullException">
+        /// If <paramref name="input"/>, <paramref name="previousInput"/>, <paramref name="previousData"/>, or <paramref name="outputStream"/>
+        /// is <see langword="null"/>
+        /// </exception>
+        /// <exception cref="ArgumentException">
+        /// If <paramref name="textureFormat"/>, <paramref name="paletteFormat"/>, or <paramref name="copyPaletteSize"/> is an invalid enum
+        /// </exception>
+        [Description("Write a TXTR to a stream, reusing the encoded tiles of the previous TXTR")]
+        public static void WriteIncremental(Image<Bgra32> input,
+            Image<Bgra32> previousInput,
+            byte[] previousData,
+            Stream outputStream,
+            TextureFormat textureFormat,
+            PaletteFormat paletteFormat,
+            CopyPaletteSize copyPaletteSize = CopyPaletteSize.ToWidth,
+            bool generateMipmaps = false,
+            int mipmapWidthLimit = 4,
+            int mipmapHeightLimit = 4,
+            bool keepStreamOpen = false,
+            UpdateProgressDelegate? progressCallback = null)
+        {
+            if (input != null
+                && previousInput != null
+                && previousData != null
+                && outputStream != null
+                && textureFormat.IsDefined()
+                && paletteFormat.IsDefined()
+                && copyPaletteSize.IsDefined())
+            {
+                if (!(generateMipmaps &&
+                    (textureFormat == TextureFormat.CI4
+                    || textureFormat == TextureFormat.CI8
+                    || textureFormat == TextureFormat.CI14X2)))
+                {
+                    WriteIncrementalCore(input, previousInput, previousData, outputStream, textureFormat,
+                        paletteFormat, copyPaletteSize, generateMipmaps,
+                        mipmapWidthLimit, mipmapHeightLimit, keepStreamOpen,
+                        progressCallback);
+                }
+                else
+                    throw new InvalidOperationException("Indexed formats should not have mipmaps");
+            }
+            else
+            {
+                if (input == null)
+                    throw new ArgumentNullException(nameof(input));
+                else if (previousInput == null)
+                    throw new ArgumentNullException(nameof(previousInput));
+                else if (previousData == null)
+                    throw new ArgumentNullException(nameof(previousData));
+                else if (outputStream == null)
+                    throw new ArgumentNullException(nameof(outputStream));
+                else if (!textureFormat.IsDefined())
+                    throw new ArgumentException(
+                        $"Invalid texture format: 0x{textureFormat.AsUInt32():X8}",
+                        nameof(textureFormat));
+                else if (!paletteFormat.IsDefined())
+                    throw new ArgumentException(
+                        $"Invalid texture format: 0x{paletteFormat.AsUInt32():X8}",
+                        nameof(paletteFormat));
+                else
+                    throw new ArgumentException("Invalid location for copying the palette size",
+                        nameof(copyPaletteSize));
+            }
+        }
+
+        /// <summary>
+        /// Transcode a CMPR TXTR file to a BC1 (DXT1) DDS file.<br/>
+        /// CMPR is BC1 stored differently, so the blocks are only rewritten (not decoded and encoded again) and the DDS has
+        /// exactly the colors of the TXTR. The DDS is flipped the same as the images read by
+        /// <see cref="Read(string, bool, UpdateProgressDelegate?, bool)"/>, which requires the height of every mipmap to be
+        /// less than 4 or a multiple of 4.<br/>
+        /// The output file is only created or replaced once the DDS is complete.
+        /// </summary>
+        /// <param name="inputFilePath">The input TXTR file path</param>
+        /// <param name="outputFilePath">The output DDS file path</param>
+        /// <param name="includeMipmaps">Transcode all mipmaps of the TXTR (else only the first)</param>
+        /// <exception cref="ArgumentNullException">If <paramref name="inputFilePath"/> or <paramref name="outputFilePath"/> is <see langword="null"/></exception>
+        /// <exception cref="ArgumentException">If <paramref name="inputFilePath"/> or <paramref name="outputFilePath"/> is empty</exception>
+        /// <exception cref="InvalidDataException">If the TXTR is not CMPR or a mipmap height cannot be transcoded</exception>
+        [Description("Transcode a CMPR TXTR file to a BC1 (DXT1) DDS file")]
+        public static void TranscodeToDDS(string inputFilePath,
+            string outputFilePath,
+            bool includeMipmaps = true)
+        {
+            if (!string.IsNullOrWhiteSpace(inputFilePath) && !string.IsNullOrWhiteSpace(outputFilePath))
+            {
+                using (FileStream inputStream = File.OpenRead(inputFilePath))
+                {
+                    WriteFileReplacing(outputFilePath,
+                        outputStream => TranscodeToDDSCore(inputStream, outputStream, includeMipmaps, false));
+                }
+            }
+            else if (string.IsNullOrWhiteSpace(inputFilePath))
+                throw inputFilePath == null
+                    ? new ArgumentNullException(nameof(inputFilePath))
+                    : new ArgumentException("Path is empty", nameof(inputFilePath));
+            else
+                throw outputFilePath == null
+                    ? new ArgumentNullException(nameof(outputFilePath))
+                    : new ArgumentException("Path is empty", nameof(outputFilePath));
+        }
+
+        /// <summary>
+        /// Transcode a CMPR TXTR from a stream to a BC1 (DXT1) DDS in a stream.<br/>
+        /// CMPR is BC1 stored differently, so the blocks are only rewritten (not decoded and encoded again) and the DDS has
+        /// exactly the colors of the TXTR. The DDS is flipped the same as the images read by
+        /// <see cref="Read(Stream, bool, bool, UpdateProgressDelegate?, bool)"/>, which requires the height of every mipmap
+        /// to be less than 4 or a multiple of 4.<br/>
+        /// <paramref name="inputStream"/> and <paramref name="outputStream"/> will be automatically closed unless
+        /// <paramref name="keepStreamsOpen"/> is <see langword="true"/>.
+        /// </summary>
+        /// <param name="inputStream">The input TXTR stream</param>
+        /// <param name="outputStream">The output DDS stream</param>
+        /// <param name="includeMipmaps">Transcode all mipmaps of the TXTR (else only the first)</param>
+        /// <param name="keepStreamsOpen">Keep the streams open (do not auto close streams)</param>
+        /// <exception cref="ArgumentNullException">If <paramref name="inputStream"/> or <paramref name="outputStream"/> is <see langword="null"/></exception>
+        /// <exception cref="InvalidDataException">If the TXTR is not CMPR or a mipmap height cannot be transcoded</exception>
+        [Description("Transcode a CMPR TXTR from a stream to a BC1 (DXT1) DDS in a stream")]
+        public static void TranscodeToDDS(Stream inputStream,
+            Stream outputStream,
+            bool includeMipmaps = true,
+            bool keepStreamsOpen = false)
+        {
+            if (inputStream != null && outputStream != null)
+            {
+                TranscodeToDDSCore(inputStream, outputStream, includeMipmaps, keepStreamsOpen);
+            }
+            else
+                throw new ArgumentNullException(inputStream == null ? nameof(inputStream) : nameof(outputStream));
+        }
+
+        /// <summary>
+        /// Transcode a BC1 (DXT1) DDS file to a CMPR TXTR file.<br/>
+        /// The blocks are only rewritten (not decoded and encoded again), see
+        /// <see cref="TranscodeToDDS(string, string, bool)"/>. Mipmaps of the DDS with a width or height that would be 0
+        /// in a TXTR (a DDS keeps them at 1) are left out.<br/>
+        /// The output file is only created or replaced once the TXTR is complete.
+        /// </summary>
+        /// <param name="inputFilePath">The input DDS file path</param>
+        /// <param name="outputFilePath">The output TXTR file path</param>
+        /// <exception cref="ArgumentNullException">If <paramref name="inputFilePath"/> or <paramref name="outputFilePath"/> is <see langword="null"/></exception>
+        /// <exception cref="ArgumentException">If <paramref name="inputFilePath"/> or <paramref name="outputFilePath"/> is empty</exception>
+        /// <exception cref="InvalidDataException">If the DDS is not BC1 or a mipmap height cannot be transcoded</exception>
+        [Description("Transcode a BC1 (DXT1) DDS file to a CMPR TXTR file")]
+        public static void TranscodeFromDDS(string inputFilePath,
+            string outputFilePath)
+        {
+            if (!string.IsNullOrWhiteSpace(inputFilePath) && !string.IsNullOrWhiteSpace(outputFilePath))
+            {
+                using (FileStream inputStream = File.OpenRead(inputFilePath))
+                {
+                    WriteFileReplacing(outputFilePath,
+                        outputStream => TranscodeFromDDSCore(inputStream, outputStream, false));
+                }
+            }
+            else if (string.IsNullOrWhiteSpace(inputFilePath))
+                throw inputFilePath == null
+                    ? new ArgumentNullException(nameof(inputFilePath))
+                    : new ArgumentException("Path is empty", nameof(inputFilePath));
+            else
+                throw outputFilePath == null
+                    ? new ArgumentNullException(nameof(outputFilePath))
+                    : new ArgumentException("Path is empty", nameof(outputFilePath));
+        }
+
+        /// <summary>
+        /// Transcode a BC1 (DXT1) DDS from a stream to a CMPR TXTR in a stream.<br/>
+        /// The blocks are only rewritten (not decoded and encoded again), see
+        /// <see cref="TranscodeToDDS(Stream, Stream, bool, bool)"/>. Mipmaps of the DDS with a width or height that would
+        /// be 0 in a TXTR (a DDS keeps them at 1) are left out.<br/>
+        /// <paramref name="inputStream"/> and <paramref name="outputStream"/> will be automatically closed unless
+        /// <paramref name="keepStreamsOpen"/> is <see langword="true"/>.
+        /// </summary>
+        /// <param name="inputStream">The input DDS stream</param>
+        /// <param name="outputStream">The output TXTR stream</param>
+        /// <param name="keepStreamsOpen">Keep the streams open (do not auto close streams)</param>
+        /// <exception cref="ArgumentNullException">If <paramref name="inputStream"/> or <paramref name="outputStream"/> is <see langword="null"/></exception>
+        /// <exception cref="InvalidDataException">If the DDS is not BC1 or a mipmap height cannot be transcoded</exception>
+        [Description("Transcode a BC1 (DXT1) DDS from a stream to a CMPR TXTR in a stream")]
+        public static void TranscodeFromDDS(Stream inputStream,
+            Stream outputStream,
+            bool keepStreamsOpen = false)
+        {
+            if (inputStream != null && outputStream != null)
+            {
+                TranscodeFromDDSCore(inputStream, outputStream, keepStreamsOpen);
+            }
+            else
+                throw new ArgumentNullException(inputStream == null ? nameof(inputStream) : nameof(outputStream));
+        }
     }
 }
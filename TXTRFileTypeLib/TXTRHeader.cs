@@ -0,0 +1,147 @@
+﻿/*
+TXTRFileType
+Copyright (C) 2021 xchellx
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+*/
+
+using libWiiSharp.Formats;
+using System;
+using System.Collections.Generic;
+using System.ComponentModel;
+
+namespace TXTRFileTypeLib
+{
+    /// <summary>
+    /// The header of a TXTR and the location of its palette and mipmaps, read without decoding any pixels.<br/>
+    /// See: <see cref="TXTRFileTypeLibAPI.ReadHeader(string)"/>
+    /// </summary>
+    [Description("The header of a TXTR and the location of its palette and mipmaps")]
+    public sealed class TXTRHeader
+    {
+        internal TXTRHeader(TextureFormat textureFormat,
+            ushort width,
+            ushort height,
+            uint mipmapCount,
+            PaletteFormat? paletteFormat,
+            ushort paletteWidth,
+            ushort paletteHeight,
+            long paletteOffset,
+            int paletteSize,
+            TXTRMipmapInfo[] mipmaps)
+        {
+            TextureFormat = textureFormat;
+            Width = width;
+            Height = height;
+            MipmapCount = mipmapCount;
+            PaletteFormat = paletteFormat;
+            PaletteWidth = paletteWidth;
+            PaletteHeight = paletteHeight;
+            PaletteOffset = paletteOffset;
+            PaletteSize = paletteSize;
+            Mipmaps = mipmaps;
+        }
+
+        /// <summary>
+        /// The texture format
+        /// </summary>
+        [Description("The texture format")]
+        public TextureFormat TextureFormat { get; }
+
+        /// <summary>
+        /// The width of the first mipmap
+        /// </summary>
+        [Description("The width of the first mipmap")]
+        public ushort Width { get; }
+
+        /// <summary>
+        /// The height of the first mipmap
+        /// </summary>
+        [Description("The height of the first mipmap")]
+        public ushort Height { get; }
+
+        /// <summary>
+        /// The count of mipmaps, including the first mipmap
+        /// </summary>
+        [Description("The count of mipmaps, including the first mipmap")]
+        public uint MipmapCount { get; }
+
+        /// <summary>
+        /// Whether the texture format is an indexed format (<see cref="TextureFormat.CI4"/>, <see cref="TextureFormat.CI8"/>,
+        /// or <see cref="TextureFormat.CI14X2"/>)
+        /// </summary>
+        [Description("Whether the texture format is an indexed format")]
+        public bool IsIndexed { get => PaletteFormat != null; }
+
+        /// <summary>
+        /// The palette format, or <see langword="null"/> if the texture format is not an indexed format
+        /// </summary>
+        [Description("The palette format")]
+        public PaletteFormat? PaletteFormat { get; }
+
+        /// <summary>
+        /// The palette width, or 0 if the texture format is not an indexed format
+        /// </summary>
+        [Description("The palette width")]
+        public ushort PaletteWidth { get; }
+
+        /// <summary>
+        /// The palette height, or 0 if the texture format is not an indexed format
+        /// </summary>
+        [Description("The palette height")]
+        public ushort PaletteHeight { get; }
+
+        /// <summary>
+        /// The offset of the palette data from the start of the TXTR, or 0 if the texture format is not an indexed format
+        /// </summary>
+        [Description("The offset of the palette data from the start of the TXTR")]
+        public long PaletteOffset { get; }
+
+        /// <summary>
+        /// The size of the palette data in bytes, or 0 if the texture format is not an indexed format
+        /// </summary>
+        [Description("The size of the palette data in bytes")]
+        public int PaletteSize { get; }
+
+        /// <summary>
+        /// The dimensions and the location of every mipmap, from the first (largest) mipmap to the last
+        /// </summary>
+        [Description("The dimensions and the location of every mipmap")]
+        public IReadOnlyList<TXTRMipmapInfo> Mipmaps { get; }
+
+        /// <summary>
+        /// Find the smallest mipmap that is at least of the specified dimensions.<br/>
+        /// If even the first mipmap is smaller than the specified dimensions, the first mipmap (0) is returned.
+        /// </summary>
+        /// <param name="minWidth">The minimum width of the mipmap</param>
+        /// <param name="minHeight">The minimum height of the mipmap</param>
+        /// <returns>The index of the mipmap in <see cref="Mipmaps"/></returns>
+        /// <exception cref="ArgumentOutOfRangeException">If <paramref name="minWidth"/> or <paramref name="minHeight"/> is less than 0</exception>
+        [Description("Find the smallest mipmap that is at least of the specified dimensions")]
+        public int FindMipmapLevel(int minWidth, int minHeight)
+        {
+            if (minWidth < 0)
+                throw new ArgumentOutOfRangeException(nameof(minWidth), minWidth, "Must be 0 or greater");
+            else if (minHeight < 0)
+                throw new ArgumentOutOfRangeException(nameof(minHeight), minHeight, "Must be 0 or greater");
+
+            // The mipmaps only get smaller, so stop at the first mipmap that is too small
+            int mipmapLevel = 0;
+            while (mipmapLevel + 1 < Mipmaps.Count && Mipmaps[mipmapLevel + 1].Width >= minWidth
+                && Mipmaps[mipmapLevel + 1].Height >= minHeight)
+                mipmapLevel++;
+            return mipmapLevel;
+        }
+    }
+}
@@ -0,0 +1,62 @@
+﻿/*
+TXTRFileType
+Copyright (C) 2021 xchellx
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+*/
+
+using System.ComponentModel;
+
+namespace TXTRFileTypeLib
+{
+    /// <summary>
+    /// The dimensions and the location of a mipmap of a TXTR.<br/>
+    /// See: <see cref="TXTRHeader.Mipmaps"/>
+    /// </summary>
+    [Description("The dimensions and the location of a mipmap of a TXTR")]
+    public readonly struct TXTRMipmapInfo
+    {
+        internal TXTRMipmapInfo(ushort width, ushort height, long offset, int size)
+        {
+            Width = width;
+            Height = height;
+            Offset = offset;
+            Size = size;
+        }
+
+        /// <summary>
+        /// The width of the mipmap
+        /// </summary>
+        [Description("The width of the mipmap")]
+        public ushort Width { get; }
+
+        /// <summary>
+        /// The height of the mipmap
+        /// </summary>
+        [Description("The height of the mipmap")]
+        public ushort Height { get; }
+
+        /// <summary>
+        /// The offset of the mipmap data from the start of the TXTR
+        /// </summary>
+        [Description("The offset of the mipmap data from the start of the TXTR")]
+        public long Offset { get; }
+
+        /// <summary>
+        /// The size of the mipmap data in bytes
+        /// </summary>
+        [Description("The size of the mipmap data in bytes")]
+        public int Size { get; }
+    }
+}
@@ -16,10 +16,15 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 */
 
+using libWiiSharp;
 using SixLabors.ImageSharp;
+using SixLabors.ImageSharp.Advanced;
+using SixLabors.ImageSharp.ColorSpaces.Companding;
+using SixLabors.ImageSharp.Memory;
 using SixLabors.ImageSharp.PixelFormats;
 using System;
 using System.Runtime.InteropServices;
+using System.Threading.Tasks;
 
 namespace TXTRFileTypeLib.Util
 {
@@ -28,6 +33,9 @@ namespace TXTRFileTypeLib.Util
     /// </summary>
     public static class ImageUtil
     {
+        // sRGB to linear for every 8-bit channel value, so a mipmap is averaged like a companded resize
+        private static readonly float[] expandedChannels = CreateExpandedChannels();
+
         /// <summary>
         /// Flip a coordinate to its opposite along its own axis
         /// </summary>
@@ -98,8 +106,92 @@ namespace TXTRFileTypeLib.Util
         /// <returns>The bytes of <paramref name="img"/></returns>
         public static byte[] FromImage<TPixel>(Image<TPixel> img)
             where TPixel : unmanaged, IPixel<TPixel>, IPixel, IEquatable<TPixel>
-            => (img.TryGetSinglePixelSpan(out Span<TPixel> pixelSpan))
-            ? MemoryMarshal.AsBytes(pixelSpan).ToArray()
-            : throw new Exception("Failed to retrieve raw pixel data from image");
+            => MemoryMarshal.AsBytes(GetPixelMemory(img).Span).ToArray();
+
+        /// <summary>
+        /// Get the pixels of a <see cref="Image{TPixel}"/> without copying them
+        /// </summary>
+        /// <typeparam name="TPixel">The type of pixel data in <paramref name="img"/></typeparam>
+        /// <param name="img">A <see cref="Image{TPixel}"/></param>
+        /// <returns>The pixel memory of <paramref name="img"/>, valid until <paramref name="img"/> is disposed</returns>
+        public static Memory<TPixel> GetPixelMemory<TPixel>(Image<TPixel> img)
+            where TPixel : unmanaged, IPixel<TPixel>, IPixel, IEquatable<TPixel>
+        {
+            IMemoryGroup<TPixel> memoryGroup = img.GetPixelMemoryGroup();
+            return memoryGroup.Count == 1
+                ? memoryGroup[0]
+                : throw new Exception("Failed to retrieve raw pixel data from image");
+        }
+
+        /// <summary>
+        /// Downsample an image to half of its size with a 2x2 box filter in linear (companded) color space
+        /// </summary>
+        /// <remarks>
+        /// An odd last column or row of <paramref name="img"/> is averaged into the last column or row of the mipmap.
+        /// Alpha is not premultiplied. Channels are rounded half away from zero, the same as pytxtr of libtxtrPython.
+        /// With <paramref name="flipVertically"/>, the rows of <paramref name="img"/> are read from the bottom up, so the
+        /// mipmap is the same as the one of a flipped copy of <paramref name="img"/> without making that copy.
+        /// </remarks>
+        /// <param name="img">A <see cref="Image{TPixel}"/>, which is not modified</param>
+        /// <param name="flipVertically">Whether <paramref name="img"/> is downsampled as if it was flipped vertically</param>
+        /// <returns>A new <see cref="Image{TPixel}"/> of half the size of <paramref name="img"/>, at least 1x1</returns>
+        public static Image<Bgra32> DownsampleMipmap(Image<Bgra32> img, bool flipVertically = false)
+        {
+            int sourceWidth = img.Width,
+                sourceHeight = img.Height,
+                width = Math.Max(sourceWidth / 2, 1),
+                height = Math.Max(sourceHeight / 2, 1);
+            ReadOnlyMemory<Bgra32> sourceMemory = GetPixelMemory(img);
+            Image<Bgra32> mipmap = new(width, height);
+            try
+            {
+                Memory<Bgra32> mipmapMemory = GetPixelMemory(mipmap);
+                Parallel.For(0, height, TextureConverter.ParallelOptions, y =>
+                {
+                    ReadOnlySpan<Bgra32> source = sourceMemory.Span;
+                    Span<Bgra32> row = mipmapMemory.Span.Slice(y * width, width);
+                    int y0 = y * 2,
+                        y1 = y == height - 1 ? sourceHeight : y0 + 2;
+                    for (int x = 0; x < width; x++)
+                    {
+                        int x0 = x * 2,
+                            x1 = x == width - 1 ? sourceWidth : x0 + 2;
+                        float r = 0, g = 0, b = 0, a = 0;
+                        for (int sy = y0; sy < y1; sy++)
+                        {
+                            int sourceRow = (flipVertically ? FlipCoordinate(sourceHeight, sy) : sy) * sourceWidth;
+                            for (int sx = x0; sx < x1; sx++)
+                            {
+                                Bgra32 pixel = source[sourceRow + sx];
+                                r += expandedChannels[pixel.R];
+                                g += expandedChannels[pixel.G];
+                                b += expandedChannels[pixel.B];
+                                a += pixel.A;
+                            }
+                        }
+                        float count = (y1 - y0) * (x1 - x0);
+                        row[x] = new Bgra32(CompressChannel(r / count), CompressChannel(g / count),
+                            CompressChannel(b / count), (byte)MathF.Round(a / count, MidpointRounding.AwayFromZero));
+                    }
+                });
+            }
+            catch
+            {
+                mipmap.Dispose();
+                throw;
+            }
+            return mipmap;
+        }
+
+        private static byte CompressChannel(float channel)
+            => (byte)Math.Clamp(MathF.Round(SRgbCompanding.Compress(channel) * byte.MaxValue, MidpointRounding.AwayFromZero), byte.MinValue, byte.MaxValue);
+
+        private static float[] CreateExpandedChannels()
+        {
+            float[] channels = new float[byte.MaxValue + 1];
+            for (int i = 0; i < channels.Length; i++)
+                channels[i] = SRgbCompanding.Expand(i / (float)byte.MaxValue);
+            return channels;
+        }
     }
 }
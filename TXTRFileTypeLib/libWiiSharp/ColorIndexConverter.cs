@@ -20,51 +20,68 @@
 //Thanks to the authors!
 
 using libWiiSharp.Formats;
+using SixLabors.ImageSharp.PixelFormats;
 using System;
+using System.Buffers.Binary;
 using System.Collections.Generic;
+using System.Threading.Tasks;
 
 namespace libWiiSharp
 {
     internal class ColorIndexConverter
     {
         private uint[] rgbaPalette;
+        // Palette index of every 16-bit palette value, -1 if not looked up yet. See: GetColorIndex
+        private int[] colorIndexes;
+        // Palette RGBA values sorted by the sum of their channels, to find the nearest color. See: FindNearestColorIndex
+        private uint[] sortedPaletteColors;
+        private int[] sortedPaletteSums;
+        private int[] sortedPaletteIndexes;
         private byte[] texturePalette;
         private byte[] textureData;
-        private readonly uint[] rgbaData;
+        private readonly ReadOnlyMemory<Bgra32> rgbaMemory;
         private readonly TextureFormat textureFormat;
         private readonly PaletteFormat paletteFormat;
         private readonly int width;
         private readonly int height;
 
         public byte[] Palette { get => texturePalette; }
+        // Rented from ArrayPool<byte>.Shared, only the first TextureConverter.GetTextureSize bytes are the texture
         public byte[] Data { get => textureData; }
 
-        public ColorIndexConverter(uint[] rgbaData, int width, int height, TextureFormat textureFormat, PaletteFormat paletteFormat)
+        public ColorIndexConverter(ReadOnlyMemory<Bgra32> rgbaMemory, int width, int height, TextureFormat textureFormat, PaletteFormat paletteFormat)
         {
             if (textureFormat != TextureFormat.CI4 && textureFormat != TextureFormat.CI8 && textureFormat != TextureFormat.CI14X2)
                 throw new Exception("Texture format must be either CI4 or CI8 or CI14X2!");
             if (paletteFormat != PaletteFormat.IA8 && paletteFormat != PaletteFormat.RGB565 && paletteFormat != PaletteFormat.RGB5A3)
                 throw new Exception("Palette format must be either IA8, RGB565 or RGB5A3!");
 
-            this.rgbaData = rgbaData;
+            this.rgbaMemory = rgbaMemory;
             this.width = width;
             this.height = height;
             this.textureFormat = textureFormat;
             this.paletteFormat = paletteFormat;
             this.texturePalette = Array.Empty<byte>();
             this.rgbaPalette = Array.Empty<uint>();
+            this.colorIndexes = Array.Empty<int>();
+            this.sortedPaletteColors = Array.Empty<uint>();
+            this.sortedPaletteSums = Array.Empty<int>();
+            this.sortedPaletteIndexes = Array.Empty<int>();
             this.textureData = Array.Empty<byte>();
 
             BuildPalette();
         }
 
-        public static byte[] FromCI4(byte[] texture, uint[] paletteData, int width, int height)
+        public static void FromCI4(ReadOnlyMemory<byte> textureMemory, uint[] paletteData, Memory<Bgra32> pixelMemory, int width, int height)
         {
-            uint[] output = new uint[width * height];
-            int i = 0;
-
-            for (int y = 0; y < height; y += 8)
+            Parallel.For(0, (height + 7) / 8, TextureConverter.ParallelOptions, tileRow =>
             {
+                ReadOnlySpan<byte> texture = textureMemory.Span;
+                Span<uint> output = TextureConverter.AsRgba(pixelMemory);
+                int y = tileRow * 8;
+                // The read position only advances inside of the image, by (width + 1) / 2 bytes per pixel row
+                int i = y * ((width + 1) / 2);
+
                 for (int x = 0; x < width; x += 8)
                 {
                     for (int y1 = y; y1 < y + 8; y1++)
@@ -76,23 +93,28 @@ namespace libWiiSharp
 
                             byte pixel = texture[i++];
 
-                            output[y1 * width + x1] = paletteData[pixel >> 4]; ;
-                            if (y1 * width + x1 + 1 < output.Length) output[y1 * width + x1 + 1] = paletteData[pixel & 0x0F];
+                            output[y1 * width + x1] = paletteData[pixel >> 4];
+                            // With an odd width the second pixel of the last byte of a row lands on the next row. On the
+                            // last row of a tile row that pixel belongs to the next tile row, which overwrites it anyway.
+                            if (y1 * width + x1 + 1 < output.Length && (x1 + 1 < width || y1 + 1 < y + 8))
+                                output[y1 * width + x1 + 1] = paletteData[pixel & 0x0F];
                         }
                     }
                 }
-            }
-
-            return Shared.UIntArrayToByteArray(output);
+            });
         }
 
         public void ToCI4()
         {
-            byte[] indexData = new byte[TextureConverter.GetTextureSize(textureFormat, width, height)];
-            int i = 0;
+            byte[] indexData = TextureConverter.RentTextureBuffer(textureFormat, width, height);
 
-            for (int y = 0; y < height; y += 8)
+            Parallel.For(0, (height + 7) / 8, TextureConverter.ParallelOptions, tileRow =>
             {
+                ReadOnlySpan<uint> rgbaData = TextureConverter.AsRgba(rgbaMemory);
+                int y = tileRow * 8;
+                // Every 8x8 tile is 32 bytes
+                int i = tileRow * ((width + 7) / 8) * 32;
+
                 for (int x = 0; x < width; x += 8)
                 {
                     for (int y1 = y; y1 < y + 8; y1++)
@@ -121,18 +143,21 @@ namespace libWiiSharp
                         }
                     }
                 }
-            }
+            });
 
             this.textureData = indexData;
         }
 
-        public static byte[] FromCI8(byte[] texture, uint[] paletteData, int width, int height)
+        public static void FromCI8(ReadOnlyMemory<byte> textureMemory, uint[] paletteData, Memory<Bgra32> pixelMemory, int width, int height)
         {
-            uint[] output = new uint[width * height];
-            int i = 0;
-
-            for (int y = 0; y < height; y += 4)
+            Parallel.For(0, (height + 3) / 4, TextureConverter.ParallelOptions, tileRow =>
             {
+                ReadOnlySpan<byte> texture = textureMemory.Span;
+                Span<uint> output = TextureConverter.AsRgba(pixelMemory);
+                int y = tileRow * 4;
+                // The read position only advances inside of the image, by width bytes per pixel row
+                int i = y * width;
+
                 for (int x = 0; x < width; x += 8)
                 {
                     for (int y1 = y; y1 < y + 4; y1++)
@@ -148,18 +173,20 @@ namespace libWiiSharp
                         }
                     }
                 }
-            }
-
-            return Shared.UIntArrayToByteArray(output);
+            });
         }
 
         public void ToCI8()
         {
-            byte[] indexData = new byte[TextureConverter.GetTextureSize(textureFormat, width, height)];
-            int i = 0;
+            byte[] indexData = TextureConverter.RentTextureBuffer(textureFormat, width, height);
 
-            for (int y = 0; y < height; y += 4)
+            Parallel.For(0, (height + 3) / 4, TextureConverter.ParallelOptions, tileRow =>
             {
+                ReadOnlySpan<uint> rgbaData = TextureConverter.AsRgba(rgbaMemory);
+                int y = tileRow * 4;
+                // Every 8x4 tile is 32 bytes
+                int i = tileRow * ((width + 7) / 8) * 32;
+
                 for (int x = 0; x < width; x += 8)
                 {
                     for (int y1 = y; y1 < y + 4; y1++)
@@ -177,18 +204,21 @@ namespace libWiiSharp
                         }
                     }
                 }
-            }
+            });
 
             this.textureData = indexData;
         }
 
-        public static byte[] FromCI14X2(byte[] texture, uint[] paletteData, int width, int height)
+        public static void FromCI14X2(ReadOnlyMemory<byte> textureMemory, uint[] paletteData, Memory<Bgra32> pixelMemory, int width, int height)
         {
-            uint[] output = new uint[width * height];
-            int i = 0;
-
-            for (int y = 0; y < height; y += 4)
+            Parallel.For(0, (height + 3) / 4, TextureConverter.ParallelOptions, tileRow =>
             {
+                ReadOnlySpan<byte> texture = textureMemory.Span;
+                Span<uint> output = TextureConverter.AsRgba(pixelMemory);
+                int y = tileRow * 4;
+                // The read position only advances inside of the image, by width pixels per pixel row
+                int i = y * width;
+
                 for (int x = 0; x < width; x += 4)
                 {
                     for (int y1 = y; y1 < y + 4; y1++)
@@ -198,24 +228,26 @@ namespace libWiiSharp
                             if (y1 >= height || x1 >= width)
                                 continue;
 
-                            ushort pixel = Shared.Swap(BitConverter.ToUInt16(texture, i++ * 2));
+                            ushort pixel = BinaryPrimitives.ReadUInt16BigEndian(texture.Slice(i++ * 2));
 
                             output[y1 * width + x1] = paletteData[pixel & 0x3FFF];
                         }
                     }
                 }
-            }
-
-            return Shared.UIntArrayToByteArray(output);
+            });
         }
 
         public void ToCI14X2()
         {
-            byte[] indexData = new byte[TextureConverter.GetTextureSize(textureFormat, width, height)];
-            int i = 0;
+            byte[] indexData = TextureConverter.RentTextureBuffer(textureFormat, width, height);
 
-            for (int y = 0; y < height; y += 4)
+            Parallel.For(0, (height + 3) / 4, TextureConverter.ParallelOptions, tileRow =>
             {
+                ReadOnlySpan<uint> rgbaData = TextureConverter.AsRgba(rgbaMemory);
+                int y = tileRow * 4;
+                // Every 4x4 tile is 32 bytes
+                int i = tileRow * ((width + 3) / 4) * 32;
+
                 for (int x = 0; x < width; x += 4)
                 {
                     for (int y1 = y; y1 < y + 4; y1++)
@@ -229,13 +261,13 @@ namespace libWiiSharp
                             else
                                 pixel = rgbaData[y1 * width + x1];
 
-                            byte[] temp = BitConverter.GetBytes((ushort)GetColorIndex(pixel));
-                            indexData[i++] = temp[1];
-                            indexData[i++] = temp[0];
+                            ushort index = (ushort)GetColorIndex(pixel);
+                            indexData[i++] = (byte)(index >> 8);
+                            indexData[i++] = (byte)(index & 0xff);
                         }
                     }
                 }
-            }
+            });
 
             this.textureData = indexData;
         }
@@ -248,29 +280,65 @@ namespace libWiiSharp
 
             List<uint> palette = new();
             List<ushort> tPalette = new();
+            // Lookups for the colors and palette values already in the palette, the lists keep the first-seen order
+            HashSet<uint> paletteColors = new();
+            bool[] paletteValues = new bool[ushort.MaxValue + 1];
 
             palette.Add(0);
             tPalette.Add(0);
+            paletteColors.Add(0);
+            paletteValues[0] = true;
 
+            ReadOnlySpan<uint> rgbaData = TextureConverter.AsRgba(rgbaMemory);
             for (int i = 1; i < rgbaData.Length; i++)
             {
                 if (palette.Count == palLength) break;
                 if (((rgbaData[i] >> 24) & 0xff) < ((textureFormat == TextureFormat.CI14X2) ? 1 : 25)) continue;
 
-                ushort textureValue = Shared.Swap(ConvertToPaletteValue((int)rgbaData[i]));
+                ushort textureValue = ConvertToPaletteValue((int)rgbaData[i]);
 
-                if (!palette.Contains(rgbaData[i]) && !tPalette.Contains(textureValue))
+                if (!paletteValues[textureValue] && paletteColors.Add(rgbaData[i]))
                 {
                     palette.Add(rgbaData[i]);
                     tPalette.Add(textureValue);
+                    paletteValues[textureValue] = true;
                 }
             }
 
             while (palette.Count % 16 != 0)
             { palette.Add(0xffffffff); tPalette.Add(0xffff); }
 
-            texturePalette = Shared.UShortArrayToByteArray(tPalette.ToArray());
+            ushort[] paletteData = tPalette.ToArray();
+            Shared.NativeToBigEndian(paletteData);
+            texturePalette = Shared.UShortArrayToByteArray(paletteData);
             rgbaPalette = palette.ToArray();
+
+            BuildColorIndexLookup();
+        }
+
+        private void BuildColorIndexLookup()
+        {
+            uint[] paletteColors = new uint[rgbaPalette.Length];
+            colorIndexes = new int[ushort.MaxValue + 1];
+            Array.Fill(colorIndexes, -1);
+            sortedPaletteColors = new uint[rgbaPalette.Length];
+            sortedPaletteSums = new int[rgbaPalette.Length];
+            sortedPaletteIndexes = new int[rgbaPalette.Length];
+
+            // Backwards so an exact match resolves to the first palette entry with that value
+            for (int i = rgbaPalette.Length - 1; i >= 0; i--)
+            {
+                ushort curPal = ConvertToPaletteValue((int)rgbaPalette[i]);
+
+                colorIndexes[curPal] = i;
+                paletteColors[i] = ConvertToRgbaValue(curPal);
+                sortedPaletteSums[i] = GetChannelSum(paletteColors[i]);
+                sortedPaletteIndexes[i] = i;
+            }
+
+            Array.Sort(sortedPaletteSums, sortedPaletteIndexes);
+            for (int i = 0; i < sortedPaletteIndexes.Length; i++)
+                sortedPaletteColors[i] = paletteColors[sortedPaletteIndexes[i]];
         }
 
         private ushort ConvertToPaletteValue(int rgba)
@@ -328,34 +396,60 @@ namespace libWiiSharp
 
         private uint GetColorIndex(uint value)
         {
-            uint minDistance = 0x7FFFFFFF;
-            uint colorIndex = 0;
-
             if (((value >> 24) & 0xFF) < ((textureFormat == TextureFormat.CI14X2) ? 1 : 25)) return 0;
             ushort color = ConvertToPaletteValue((int)value);
 
-            for (int i = 0; i < rgbaPalette.Length; i++)
+            // The index only depends on the palette value, so each one is looked up once. Exact matches are already
+            // known, racing threads can only store the same index.
+            int colorIndex = colorIndexes[color];
+            if (colorIndex < 0)
             {
-                ushort curPal = ConvertToPaletteValue((int)rgbaPalette[i]);
+                colorIndex = FindNearestColorIndex(color);
+                colorIndexes[color] = colorIndex;
+            }
+
+            return (uint)colorIndex;
+        }
 
-                if (color == curPal) return (uint)i;
-                uint curDistance = GetDistance(color, curPal); //(uint)Math.Abs(Math.Abs(color) - Math.Abs(curVal));
+        private int FindNearestColorIndex(ushort color)
+        {
+            uint curCol = ConvertToRgbaValue(color);
+            int curSum = GetChannelSum(curCol);
+            uint minDistance = 0x7FFFFFFF;
+            int colorIndex = 0;
 
-                if (curDistance < minDistance)
+            // The difference of the channel sums is never more than the distance, so the search goes outwards from
+            // the sum of the color and stops once the sums are further away than the nearest color. Ties keep the
+            // lowest palette index, like a scan of the whole palette.
+            int start = Array.BinarySearch(sortedPaletteSums, curSum);
+            if (start < 0) start = ~start;
+
+            for (int i = start; i < sortedPaletteSums.Length && (uint)(sortedPaletteSums[i] - curSum) <= minDistance; i++)
+                CheckDistance(i);
+            for (int i = start - 1; i >= 0 && (uint)(curSum - sortedPaletteSums[i]) <= minDistance; i--)
+                CheckDistance(i);
+
+            return colorIndex;
+
+            void CheckDistance(int i)
+            {
+                uint curDistance = GetDistance(curCol, sortedPaletteColors[i]);
+
+                if (curDistance < minDistance || (curDistance == minDistance && sortedPaletteIndexes[i] < colorIndex))
                 {
                     minDistance = curDistance;
-                    colorIndex = (uint)i;
+                    colorIndex = sortedPaletteIndexes[i];
                 }
             }
-
-            return colorIndex;
         }
 
-        private uint GetDistance(ushort color, ushort paletteColor)
+        private static int GetChannelSum(uint rgba)
         {
-            uint curCol = ConvertToRgbaValue(color);
-            uint palCol = ConvertToRgbaValue(paletteColor);
+            return (int)(((rgba >> 24) & 0xFF) + ((rgba >> 16) & 0xFF) + ((rgba >> 8) & 0xFF) + ((rgba >> 0) & 0xFF));
+        }
 
+        private static uint GetDistance(uint curCol, uint palCol)
+        {
             uint curA = (curCol >> 24) & 0xFF;
             uint curR = (curCol >> 16) & 0xFF;
             uint curG = (curCol >> 8) & 0xFF;
@@ -16,8 +16,9 @@
  */
 
 using System;
+using System.Buffers.Binary;
 using System.Collections.Generic;
-using System.Net;
+using System.Runtime.InteropServices;
 
 namespace libWiiSharp
 {
@@ -125,70 +126,68 @@ namespace libWiiSharp
             return value;
         }
 
-        // Swaps endianness.
+        // Swaps endianness (between native and big endian, a no-op on big endian machines).
         public static ushort Swap(ushort value)
         {
-            return (ushort)IPAddress.HostToNetworkOrder((short)value);
+            return BitConverter.IsLittleEndian ? BinaryPrimitives.ReverseEndianness(value) : value;
         }
 
-        // Swaps endianness.
+        // Swaps endianness (between native and big endian, a no-op on big endian machines).
         public static uint Swap(uint value)
         {
-            return (uint)IPAddress.HostToNetworkOrder((int)value);
+            return BitConverter.IsLittleEndian ? BinaryPrimitives.ReverseEndianness(value) : value;
         }
 
-        // Swaps endianness
+        // Swaps endianness (between native and big endian, a no-op on big endian machines).
         public static ulong Swap(ulong value)
         {
-            return (ulong)IPAddress.HostToNetworkOrder((long)value);
+            return BitConverter.IsLittleEndian ? BinaryPrimitives.ReverseEndianness(value) : value;
         }
 
+        // Converts big endian values to native endianness in place.
+        public static void BigEndianToNative(Span<ushort> values)
+        {
+            if (BitConverter.IsLittleEndian)
+                for (int i = 0; i < values.Length; i++)
+                    values[i] = BinaryPrimitives.ReverseEndianness(values[i]);
+        }
+
+        // Converts big endian values to native endianness in place.
+        public static void BigEndianToNative(Span<uint> values)
+        {
+            if (BitConverter.IsLittleEndian)
+                for (int i = 0; i < values.Length; i++)
+                    values[i] = BinaryPrimitives.ReverseEndianness(values[i]);
+        }
+
+        // Converts native endianness values to big endian in place.
+        public static void NativeToBigEndian(Span<ushort> values) => BigEndianToNative(values);
+
+        // Converts native endianness values to big endian in place.
+        public static void NativeToBigEndian(Span<uint> values) => BigEndianToNative(values);
+
         // Turns a ushort array into a byte array.
         public static byte[] UShortArrayToByteArray(ushort[] array)
         {
-            List<byte> results = new();
-            foreach (ushort value in array)
-            {
-                byte[] converted = BitConverter.GetBytes(value);
-                results.AddRange(converted);
-            }
-            return results.ToArray();
+            return MemoryMarshal.AsBytes(array.AsSpan()).ToArray();
         }
 
         // Turns a uint array into a byte array.
         public static byte[] UIntArrayToByteArray(uint[] array)
         {
-            List<byte> results = new();
-            foreach (uint value in array)
-            {
-                byte[] converted = BitConverter.GetBytes(value);
-                results.AddRange(converted);
-            }
-            return results.ToArray();
+            return MemoryMarshal.AsBytes(array.AsSpan()).ToArray();
         }
 
         // Turns a byte array into a uint array.
         public static uint[] ByteArrayToUIntArray(byte[] array)
         {
-            UInt32[] converted = new UInt32[array.Length / 4];
-            int j = 0;
-
-            for (int i = 0; i < array.Length; i += 4)
-                converted[j++] = BitConverter.ToUInt32(array, i);
-
-            return converted;
+            return MemoryMarshal.Cast<byte, uint>(array).ToArray();
         }
 
         // Turns a byte array into a ushort array.
         public static ushort[] ByteArrayToUShortArray(byte[] array)
         {
-            ushort[] converted = new ushort[array.Length / 2];
-            int j = 0;
-
-            for (int i = 0; i < array.Length; i += 2)
-                converted[j++] = BitConverter.ToUInt16(array, i);
-
-            return converted;
+            return MemoryMarshal.Cast<byte, ushort>(array).ToArray();
         }
     }
 }
@@ -23,6 +23,8 @@ using libWiiSharp.Formats;
 using SixLabors.ImageSharp.PixelFormats;
 using SixLabors.ImageSharp;
 using System;
+using System.Buffers;
+using System.Threading.Tasks;
 using BCnEncoder.Decoder;
 using BCnEncoder.Encoder;
 using BCnEncoder.Shared;
@@ -31,19 +33,24 @@ namespace libWiiSharp
 {
     internal static partial class TextureConverter
     {
-        private static byte[] FromCMPR(byte[] texture, int width, int height)
+        private static void FromCMPR(ReadOnlyMemory<byte> textureMemory, Memory<Bgra32> pixelMemory, int width, int height)
         {
-            // BC1 with 1 bit Alpha
-            BcDecoder bc1Decoder = new();
-            // struct DXTBlock { uint16_t color1; uint16_t color2; uint8_t lines[4]; }
-            byte[] block = new byte[8];
-            // Data read position
-            long offset = 0L;
-            // { r1, g1, b1, a1, ..., r16, g16, b16, a16 }
-            ColorRgba32[,] rgba = new ColorRgba32[4, 4];
-            uint[] bgra = new uint[width * height];
-            for (int ty = 0; ty < height; ty += 8)
+            // Every 8x8 tile is 4 DXTBlocks (4 * 8 bytes)
+            int tileRowSize = (width + 7) / 8 * 32;
+            Parallel.For(0, (height + 7) / 8, ParallelOptions, tileRow =>
             {
+                ReadOnlySpan<byte> texture = textureMemory.Span;
+                Span<uint> bgra = AsRgba(pixelMemory);
+                int ty = tileRow * 8;
+                CMPRScratch scratch = CMPRScratch.ForCurrentThread;
+                // BC1 with 1 bit Alpha
+                BcDecoder bc1Decoder = scratch.Bc1Decoder;
+                // struct DXTBlock { uint16_t color1; uint16_t color2; uint8_t lines[4]; }
+                byte[] block = scratch.Block;
+                // Data read position
+                int offset = tileRow * tileRowSize;
+                // { r1, g1, b1, a1, ..., r16, g16, b16, a16 }
+                ColorRgba32[,] rgba = scratch.DecodedBlock;
                 for (int tx = 0; tx < width; tx += 8)
                 {
                     for (int by = 0; by < 8; by += 4)
@@ -51,8 +58,8 @@ namespace libWiiSharp
                         for (int bx = 0; bx < 8; bx += 4)
                         {
                             // Read DXTBlock (sizeof(DXTBlock) == 8)
-                            Array.Copy(texture, offset, block, 0, 8);
-                            offset += 8L;
+                            texture.Slice(offset, 8).CopyTo(block);
+                            offset += 8;
                             // Fix DXTBlock endianness
                             S3TC1ReverseBlock(ref block);
                             // BC1 with 1 bit Alpha
@@ -75,69 +82,181 @@ namespace libWiiSharp
                         }
                     }
                 }
+            });
+        }
+
+        private static void ToCMPR(ReadOnlyMemory<Bgra32> pixelMemory, int width, int height, byte[] texture,
+            int firstTileRow, int tileRowCount)
+        {
+            // Every 8x8 tile is 4 DXTBlocks (4 * 8 bytes)
+            int tileRowSize = (width + 7) / 8 * 32;
+            Parallel.For(firstTileRow, firstTileRow + tileRowCount, ParallelOptions, tileRow =>
+            {
+                ReadOnlySpan<uint> bgra = AsRgba(pixelMemory);
+                CMPRScratch scratch = CMPRScratch.ForCurrentThread;
+                // Data write position
+                long offset = (long)(tileRow - firstTileRow) * tileRowSize;
+                for (int tx = 0; tx < width; tx += 8)
+                {
+                    ToCMPRTile(bgra, width, height, tx, tileRow * 8, texture, offset, scratch);
+                    offset += 32L;
+                }
+            });
+        }
+
+        // Encodes only the tiles of the tile rows [firstTileRow, firstTileRow + tileRowCount) that are true in tiles (in
+        // rows of (width + 7) / 8 tiles) to their place in texture, the other tiles of texture are left as they are.
+        // pixelMemory starts at the first pixel row of firstTileRow, the same as for ToCMPR.
+        private static void ToCMPRTiles(ReadOnlyMemory<Bgra32> pixelMemory, int width, int height, byte[] texture,
+            bool[] tiles, int firstTileRow, int tileRowCount)
+        {
+            int tileColumnCount = (width + 7) / 8,
+                firstTile = firstTileRow * tileColumnCount,
+                lastTile = (firstTileRow + tileRowCount) * tileColumnCount;
+            int[] tileIndices = ArrayPool<int>.Shared.Rent(lastTile - firstTile);
+            try
+            {
+                int tileCount = 0;
+                for (int i = firstTile; i < lastTile; i++)
+                {
+                    if (tiles[i])
+                        tileIndices[tileCount++] = i;
+                }
+
+                // Every 8x8 tile is 4 DXTBlocks (4 * 8 bytes)
+                Parallel.For(0, tileCount, ParallelOptions, i =>
+                {
+                    int tileRow = tileIndices[i] / tileColumnCount,
+                        tileColumn = tileIndices[i] % tileColumnCount;
+                    ToCMPRTile(AsRgba(pixelMemory), width, height, tileColumn * 8, (tileRow - firstTileRow) * 8, texture,
+                        (long)tileIndices[i] * 32L, CMPRScratch.ForCurrentThread);
+                });
+            }
+            finally
+            {
+                ArrayPool<int>.Shared.Return(tileIndices);
             }
-            // Packed uints to unpacked bytes
-            return Shared.UIntArrayToByteArray(bgra);
         }
 
-        private static byte[] ToCMPR(Image<Bgra32> img, TextureFormat textureFormat)
+        private static void ToCMPRTile(ReadOnlySpan<uint> bgra, int width, int height, int tx, int ty, byte[] texture,
+            long offset, CMPRScratch scratch)
         {
-            byte[] texture = new byte[GetTextureSize(textureFormat, img.Width, img.Height)];
             // BC1 with 1 bit Alpha
-            BcEncoder bc1Encoder = new(CompressionFormat.Bc1WithAlpha);
+            BcEncoder bc1Encoder = scratch.Bc1Encoder;
             // struct DXTBlock { uint16_t color1; uint16_t color2; uint8_t lines[4]; }
-            byte[] block = new byte[8];
-            // Data write position
-            long offset = 0L;
+            byte[] block = scratch.Block;
             // { r1, g1, b1, a1, ..., r16, g16, b16, a16 }
-            ColorRgba32[] rgba = new ColorRgba32[16];
-            // Image to packed uint
-            uint[] bgra = ImageToRgba(img);
-            for (int ty = 0; ty < img.Height; ty += 8)
+            ColorRgba32[] rgba = scratch.EncodedBlock;
+            for (int by = 0; by < 8; by += 4)
             {
-                for (int tx = 0; tx < img.Width; tx += 8)
+                for (int bx = 0; bx < 8; bx += 4)
                 {
-                    for (int by = 0; by < 8; by += 4)
+                    // Read pixels as decompressed 16 bit blocks
+                    for (int py = 0; py < 4; py++)
                     {
-                        for (int bx = 0; bx < 8; bx += 4)
+                        for (int px = 0; px < 4; px++)
                         {
-                            // Read pixels as decompressed 16 bit blocks
-                            for (int py = 0; py < 4; py++)
+                            int pi = (py * 4) + px;
+                            // Discard exceeding pixels caused by extra GX blocks
+                            if ((ty + by + py) < height && (tx + bx + px) < width)
                             {
-                                for (int px = 0; px < 4; px++)
-                                {
-                                    int pi = (py * 4) + px;
-                                    // Discard exceeding pixels caused by extra GX blocks
-                                    if ((ty + by + py) < img.Height && (tx + bx + px) < img.Width)
-                                    {
-                                        // Unpack color to correct position
-                                        rgba[pi].r = (byte)(bgra[(ty + by + py) * img.Width + (tx + bx + px)] >> 16);
-                                        rgba[pi].g = (byte)(bgra[(ty + by + py) * img.Width + (tx + bx + px)] >> 8);
-                                        rgba[pi].b = (byte)(bgra[(ty + by + py) * img.Width + (tx + bx + px)] >> 0);
-                                        rgba[pi].a = (byte)(bgra[(ty + by + py) * img.Width + (tx + bx + px)] >> 24);
-                                    }
-                                    else
-                                    {
-                                        // Add dummy color for extra GX blocks
-                                        rgba[pi].r = 0;
-                                        rgba[pi].g = 0;
-                                        rgba[pi].b = 0;
-                                        rgba[pi].a = 0;
-                                    }
-                                }
+                                // Unpack color to correct position
+                                rgba[pi].r = (byte)(bgra[(ty + by + py) * width + (tx + bx + px)] >> 16);
+                                rgba[pi].g = (byte)(bgra[(ty + by + py) * width + (tx + bx + px)] >> 8);
+                                rgba[pi].b = (byte)(bgra[(ty + by + py) * width + (tx + bx + px)] >> 0);
+                                rgba[pi].a = (byte)(bgra[(ty + by + py) * width + (tx + bx + px)] >> 24);
+                            }
+                            else
+                            {
+                                // Add dummy color for extra GX blocks
+                                rgba[pi].r = 0;
+                                rgba[pi].g = 0;
+                                rgba[pi].b = 0;
+                                rgba[pi].a = 0;
                             }
-                            // BC1 with 1 bit Alpha
-                            Array.Copy(bc1Encoder.EncodeBlock(rgba), 0, block, 0, 8);
-                            // Fix DXTBlock endianness
-                            S3TC1ReverseBlock(ref block);
-                            // Write compressed 8 bit block to pixels
-                            Array.Copy(block, 0, texture, offset, 8);
-                            offset += 8L;
                         }
                     }
+                    // BC1 with 1 bit Alpha
+                    Array.Copy(bc1Encoder.EncodeBlock(rgba), 0, block, 0, 8);
+                    // Fix DXTBlock endianness
+                    S3TC1ReverseBlock(ref block);
+                    // Write compressed 8 bit block to pixels
+                    Array.Copy(block, 0, texture, offset, 8);
+                    offset += 8L;
+                }
+            }
+        }
+
+        // Rewrites CMPR blocks as BC1 blocks in rows of (width + 3) / 4 blocks without decoding them. See: TranscodeCMPR
+        internal static void CMPRToBC1(ReadOnlySpan<byte> texture, Span<byte> bc1, int width, int height)
+            => TranscodeCMPR(texture, bc1, width, height, true);
+
+        // Rewrites BC1 blocks in rows of (width + 3) / 4 blocks as CMPR blocks without decoding them. See: TranscodeCMPR
+        internal static void BC1ToCMPR(ReadOnlySpan<byte> bc1, Span<byte> texture, int width, int height)
+            => TranscodeCMPR(bc1, texture, width, height, false);
+
+        // The rows of a TXTR are stored bottom to top, so a block can only be flipped to top to bottom as a whole when
+        // none of its rows belong to another block after the flip
+        internal static bool CanTranscodeCMPR(int height)
+            => height < 4 || height % 4 == 0;
+
+        internal static int GetBC1Size(int width, int height)
+            => (width + 3 >> 2) * (height + 3 >> 2) * 8;
+
+        private static void TranscodeCMPR(ReadOnlySpan<byte> source, Span<byte> destination, int width, int height, bool toBC1)
+        {
+            if (!CanTranscodeCMPR(height))
+                throw new NotSupportedException($"CMPR with a height of {height} cannot be transcoded, the height must be less than 4 or a multiple of 4");
+
+            int blocksWide = (width + 3) / 4;
+            int blocksHigh = (height + 3) / 4;
+            // Every 8x8 tile is 4 DXTBlocks (4 * 8 bytes)
+            int tileRowSize = (width + 7) / 8 * 32;
+            // The rows of the last (or only) block row that are inside of the image
+            int rows = Math.Min(height, 4);
+            for (int by = 0; by < blocksHigh; by++)
+            {
+                for (int bx = 0; bx < blocksWide; bx++)
+                {
+                    // The 4 blocks of a tile are in rows of 2 blocks
+                    int cmprOffset = (by / 2 * tileRowSize) + (bx / 2 * 32) + (((by % 2 * 2) + (bx % 2)) * 8);
+                    // BC1 block rows are top to bottom
+                    int bc1Offset = (((blocksHigh - 1 - by) * blocksWide) + bx) * 8;
+                    if (toBC1)
+                        TranscodeBlock(source.Slice(cmprOffset, 8), destination.Slice(bc1Offset, 8), rows);
+                    else
+                        TranscodeBlock(source.Slice(bc1Offset, 8), destination.Slice(cmprOffset, 8), rows);
                 }
             }
-            return texture;
+        }
+
+        // Does the same as S3TC1ReverseBlock and also reverses the first rows index lines of the block, so it converts both ways
+        private static void TranscodeBlock(ReadOnlySpan<byte> source, Span<byte> destination, int rows)
+        {
+            // Reverse bytes of endpoint 1 and 2 (ushort)
+            destination[0] = source[1];
+            destination[1] = source[0];
+            destination[2] = source[3];
+            destination[3] = source[2];
+            // Reverse the bits of the 4 indices (byte[4]) and the order of the rows
+            for (int line = 0; line < 4; line++)
+                destination[4 + line] = S3TC1ReverseByte(source[4 + (line < rows ? rows - 1 - line : line)]);
+        }
+
+        // The BC1 codecs and block buffers of a thread, reused by every tile (row) it converts instead of being
+        // created again for each tile (row)
+        private sealed class CMPRScratch
+        {
+            [ThreadStatic]
+            private static CMPRScratch? current;
+
+            public static CMPRScratch ForCurrentThread => current ??= new();
+
+            public BcDecoder Bc1Decoder { get; } = new();
+            public BcEncoder Bc1Encoder { get; } = new(CompressionFormat.Bc1WithAlpha);
+            public byte[] Block { get; } = new byte[8];
+            public ColorRgba32[,] DecodedBlock { get; } = new ColorRgba32[4, 4];
+            public ColorRgba32[] EncodedBlock { get; } = new ColorRgba32[16];
         }
     }
 }
@@ -22,18 +22,23 @@
 using libWiiSharp.Formats;
 using SixLabors.ImageSharp.PixelFormats;
 using SixLabors.ImageSharp;
+using System;
+using System.Threading.Tasks;
 
 namespace libWiiSharp
 {
     internal static partial class TextureConverter
     {
-        private static byte[] FromI4(byte[] texture, int width, int height)
+        private static void FromI4(ReadOnlyMemory<byte> textureMemory, Memory<Bgra32> pixelMemory, int width, int height)
         {
-            uint[] output = new uint[width * height];
-            int inp = 0;
-
-            for (int y = 0; y < height; y += 8)
+            Parallel.For(0, (height + 7) / 8, ParallelOptions, tileRow =>
             {
+                ReadOnlySpan<byte> texture = textureMemory.Span;
+                Span<uint> output = AsRgba(pixelMemory);
+                int y = tileRow * 8;
+                // The read position only advances inside of the image, by (width + 1) / 2 bytes per pixel row
+                int inp = y * ((width + 1) / 2);
+
                 for (int x = 0; x < width; x += 8)
                 {
                     for (int y1 = y; y1 < y + 8; y1++)
@@ -48,26 +53,27 @@ namespace libWiiSharp
                             int i = (pixel >> 4) * 255 / 15;
                             output[y1 * width + x1] = (uint)((i << 0) | (i << 8) | (i << 16) | (255 << 24));
 
+                            // With an odd width the second pixel of the last byte of a row lands on the next row. On the
+                            // last row of a tile row that pixel belongs to the next tile row, which overwrites it anyway.
                             i = (pixel & 0x0F) * 255 / 15;
-                            if (y1 * width + x1 + 1 < output.Length) output[y1 * width + x1 + 1] = (uint)((i << 0) | (i << 8) | (i << 16) | (255 << 24));
+                            if (y1 * width + x1 + 1 < output.Length && (x1 + 1 < width || y1 + 1 < y + 8))
+                                output[y1 * width + x1 + 1] = (uint)((i << 0) | (i << 8) | (i << 16) | (255 << 24));
                         }
                     }
                 }
-            }
-
-            return Shared.UIntArrayToByteArray(output);
+            });
         }
 
-        private static byte[] ToI4(Image<Bgra32> img, TextureFormat textureFormat)
+        private static void ToI4(ReadOnlyMemory<Bgra32> pixelMemory, int w, int h, byte[] output, int firstTileRow,
+            int tileRowCount)
         {
-            uint[] pixeldata = ImageToRgba(img);
-            int w = img.Width;
-            int h = img.Height;
-            int inp = 0;
-            byte[] output = new byte[GetTextureSize(textureFormat, img.Width, img.Height)];
-
-            for (int y1 = 0; y1 < h; y1 += 8)
+            Parallel.For(firstTileRow, firstTileRow + tileRowCount, ParallelOptions, tileRow =>
             {
+                ReadOnlySpan<uint> pixeldata = AsRgba(pixelMemory);
+                int y1 = tileRow * 8;
+                // Every 8x8 tile is 32 bytes
+                int inp = (tileRow - firstTileRow) * ((w + 7) / 8) * 32;
+
                 for (int x1 = 0; x1 < w; x1 += 8)
                 {
                     for (int y = y1; y < y1 + 8; y++)
@@ -104,9 +110,7 @@ namespace libWiiSharp
                         }
                     }
                 }
-            }
-
-            return output;
+            });
         }
     }
 }
@@ -22,18 +22,23 @@
 using libWiiSharp.Formats;
 using SixLabors.ImageSharp.PixelFormats;
 using SixLabors.ImageSharp;
+using System;
+using System.Threading.Tasks;
 
 namespace libWiiSharp
 {
     internal static partial class TextureConverter
     {
-        private static byte[] FromI8(byte[] texture, int width, int height)
+        private static void FromI8(ReadOnlyMemory<byte> textureMemory, Memory<Bgra32> pixelMemory, int width, int height)
         {
-            uint[] output = new uint[width * height];
-            int inp = 0;
-
-            for (int y = 0; y < height; y += 4)
+            Parallel.For(0, (height + 3) / 4, ParallelOptions, tileRow =>
             {
+                ReadOnlySpan<byte> texture = textureMemory.Span;
+                Span<uint> output = AsRgba(pixelMemory);
+                int y = tileRow * 4;
+                // The read position only advances inside of the image, by width bytes per pixel row
+                int inp = y * width;
+
                 for (int x = 0; x < width; x += 8)
                 {
                     for (int y1 = y; y1 < y + 4; y1++)
@@ -49,21 +54,19 @@ namespace libWiiSharp
                         }
                     }
                 }
-            }
-
-            return Shared.UIntArrayToByteArray(output);
+            });
         }
 
-        private static byte[] ToI8(Image<Bgra32> img, TextureFormat textureFormat)
+        private static void ToI8(ReadOnlyMemory<Bgra32> pixelMemory, int w, int h, byte[] output, int firstTileRow,
+            int tileRowCount)
         {
-            uint[] pixeldata = ImageToRgba(img);
-            int w = img.Width;
-            int h = img.Height;
-            int inp = 0;
-            byte[] output = new byte[GetTextureSize(textureFormat, img.Width, img.Height)];
-
-            for (int y1 = 0; y1 < h; y1 += 4)
+            Parallel.For(firstTileRow, firstTileRow + tileRowCount, ParallelOptions, tileRow =>
             {
+                ReadOnlySpan<uint> pixeldata = AsRgba(pixelMemory);
+                int y1 = tileRow * 4;
+                // Every 8x4 tile is 32 bytes
+                int inp = (tileRow - firstTileRow) * ((w + 7) / 8) * 32;
+
                 for (int x1 = 0; x1 < w; x1 += 8)
                 {
                     for (int y = y1; y < y1 + 4; y++)
@@ -89,9 +92,7 @@ namespace libWiiSharp
                         }
                     }
                 }
-            }
-
-            return output;
+            });
         }
     }
 }
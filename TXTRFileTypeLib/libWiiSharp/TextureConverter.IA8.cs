@@ -23,18 +23,25 @@ using libWiiSharp.Formats;
 using SixLabors.ImageSharp.PixelFormats;
 using SixLabors.ImageSharp;
 using System;
+using System.Buffers.Binary;
+using System.Threading.Tasks;
 
 namespace libWiiSharp
 {
     internal static partial class TextureConverter
     {
-        private static byte[] FromIA8(byte[] texture, int width, int height)
+        private static void FromIA8(ReadOnlyMemory<byte> textureMemory, Memory<Bgra32> pixelMemory, int width, int height)
         {
-            uint[] output = new uint[width * height];
-            int inp = 0;
+            uint[] table = IA8Table;
 
-            for (int y = 0; y < height; y += 4)
+            Parallel.For(0, (height + 3) / 4, ParallelOptions, tileRow =>
             {
+                ReadOnlySpan<byte> texture = textureMemory.Span;
+                Span<uint> output = AsRgba(pixelMemory);
+                int y = tileRow * 4;
+                // The read position only advances inside of the image, by width pixels per pixel row
+                int inp = y * width;
+
                 for (int x = 0; x < width; x += 4)
                 {
                     for (int y1 = y; y1 < y + 4; y1++)
@@ -44,30 +51,25 @@ namespace libWiiSharp
                             if (y1 >= height || x1 >= width)
                                 continue;
 
-                            int pixel = Shared.Swap(BitConverter.ToUInt16(texture, inp++ * 2));
-
-                            uint a = (uint)(pixel >> 8);
-                            uint i = (uint)(pixel & 0xff);
+                            ushort pixel = BinaryPrimitives.ReadUInt16BigEndian(texture.Slice(inp++ * 2));
 
-                            output[y1 * width + x1] = (i << 0) | (i << 8) | (i << 16) | (a << 24);
+                            output[y1 * width + x1] = table[pixel];
                         }
                     }
                 }
-            }
-
-            return Shared.UIntArrayToByteArray(output);
+            });
         }
 
-        private static byte[] ToIA8(Image<Bgra32> img, TextureFormat textureFormat)
+        private static void ToIA8(ReadOnlyMemory<Bgra32> pixelMemory, int w, int h, byte[] output, int firstTileRow,
+            int tileRowCount)
         {
-            uint[] pixeldata = ImageToRgba(img);
-            int w = img.Width;
-            int h = img.Height;
-            int inp = 0;
-            byte[] output = new byte[GetTextureSize(textureFormat, img.Width, img.Height)];
-
-            for (int y1 = 0; y1 < h; y1 += 4)
+            Parallel.For(firstTileRow, firstTileRow + tileRowCount, ParallelOptions, tileRow =>
             {
+                ReadOnlySpan<uint> pixeldata = AsRgba(pixelMemory);
+                int y1 = tileRow * 4;
+                // Every 4x4 tile is 32 bytes
+                int inp = (tileRow - firstTileRow) * ((w + 3) / 4) * 32;
+
                 for (int x1 = 0; x1 < w; x1 += 4)
                 {
                     for (int y = y1; y < y1 + 4; y++)
@@ -92,17 +94,12 @@ namespace libWiiSharp
                                 newpixel = (ushort)((a << 8) | i);
                             }
 
-                            byte[] temp = BitConverter.GetBytes(newpixel);
-                            Array.Reverse(temp);
-
                             output[inp++] = (byte)(newpixel >> 8);
                             output[inp++] = (byte)(newpixel & 0xff);
                         }
                     }
                 }
-            }
-
-            return output;
+            });
         }
     }
 }
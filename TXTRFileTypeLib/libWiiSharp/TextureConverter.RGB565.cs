@@ -23,18 +23,25 @@ using libWiiSharp.Formats;
 using SixLabors.ImageSharp.PixelFormats;
 using SixLabors.ImageSharp;
 using System;
+using System.Buffers.Binary;
+using System.Threading.Tasks;
 
 namespace libWiiSharp
 {
     internal static partial class TextureConverter
     {
-        private static byte[] FromRGB565(byte[] texture, int width, int height)
+        private static void FromRGB565(ReadOnlyMemory<byte> textureMemory, Memory<Bgra32> pixelMemory, int width, int height)
         {
-            uint[] output = new uint[width * height];
-            int inp = 0;
+            uint[] table = RGB565Table;
 
-            for (int y = 0; y < height; y += 4)
+            Parallel.For(0, (height + 3) / 4, ParallelOptions, tileRow =>
             {
+                ReadOnlySpan<byte> texture = textureMemory.Span;
+                Span<uint> output = AsRgba(pixelMemory);
+                int y = tileRow * 4;
+                // The read position only advances inside of the image, by width pixels per pixel row
+                int inp = y * width;
+
                 for (int x = 0; x < width; x += 4)
                 {
                     for (int y1 = y; y1 < y + 4; y1++)
@@ -44,31 +51,25 @@ namespace libWiiSharp
                             if (y1 >= height || x1 >= width)
                                 continue;
 
-                            ushort pixel = Shared.Swap(BitConverter.ToUInt16(texture, inp++ * 2));
-
-                            int b = (((pixel >> 11) & 0x1F) << 3) & 0xff;
-                            int g = (((pixel >> 5) & 0x3F) << 2) & 0xff;
-                            int r = (((pixel >> 0) & 0x1F) << 3) & 0xff;
+                            ushort pixel = BinaryPrimitives.ReadUInt16BigEndian(texture.Slice(inp++ * 2));
 
-                            output[y1 * width + x1] = (uint)((r << 0) | (g << 8) | (b << 16) | (255 << 24));
+                            output[y1 * width + x1] = table[pixel];
                         }
                     }
                 }
-            }
-
-            return Shared.UIntArrayToByteArray(output);
+            });
         }
 
-        private static byte[] ToRGB565(Image<Bgra32> img, TextureFormat textureFormat)
+        private static void ToRGB565(ReadOnlyMemory<Bgra32> pixelMemory, int w, int h, byte[] output, int firstTileRow,
+            int tileRowCount)
         {
-            uint[] pixeldata = ImageToRgba(img);
-            int w = img.Width;
-            int h = img.Height;
-            int z = -1;
-            byte[] output = new byte[GetTextureSize(textureFormat, img.Width, img.Height)];
-
-            for (int y1 = 0; y1 < h; y1 += 4)
+            Parallel.For(firstTileRow, firstTileRow + tileRowCount, ParallelOptions, tileRow =>
             {
+                ReadOnlySpan<uint> pixeldata = AsRgba(pixelMemory);
+                int y1 = tileRow * 4;
+                // Every 4x4 tile is 32 bytes
+                int z = (tileRow - firstTileRow) * ((w + 3) / 4) * 32 - 1;
+
                 for (int x1 = 0; x1 < w; x1 += 4)
                 {
                     for (int y = y1; y < y1 + 4; y++)
@@ -95,9 +96,7 @@ namespace libWiiSharp
                         }
                     }
                 }
-            }
-
-            return output;
+            });
         }
     }
 }
@@ -23,20 +23,25 @@ using libWiiSharp.Formats;
 using SixLabors.ImageSharp.PixelFormats;
 using SixLabors.ImageSharp;
 using System;
+using System.Buffers.Binary;
+using System.Threading.Tasks;
 
 namespace libWiiSharp
 {
     internal static partial class TextureConverter
     {
-        private static byte[] FromRGB5A3(byte[] texture, int width, int height)
+        private static void FromRGB5A3(ReadOnlyMemory<byte> textureMemory, Memory<Bgra32> pixelMemory, int width, int height)
         {
-            uint[] output = new uint[width * height];
-            int inp = 0;
-            int r, g, b;
-            int a = 0;
+            uint[] table = RGB5A3Table;
 
-            for (int y = 0; y < height; y += 4)
+            Parallel.For(0, (height + 3) / 4, ParallelOptions, tileRow =>
             {
+                ReadOnlySpan<byte> texture = textureMemory.Span;
+                Span<uint> output = AsRgba(pixelMemory);
+                int y = tileRow * 4;
+                // The read position only advances inside of the image, by width pixels per pixel row
+                int inp = y * width;
+
                 for (int x = 0; x < width; x += 4)
                 {
                     for (int y1 = y; y1 < y + 4; y1++)
@@ -46,42 +51,25 @@ namespace libWiiSharp
                             if (y1 >= height || x1 >= width)
                                 continue;
 
-                            ushort pixel = Shared.Swap(BitConverter.ToUInt16(texture, inp++ * 2));
+                            ushort pixel = BinaryPrimitives.ReadUInt16BigEndian(texture.Slice(inp++ * 2));
 
-                            if ((pixel & (1 << 15)) != 0)
-                            {
-                                b = (((pixel >> 10) & 0x1F) * 255) / 31;
-                                g = (((pixel >> 5) & 0x1F) * 255) / 31;
-                                r = (((pixel >> 0) & 0x1F) * 255) / 31;
-                                a = 255;
-                            }
-                            else
-                            {
-                                a = (((pixel >> 12) & 0x07) * 255) / 7;
-                                b = (((pixel >> 8) & 0x0F) * 255) / 15;
-                                g = (((pixel >> 4) & 0x0F) * 255) / 15;
-                                r = (((pixel >> 0) & 0x0F) * 255) / 15;
-                            }
-
-                            output[(y1 * width) + x1] = (uint)((r << 0) | (g << 8) | (b << 16) | (a << 24));
+                            output[(y1 * width) + x1] = table[pixel];
                         }
                     }
                 }
-            }
-
-            return Shared.UIntArrayToByteArray(output);
+            });
         }
 
-        private static byte[] ToRGB5A3(Image<Bgra32> img, TextureFormat textureFormat)
+        private static void ToRGB5A3(ReadOnlyMemory<Bgra32> pixelMemory, int w, int h, byte[] output, int firstTileRow,
+            int tileRowCount)
         {
-            uint[] pixeldata = ImageToRgba(img);
-            int w = img.Width;
-            int h = img.Height;
-            int z = -1;
-            byte[] output = new byte[GetTextureSize(textureFormat, img.Width, img.Height)];
-
-            for (int y1 = 0; y1 < h; y1 += 4)
+            Parallel.For(firstTileRow, firstTileRow + tileRowCount, ParallelOptions, tileRow =>
             {
+                ReadOnlySpan<uint> pixeldata = AsRgba(pixelMemory);
+                int y1 = tileRow * 4;
+                // Every 4x4 tile is 32 bytes
+                int z = (tileRow - firstTileRow) * ((w + 3) / 4) * 32 - 1;
+
                 for (int x1 = 0; x1 < w; x1 += 4)
                 {
                     for (int y = y1; y < y1 + 4; y++)
@@ -130,9 +118,7 @@ namespace libWiiSharp
                         }
                     }
                 }
-            }
-
-            return output;
+            });
         }
     }
 }
@@ -23,18 +23,23 @@ using libWiiSharp.Formats;
 using SixLabors.ImageSharp.PixelFormats;
 using SixLabors.ImageSharp;
 using System;
+using System.Buffers.Binary;
+using System.Threading.Tasks;
 
 namespace libWiiSharp
 {
     internal static partial class TextureConverter
     {
-        private static byte[] FromRGBA32(byte[] texture, int width, int height)
+        private static void FromRGBA32(ReadOnlyMemory<byte> textureMemory, Memory<Bgra32> pixelMemory, int width, int height)
         {
-            uint[] output = new uint[width * height];
-            int inp = 0;
-
-            for (int y = 0; y < height; y += 4)
+            Parallel.For(0, (height + 3) / 4, ParallelOptions, tileRow =>
             {
+                ReadOnlySpan<byte> texture = textureMemory.Span;
+                Span<uint> output = AsRgba(pixelMemory);
+                int y = tileRow * 4;
+                // The read position only advances inside of the image, by width pixels twice (AR then GB) per pixel row
+                int inp = y * width * 2;
+
                 for (int x = 0; x < width; x += 4)
                 {
                     for (int k = 0; k < 2; k++)
@@ -46,7 +51,7 @@ namespace libWiiSharp
                                 if ((x1 >= width) || (y1 >= height))
                                     continue;
 
-                                ushort pixel = Shared.Swap(BitConverter.ToUInt16(texture, inp++ * 2));
+                                ushort pixel = BinaryPrimitives.ReadUInt16BigEndian(texture.Slice(inp++ * 2));
 
                                 if (k == 0)
                                 {
@@ -64,22 +69,24 @@ namespace libWiiSharp
                         }
                     }
                 }
-            }
-
-            return Shared.UIntArrayToByteArray(output);
+            });
         }
 
-        private static byte[] ToRGBA32(Image<Bgra32> img, TextureFormat textureFormat)
+        private static void ToRGBA32(ReadOnlyMemory<Bgra32> pixelMemory, int w, int h, byte[] output, int firstTileRow,
+            int tileRowCount)
         {
-            uint[] pixeldata = ImageToRgba(img);
-            int w = img.Width;
-            int h = img.Height;
-            int z = 0, iv = 0;
-            byte[] output = new byte[GetTextureSize(textureFormat, img.Width, img.Height)];
-            uint[] lr = new uint[32], lg = new uint[32], lb = new uint[32], la = new uint[32];
-
-            for (int y1 = 0; y1 < h; y1 += 4)
+            Parallel.For(firstTileRow, firstTileRow + tileRowCount, ParallelOptions, tileRow =>
             {
+                ReadOnlySpan<uint> pixeldata = AsRgba(pixelMemory);
+                int y1 = tileRow * 4;
+                int z = 0;
+                // Every 4x4 tile is 64 bytes
+                int iv = (tileRow - firstTileRow) * ((w + 3) / 4) * 64;
+                Span<uint> lr = stackalloc uint[32];
+                Span<uint> lg = stackalloc uint[32];
+                Span<uint> lb = stackalloc uint[32];
+                Span<uint> la = stackalloc uint[32];
+
                 for (int x1 = 0; x1 < w; x1 += 4)
                 {
                     for (int y = y1; y < (y1 + 4); y++)
@@ -118,9 +125,7 @@ namespace libWiiSharp
                         z = 0;
                     }
                 }
-            }
-
-            return output;
+            });
         }
     }
 }
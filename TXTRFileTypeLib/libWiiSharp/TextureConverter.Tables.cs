@@ -0,0 +1,95 @@
+﻿/* This file is part of libWiiSharp
+ * Copyright (C) 2009 Leathl
+ * 
+ * libWiiSharp is free software: you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License as published
+ * by the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * libWiiSharp is distributed in the hope that it will be
+ * useful, but WITHOUT ANY WARRANTY; without even the implied warranty
+ * of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+//TPL conversion based on Wii.py by Xuzz, SquidMan, megazig, Matt_P, Omega and The Lemon Man.
+//Zetsubou by SquidMan was also a reference.
+//Thanks to the authors!
+
+using libWiiSharp.Extensions;
+using libWiiSharp.Formats;
+using System;
+
+namespace libWiiSharp
+{
+    internal static partial class TextureConverter
+    {
+        // 16 bit pixel to packed BGRA, built the first time a format is used and shared by all conversions
+        private static readonly Lazy<uint[]> ia8Table = new(() => BuildPixelTable(FromIA8Pixel));
+        private static readonly Lazy<uint[]> rgb565Table = new(() => BuildPixelTable(FromRGB565Pixel));
+        private static readonly Lazy<uint[]> rgb5a3Table = new(() => BuildPixelTable(FromRGB5A3Pixel));
+
+        internal static uint[] IA8Table { get => ia8Table.Value; }
+        internal static uint[] RGB565Table { get => rgb565Table.Value; }
+        internal static uint[] RGB5A3Table { get => rgb5a3Table.Value; }
+
+        internal static uint[] GetPixelTable(PaletteFormat paletteFormat)
+            => paletteFormat switch
+            {
+                PaletteFormat.IA8    => IA8Table,
+                PaletteFormat.RGB565 => RGB565Table,
+                PaletteFormat.RGB5A3 => RGB5A3Table,
+                _                    => throw new NotSupportedException($"Palette format '{paletteFormat}' (0x{paletteFormat.AsUInt32():X8}) is not supported"),
+            };
+
+        private static uint[] BuildPixelTable(Func<ushort, uint> fromPixel)
+        {
+            uint[] table = new uint[ushort.MaxValue + 1];
+            for (int pixel = 0; pixel < table.Length; pixel++)
+                table[pixel] = fromPixel((ushort)pixel);
+            return table;
+        }
+
+        private static uint FromIA8Pixel(ushort pixel)
+        {
+            uint a = (uint)(pixel >> 8);
+            uint i = (uint)(pixel & 0xff);
+
+            return (i << 0) | (i << 8) | (i << 16) | (a << 24);
+        }
+
+        private static uint FromRGB565Pixel(ushort pixel)
+        {
+            int b = (((pixel >> 11) & 0x1F) << 3) & 0xff;
+            int g = (((pixel >> 5) & 0x3F) << 2) & 0xff;
+            int r = (((pixel >> 0) & 0x1F) << 3) & 0xff;
+
+            return (uint)((r << 0) | (g << 8) | (b << 16) | (255 << 24));
+        }
+
+        private static uint FromRGB5A3Pixel(ushort pixel)
+        {
+            int r, g, b, a;
+
+            if ((pixel & (1 << 15)) != 0) //RGB555
+            {
+                b = (((pixel >> 10) & 0x1F) * 255) / 31;
+                g = (((pixel >> 5) & 0x1F) * 255) / 31;
+                r = (((pixel >> 0) & 0x1F) * 255) / 31;
+                a = 255;
+            }
+            else //RGB4A3
+            {
+                a = (((pixel >> 12) & 0x07) * 255) / 7;
+                b = (((pixel >> 8) & 0x0F) * 255) / 15;
+                g = (((pixel >> 4) & 0x0F) * 255) / 15;
+                r = (((pixel >> 0) & 0x0F) * 255) / 15;
+            }
+
+            return (uint)((r << 0) | (g << 8) | (b << 16) | (a << 24));
+        }
+    }
+}
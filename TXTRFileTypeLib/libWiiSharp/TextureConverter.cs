@@ -24,83 +24,307 @@ using libWiiSharp.Formats;
 using SixLabors.ImageSharp;
 using SixLabors.ImageSharp.PixelFormats;
 using System;
+using System.Buffers;
+using System.IO;
+using System.Runtime.InteropServices;
+using System.Threading.Tasks;
 using TXTRFileTypeLib.Util;
 
 namespace libWiiSharp
 {
     internal static partial class TextureConverter
     {
-        public static Image<Bgra32> DecodeTexture(byte[] textureData, int textureWidth, int textureHeight,
+        // Shared by all of the converters, each of them converts its tile rows in parallel
+        internal static ParallelOptions ParallelOptions { get; set; } = new();
+
+        public static Image<Bgra32> DecodeTexture(ReadOnlyMemory<byte> textureData, int textureWidth, int textureHeight,
             TextureFormat textureFormat)
         {
             if (textureFormat != TextureFormat.CI4 && textureFormat != TextureFormat.CI8 && textureFormat != TextureFormat.CI14X2)
             {
-                byte[] rgbaData = textureFormat switch
+                Action<ReadOnlyMemory<byte>, Memory<Bgra32>, int, int> decode = textureFormat switch
                 {
-                    TextureFormat.I4     => FromI4(textureData, textureWidth, textureHeight),
-                    TextureFormat.I8     => FromI8(textureData, textureWidth, textureHeight),
-                    TextureFormat.IA4    => FromIA4(textureData, textureWidth, textureHeight),
-                    TextureFormat.IA8    => FromIA8(textureData, textureWidth, textureHeight),
-                    TextureFormat.RGB565 => FromRGB565(textureData, textureWidth, textureHeight),
-                    TextureFormat.RGB5A3 => FromRGB5A3(textureData, textureWidth, textureHeight),
-                    TextureFormat.RGBA32 => FromRGBA32(textureData, textureWidth, textureHeight),
-                    TextureFormat.CMPR   => FromCMPR(textureData, textureWidth, textureHeight),
+                    TextureFormat.I4     => FromI4,
+                    TextureFormat.I8     => FromI8,
+                    TextureFormat.IA4    => FromIA4,
+                    TextureFormat.IA8    => FromIA8,
+                    TextureFormat.RGB565 => FromRGB565,
+                    TextureFormat.RGB5A3 => FromRGB5A3,
+                    TextureFormat.RGBA32 => FromRGBA32,
+                    TextureFormat.CMPR   => FromCMPR,
                     _                    => throw new NotSupportedException($"Texture format '{textureFormat}' (0x{textureFormat.AsUInt32():X8}) is not supported"),
                 };
 
-                return RgbaToImage(rgbaData, textureWidth, textureHeight);
+                Image<Bgra32> image = RgbaToImage(textureWidth, textureHeight);
+                try
+                {
+                    decode(textureData, ImageUtil.GetPixelMemory(image), textureWidth, textureHeight);
+                    return image;
+                }
+                catch
+                {
+                    image.Dispose();
+                    throw;
+                }
             }
             else
                 throw new InvalidOperationException($"Use {nameof(DecodeIndexedTexture)} instead for indexed textures");
         }
 
-        public static Image<Bgra32> DecodeIndexedTexture(byte[] textureData, byte[] paletteData, int textureWidth,
+        public static Image<Bgra32> DecodeIndexedTexture(ReadOnlyMemory<byte> textureData, ReadOnlySpan<byte> paletteData, int textureWidth,
             int textureHeight, TextureFormat textureFormat, PaletteFormat paletteFormat)
         {
             if (textureFormat == TextureFormat.CI4 || textureFormat == TextureFormat.CI8 || textureFormat == TextureFormat.CI14X2)
             {
-                byte[] rgbaData = null!;
-
-                switch (textureFormat)
+                uint[] rgbaPalette = PaletteToRgba(paletteFormat, paletteData);
+                Image<Bgra32> image = RgbaToImage(textureWidth, textureHeight);
+                try
                 {
-                    case TextureFormat.CI4:
-                        rgbaData = ColorIndexConverter.FromCI4(textureData, PaletteToRgba(paletteFormat, paletteData), textureWidth, textureHeight);
-                        break;
-                    case TextureFormat.CI8:
-                        rgbaData = ColorIndexConverter.FromCI8(textureData, PaletteToRgba(paletteFormat, paletteData), textureWidth, textureHeight);
-                        break;
-                    case TextureFormat.CI14X2:
-                        rgbaData = ColorIndexConverter.FromCI14X2(textureData, PaletteToRgba(paletteFormat, paletteData), textureWidth, textureHeight);
-                        break;
-                };
-
-                return RgbaToImage(rgbaData, textureWidth, textureHeight);
+                    Memory<Bgra32> pixelMemory = ImageUtil.GetPixelMemory(image);
+                    switch (textureFormat)
+                    {
+                        case TextureFormat.CI4:
+                            ColorIndexConverter.FromCI4(textureData, rgbaPalette, pixelMemory, textureWidth, textureHeight);
+                            break;
+                        case TextureFormat.CI8:
+                            ColorIndexConverter.FromCI8(textureData, rgbaPalette, pixelMemory, textureWidth, textureHeight);
+                            break;
+                        case TextureFormat.CI14X2:
+                            ColorIndexConverter.FromCI14X2(textureData, rgbaPalette, pixelMemory, textureWidth, textureHeight);
+                            break;
+                    };
+                    return image;
+                }
+                catch
+                {
+                    image.Dispose();
+                    throw;
+                }
             }
             else
                 throw new InvalidOperationException($"Use {nameof(DecodeTexture)} instead for normal textures");
         }
 
-        public static void EncodeTexture(Image<Bgra32> image, out byte[] textureData, TextureFormat textureFormat)
+        // Writes the texture to output a few tile rows at a time (one per core), so only those tile rows are buffered.
+        // With flipVertically the texture of the image flipped vertically is written, without a flipped copy of it.
+        public static void EncodeTexture(Image<Bgra32> image, Stream output, TextureFormat textureFormat,
+            bool flipVertically = false)
         {
-            if (textureFormat != TextureFormat.CI4 && textureFormat != TextureFormat.CI8 && textureFormat != TextureFormat.CI14X2)
+            Action<ReadOnlyMemory<Bgra32>, int, int, byte[], int, int> encode = GetEncoder(textureFormat);
+            ReadOnlyMemory<Bgra32> pixelMemory = ImageToRgba(image);
+            int tileRowCount = GetTileRowCount(textureFormat, image.Height);
+            int tileRowSize = GetTileRowSize(textureFormat, image.Width);
+            int chunkTileRowCount = GetChunkTileRowCount(tileRowCount);
+            byte[] chunk = ArrayPool<byte>.Shared.Rent(chunkTileRowCount * tileRowSize);
+            Bgra32[]? band = flipVertically ? RentFlippedBand(textureFormat, image.Width, image.Height, chunkTileRowCount) : null;
+            try
             {
-                textureData = textureFormat switch
+                for (int firstTileRow = 0; firstTileRow < tileRowCount; firstTileRow += chunkTileRowCount)
                 {
-                    TextureFormat.I4     => ToI4(image, textureFormat),
-                    TextureFormat.I8     => ToI8(image, textureFormat),
-                    TextureFormat.IA4    => ToIA4(image, textureFormat),
-                    TextureFormat.IA8    => ToIA8(image, textureFormat),
-                    TextureFormat.RGB565 => ToRGB565(image, textureFormat),
-                    TextureFormat.RGB5A3 => ToRGB5A3(image, textureFormat),
-                    TextureFormat.RGBA32 => ToRGBA32(image, textureFormat),
-                    TextureFormat.CMPR   => ToCMPR(image, textureFormat),
-                    _ => throw new NotSupportedException($"Texture format '{textureFormat}' (0x{textureFormat.AsUInt32():X8}) is not supported"),
-                };
+                    int chunkSize = Math.Min(chunkTileRowCount, tileRowCount - firstTileRow) * tileRowSize;
+                    ReadOnlyMemory<Bgra32> tileRowPixels = GetTileRowPixels(pixelMemory, textureFormat, image.Width,
+                        image.Height, firstTileRow, chunkSize / tileRowSize, band, out int rowCount);
+                    Array.Clear(chunk, 0, chunkSize);
+                    encode(tileRowPixels, image.Width, rowCount, chunk, 0, chunkSize / tileRowSize);
+                    output.Write(chunk, 0, chunkSize);
+                }
+
+                // GetTextureSize can include padding after the last tile row, which is always empty
+                int paddingSize = GetTextureSize(textureFormat, image.Width, image.Height) - tileRowCount * tileRowSize;
+                Array.Clear(chunk, 0, Math.Min(paddingSize, chunk.Length));
+                for (; paddingSize > 0; paddingSize -= chunk.Length)
+                    output.Write(chunk, 0, Math.Min(paddingSize, chunk.Length));
+            }
+            finally
+            {
+                ArrayPool<byte>.Shared.Return(chunk);
+                if (band != null)
+                    ArrayPool<Bgra32>.Shared.Return(band);
             }
-            else
-                throw new InvalidOperationException($"Use {nameof(EncodeIndexedTexture)} instead for indexed textures");
         }
 
+        // Encodes only the tiles of image that changed over textureData, which holds the texture the image had before.
+        // changedTiles is in rows of GetTileColumnCount tiles (see: FindChangedTiles and GetMipmapChangedTiles).
+        // With flipVertically the tiles of the image flipped vertically are encoded, the same as EncodeTexture.
+        public static void EncodeChangedTiles(Image<Bgra32> image, byte[] textureData, TextureFormat textureFormat,
+            bool[] changedTiles, bool flipVertically = false)
+        {
+            int tileColumnCount = GetTileColumnCount(textureFormat, image.Width),
+                tileRowCount = GetTileRowCount(textureFormat, image.Height);
+            bool[] tiles = changedTiles;
+            if (textureFormat == TextureFormat.I4 && image.Width % 2 != 0)
+            {
+                // With an odd width the last byte of a pixel row takes the first pixel of the next row (see: ToI4), so
+                // the last tile of a tile row also changes with the first tile of its own and of the next tile row
+                tiles = (bool[])changedTiles.Clone();
+                for (int tileRow = 0; tileRow < tileRowCount; tileRow++)
+                {
+                    if (changedTiles[tileRow * tileColumnCount]
+                        || (tileRow + 1 < tileRowCount && changedTiles[(tileRow + 1) * tileColumnCount]))
+                        tiles[tileRow * tileColumnCount + tileColumnCount - 1] = true;
+                }
+            }
+
+            // Only the changed tiles are encoded with CMPR. The other encoders are cheap, so every tile row with a changed
+            // tile is encoded as a whole. Either way a few tile rows at a time, the same as EncodeTexture.
+            Action<ReadOnlyMemory<Bgra32>, int, int, byte[], int, int> encode = GetEncoder(textureFormat);
+            ReadOnlyMemory<Bgra32> pixelMemory = ImageToRgba(image);
+            int tileRowSize = GetTileRowSize(textureFormat, image.Width);
+            int chunkTileRowCount = GetChunkTileRowCount(tileRowCount);
+            byte[]? chunk = textureFormat != TextureFormat.CMPR
+                ? ArrayPool<byte>.Shared.Rent(chunkTileRowCount * tileRowSize) : null;
+            Bgra32[]? band = flipVertically ? RentFlippedBand(textureFormat, image.Width, image.Height, chunkTileRowCount) : null;
+            try
+            {
+                int firstTileRow = 0;
+                while (firstTileRow < tileRowCount)
+                {
+                    if (Array.IndexOf(tiles, true, firstTileRow * tileColumnCount, tileColumnCount) < 0)
+                    {
+                        firstTileRow++;
+                        continue;
+                    }
+
+                    int lastTileRow = firstTileRow + 1;
+                    while (lastTileRow < tileRowCount && lastTileRow - firstTileRow < chunkTileRowCount
+                        && Array.IndexOf(tiles, true, lastTileRow * tileColumnCount, tileColumnCount) >= 0)
+                        lastTileRow++;
+                    ReadOnlyMemory<Bgra32> tileRowPixels = GetTileRowPixels(pixelMemory, textureFormat, image.Width,
+                        image.Height, firstTileRow, lastTileRow - firstTileRow, band, out int rowCount);
+                    if (chunk == null)
+                        ToCMPRTiles(tileRowPixels, image.Width, rowCount, textureData, tiles, firstTileRow,
+                            lastTileRow - firstTileRow);
+                    else
+                    {
+                        int chunkSize = (lastTileRow - firstTileRow) * tileRowSize;
+                        Array.Clear(chunk, 0, chunkSize);
+                        encode(tileRowPixels, image.Width, rowCount, chunk, 0, lastTileRow - firstTileRow);
+                        Array.Copy(chunk, 0, textureData, (long)firstTileRow * tileRowSize, chunkSize);
+                    }
+                    firstTileRow = lastTileRow;
+                }
+            }
+            finally
+            {
+                if (chunk != null)
+                    ArrayPool<byte>.Shared.Return(chunk);
+                if (band != null)
+                    ArrayPool<Bgra32>.Shared.Return(band);
+            }
+        }
+
+        // The tile rows encoded at once by EncodeTexture and EncodeChangedTiles, one per core
+        private static int GetChunkTileRowCount(int tileRowCount)
+            => Math.Min(ParallelOptions.MaxDegreeOfParallelism > 0
+                ? ParallelOptions.MaxDegreeOfParallelism : Environment.ProcessorCount, tileRowCount);
+
+        // A band for the flipped pixel rows of chunkTileRowCount tile rows (see: GetTileRowPixels), the caller returns it
+        // to ArrayPool<Bgra32>.Shared
+        private static Bgra32[] RentFlippedBand(TextureFormat textureFormat, int width, int height, int chunkTileRowCount)
+            => ArrayPool<Bgra32>.Shared.Rent(Math.Min(chunkTileRowCount * GetTileHeight(textureFormat) + 1, height) * width);
+
+        // The pixel rows of the tile rows [firstTileRow, firstTileRow + tileRowCount) for an encoder to encode as the tile
+        // rows [0, tileRowCount) with a height of rowCount. They are followed by the row after them if there is one,
+        // which ToI4 reads with an odd width. If band is not null, the rows are copied to it flipped vertically (row y
+        // is row height - 1 - y of pixelMemory), else they are a slice of pixelMemory.
+        private static ReadOnlyMemory<Bgra32> GetTileRowPixels(ReadOnlyMemory<Bgra32> pixelMemory, TextureFormat textureFormat,
+            int width, int height, int firstTileRow, int tileRowCount, Bgra32[]? band, out int rowCount)
+        {
+            int tileHeight = GetTileHeight(textureFormat),
+                firstRow = firstTileRow * tileHeight;
+            rowCount = Math.Min(tileRowCount * tileHeight, height - firstRow);
+            if (band == null)
+                return pixelMemory.Slice(firstRow * width);
+
+            int bandRowCount = Math.Min(rowCount + 1, height - firstRow);
+            ReadOnlySpan<Bgra32> pixels = pixelMemory.Span;
+            for (int y = 0; y < bandRowCount; y++)
+                pixels.Slice(ImageUtil.FlipCoordinate(height, firstRow + y) * width, width).CopyTo(band.AsSpan(y * width, width));
+            return band.AsMemory(0, bandRowCount * width);
+        }
+
+        // The tiles of the texture of image whose pixels differ from previousImage (of the same size), in rows of
+        // GetTileColumnCount tiles. The images are compared flipped vertically, as the mipmaps are encoded.
+        public static bool[] FindChangedTiles(Image<Bgra32> image, Image<Bgra32> previousImage, TextureFormat textureFormat)
+        {
+            int width = image.Width,
+                height = image.Height,
+                tileWidth = GetTileWidth(textureFormat),
+                tileHeight = GetTileHeight(textureFormat),
+                tileColumnCount = GetTileColumnCount(textureFormat, width);
+            bool[] changedTiles = new bool[tileColumnCount * GetTileRowCount(textureFormat, height)];
+            ReadOnlyMemory<Bgra32> pixelMemory = ImageToRgba(image),
+                previousPixelMemory = ImageToRgba(previousImage);
+            Parallel.For(0, height, ParallelOptions, y =>
+            {
+                ReadOnlySpan<uint> row = AsRgba(pixelMemory).Slice(y * width, width),
+                    previousRow = AsRgba(previousPixelMemory).Slice(y * width, width);
+                if (row.SequenceEqual(previousRow))
+                    return;
+
+                // Only ever set to true, so the rows can be compared in parallel
+                int tileRow = ImageUtil.FlipCoordinate(height, y) / tileHeight;
+                for (int tileColumn = 0; tileColumn < tileColumnCount; tileColumn++)
+                {
+                    int x = tileColumn * tileWidth,
+                        count = Math.Min(tileWidth, width - x);
+                    if (!row.Slice(x, count).SequenceEqual(previousRow.Slice(x, count)))
+                        changedTiles[tileRow * tileColumnCount + tileColumn] = true;
+                }
+            });
+            return changedTiles;
+        }
+
+        // The tiles of a mipmap downsampled by ImageUtil.DownsampleMipmap that change with the changed tiles of the
+        // image it is downsampled from
+        public static bool[] GetMipmapChangedTiles(bool[] changedTiles, TextureFormat textureFormat, int width, int height,
+            int mipmapWidth, int mipmapHeight)
+        {
+            int tileWidth = GetTileWidth(textureFormat),
+                tileHeight = GetTileHeight(textureFormat),
+                tileColumnCount = GetTileColumnCount(textureFormat, width),
+                mipmapTileColumnCount = GetTileColumnCount(textureFormat, mipmapWidth);
+            bool[] mipmapChangedTiles = new bool[mipmapTileColumnCount * GetTileRowCount(textureFormat, mipmapHeight)];
+            for (int i = 0; i < changedTiles.Length; i++)
+            {
+                if (!changedTiles[i])
+                    continue;
+
+                // A pixel x of the image is averaged into the mipmap pixel x / 2, an odd last column or row into the
+                // last column or row of the mipmap
+                int x = i % tileColumnCount * tileWidth,
+                    y = i / tileColumnCount * tileHeight,
+                    mipmapX0 = Math.Min(x / 2, mipmapWidth - 1),
+                    mipmapX1 = Math.Min((Math.Min(x + tileWidth, width) - 1) / 2, mipmapWidth - 1),
+                    mipmapY0 = Math.Min(y / 2, mipmapHeight - 1),
+                    mipmapY1 = Math.Min((Math.Min(y + tileHeight, height) - 1) / 2, mipmapHeight - 1);
+                for (int tileRow = mipmapY0 / tileHeight; tileRow <= mipmapY1 / tileHeight; tileRow++)
+                {
+                    for (int tileColumn = mipmapX0 / tileWidth; tileColumn <= mipmapX1 / tileWidth; tileColumn++)
+                        mipmapChangedTiles[tileRow * mipmapTileColumnCount + tileColumn] = true;
+                }
+            }
+            return mipmapChangedTiles;
+        }
+
+        // Every encoder writes the tile rows [firstTileRow, firstTileRow + tileRowCount) to the start of its output
+        private static Action<ReadOnlyMemory<Bgra32>, int, int, byte[], int, int> GetEncoder(TextureFormat textureFormat)
+            => textureFormat switch
+            {
+                TextureFormat.I4     => ToI4,
+                TextureFormat.I8     => ToI8,
+                TextureFormat.IA4    => ToIA4,
+                TextureFormat.IA8    => ToIA8,
+                TextureFormat.RGB565 => ToRGB565,
+                TextureFormat.RGB5A3 => ToRGB5A3,
+                TextureFormat.RGBA32 => ToRGBA32,
+                TextureFormat.CMPR   => ToCMPR,
+                TextureFormat.CI4 or TextureFormat.CI8 or TextureFormat.CI14X2
+                                     => throw new InvalidOperationException($"Use {nameof(EncodeIndexedTexture)} instead for indexed textures"),
+                _                    => throw new NotSupportedException($"Texture format '{textureFormat}' (0x{textureFormat.AsUInt32():X8}) is not supported"),
+            };
+
+        // textureData is rented from ArrayPool<byte>.Shared, only its first GetTextureSize bytes are the texture
         public static (ushort paletteWidth, ushort paletteHeight) EncodeIndexedTexture(Image<Bgra32> image,
             out byte[] textureData, out byte[] paletteData, TextureFormat textureFormat, PaletteFormat paletteFormat,
             CopyPaletteSize copyPaletteSize)
@@ -137,64 +361,47 @@ namespace libWiiSharp
                 throw new InvalidOperationException($"Use {nameof(EncodeTexture)} instead for normal textures");
         }
 
-        private static uint[] ImageToRgba(Image<Bgra32> img)
+        // A cleared buffer for an encoded texture, the caller returns it to ArrayPool<byte>.Shared once it is written
+        internal static byte[] RentTextureBuffer(TextureFormat textureFormat, int width, int height)
         {
-            return Shared.ByteArrayToUIntArray(ImageUtil.FromImage(img));
+            int textureSize = GetTextureSize(textureFormat, width, height);
+            byte[] buffer = ArrayPool<byte>.Shared.Rent(textureSize);
+            Array.Clear(buffer, 0, textureSize);
+            return buffer;
         }
 
-        private static Image<Bgra32> RgbaToImage(byte[] data, int width, int height)
+        // The pixels of the image itself, not a copy of them
+        private static ReadOnlyMemory<Bgra32> ImageToRgba(Image<Bgra32> img)
         {
-            return ImageUtil.ToImage<Bgra32>(data, width, height);
+            return ImageUtil.GetPixelMemory(img);
         }
 
-        private static uint[] PaletteToRgba(PaletteFormat paletteFormat, byte[] paletteData)
+        // A blank image for the decoders to write their pixels into
+        private static Image<Bgra32> RgbaToImage(int width, int height)
         {
-            int itemcount = paletteData.Length / 2;
-            int r, g, b, a;
+            return new Image<Bgra32>(width > 0 ? width : 1, height > 0 ? height : 1);
+        }
 
-            uint[] output = new uint[itemcount];
-            for (int i = 0; i < itemcount; i++)
-            {
-                if (i >= itemcount) continue;
+        // Reinterprets Bgra32 pixels as packed 0xAARRGGBB uints in place
+        internal static Span<uint> AsRgba(Memory<Bgra32> pixels)
+        {
+            return MemoryMarshal.Cast<Bgra32, uint>(pixels.Span);
+        }
 
-                ushort pixel = BitConverter.ToUInt16(new byte[] { paletteData[i * 2 + 1], paletteData[i * 2] }, 0);
+        // Reinterprets Bgra32 pixels as packed 0xAARRGGBB uints in place
+        internal static ReadOnlySpan<uint> AsRgba(ReadOnlyMemory<Bgra32> pixels)
+        {
+            return MemoryMarshal.Cast<Bgra32, uint>(pixels.Span);
+        }
 
-                switch (paletteFormat)
-                {
-                    case PaletteFormat.IA8: //IA8
-                        r = pixel & 0xff;
-                        b = r;
-                        g = r;
-                        a = pixel >> 8;
-                        break;
-                    case PaletteFormat.RGB565: //RGB565
-                        b = (((pixel >> 11) & 0x1F) << 3) & 0xff;
-                        g = (((pixel >> 5) & 0x3F) << 2) & 0xff;
-                        r = (((pixel >> 0) & 0x1F) << 3) & 0xff;
-                        a = 255;
-                        break;
-                    case PaletteFormat.RGB5A3: //RGB5A3
-                        if ((pixel & (1 << 15)) != 0) //RGB555
-                        {
-                            a = 255;
-                            b = (((pixel >> 10) & 0x1F) * 255) / 31;
-                            g = (((pixel >> 5) & 0x1F) * 255) / 31;
-                            r = (((pixel >> 0) & 0x1F) * 255) / 31;
-                        }
-                        else //RGB4A3
-                        {
-                            a = (((pixel >> 12) & 0x07) * 255) / 7;
-                            b = (((pixel >> 8) & 0x0F) * 255) / 15;
-                            g = (((pixel >> 4) & 0x0F) * 255) / 15;
-                            r = (((pixel >> 0) & 0x0F) * 255) / 15;
-                        }
-                        break;
-                    default:
-                        throw new NotSupportedException($"Palette format '{paletteFormat}' (0x{paletteFormat.AsUInt32():X8}) is not supported");
-                }
+        private static uint[] PaletteToRgba(PaletteFormat paletteFormat, ReadOnlySpan<byte> paletteData)
+        {
+            uint[] table = GetPixelTable(paletteFormat);
+            int itemcount = paletteData.Length / 2;
 
-                output[i] = (uint)((r << 0) | (g << 8) | (b << 16) | (a << 24));
-            }
+            uint[] output = new uint[itemcount];
+            for (int i = 0; i < itemcount; i++)
+                output[i] = table[(paletteData[i * 2] << 8) | paletteData[i * 2 + 1]];
 
             return output;
         }
@@ -244,6 +451,58 @@ namespace libWiiSharp
                 _ => throw new NotSupportedException($"Texture format 0x{format.AsUInt32():X8} is not supported")
             };
 
+        internal static int GetTileHeight(TextureFormat format)
+            => format switch
+            {
+                TextureFormat.I4 or TextureFormat.CI4 or TextureFormat.CMPR => 8,
+                TextureFormat.I8 or TextureFormat.IA4 or TextureFormat.CI8 or TextureFormat.IA8 or TextureFormat.RGB565
+                    or TextureFormat.RGB5A3 or TextureFormat.CI14X2 or TextureFormat.RGBA32 => 4,
+                _ => throw new NotSupportedException($"Texture format 0x{format.AsUInt32():X8} is not supported")
+            };
+
+        internal static int GetTileWidth(TextureFormat format)
+            => format switch
+            {
+                TextureFormat.I4 or TextureFormat.CI4 or TextureFormat.CMPR or TextureFormat.I8 or TextureFormat.IA4
+                    or TextureFormat.CI8 => 8,
+                TextureFormat.IA8 or TextureFormat.RGB565 or TextureFormat.RGB5A3 or TextureFormat.CI14X2
+                    or TextureFormat.RGBA32 => 4,
+                _ => throw new NotSupportedException($"Texture format 0x{format.AsUInt32():X8} is not supported")
+            };
+
+        internal static int GetTileRowSize(TextureFormat format, int width)
+            => format switch
+            {
+                TextureFormat.I4 or TextureFormat.CI4 or TextureFormat.CMPR or TextureFormat.I8 or TextureFormat.IA4
+                    or TextureFormat.CI8 => (width + 7 >> 3) * 32,
+                TextureFormat.IA8 or TextureFormat.RGB565 or TextureFormat.RGB5A3 or TextureFormat.CI14X2 => (width + 3 >> 2) * 32,
+                TextureFormat.RGBA32 => (width + 3 >> 2) * 64,
+                _ => throw new NotSupportedException($"Texture format 0x{format.AsUInt32():X8} is not supported")
+            };
+
+        // Every decoder except CMPR only reads the pixels inside of the image, so a pixel row takes this many bytes
+        internal static int GetDecodedRowSize(TextureFormat format, int width)
+            => format switch
+            {
+                TextureFormat.I4 or TextureFormat.CI4 => (width + 1) / 2,
+                TextureFormat.I8 or TextureFormat.IA4 or TextureFormat.CI8 => width,
+                TextureFormat.IA8 or TextureFormat.RGB565 or TextureFormat.RGB5A3 or TextureFormat.CI14X2 => width * 2,
+                TextureFormat.RGBA32 => width * 4,
+                _ => throw new NotSupportedException($"Texture format 0x{format.AsUInt32():X8} is not supported")
+            };
+
+        internal static int GetTileRowCount(TextureFormat format, int height)
+        {
+            int tileHeight = GetTileHeight(format);
+            return (height + tileHeight - 1) / tileHeight;
+        }
+
+        internal static int GetTileColumnCount(TextureFormat format, int width)
+        {
+            int tileWidth = GetTileWidth(format);
+            return (width + tileWidth - 1) / tileWidth;
+        }
+
         internal static int GetPaletteSize(PaletteFormat format, int width, int height)
             => format switch
             {
@@ -0,0 +1,224 @@
+﻿/*
+TXTRFileType
+Copyright (C) 2021 xchellx
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+*/
+
+using SixLabors.ImageSharp;
+using SixLabors.ImageSharp.PixelFormats;
+using System;
+using System.Buffers;
+using System.ComponentModel;
+using System.Runtime.CompilerServices;
+using System.Runtime.InteropServices;
+using TXTRFileTypeLib;
+
+namespace libtxtr
+{
+    public static partial class libtxtrAPI
+    {
+        // The buffer of the caller is decoded from directly (no copy), so it only has to stay valid for the call
+        private sealed unsafe class UnmanagedMemoryManager : MemoryManager<byte>
+        {
+            private readonly byte* pointer;
+            private readonly int length;
+
+            public UnmanagedMemoryManager(IntPtr pointer, int length)
+            {
+                this.pointer = (byte*)pointer;
+                this.length = length;
+            }
+
+            public override Span<byte> GetSpan() => new(pointer, length);
+
+            public override MemoryHandle Pin(int elementIndex = 0) => new(pointer + elementIndex);
+
+            public override void Unpin()
+            {
+            }
+
+            protected override void Dispose(bool disposing)
+            {
+            }
+        }
+
+        /// <summary>
+        /// Read an TXTR from a buffer to an image.<br/>
+        /// <strong>Note:</strong><br/>
+        /// The TXTR is decoded directly from <paramref name="bufferPtr"/> (such as a memory-mapped file) without being copied,
+        /// the buffer is not used anymore after this method returns.<br/>
+        /// <paramref name="progressCallbackPtr"/> can be <see cref="IntPtr.Zero"/> (null pointer is valid; parameter is optional).<br/>
+        /// <strong>Possible Status Codes:</strong><br/>
+        /// <see cref="STATUS_SUCCESS"/> - No error.<br/>
+        /// <see cref="STATUS_NULLPTR"/> - <paramref name="bufferPtr"/> is <see cref="IntPtr.Zero"/> (null pointer).<br/>
+        /// <see cref="STATUS_IMGALRINIT"/> - The are already loaded images. See: <see cref="DisposeLoadedImages"/> and <see cref="IsImagesLoaded"/><br/>
+        /// <see cref="STATUS_INVALIDARG"/> - <paramref name="bufferLength"/> is less than 0.<br/>
+        /// <see cref="STATUS_FAILED"/> - Failed to read the TXTR. See: <see cref="GetLastInteropError(IntPtr, bool)"/>
+        /// </summary>
+        /// <param name="bufferPtr">A pointer to a byte buffer that contains the TXTR</param>
+        /// <param name="bufferLength">The length of the buffer</param>
+        /// <param name="readMipmaps">Whether all mipmaps should be read or just the first mipmap</param>
+        /// <param name="progressCallbackPtr">A function pointer to the progress callback, can be <see cref="IntPtr.Zero"/> (null pointer is valid; parameter is optional)</param>
+        /// <returns>The status code of whether the method succeeded or not. See: <see cref="GetLastInteropError(IntPtr, bool)"/></returns>
+        [Description("Read an TXTR from a buffer to an image.")]
+        [UnmanagedCallersOnly(EntryPoint = nameof(OpenBuffer), CallConvs = new[] { typeof(CallConvCdecl) })]
+        public static int OpenBuffer(IntPtr bufferPtr, int bufferLength, bool readMipmaps, IntPtr progressCallbackPtr)
+        {
+            if (images.Count == 0 && bufferPtr != IntPtr.Zero && bufferLength >= 0)
+            {
+                Image<Bgra32>[] newImages;
+                try
+                {
+                    newImages = TXTRFileTypeLibAPI.Read(new UnmanagedMemoryManager(bufferPtr, bufferLength).Memory,
+                        readMipmaps,
+                        GetProgressCallback(progressCallbackPtr));
+                }
+                catch (Exception e)
+                {
+                    lastErrorMsg.Clear();
+                    lastErrorMsg.AppendLine("Exception occurred while reading the image. Stacktrace:");
+                    lastErrorMsg.Append(e);
+                    lastErrorMsg.AppendLine();
+                    lastErrorMsg.AppendLine("==== DEBUG INFO ====");
+                    lastErrorMsg.Append("Method name = ");
+                    lastErrorMsg.Append(nameof(OpenBuffer));
+                    lastErrorMsg.AppendLine();
+                    lastErrorMsg.Append("Buffer pointer = ");
+                    lastErrorMsg.Append(bufferPtr);
+                    lastErrorMsg.AppendLine();
+                    lastErrorMsg.Append("Buffer length = ");
+                    lastErrorMsg.Append(bufferLength);
+                    lastErrorMsg.AppendLine();
+                    lastErrorMsg.Append("Image count = ");
+                    lastErrorMsg.Append(images.Count);
+                    lastErrorMsg.AppendLine();
+                    lastErrorMsg.Append("Progress callback pointer = ");
+                    lastErrorMsg.Append(progressCallbackPtr);
+                    return STATUS_FAILED;
+                }
+                images.Clear();
+                images.AddRange(newImages);
+
+                lastErrorMsg.Clear();
+                lastErrorMsg.Append("No error");
+                return STATUS_SUCCESS;
+            }
+            else
+            {
+                lastErrorMsg.Clear();
+                if (images.Count != 0)
+                {
+                    lastErrorMsg.Append("There are already image(s) loaded. Please use the \"");
+                    lastErrorMsg.Append(nameof(DisposeLoadedImages));
+                    lastErrorMsg.Append("\" method to dispose all loaded image(s).");
+                    return STATUS_IMGALRINIT;
+                }
+                else if (bufferPtr == IntPtr.Zero)
+                {
+                    lastErrorMsg.Append("The input pointer to the buffer is null");
+                    return STATUS_NULLPTR;
+                }
+                else
+                {
+                    lastErrorMsg.Append("The buffer length is less than 0: ");
+                    lastErrorMsg.Append(bufferLength);
+                    return STATUS_INVALIDARG;
+                }
+            }
+        }
+
+        /// <summary>
+        /// Read an TXTR from a buffer to the images of a new handle.<br/>
+        /// <strong>Note:</strong><br/>
+        /// The TXTR is decoded directly from <paramref name="bufferPtr"/> (such as a memory-mapped file) without being copied,
+        /// the buffer is not used anymore after this method returns.<br/>
+        /// <paramref name="progressCallbackPtr"/> can be <see cref="IntPtr.Zero"/> (null pointer is valid; parameter is optional).<br/>
+        /// The handle is written to <paramref name="handlePtr"/> as a signed 32bit integer. It is never 0.<br/>
+        /// It is strongly advised you call <see cref="DisposeHandle(int)"/> at all possible endpoints in the control flow of your code or else memory leaks will ensue.<br/>
+        /// <strong>Possible Status Codes:</strong><br/>
+        /// <see cref="STATUS_SUCCESS"/> - No error.<br/>
+        /// <see cref="STATUS_NULLPTR"/> - <paramref name="bufferPtr"/> and/or <paramref name="handlePtr"/> is <see cref="IntPtr.Zero"/> (null pointer).<br/>
+        /// <see cref="STATUS_INVALIDARG"/> - <paramref name="bufferLength"/> is less than 0.<br/>
+        /// <see cref="STATUS_FAILED"/> - Failed to read the TXTR. See: <see cref="GetLastInteropError(IntPtr, bool)"/>
+        /// </summary>
+        /// <param name="bufferPtr">A pointer to a byte buffer that contains the TXTR</param>
+        /// <param name="bufferLength">The length of the buffer</param>
+        /// <param name="readMipmaps">Whether all mipmaps should be read or just the first mipmap</param>
+        /// <param name="progressCallbackPtr">A function pointer to the progress callback, can be <see cref="IntPtr.Zero"/> (null pointer is valid; parameter is optional)</param>
+        /// <param name="handlePtr">A pointer to an int for which the handle can be written to</param>
+        /// <returns>The status code of whether the method succeeded or not. See: <see cref="GetLastInteropError(IntPtr, bool)"/></returns>
+        [Description("Read an TXTR from a buffer to the images of a new handle.")]
+        [UnmanagedCallersOnly(EntryPoint = nameof(OpenBufferHandle), CallConvs = new[] { typeof(CallConvCdecl) })]
+        public static int OpenBufferHandle(IntPtr bufferPtr, int bufferLength, bool readMipmaps, IntPtr progressCallbackPtr,
+            IntPtr handlePtr)
+        {
+            if (bufferPtr != IntPtr.Zero && handlePtr != IntPtr.Zero && bufferLength >= 0)
+            {
+                Image<Bgra32>[] newImages;
+                try
+                {
+                    newImages = TXTRFileTypeLibAPI.Read(new UnmanagedMemoryManager(bufferPtr, bufferLength).Memory,
+                        readMipmaps,
+                        GetProgressCallback(progressCallbackPtr));
+                }
+                catch (Exception e)
+                {
+                    lastErrorMsg.Clear();
+                    lastErrorMsg.AppendLine("Exception occurred while reading the image. Stacktrace:");
+                    lastErrorMsg.Append(e);
+                    lastErrorMsg.AppendLine();
+                    lastErrorMsg.AppendLine("==== DEBUG INFO ====");
+                    lastErrorMsg.Append("Method name = ");
+                    lastErrorMsg.Append(nameof(OpenBufferHandle));
+                    lastErrorMsg.AppendLine();
+                    lastErrorMsg.Append("Buffer pointer = ");
+                    lastErrorMsg.Append(bufferPtr);
+                    lastErrorMsg.AppendLine();
+                    lastErrorMsg.Append("Buffer length = ");
+                    lastErrorMsg.Append(bufferLength);
+                    lastErrorMsg.AppendLine();
+                    lastErrorMsg.Append("Progress callback pointer = ");
+                    lastErrorMsg.Append(progressCallbackPtr);
+                    return STATUS_FAILED;
+                }
+                Marshal.WriteInt32(handlePtr, AddHandle(newImages));
+
+                lastErrorMsg.Clear();
+                lastErrorMsg.Append("No error");
+                return STATUS_SUCCESS;
+            }
+            else
+            {
+                lastErrorMsg.Clear();
+                if (bufferPtr == IntPtr.Zero)
+                {
+                    lastErrorMsg.Append("The input pointer to the buffer is null");
+                    return STATUS_NULLPTR;
+                }
+                else if (handlePtr == IntPtr.Zero)
+                {
+                    lastErrorMsg.Append("The input pointer to the output handle is null");
+                    return STATUS_NULLPTR;
+                }
+                else
+                {
+                    lastErrorMsg.Append("The buffer length is less than 0: ");
+                    lastErrorMsg.Append(bufferLength);
+                    return STATUS_INVALIDARG;
+                }
+            }
+        }
+    }
+}
@@ -0,0 +1,938 @@
+﻿/*
+TXTRFileType
+Copyright (C) 2021 xchellx
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+*/
+
+using libWiiSharp;
+using libWiiSharp.Extensions;
+using libWiiSharp.Formats;
+using SixLabors.ImageSharp;
+using SixLabors.ImageSharp.PixelFormats;
+using System;
+using System.Buffers;
+using System.Collections.Generic;
+using System.ComponentModel;
+using System.Runtime.CompilerServices;
+using System.Runtime.InteropServices;
+using System.Threading;
+using TXTRFileTypeLib;
+
+namespace libtxtr
+{
+    public static partial class libtxtrAPI
+    {
+        // Handles are independent of the loaded images and the save image, so any number of textures can be
+        // worked on at the same time. A handle owns one or more images: all mipmaps for a handle from
+        // OpenHandle and one image for a handle from CreateHandle. Saving a handle writes its first image.
+        // Different handles can be used from different threads at the same time (the last error message is
+        // per thread), but one handle must only be used by one thread at a time.
+
+        private sealed class ImageHandle : IDisposable
+        {
+            public ImageHandle(Image<Bgra32>[] images)
+            {
+                Images = images;
+                PinnedImages = new Dictionary<int, MemoryHandle>();
+            }
+
+            public Image<Bgra32>[] Images { get; }
+
+            public Dictionary<int, MemoryHandle> PinnedImages { get; }
+
+            public void Dispose()
+            {
+                foreach (MemoryHandle pinnedImage in PinnedImages.Values)
+                    pinnedImage.Dispose();
+                PinnedImages.Clear();
+                foreach (Image<Bgra32> image in Images)
+                    image.Dispose();
+            }
+        }
+
+        /// <summary>
+        /// Read an TXTR file to the images of a new handle.<br/>
+        /// <strong>Note:</strong><br/>
+        /// <paramref name="filePathPtr"/> must be passed null terminated ASCII bytes.<br/>
+        /// <paramref name="progressCallbackPtr"/> can be <see cref="IntPtr.Zero"/> (null pointer is valid; parameter is optional).<br/>
+        /// The handle is written to <paramref name="handlePtr"/> as a signed 32bit integer. It is never 0.<br/>
+        /// It is strongly advised you call <see cref="DisposeHandle(int)"/> at all possible endpoints in the control flow of your code or else memory leaks will ensue.<br/>
+        /// <strong>Possible Status Codes:</strong><br/>
+        /// <see cref="STATUS_SUCCESS"/> - No error.<br/>
+        /// <see cref="STATUS_NULLPTR"/> - <paramref name="filePathPtr"/> and/or <paramref name="handlePtr"/> is <see cref="IntPtr.Zero"/> (null pointer).<br/>
+        /// <see cref="STATUS_MARSHALFAIL"/> - Failed to marshal <paramref name="filePathPtr"/> to a string.<br/>
+        /// <see cref="STATUS_FAILED"/> - Failed to read the TXTR. See: <see cref="GetLastInteropError(IntPtr, bool)"/>
+        /// </summary>
+        /// <param name="filePathPtr">A pointer to a char buffer that contains the string of the file path to read TXTR the from</param>
+        /// <param name="readMipmaps">Whether all mipmaps should be read or just the first mipmap</param>
+        /// <param name="progressCallbackPtr">A function pointer to the progress callback, can be <see cref="IntPtr.Zero"/> (null pointer is valid; parameter is optional)</param>
+        /// <param name="handlePtr">A pointer to an int for which the handle can be written to</param>
+        /// <returns>The status code of whether the method succeeded or not. See: <see cref="GetLastInteropError(IntPtr, bool)"/></returns>
+        [Description("Read an TXTR file to the images of a new handle.")]
+        [UnmanagedCallersOnly(EntryPoint = nameof(OpenHandle), CallConvs = new[] { typeof(CallConvCdecl) })]
+        public static int OpenHandle(IntPtr filePathPtr, bool readMipmaps, IntPtr progressCallbackPtr, IntPtr handlePtr)
+        {
+            if (filePathPtr != IntPtr.Zero && handlePtr != IntPtr.Zero)
+            {
+                string? filePath = Marshal.PtrToStringAnsi(filePathPtr);
+                if (filePath != null)
+                {
+                    Image<Bgra32>[] newImages;
+                    try
+                    {
+                        newImages = TXTRFileTypeLibAPI.Read(filePath, readMipmaps, GetProgressCallback(progressCallbackPtr));
+                    }
+                    catch (Exception e)
+                    {
+                        lastErrorMsg.Clear();
+                        lastErrorMsg.AppendLine("Exception occurred while reading the image. Stacktrace:");
+                        lastErrorMsg.Append(e);
+                        lastErrorMsg.AppendLine();
+                        lastErrorMsg.AppendLine("==== DEBUG INFO ====");
+                        lastErrorMsg.Append("Method name = ");
+                        lastErrorMsg.Append(nameof(OpenHandle));
+                        lastErrorMsg.AppendLine();
+                        lastErrorMsg.Append("File path pointer = ");
+                        lastErrorMsg.Append(filePathPtr);
+                        lastErrorMsg.AppendLine();
+                        lastErrorMsg.Append("File path = ");
+                        lastErrorMsg.Append(filePath);
+                        lastErrorMsg.AppendLine();
+                        lastErrorMsg.Append("Progress callback pointer = ");
+                        lastErrorMsg.Append(progressCallbackPtr);
+                        return STATUS_FAILED;
+                    }
+                    Marshal.WriteInt32(handlePtr, AddHandle(newImages));
+
+                    lastErrorMsg.Clear();
+                    lastErrorMsg.Append("No error");
+                    return STATUS_SUCCESS;
+                }
+                else
+                {
+                    lastErrorMsg.Clear();
+                    lastErrorMsg.Append("Failed to marshal input file path");
+                    return STATUS_MARSHALFAIL;
+                }
+            }
+            else
+            {
+                lastErrorMsg.Clear();
+                if (filePathPtr == IntPtr.Zero)
+                    lastErrorMsg.Append("The pointer to the file path is null");
+                else
+                    lastErrorMsg.Append("The input pointer to the output handle is null");
+                return STATUS_NULLPTR;
+            }
+        }
+
+        /// <summary>
+        /// Read one mipmap of an TXTR file to the image of a new handle, skipping the mipmaps before it without reading them.<br/>
+        /// <strong>Note:</strong><br/>
+        /// <paramref name="filePathPtr"/> must be passed null terminated ASCII bytes.<br/>
+        /// If <paramref name="mipmapLevel"/> is <see cref="MIPMAPLEVEL_FORSIZE"/>, the smallest mipmap that is at least
+        /// <paramref name="minWidth"/> x <paramref name="minHeight"/> is read (or the first mipmap if it is smaller), else
+        /// <paramref name="minWidth"/> and <paramref name="minHeight"/> are ignored.<br/>
+        /// <paramref name="progressCallbackPtr"/> can be <see cref="IntPtr.Zero"/> (null pointer is valid; parameter is optional).<br/>
+        /// The handle is written to <paramref name="handlePtr"/> as a signed 32bit integer. It is never 0.<br/>
+        /// It is strongly advised you call <see cref="DisposeHandle(int)"/> at all possible endpoints in the control flow of your code or else memory leaks will ensue.<br/>
+        /// <strong>Possible Status Codes:</strong><br/>
+        /// <see cref="STATUS_SUCCESS"/> - No error.<br/>
+        /// <see cref="STATUS_NULLPTR"/> - <paramref name="filePathPtr"/> and/or <paramref name="handlePtr"/> is <see cref="IntPtr.Zero"/> (null pointer).<br/>
+        /// <see cref="STATUS_INVALIDARG"/> - <paramref name="mipmapLevel"/> is less than <see cref="MIPMAPLEVEL_FORSIZE"/>, or
+        /// <paramref name="minWidth"/> and/or <paramref name="minHeight"/> is less than 0.<br/>
+        /// <see cref="STATUS_MARSHALFAIL"/> - Failed to marshal <paramref name="filePathPtr"/> to a string.<br/>
+        /// <see cref="STATUS_FAILED"/> - Failed to read the TXTR, or the TXTR has no mipmap <paramref name="mipmapLevel"/>. See: <see cref="GetLastInteropError(IntPtr, bool)"/>
+        /// </summary>
+        /// <param name="filePathPtr">A pointer to a char buffer that contains the string of the file path to read TXTR the from</param>
+        /// <param name="mipmapLevel">The index of the mipmap to read (0 is the first mipmap), or <see cref="MIPMAPLEVEL_FORSIZE"/></param>
+        /// <param name="minWidth">The minimum width of the mipmap if <paramref name="mipmapLevel"/> is <see cref="MIPMAPLEVEL_FORSIZE"/></param>
+        /// <param name="minHeight">The minimum height of the mipmap if <paramref name="mipmapLevel"/> is <see cref="MIPMAPLEVEL_FORSIZE"/></param>
+        /// <param name="progressCallbackPtr">A function pointer to the progress callback, can be <see cref="IntPtr.Zero"/> (null pointer is valid; parameter is optional)</param>
+        /// <param name="handlePtr">A pointer to an int for which the handle can be written to</param>
+        /// <returns>The status code of whether the method succeeded or not. See: <see cref="GetLastInteropError(IntPtr, bool)"/></returns>
+        [Description("Read one mipmap of an TXTR file to the image of a new handle.")]
+        [UnmanagedCallersOnly(EntryPoint = nameof(OpenMipmapHandle), CallConvs = new[] { typeof(CallConvCdecl) })]
+        public static int OpenMipmapHandle(IntPtr filePathPtr, int mipmapLevel, int minWidth, int minHeight,
+            IntPtr progressCallbackPtr, IntPtr handlePtr)
+        {
+            if (filePathPtr != IntPtr.Zero && handlePtr != IntPtr.Zero && IsValidMipmapLevel(mipmapLevel, minWidth, minHeight))
+            {
+                string? filePath = Marshal.PtrToStringAnsi(filePathPtr);
+                if (filePath != null)
+                {
+                    Image<Bgra32> newImage;
+                    try
+                    {
+                        newImage = ReadMipmapFile(filePath, mipmapLevel, minWidth, minHeight, progressCallbackPtr);
+                    }
+                    catch (Exception e)
+                    {
+                        lastErrorMsg.Clear();
+                        lastErrorMsg.AppendLine("Exception occurred while reading the image. Stacktrace:");
+                        lastErrorMsg.Append(e);
+                        lastErrorMsg.AppendLine();
+                        lastErrorMsg.AppendLine("==== DEBUG INFO ====");
+                        lastErrorMsg.Append("Method name = ");
+                        lastErrorMsg.Append(nameof(OpenMipmapHandle));
+                        lastErrorMsg.AppendLine();
+                        lastErrorMsg.Append("File path pointer = ");
+                        lastErrorMsg.Append(filePathPtr);
+                        lastErrorMsg.AppendLine();
+                        lastErrorMsg.Append("File path = ");
+                        lastErrorMsg.Append(filePath);
+                        lastErrorMsg.AppendLine();
+                        lastErrorMsg.Append("Mipmap level = ");
+                        lastErrorMsg.Append(mipmapLevel);
+                        lastErrorMsg.AppendLine();
+                        lastErrorMsg.Append("Min width = ");
+                        lastErrorMsg.Append(minWidth);
+                        lastErrorMsg.AppendLine();
+                        lastErrorMsg.Append("Min height = ");
+                        lastErrorMsg.Append(minHeight);
+                        lastErrorMsg.AppendLine();
+                        lastErrorMsg.Append("Progress callback pointer = ");
+                        lastErrorMsg.Append(progressCallbackPtr);
+                        return STATUS_FAILED;
+                    }
+                    Marshal.WriteInt32(handlePtr, AddHandle(new[] { newImage }));
+
+                    lastErrorMsg.Clear();
+                    lastErrorMsg.Append("No error");
+                    return STATUS_SUCCESS;
+                }
+                else
+                {
+                    lastErrorMsg.Clear();
+                    lastErrorMsg.Append("Failed to marshal input file path");
+                    return STATUS_MARSHALFAIL;
+                }
+            }
+            else
+            {
+                lastErrorMsg.Clear();
+                if (filePathPtr == IntPtr.Zero)
+                {
+                    lastErrorMsg.Append("The pointer to the file path is null");
+                    return STATUS_NULLPTR;
+                }
+                else if (handlePtr == IntPtr.Zero)
+                {
+                    lastErrorMsg.Append("The input pointer to the output handle is null");
+                    return STATUS_NULLPTR;
+                }
+                else
+                {
+                    AppendInvalidMipmapLevel(mipmapLevel, minWidth, minHeight);
+                    return STATUS_INVALIDARG;
+                }
+            }
+        }
+
+        /// <summary>
+        /// Creates a new handle with one blank image of the specified width and height.<br/>
+        /// <strong>Note:</strong><br/>
+        /// The handle is written to <paramref name="handlePtr"/> as a signed 32bit integer. It is never 0.<br/>
+        /// It is strongly advised you call <see cref="DisposeHandle(int)"/> at all possible endpoints in the control flow of your code or else memory leaks will ensue.<br/>
+        /// <strong>Possible Status Codes:</strong><br/>
+        /// <see cref="STATUS_SUCCESS"/> - No error.<br/>
+        /// <see cref="STATUS_NULLPTR"/> - <paramref name="handlePtr"/> is <see cref="IntPtr.Zero"/> (null pointer).<br/>
+        /// <see cref="STATUS_INVALIDARG"/> - <paramref name="width"/> and/or <paramref name="height"/> is less than or equal to 0.<br/>
+        /// <see cref="STATUS_FAILED"/> - Failed initializing the image. See: <see cref="GetLastInteropError(IntPtr, bool)"/>
+        /// </summary>
+        /// <param name="width">The width of the image</param>
+        /// <param name="height">The height of the image</param>
+        /// <param name="handlePtr">A pointer to an int for which the handle can be written to</param>
+        /// <returns>The status code of whether the method succeeded or not. See: <see cref="GetLastInteropError(IntPtr, bool)"/></returns>
+        [Description("Creates a new handle with one blank image of the specified width and height.")]
+        [UnmanagedCallersOnly(EntryPoint = nameof(CreateHandle), CallConvs = new[] { typeof(CallConvCdecl) })]
+        public static int CreateHandle(int width, int height, IntPtr handlePtr)
+        {
+            if (handlePtr != IntPtr.Zero && width > 0 && height > 0)
+            {
+                Image<Bgra32> newImage;
+                try
+                {
+                    newImage = new Image<Bgra32>(width, height);
+                }
+                catch (Exception e)
+                {
+                    lastErrorMsg.Clear();
+                    lastErrorMsg.AppendLine("Exception occurred while initializing the image. Stacktrace:");
+                    lastErrorMsg.Append(e);
+                    lastErrorMsg.AppendLine();
+                    lastErrorMsg.AppendLine("==== DEBUG INFO ====");
+                    lastErrorMsg.Append("Method name = ");
+                    lastErrorMsg.Append(nameof(CreateHandle));
+                    lastErrorMsg.AppendLine();
+                    lastErrorMsg.Append("Width = ");
+                    lastErrorMsg.Append(width);
+                    lastErrorMsg.AppendLine();
+                    lastErrorMsg.Append("Height = ");
+                    lastErrorMsg.Append(height);
+                    return STATUS_FAILED;
+                }
+                Marshal.WriteInt32(handlePtr, AddHandle(new[] { newImage }));
+
+                lastErrorMsg.Clear();
+                lastErrorMsg.Append("No error");
+                return STATUS_SUCCESS;
+            }
+            else
+            {
+                lastErrorMsg.Clear();
+                if (handlePtr == IntPtr.Zero)
+                {
+                    lastErrorMsg.Append("The input pointer to the output handle is null");
+                    return STATUS_NULLPTR;
+                }
+                else
+                {
+                    lastErrorMsg.Append("The input ");
+                    if (width <= 0)
+                        lastErrorMsg.Append("width");
+                    else
+                        lastErrorMsg.Append("height");
+                    lastErrorMsg.Append(" must be greater than 0");
+                    return STATUS_INVALIDARG;
+                }
+            }
+        }
+
+        /// <summary>
+        /// Write the first image of a handle to a TXTR file.<br/>
+        /// <strong>Note:</strong><br/>
+        /// <paramref name="filePathPtr"/> must be passed null terminated ASCII bytes.<br/>
+        /// <paramref name="progressCallbackPtr"/> can be <see cref="IntPtr.Zero"/> (null pointer is valid; parameter is optional).<br/>
+        /// The image of the handle is not modified, so a handle can be written multiple times.<br/>
+        /// <strong>Possible Status Codes:</strong><br/>
+        /// <see cref="STATUS_SUCCESS"/> - No error.<br/>
+        /// <see cref="STATUS_NULLPTR"/> - <paramref name="filePathPtr"/> is <see cref="IntPtr.Zero"/> (null pointer).<br/>
+        /// <see cref="STATUS_INVALIDHANDLE"/> - <paramref name="handle"/> does not exist. See: <see cref="OpenHandle(IntPtr, bool, IntPtr, IntPtr)"/> and <see cref="CreateHandle(int, int, IntPtr)"/><br/>
+        /// <see cref="STATUS_MARSHALFAIL"/> - Failed to marshal <paramref name="filePathPtr"/> to a string.<br/>
+        /// <see cref="STATUS_INVALIDARG"/> - <paramref name="textureFormat"/>, <paramref name="paletteFormat"/>, and/or <paramref name="copyPaletteSize"/> is not a valid enumeration.<br/>
+        /// <see cref="STATUS_FAILED"/> - Failed to write the TXTR. See: <see cref="GetLastInteropError(IntPtr, bool)"/><br/>
+        /// </summary>
+        /// <param name="handle">The handle</param>
+        /// <param name="filePathPtr">A pointer to a char buffer that contains the string of the file path to write the TXTR to</param>
+        /// <param name="textureFormat">The texture format to save the TXTR in. See: <see cref="TextureFormat"/></param>
+        /// <param name="paletteFormat">The palette format to save the TXTR in. See: <see cref="PaletteFormat"/></param>
+        /// <param name="copyPaletteSize">The location to write the palette length to in the TXTR. See: <see cref="CopyPaletteSize"/></param>
+        /// <param name="generateMipmaps">Whether mipmaps should be generated</param>
+        /// <param name="mipmapWidthLimit">Width limit for mipmap generation</param>
+        /// <param name="mipmapHeightLimit">Height limit for mipmap generation</param>
+        /// <param name="progressCallbackPtr">A function pointer to the progress callback, can be <see cref="IntPtr.Zero"/> (null pointer is valid; parameter is optional)</param>
+        /// <returns>The status code of whether the method succeeded or not. See: <see cref="GetLastInteropError(IntPtr, bool)"/></returns>
+        [Description("Write the first image of a handle to a TXTR file.")]
+        [UnmanagedCallersOnly(EntryPoint = nameof(SaveHandle), CallConvs = new[] { typeof(CallConvCdecl) })]
+        public static int SaveHandle(int handle, IntPtr filePathPtr, uint textureFormat, uint paletteFormat, uint copyPaletteSize,
+            bool generateMipmaps, int mipmapWidthLimit, int mipmapHeightLimit, IntPtr progressCallbackPtr)
+        {
+            if (handles.TryGetValue(handle, out ImageHandle? imageHandle) && filePathPtr != IntPtr.Zero)
+            {
+                string? filePath = Marshal.PtrToStringAnsi(filePathPtr);
+                if (filePath != null && ((TextureFormat)textureFormat).IsDefined()
+                    && ((PaletteFormat)paletteFormat).IsDefined()
+                    && ((CopyPaletteSize)copyPaletteSize).IsDefined())
+                {
+                    try
+                    {
+                        TXTRFileTypeLibAPI.Write(imageHandle.Images[0], filePath, (TextureFormat)textureFormat, (PaletteFormat)paletteFormat,
+                            (CopyPaletteSize)copyPaletteSize, generateMipmaps, mipmapWidthLimit, mipmapHeightLimit,
+                            GetProgressCallback(progressCallbackPtr));
+                    }
+                    catch (Exception e)
+                    {
+                        lastErrorMsg.Clear();
+                        lastErrorMsg.AppendLine("Exception occurred while writing the image. Stacktrace:");
+                        lastErrorMsg.Append(e);
+                        lastErrorMsg.AppendLine();
+                        lastErrorMsg.AppendLine("==== DEBUG INFO ====");
+                        lastErrorMsg.Append("Method name = ");
+                        lastErrorMsg.Append(nameof(SaveHandle));
+                        lastErrorMsg.AppendLine();
+                        lastErrorMsg.Append("Handle = ");
+                        lastErrorMsg.Append(handle);
+                        lastErrorMsg.AppendLine();
+                        lastErrorMsg.Append("File path pointer = ");
+                        lastErrorMsg.Append(filePathPtr);
+                        lastErrorMsg.AppendLine();
+                        lastErrorMsg.Append("File path = ");
+                        lastErrorMsg.Append(filePath);
+                        lastErrorMsg.AppendLine();
+                        lastErrorMsg.Append("Progress callback pointer = ");
+                        lastErrorMsg.Append(progressCallbackPtr);
+                        lastErrorMsg.AppendLine();
+                        lastErrorMsg.Append("Texture format = ");
+                        lastErrorMsg.Append((TextureFormat)textureFormat);
+                        lastErrorMsg.AppendLine();
+                        lastErrorMsg.Append("Palette format = ");
+                        lastErrorMsg.Append((PaletteFormat)paletteFormat);
+                        lastErrorMsg.AppendLine();
+                        lastErrorMsg.Append("Copy palette size = ");
+                        lastErrorMsg.Append((CopyPaletteSize)copyPaletteSize);
+                        return STATUS_FAILED;
+                    }
+
+                    lastErrorMsg.Clear();
+                    lastErrorMsg.Append("No error");
+                    return STATUS_SUCCESS;
+                }
+                else
+                {
+                    lastErrorMsg.Clear();
+                    if (filePath == null)
+                    {
+                        lastErrorMsg.Append("Failed to marshal input file path");
+                        return STATUS_MARSHALFAIL;
+                    }
+                    else
+                    {
+                        lastErrorMsg.Append("The input ");
+                        if (!((TextureFormat)textureFormat).IsDefined())
+                            lastErrorMsg.Append("texture format");
+                        else if (!((PaletteFormat)paletteFormat).IsDefined())
+                            lastErrorMsg.Append("palette format");
+                        else
+                            lastErrorMsg.Append("copy palette size");
+                        lastErrorMsg.Append(" does not fit any of the values in the ");
+                        if (!((TextureFormat)textureFormat).IsDefined())
+                            lastErrorMsg.Append(nameof(TextureFormat));
+                        else if (!((PaletteFormat)paletteFormat).IsDefined())
+                            lastErrorMsg.Append(nameof(PaletteFormat));
+                        else
+                            lastErrorMsg.Append(nameof(CopyPaletteSize));
+                        lastErrorMsg.Append(" enumeration");
+                        return STATUS_INVALIDARG;
+                    }
+                }
+            }
+            else
+            {
+                lastErrorMsg.Clear();
+                if (!handles.ContainsKey(handle))
+                    return InvalidHandle(handle);
+                else
+                {
+                    lastErrorMsg.Append("The pointer to the file path is null");
+                    return STATUS_NULLPTR;
+                }
+            }
+        }
+
+        /// <summary>
+        /// Gets the count of images of a handle.<br/>
+        /// <strong>Note:</strong><br/>
+        /// The image count is written to the pointer as a signed 32bit integer.<br/>
+        /// <strong>Possible Status Codes:</strong><br/>
+        /// <see cref="STATUS_SUCCESS"/> - No error.<br/>
+        /// <see cref="STATUS_NULLPTR"/> - <paramref name="imageCountPtr"/> is <see cref="IntPtr.Zero"/> (null pointer).<br/>
+        /// <see cref="STATUS_INVALIDHANDLE"/> - <paramref name="handle"/> does not exist.
+        /// </summary>
+        /// <param name="handle">The handle</param>
+        /// <param name="imageCountPtr">A pointer to an int for which the image count can be written to</param>
+        /// <returns>The status code of whether the method succeeded or not. See: <see cref="GetLastInteropError(IntPtr, bool)"/></returns>
+        [Description("Gets the count of images of a handle.")]
+        [UnmanagedCallersOnly(EntryPoint = nameof(GetHandleImageCount), CallConvs = new[] { typeof(CallConvCdecl) })]
+        public static int GetHandleImageCount(int handle, IntPtr imageCountPtr)
+        {
+            if (imageCountPtr != IntPtr.Zero && handles.TryGetValue(handle, out ImageHandle? imageHandle))
+            {
+                Marshal.WriteInt32(imageCountPtr, imageHandle.Images.Length);
+
+                lastErrorMsg.Clear();
+                lastErrorMsg.Append("No error");
+                return STATUS_SUCCESS;
+            }
+            else
+            {
+                lastErrorMsg.Clear();
+                if (imageCountPtr == IntPtr.Zero)
+                {
+                    lastErrorMsg.Append("The input pointer to the output image count is null");
+                    return STATUS_NULLPTR;
+                }
+                else
+                    return InvalidHandle(handle);
+            }
+        }
+
+        /// <summary>
+        /// Get the dimensions (width and height) of an image of a handle.<br/>
+        /// <strong>Note:</strong><br/>
+        /// The width and height are written to the pointers as signed 32bit integers.<br/>
+        /// <strong>Possible Status Codes:</strong><br/>
+        /// <see cref="STATUS_SUCCESS"/> - No error.<br/>
+        /// <see cref="STATUS_NULLPTR"/> - <paramref name="widthPtr"/> and/or <paramref name="heightPtr"/> is <see cref="IntPtr.Zero"/> (null pointer).<br/>
+        /// <see cref="STATUS_INVALIDHANDLE"/> - <paramref name="handle"/> does not exist.<br/>
+        /// <see cref="STATUS_IDXOUTOFRANGE"/> - <paramref name="index"/> is out of range of the images of the handle.
+        /// </summary>
+        /// <param name="handle">The handle</param>
+        /// <param name="index">The image index</param>
+        /// <param name="widthPtr">A pointer to an int for which the width can be written to</param>
+        /// <param name="heightPtr">A pointer to an int for which the height can be written to</param>
+        /// <returns>The status code of whether the method succeeded or not. See: <see cref="GetLastInteropError(IntPtr, bool)"/></returns>
+        [Description("Get the dimensions (width and height) of an image of a handle.")]
+        [UnmanagedCallersOnly(EntryPoint = nameof(GetHandleImageDimensions), CallConvs = new[] { typeof(CallConvCdecl) })]
+        public static int GetHandleImageDimensions(int handle, int index, IntPtr widthPtr, IntPtr heightPtr)
+        {
+            if (widthPtr != IntPtr.Zero && heightPtr != IntPtr.Zero && handles.TryGetValue(handle, out ImageHandle? imageHandle)
+                && index >= 0 && index < imageHandle.Images.Length)
+            {
+                Marshal.WriteInt32(widthPtr, imageHandle.Images[index].Width);
+                Marshal.WriteInt32(heightPtr, imageHandle.Images[index].Height);
+
+                lastErrorMsg.Clear();
+                lastErrorMsg.Append("No error");
+                return STATUS_SUCCESS;
+            }
+            else
+            {
+                lastErrorMsg.Clear();
+                if (widthPtr == IntPtr.Zero || heightPtr == IntPtr.Zero)
+                {
+                    lastErrorMsg.Append("The input pointer to the output ");
+                    if (widthPtr == IntPtr.Zero)
+                        lastErrorMsg.Append("width");
+                    else
+                        lastErrorMsg.Append("height");
+                    lastErrorMsg.Append(" is null");
+                    return STATUS_NULLPTR;
+                }
+                else if (!handles.ContainsKey(handle))
+                    return InvalidHandle(handle);
+                else
+                    return HandleIndexOutOfRange(index);
+            }
+        }
+
+        /// <summary>
+        /// Gets a pixel in an image of a handle.<br/>
+        /// <strong>Note:</strong><br/>
+        /// r, g, b, and a are written to the pointers as a byte.<br/>
+        /// <strong>Possible Status Codes:</strong><br/>
+        /// <see cref="STATUS_SUCCESS"/> - No error.<br/>
+        /// <see cref="STATUS_NULLPTR"/> - <paramref name="rPtr"/>, <paramref name="gPtr"/>, <paramref name="bPtr"/>, and/or <paramref name="aPtr"/> is <see cref="IntPtr.Zero"/> (null pointer).<br/>
+        /// <see cref="STATUS_INVALIDHANDLE"/> - <paramref name="handle"/> does not exist.<br/>
+        /// <see cref="STATUS_IDXOUTOFRANGE"/> - <paramref name="index"/> is out of range of the images of the handle.<br/>
+        /// <see cref="STATUS_INVALIDARG"/> - <paramref name="x"/> and/or <paramref name="y"/> is less than 0 and/or exceeds the image width and/or height
+        /// </summary>
+        /// <param name="handle">The handle</param>
+        /// <param name="index">The image index</param>
+        /// <param name="x">The x coordinate of the target pixel</param>
+        /// <param name="y">The y coordinate of the target pixel</param>
+        /// <param name="rPtr">A pointer to a byte for which the red component of the color can be written to</param>
+        /// <param name="gPtr">A pointer to a byte for which the green component of the color can be written to</param>
+        /// <param name="bPtr">A pointer to a byte for which the blue component of the color can be written to</param>
+        /// <param name="aPtr">A pointer to a byte for which the alpha component of the color can be written to</param>
+        /// <returns>The status code of whether the method succeeded or not. See: <see cref="GetLastInteropError(IntPtr, bool)"/></returns>
+        [Description("Gets a pixel in an image of a handle.")]
+        [UnmanagedCallersOnly(EntryPoint = nameof(GetHandlePixel), CallConvs = new[] { typeof(CallConvCdecl) })]
+        public static int GetHandlePixel(int handle, int index, int x, int y, IntPtr rPtr, IntPtr gPtr, IntPtr bPtr, IntPtr aPtr)
+        {
+            if (rPtr != IntPtr.Zero && gPtr != IntPtr.Zero && bPtr != IntPtr.Zero && aPtr != IntPtr.Zero
+                && handles.TryGetValue(handle, out ImageHandle? imageHandle) && index >= 0 && index < imageHandle.Images.Length
+                && x >= 0 && x < imageHandle.Images[index].Width && y >= 0 && y < imageHandle.Images[index].Height)
+            {
+                Bgra32 pixel = imageHandle.Images[index][x, y];
+                Marshal.WriteByte(rPtr, pixel.R);
+                Marshal.WriteByte(gPtr, pixel.G);
+                Marshal.WriteByte(bPtr, pixel.B);
+                Marshal.WriteByte(aPtr, pixel.A);
+
+                lastErrorMsg.Clear();
+                lastErrorMsg.Append("No error");
+                return STATUS_SUCCESS;
+            }
+            else
+            {
+                lastErrorMsg.Clear();
+                if (rPtr == IntPtr.Zero || gPtr == IntPtr.Zero || bPtr == IntPtr.Zero || aPtr == IntPtr.Zero)
+                {
+                    lastErrorMsg.Append("The input pointer to the output ");
+                    if (rPtr == IntPtr.Zero)
+                        lastErrorMsg.Append('r');
+                    else if (gPtr == IntPtr.Zero)
+                        lastErrorMsg.Append('g');
+                    else if (bPtr == IntPtr.Zero)
+                        lastErrorMsg.Append('b');
+                    else
+                        lastErrorMsg.Append('a');
+                    lastErrorMsg.Append(" is null");
+                    return STATUS_NULLPTR;
+                }
+                else if (!handles.TryGetValue(handle, out imageHandle))
+                    return InvalidHandle(handle);
+                else if (index < 0 || index >= imageHandle.Images.Length)
+                    return HandleIndexOutOfRange(index);
+                else
+                    return CoordinateOutOfRange(imageHandle.Images[index], x, y);
+            }
+        }
+
+        /// <summary>
+        /// Sets a pixel to the passed RGBA color values on the first image of a handle.<br/>
+        /// <strong>Possible Status Codes:</strong><br/>
+        /// <see cref="STATUS_SUCCESS"/> - No error.<br/>
+        /// <see cref="STATUS_INVALIDHANDLE"/> - <paramref name="handle"/> does not exist.<br/>
+        /// <see cref="STATUS_INVALIDARG"/> - <paramref name="x"/> and/or <paramref name="y"/> is less than 0 and/or exceeds the image width and/or height
+        /// </summary>
+        /// <param name="handle">The handle</param>
+        /// <param name="x">The x coordinate of the target pixel</param>
+        /// <param name="y">The y coordinate of the target pixel</param>
+        /// <param name="r">The red component of the color</param>
+        /// <param name="g">The green component of the color</param>
+        /// <param name="b">The blue component of the color</param>
+        /// <param name="a">The alpha component of the color</param>
+        /// <returns>The status code of whether the method succeeded or not. See: <see cref="GetLastInteropError(IntPtr, bool)"/></returns>
+        [Description("Sets a pixel to the passed RGBA color values on the first image of a handle.")]
+        [UnmanagedCallersOnly(EntryPoint = nameof(SetHandlePixel), CallConvs = new[] { typeof(CallConvCdecl) })]
+        public static int SetHandlePixel(int handle, int x, int y, byte r, byte g, byte b, byte a)
+        {
+            if (handles.TryGetValue(handle, out ImageHandle? imageHandle)
+                && x >= 0 && x < imageHandle.Images[0].Width && y >= 0 && y < imageHandle.Images[0].Height)
+            {
+                imageHandle.Images[0][x, y] = new Bgra32(r, g, b, a);
+
+                lastErrorMsg.Clear();
+                lastErrorMsg.Append("No error");
+                return STATUS_SUCCESS;
+            }
+            else
+            {
+                lastErrorMsg.Clear();
+                if (imageHandle == null)
+                    return InvalidHandle(handle);
+                else
+                    return CoordinateOutOfRange(imageHandle.Images[0], x, y);
+            }
+        }
+
+        /// <summary>
+        /// Copies all of the pixels of an image of a handle to a buffer in one call.<br/>
+        /// <strong>Note:</strong><br/>
+        /// The pixels are written to the buffer as BGRA bytes (4 bytes per pixel), row by row from the top row,
+        /// with no padding between rows.<br/>
+        /// <paramref name="bufferLength"/> must be at least width * height * 4 bytes. See: <see cref="GetHandleImageDimensions(int, int, IntPtr, IntPtr)"/><br/>
+        /// <strong>Possible Status Codes:</strong><br/>
+        /// <see cref="STATUS_SUCCESS"/> - No error.<br/>
+        /// <see cref="STATUS_NULLPTR"/> - <paramref name="bufferPtr"/> is <see cref="IntPtr.Zero"/> (null pointer).<br/>
+        /// <see cref="STATUS_INVALIDHANDLE"/> - <paramref name="handle"/> does not exist.<br/>
+        /// <see cref="STATUS_IDXOUTOFRANGE"/> - <paramref name="index"/> is out of range of the images of the handle.<br/>
+        /// <see cref="STATUS_INVALIDARG"/> - <paramref name="bufferLength"/> is too small to hold the pixels of the image.
+        /// </summary>
+        /// <param name="handle">The handle</param>
+        /// <param name="index">The image index</param>
+        /// <param name="bufferPtr">A pointer to a byte buffer for which the pixels can be written to</param>
+        /// <param name="bufferLength">The length of the byte buffer in bytes</param>
+        /// <returns>The status code of whether the method succeeded or not. See: <see cref="GetLastInteropError(IntPtr, bool)"/></returns>
+        [Description("Copies all of the pixels of an image of a handle to a buffer in one call.")]
+        [UnmanagedCallersOnly(EntryPoint = nameof(GetHandleImageBuffer), CallConvs = new[] { typeof(CallConvCdecl) })]
+        public static int GetHandleImageBuffer(int handle, int index, IntPtr bufferPtr, int bufferLength)
+        {
+            if (bufferPtr != IntPtr.Zero && handles.TryGetValue(handle, out ImageHandle? imageHandle)
+                && index >= 0 && index < imageHandle.Images.Length
+                && bufferLength >= imageHandle.Images[index].Width * imageHandle.Images[index].Height * 4)
+            {
+                CopyImageToBuffer(imageHandle.Images[index], bufferPtr, bufferLength);
+
+                lastErrorMsg.Clear();
+                lastErrorMsg.Append("No error");
+                return STATUS_SUCCESS;
+            }
+            else
+            {
+                lastErrorMsg.Clear();
+                if (bufferPtr == IntPtr.Zero)
+                {
+                    lastErrorMsg.Append("The input pointer to the output buffer is null");
+                    return STATUS_NULLPTR;
+                }
+                else if (!handles.TryGetValue(handle, out imageHandle))
+                    return InvalidHandle(handle);
+                else if (index < 0 || index >= imageHandle.Images.Length)
+                    return HandleIndexOutOfRange(index);
+                else
+                {
+                    lastErrorMsg.Append("The input buffer length (");
+                    lastErrorMsg.Append(bufferLength);
+                    lastErrorMsg.Append(") is less than the length required by the image (");
+                    lastErrorMsg.Append(imageHandle.Images[index].Width * imageHandle.Images[index].Height * 4);
+                    lastErrorMsg.Append(')');
+                    return STATUS_INVALIDARG;
+                }
+            }
+        }
+
+        /// <summary>
+        /// Sets all of the pixels of the first image of a handle from a buffer in one call.<br/>
+        /// <strong>Note:</strong><br/>
+        /// The buffer must hold 4 bytes per pixel in the order specified by <paramref name="channelOrder"/>, row by row from the top row,
+        /// with the width and height of the image. See: <see cref="GetHandleImageDimensions(int, int, IntPtr, IntPtr)"/><br/>
+        /// <paramref name="stride"/> can be 0, in which case the rows are expected to have no padding (width * 4 bytes).<br/>
+        /// <strong>Possible Status Codes:</strong><br/>
+        /// <see cref="STATUS_SUCCESS"/> - No error.<br/>
+        /// <see cref="STATUS_NULLPTR"/> - <paramref name="bufferPtr"/> is <see cref="IntPtr.Zero"/> (null pointer).<br/>
+        /// <see cref="STATUS_INVALIDHANDLE"/> - <paramref name="handle"/> does not exist.<br/>
+        /// <see cref="STATUS_INVALIDARG"/> - <paramref name="stride"/> is less than width * 4, <paramref name="bufferLength"/> is too small,
+        /// and/or <paramref name="channelOrder"/> is not a valid channel order code.<br/>
+        /// <see cref="STATUS_FAILED"/> - Failed setting the image. See: <see cref="GetLastInteropError(IntPtr, bool)"/>
+        /// </summary>
+        /// <param name="handle">The handle</param>
+        /// <param name="bufferPtr">A pointer to a byte buffer for which the pixels can be read from</param>
+        /// <param name="bufferLength">The length of the byte buffer in bytes</param>
+        /// <param name="stride">The length of a row in the byte buffer in bytes, can be 0</param>
+        /// <param name="channelOrder">The order of the color components of a pixel in the byte buffer. See: <see cref="CHANNELORDER_BGRA"/> and <see cref="CHANNELORDER_RGBA"/></param>
+        /// <returns>The status code of whether the method succeeded or not. See: <see cref="GetLastInteropError(IntPtr, bool)"/></returns>
+        [Description("Sets all of the pixels of the first image of a handle from a buffer in one call.")]
+        [UnmanagedCallersOnly(EntryPoint = nameof(SetHandleImageBuffer), CallConvs = new[] { typeof(CallConvCdecl) })]
+        public static int SetHandleImageBuffer(int handle, IntPtr bufferPtr, int bufferLength, int stride, int channelOrder)
+        {
+            if (bufferPtr != IntPtr.Zero && handles.TryGetValue(handle, out ImageHandle? imageHandle))
+            {
+                Image<Bgra32> image = imageHandle.Images[0];
+                if (stride == 0)
+                    stride = image.Width * 4;
+                if (stride >= image.Width * 4 && (long)stride * (image.Height - 1) + image.Width * 4 <= bufferLength
+                    && (channelOrder == CHANNELORDER_BGRA || channelOrder == CHANNELORDER_RGBA))
+                {
+                    try
+                    {
+                        CopyBufferToImage(image, bufferPtr, bufferLength, stride, channelOrder);
+                    }
+                    catch (Exception e)
+                    {
+                        lastErrorMsg.Clear();
+                        lastErrorMsg.AppendLine("Exception occurred while setting the image. Stacktrace:");
+                        lastErrorMsg.Append(e);
+                        lastErrorMsg.AppendLine();
+                        lastErrorMsg.AppendLine("==== DEBUG INFO ====");
+                        lastErrorMsg.Append("Method name = ");
+                        lastErrorMsg.Append(nameof(SetHandleImageBuffer));
+                        lastErrorMsg.AppendLine();
+                        lastErrorMsg.Append("Handle = ");
+                        lastErrorMsg.Append(handle);
+                        lastErrorMsg.AppendLine();
+                        lastErrorMsg.Append("Buffer pointer = ");
+                        lastErrorMsg.Append(bufferPtr);
+                        lastErrorMsg.AppendLine();
+                        lastErrorMsg.Append("Buffer length = ");
+                        lastErrorMsg.Append(bufferLength);
+                        lastErrorMsg.AppendLine();
+                        lastErrorMsg.Append("Stride = ");
+                        lastErrorMsg.Append(stride);
+                        lastErrorMsg.AppendLine();
+                        lastErrorMsg.Append("Channel order = ");
+                        lastErrorMsg.Append(channelOrder);
+                        return STATUS_FAILED;
+                    }
+
+                    lastErrorMsg.Clear();
+                    lastErrorMsg.Append("No error");
+                    return STATUS_SUCCESS;
+                }
+                else
+                {
+                    lastErrorMsg.Clear();
+                    if (stride < image.Width * 4)
+                    {
+                        lastErrorMsg.Append("The input stride (");
+                        lastErrorMsg.Append(stride);
+                        lastErrorMsg.Append(") is less than the length of a row (");
+                        lastErrorMsg.Append(image.Width * 4);
+                        lastErrorMsg.Append(')');
+                    }
+                    else if (channelOrder != CHANNELORDER_BGRA && channelOrder != CHANNELORDER_RGBA)
+                    {
+                        lastErrorMsg.Append("Invalid channel order value: ");
+                        lastErrorMsg.Append(channelOrder);
+                    }
+                    else
+                    {
+                        lastErrorMsg.Append("The input buffer length (");
+                        lastErrorMsg.Append(bufferLength);
+                        lastErrorMsg.Append(") is less than the length required by the image (");
+                        lastErrorMsg.Append((long)stride * (image.Height - 1) + image.Width * 4);
+                        lastErrorMsg.Append(')');
+                    }
+                    return STATUS_INVALIDARG;
+                }
+            }
+            else
+            {
+                lastErrorMsg.Clear();
+                if (bufferPtr == IntPtr.Zero)
+                {
+                    lastErrorMsg.Append("The input pointer to the buffer is null");
+                    return STATUS_NULLPTR;
+                }
+                else
+                    return InvalidHandle(handle);
+            }
+        }
+
+        /// <summary>
+        /// Gets a pointer to the pixels of an image of a handle without copying them.<br/>
+        /// <strong>Note:</strong><br/>
+        /// The pixels are stored as BGRA bytes (4 bytes per pixel), row by row from the top row.<br/>
+        /// The pixels are pinned in memory, so the pointer stays valid until <see cref="DisposeHandle(int)"/> is called.
+        /// The pixels must not be written to through the pointer.<br/>
+        /// The pointer is written to <paramref name="pointerPtr"/> as a pointer sized integer. The length of the pixels in bytes and
+        /// the length of a row in bytes are written to <paramref name="lengthPtr"/> and <paramref name="stridePtr"/> as signed 32bit integers.<br/>
+        /// <strong>Possible Status Codes:</strong><br/>
+        /// <see cref="STATUS_SUCCESS"/> - No error.<br/>
+        /// <see cref="STATUS_NULLPTR"/> - <paramref name="pointerPtr"/>, <paramref name="lengthPtr"/>, and/or <paramref name="stridePtr"/> is <see cref="IntPtr.Zero"/> (null pointer).<br/>
+        /// <see cref="STATUS_INVALIDHANDLE"/> - <paramref name="handle"/> does not exist.<br/>
+        /// <see cref="STATUS_IDXOUTOFRANGE"/> - <paramref name="index"/> is out of range of the images of the handle.<br/>
+        /// <see cref="STATUS_FAILED"/> - The pixels of the image are not stored in one contiguous block of memory. See: <see cref="GetHandleImageBuffer(int, int, IntPtr, int)"/>
+        /// </summary>
+        /// <param name="handle">The handle</param>
+        /// <param name="index">The image index</param>
+        /// <param name="pointerPtr">A pointer to a pointer for which the pointer to the pixels can be written to</param>
+        /// <param name="lengthPtr">A pointer to an int for which the length of the pixels in bytes can be written to</param>
+        /// <param name="stridePtr">A pointer to an int for which the length of a row in bytes can be written to</param>
+        /// <returns>The status code of whether the method succeeded or not. See: <see cref="GetLastInteropError(IntPtr, bool)"/></returns>
+        [Description("Gets a pointer to the pixels of an image of a handle without copying them.")]
+        [UnmanagedCallersOnly(EntryPoint = nameof(GetHandleImagePointer), CallConvs = new[] { typeof(CallConvCdecl) })]
+        public static unsafe int GetHandleImagePointer(int handle, int index, IntPtr pointerPtr, IntPtr lengthPtr, IntPtr stridePtr)
+        {
+            if (pointerPtr != IntPtr.Zero && lengthPtr != IntPtr.Zero && stridePtr != IntPtr.Zero
+                && handles.TryGetValue(handle, out ImageHandle? imageHandle) && index >= 0 && index < imageHandle.Images.Length)
+            {
+                Image<Bgra32> image = imageHandle.Images[index];
+                if (!TryPinImage(image, index, imageHandle.PinnedImages, out MemoryHandle pinnedImage))
+                {
+                    lastErrorMsg.Clear();
+                    lastErrorMsg.Append("The pixels of the image at the specified index ");
+                    lastErrorMsg.Append(index);
+                    lastErrorMsg.Append(" are not stored in one contiguous block of memory. Please use the \"");
+                    lastErrorMsg.Append(nameof(GetHandleImageBuffer));
+                    lastErrorMsg.Append("\" method to copy the pixels instead.");
+                    return STATUS_FAILED;
+                }
+                Marshal.WriteIntPtr(pointerPtr, (IntPtr)pinnedImage.Pointer);
+                Marshal.WriteInt32(lengthPtr, image.Width * image.Height * 4);
+                Marshal.WriteInt32(stridePtr, image.Width * 4);
+
+                lastErrorMsg.Clear();
+                lastErrorMsg.Append("No error");
+                return STATUS_SUCCESS;
+            }
+            else
+            {
+                lastErrorMsg.Clear();
+                if (pointerPtr == IntPtr.Zero || lengthPtr == IntPtr.Zero || stridePtr == IntPtr.Zero)
+                {
+                    lastErrorMsg.Append("The input pointer to the output ");
+                    if (pointerPtr == IntPtr.Zero)
+                        lastErrorMsg.Append("pointer");
+                    else if (lengthPtr == IntPtr.Zero)
+                        lastErrorMsg.Append("length");
+                    else
+                        lastErrorMsg.Append("stride");
+                    lastErrorMsg.Append(" is null");
+                    return STATUS_NULLPTR;
+                }
+                else if (!handles.ContainsKey(handle))
+                    return InvalidHandle(handle);
+                else
+                    return HandleIndexOutOfRange(index);
+            }
+        }
+
+        /// <summary>
+        /// Gets whether a handle exists.<br/>
+        /// See: <see cref="OpenHandle(IntPtr, bool, IntPtr, IntPtr)"/> and <see cref="CreateHandle(int, int, IntPtr)"/>
+        /// </summary>
+        /// <param name="handle">The handle</param>
+        /// <returns><see langword="true"/> if the handle exists else <see langword="false"/></returns>
+        [Description("Gets whether a handle exists.")]
+        [UnmanagedCallersOnly(EntryPoint = nameof(IsHandleValid), CallConvs = new[] { typeof(CallConvCdecl) })]
+        public static bool IsHandleValid(int handle) => handles.ContainsKey(handle);
+
+        /// <summary>
+        /// Dispose the images of a handle and the handle itself.<br/>
+        /// <strong>Note:</strong><br/>
+        /// It is strongly advised you call this at all possible endpoints in the control flow of your code or else memory leaks will ensue.<br/>
+        /// <strong>Possible Status Codes:</strong><br/>
+        /// <see cref="STATUS_SUCCESS"/> - No error.<br/>
+        /// <see cref="STATUS_INVALIDHANDLE"/> - <paramref name="handle"/> does not exist (or is already disposed).
+        /// </summary>
+        /// <param name="handle">The handle</param>
+        /// <returns>The status code of whether the method succeeded or not. See: <see cref="GetLastInteropError(IntPtr, bool)"/></returns>
+        [Description("Dispose the images of a handle and the handle itself.")]
+        [UnmanagedCallersOnly(EntryPoint = nameof(DisposeHandle), CallConvs = new[] { typeof(CallConvCdecl) })]
+        public static int DisposeHandle(int handle)
+        {
+            if (handles.TryRemove(handle, out ImageHandle? imageHandle))
+            {
+                imageHandle.Dispose();
+
+                lastErrorMsg.Clear();
+                lastErrorMsg.Append("No error");
+                return STATUS_SUCCESS;
+            }
+            else
+            {
+                lastErrorMsg.Clear();
+                return InvalidHandle(handle);
+            }
+        }
+
+        private static int AddHandle(Image<Bgra32>[] images)
+        {
+            int handle = Interlocked.Increment(ref nextHandle);
+            handles[handle] = new ImageHandle(images);
+            return handle;
+        }
+
+        private static int InvalidHandle(int handle)
+        {
+            lastErrorMsg.Append("The specified handle ");
+            lastErrorMsg.Append(handle);
+            lastErrorMsg.Append(" does not exist (it was never opened or is already disposed)");
+            return STATUS_INVALIDHANDLE;
+        }
+
+        private static int HandleIndexOutOfRange(int index)
+        {
+            lastErrorMsg.Append("The specified index ");
+            lastErrorMsg.Append(index);
+            lastErrorMsg.Append(" is out of range of the images of the handle");
+            return STATUS_IDXOUTOFRANGE;
+        }
+
+        private static int CoordinateOutOfRange(Image<Bgra32> image, int x, int y)
+        {
+            lastErrorMsg.Append("The input ");
+            if (x < 0 || x >= image.Width)
+            {
+                lastErrorMsg.Append("x (");
+                lastErrorMsg.Append(x);
+                lastErrorMsg.Append(") coordinate is out of range of the image width (");
+                lastErrorMsg.Append(image.Width);
+            }
+            else
+            {
+                lastErrorMsg.Append("y (");
+                lastErrorMsg.Append(y);
+                lastErrorMsg.Append(") coordinate is out of range of the image height (");
+                lastErrorMsg.Append(image.Height);
+            }
+            lastErrorMsg.Append(')');
+            return STATUS_INVALIDARG;
+        }
+    }
+}
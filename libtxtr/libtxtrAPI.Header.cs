@@ -0,0 +1,166 @@
+﻿/*
+TXTRFileType
+Copyright (C) 2021 xchellx
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+*/
+
+using libWiiSharp.Extensions;
+using System;
+using System.ComponentModel;
+using System.Runtime.CompilerServices;
+using System.Runtime.InteropServices;
+using TXTRFileTypeLib;
+
+namespace libtxtr
+{
+    public static partial class libtxtrAPI
+    {
+        /// <summary>
+        /// Count of the signed 32bit integers written for the header of a TXTR.<br/>
+        /// See: <see cref="ReadHeader(IntPtr, IntPtr, IntPtr, int)"/>
+        /// </summary>
+        public const int HEADER_FIELDCOUNT = 10;
+
+        /// <summary>
+        /// Count of the signed 64bit integers written for each mipmap of a TXTR.<br/>
+        /// See: <see cref="ReadHeader(IntPtr, IntPtr, IntPtr, int)"/>
+        /// </summary>
+        public const int HEADER_MIPMAPFIELDCOUNT = 4;
+
+        /// <summary>
+        /// Read only the header of a TXTR file, without decoding any pixels.<br/>
+        /// <strong>Note:</strong><br/>
+        /// <paramref name="filePathPtr"/> must be passed null terminated ASCII bytes.<br/>
+        /// <paramref name="headerPtr"/> must point to <see cref="HEADER_FIELDCOUNT"/> signed 32bit integers, which are written
+        /// in this order: texture format, width, height, mipmap count, whether the texture format is indexed (0 or 1),
+        /// palette format, palette width, palette height, palette offset, and palette size. The palette fields are 0
+        /// if the texture format is not indexed.<br/>
+        /// <paramref name="mipmapsPtr"/> can be <see cref="IntPtr.Zero"/> (null pointer is valid; parameter is optional). Else it
+        /// must point to <paramref name="mipmapsLength"/> * <see cref="HEADER_MIPMAPFIELDCOUNT"/> signed 64bit integers,
+        /// which are written for each mipmap in this order: width, height, offset, and size. Only the first
+        /// <paramref name="mipmapsLength"/> mipmaps are written, the mipmap count of the header tells how many there are.<br/>
+        /// The offsets are counted in bytes from the start of the file.<br/>
+        /// <strong>Possible Status Codes:</strong><br/>
+        /// <see cref="STATUS_SUCCESS"/> - No error.<br/>
+        /// <see cref="STATUS_NULLPTR"/> - <paramref name="filePathPtr"/> and/or <paramref name="headerPtr"/> is <see cref="IntPtr.Zero"/> (null pointer).<br/>
+        /// <see cref="STATUS_INVALIDARG"/> - <paramref name="mipmapsLength"/> is less than 0.<br/>
+        /// <see cref="STATUS_MARSHALFAIL"/> - Failed to marshal <paramref name="filePathPtr"/> to a string.<br/>
+        /// <see cref="STATUS_FAILED"/> - Failed to read the header of the TXTR. See: <see cref="GetLastInteropError(IntPtr, bool)"/>
+        /// </summary>
+        /// <param name="filePathPtr">A pointer to a char buffer that contains the string of the file path to read TXTR the from</param>
+        /// <param name="headerPtr">A pointer to an int buffer for which the header can be written to</param>
+        /// <param name="mipmapsPtr">A pointer to a long buffer for which the mipmaps can be written to, can be <see cref="IntPtr.Zero"/> (null pointer is valid; parameter is optional)</param>
+        /// <param name="mipmapsLength">The count of mipmaps the long buffer can hold</param>
+        /// <returns>The status code of whether the method succeeded or not. See: <see cref="GetLastInteropError(IntPtr, bool)"/></returns>
+        [Description("Read only the header of a TXTR file, without decoding any pixels.")]
+        [UnmanagedCallersOnly(EntryPoint = nameof(ReadHeader), CallConvs = new[] { typeof(CallConvCdecl) })]
+        public static int ReadHeader(IntPtr filePathPtr, IntPtr headerPtr, IntPtr mipmapsPtr, int mipmapsLength)
+        {
+            if (filePathPtr != IntPtr.Zero && headerPtr != IntPtr.Zero && mipmapsLength >= 0)
+            {
+                string? filePath = Marshal.PtrToStringAnsi(filePathPtr);
+                if (filePath != null)
+                {
+                    TXTRHeader header;
+                    try
+                    {
+                        header = TXTRFileTypeLibAPI.ReadHeader(filePath);
+                    }
+                    catch (Exception e)
+                    {
+                        lastErrorMsg.Clear();
+                        lastErrorMsg.AppendLine("Exception occurred while reading the header. Stacktrace:");
+                        lastErrorMsg.Append(e);
+                        lastErrorMsg.AppendLine();
+                        lastErrorMsg.AppendLine("==== DEBUG INFO ====");
+                        lastErrorMsg.Append("Method name = ");
+                        lastErrorMsg.Append(nameof(ReadHeader));
+                        lastErrorMsg.AppendLine();
+                        lastErrorMsg.Append("File path pointer = ");
+                        lastErrorMsg.Append(filePathPtr);
+                        lastErrorMsg.AppendLine();
+                        lastErrorMsg.Append("File path = ");
+                        lastErrorMsg.Append(filePath);
+                        return STATUS_FAILED;
+                    }
+                    WriteHeader(header, headerPtr, mipmapsPtr, mipmapsLength);
+
+                    lastErrorMsg.Clear();
+                    lastErrorMsg.Append("No error");
+                    return STATUS_SUCCESS;
+                }
+                else
+                {
+                    lastErrorMsg.Clear();
+                    lastErrorMsg.Append("Failed to marshal input file path");
+                    return STATUS_MARSHALFAIL;
+                }
+            }
+            else
+            {
+                lastErrorMsg.Clear();
+                if (filePathPtr == IntPtr.Zero)
+                {
+                    lastErrorMsg.Append("The pointer to the file path is null");
+                    return STATUS_NULLPTR;
+                }
+                else if (headerPtr == IntPtr.Zero)
+                {
+                    lastErrorMsg.Append("The input pointer to the output header is null");
+                    return STATUS_NULLPTR;
+                }
+                else
+                {
+                    lastErrorMsg.Append("The mipmaps length must not be less than 0: ");
+                    lastErrorMsg.Append(mipmapsLength);
+                    return STATUS_INVALIDARG;
+                }
+            }
+        }
+
+        private static void WriteHeader(TXTRHeader header, IntPtr headerPtr, IntPtr mipmapsPtr, int mipmapsLength)
+        {
+            int[] headerFields = new int[HEADER_FIELDCOUNT]
+            {
+                (int)header.TextureFormat.AsUInt32(),
+                header.Width,
+                header.Height,
+                (int)header.MipmapCount,
+                header.IsIndexed ? 1 : 0,
+                header.PaletteFormat != null ? (int)header.PaletteFormat.Value.AsUInt32() : 0,
+                header.PaletteWidth,
+                header.PaletteHeight,
+                (int)header.PaletteOffset,
+                header.PaletteSize
+            };
+            Marshal.Copy(headerFields, 0, headerPtr, headerFields.Length);
+
+            if (mipmapsPtr != IntPtr.Zero)
+            {
+                int mipmapCount = Math.Min(mipmapsLength, header.Mipmaps.Count);
+                long[] mipmapFields = new long[mipmapCount * HEADER_MIPMAPFIELDCOUNT];
+                for (int i = 0; i < mipmapCount; i++)
+                {
+                    TXTRMipmapInfo mipmap = header.Mipmaps[i];
+                    mipmapFields[i * HEADER_MIPMAPFIELDCOUNT] = mipmap.Width;
+                    mipmapFields[i * HEADER_MIPMAPFIELDCOUNT + 1] = mipmap.Height;
+                    mipmapFields[i * HEADER_MIPMAPFIELDCOUNT + 2] = mipmap.Offset;
+                    mipmapFields[i * HEADER_MIPMAPFIELDCOUNT + 3] = mipmap.Size;
+                }
+                Marshal.Copy(mipmapFields, 0, mipmapsPtr, mipmapFields.Length);
+            }
+        }
+    }
+}
@@ -20,8 +20,12 @@ using libWiiSharp;
 using libWiiSharp.Extensions;
 using libWiiSharp.Formats;
 using SixLabors.ImageSharp;
+using SixLabors.ImageSharp.Advanced;
+using SixLabors.ImageSharp.Memory;
 using SixLabors.ImageSharp.PixelFormats;
 using System;
+using System.Buffers;
+using System.Collections.Concurrent;
 using System.Collections.Generic;
 using System.ComponentModel;
 using System.Runtime.CompilerServices;
@@ -36,22 +40,33 @@ namespace libtxtr
     /// </summary>
     [Description("Public API surface for libtxtr.")]
 #pragma warning disable IDE1006
-    public static class libtxtrAPI
+    public static partial class libtxtrAPI
 #pragma warning restore IDE1006
     {
         static libtxtrAPI()
         {
             images = new List<Image<Bgra32>>();
+            pinnedImages = new Dictionary<int, MemoryHandle>();
             saveImage = null;
-            lastErrorMsg = new StringBuilder(4096, 4096);
-            lastErrorMsg.Append("No error");
+            handles = new ConcurrentDictionary<int, ImageHandle>();
+            nextHandle = 0;
         }
 
         private static readonly List<Image<Bgra32>> images;
 
+        private static readonly Dictionary<int, MemoryHandle> pinnedImages;
+
         private static Image<Bgra32>? saveImage;
 
-        private static readonly StringBuilder lastErrorMsg;
+        private static readonly ConcurrentDictionary<int, ImageHandle> handles;
+
+        private static int nextHandle;
+
+        // Every thread has its own last error message so calls on different handles can run in parallel
+        [ThreadStatic]
+        private static StringBuilder? threadLastErrorMsg;
+
+        private static StringBuilder lastErrorMsg => threadLastErrorMsg ??= new StringBuilder(4096, 4096).Append("No error");
 
         /// <summary>
         /// Status code that indicates success.
@@ -98,6 +113,11 @@ namespace libtxtr
         /// </summary>
         public const int STATUS_IMGNOTINIT = 8;
 
+        /// <summary>
+        /// Status code that indicates a handle does not exist (it was never opened or is already disposed).
+        /// </summary>
+        public const int STATUS_INVALIDHANDLE = 9;
+
         /// <summary>
         /// Enum type code for <see cref="TextureFormat"/>.<br/>
         /// See: <see cref="GetEnumDescription(int, uint, IntPtr, bool)"/>
@@ -116,6 +136,24 @@ namespace libtxtr
         /// </summary>
         public const int ENUMTYPE_COPYPALETTESIZE = 3;
 
+        /// <summary>
+        /// Channel order code for buffers with pixels stored as BGRA bytes.<br/>
+        /// See: <see cref="SetImageBuffer(int, int, IntPtr, int, int, int)"/>
+        /// </summary>
+        public const int CHANNELORDER_BGRA = 0;
+
+        /// <summary>
+        /// Channel order code for buffers with pixels stored as RGBA bytes.<br/>
+        /// See: <see cref="SetImageBuffer(int, int, IntPtr, int, int, int)"/>
+        /// </summary>
+        public const int CHANNELORDER_RGBA = 1;
+
+        /// <summary>
+        /// Mipmap level code for reading the smallest mipmap that is at least of a minimum width and height.<br/>
+        /// See: <see cref="OpenMipmap(IntPtr, int, int, int, IntPtr)"/>
+        /// </summary>
+        public const int MIPMAPLEVEL_FORSIZE = -1;
+
         // For speed: all if branches are flattened as much as possible
 
         /// <summary>
@@ -148,9 +186,7 @@ namespace libtxtr
                     {
                         newImages = TXTRFileTypeLibAPI.Read(filePath,
                             readMipmaps,
-                            progressCallbackPtr != IntPtr.Zero
-                            ? Marshal.GetDelegateForFunctionPointer<TXTRFileTypeLibAPI.UpdateProgressDelegate>(progressCallbackPtr)
-                            : null);
+                            GetProgressCallback(progressCallbackPtr));
                     }
                     catch (Exception e)
                     {
@@ -207,6 +243,109 @@ namespace libtxtr
             }
         }
 
+        /// <summary>
+        /// Read one mipmap of an TXTR file to an image, skipping the mipmaps before it without reading them.<br/>
+        /// <strong>Note:</strong><br/>
+        /// <paramref name="filePathPtr"/> must be passed null terminated ASCII bytes.<br/>
+        /// If <paramref name="mipmapLevel"/> is <see cref="MIPMAPLEVEL_FORSIZE"/>, the smallest mipmap that is at least
+        /// <paramref name="minWidth"/> x <paramref name="minHeight"/> is read (or the first mipmap if it is smaller), else
+        /// <paramref name="minWidth"/> and <paramref name="minHeight"/> are ignored.<br/>
+        /// <paramref name="progressCallbackPtr"/> can be <see cref="IntPtr.Zero"/> (null pointer is valid; parameter is optional).<br/>
+        /// <strong>Possible Status Codes:</strong><br/>
+        /// <see cref="STATUS_SUCCESS"/> - No error.<br/>
+        /// <see cref="STATUS_NULLPTR"/> - <paramref name="filePathPtr"/> is <see cref="IntPtr.Zero"/> (null pointer).<br/>
+        /// <see cref="STATUS_IMGALRINIT"/> - The are already loaded images. See: <see cref="DisposeLoadedImages"/> and <see cref="IsImagesLoaded"/><br/>
+        /// <see cref="STATUS_INVALIDARG"/> - <paramref name="mipmapLevel"/> is less than <see cref="MIPMAPLEVEL_FORSIZE"/>, or
+        /// <paramref name="minWidth"/> and/or <paramref name="minHeight"/> is less than 0.<br/>
+        /// <see cref="STATUS_MARSHALFAIL"/> - Failed to marshal <paramref name="filePathPtr"/> to a string.<br/>
+        /// <see cref="STATUS_FAILED"/> - Failed to read the TXTR, or the TXTR has no mipmap <paramref name="mipmapLevel"/>. See: <see cref="GetLastInteropError(IntPtr, bool)"/>
+        /// </summary>
+        /// <param name="filePathPtr">A pointer to a char buffer that contains the string of the file path to read TXTR the from</param>
+        /// <param name="mipmapLevel">The index of the mipmap to read (0 is the first mipmap), or <see cref="MIPMAPLEVEL_FORSIZE"/></param>
+        /// <param name="minWidth">The minimum width of the mipmap if <paramref name="mipmapLevel"/> is <see cref="MIPMAPLEVEL_FORSIZE"/></param>
+        /// <param name="minHeight">The minimum height of the mipmap if <paramref name="mipmapLevel"/> is <see cref="MIPMAPLEVEL_FORSIZE"/></param>
+        /// <param name="progressCallbackPtr">A function pointer to the progress callback, can be <see cref="IntPtr.Zero"/> (null pointer is valid; parameter is optional)</param>
+        /// <returns>The status code of whether the method succeeded or not. See: <see cref="GetLastInteropError(IntPtr, bool)"/></returns>
+        [Description("Read one mipmap of an TXTR file to an image.")]
+        [UnmanagedCallersOnly(EntryPoint = nameof(OpenMipmap), CallConvs = new[] { typeof(CallConvCdecl) })]
+        public static int OpenMipmap(IntPtr filePathPtr, int mipmapLevel, int minWidth, int minHeight, IntPtr progressCallbackPtr)
+        {
+            if (images.Count == 0 && filePathPtr != IntPtr.Zero && IsValidMipmapLevel(mipmapLevel, minWidth, minHeight))
+            {
+                string? filePath = Marshal.PtrToStringAnsi(filePathPtr);
+                if (filePath != null)
+                {
+                    Image<Bgra32> newImage;
+                    try
+                    {
+                        newImage = ReadMipmapFile(filePath, mipmapLevel, minWidth, minHeight, progressCallbackPtr);
+                    }
+                    catch (Exception e)
+                    {
+                        lastErrorMsg.Clear();
+                        lastErrorMsg.AppendLine("Exception occurred while reading the image. Stacktrace:");
+                        lastErrorMsg.Append(e);
+                        lastErrorMsg.AppendLine();
+                        lastErrorMsg.AppendLine("==== DEBUG INFO ====");
+                        lastErrorMsg.Append("Method name = ");
+                        lastErrorMsg.Append(nameof(OpenMipmap));
+                        lastErrorMsg.AppendLine();
+                        lastErrorMsg.Append("File path pointer = ");
+                        lastErrorMsg.Append(filePathPtr);
+                        lastErrorMsg.AppendLine();
+                        lastErrorMsg.Append("File path = ");
+                        lastErrorMsg.Append(filePath);
+                        lastErrorMsg.AppendLine();
+                        lastErrorMsg.Append("Mipmap level = ");
+                        lastErrorMsg.Append(mipmapLevel);
+                        lastErrorMsg.AppendLine();
+                        lastErrorMsg.Append("Min width = ");
+                        lastErrorMsg.Append(minWidth);
+                        lastErrorMsg.AppendLine();
+                        lastErrorMsg.Append("Min height = ");
+                        lastErrorMsg.Append(minHeight);
+                        lastErrorMsg.AppendLine();
+                        lastErrorMsg.Append("Progress callback pointer = ");
+                        lastErrorMsg.Append(progressCallbackPtr);
+                        return STATUS_FAILED;
+                    }
+                    images.Clear();
+                    images.Add(newImage);
+
+                    lastErrorMsg.Clear();
+                    lastErrorMsg.Append("No error");
+                    return STATUS_SUCCESS;
+                }
+                else
+                {
+                    lastErrorMsg.Clear();
+                    lastErrorMsg.Append("Failed to marshal input file path");
+                    return STATUS_MARSHALFAIL;
+                }
+            }
+            else
+            {
+                lastErrorMsg.Clear();
+                if (images.Count != 0)
+                {
+                    lastErrorMsg.Append("There are already image(s) loaded. Please use the \"");
+                    lastErrorMsg.Append(nameof(DisposeLoadedImages));
+                    lastErrorMsg.Append("\" method to dispose all loaded image(s).");
+                    return STATUS_IMGALRINIT;
+                }
+                else if (filePathPtr == IntPtr.Zero)
+                {
+                    lastErrorMsg.Append("The pointer to the file path is null");
+                    return STATUS_NULLPTR;
+                }
+                else
+                {
+                    AppendInvalidMipmapLevel(mipmapLevel, minWidth, minHeight);
+                    return STATUS_INVALIDARG;
+                }
+            }
+        }
+
         /// <summary>
         /// Write an image to a TXTR file.<br/>
         /// <strong>Note:</strong><br/>
@@ -245,9 +384,7 @@ namespace libtxtr
                     {
                         TXTRFileTypeLibAPI.Write(saveImage, filePath, (TextureFormat)textureFormat, (PaletteFormat)paletteFormat,
                             (CopyPaletteSize)copyPaletteSize, generateMipmaps, mipmapWidthLimit, mipmapHeightLimit,
-                            progressCallbackPtr != IntPtr.Zero
-                            ? Marshal.GetDelegateForFunctionPointer<TXTRFileTypeLibAPI.UpdateProgressDelegate>(progressCallbackPtr)
-                            : null);
+                            GetProgressCallback(progressCallbackPtr));
                     }
                     catch (Exception e)
                     {
@@ -540,6 +677,141 @@ namespace libtxtr
             }
         }
 
+        /// <summary>
+        /// Sets all of the pixels of the save image from a buffer in one call.<br/>
+        /// The save image is initialized with <paramref name="width"/> and <paramref name="height"/> if it is not
+        /// initialized yet, otherwise its dimensions must match <paramref name="width"/> and <paramref name="height"/>.<br/>
+        /// See: <see cref="InitializeSaveImage(int, int)"/>, <see cref="IsSaveImageInitialized"/>, and <see cref="DisposeSaveImage"/><br/>
+        /// <strong>Note:</strong><br/>
+        /// The buffer must hold 4 bytes per pixel in the order specified by <paramref name="channelOrder"/>, row by row from the top row.<br/>
+        /// <paramref name="stride"/> can be 0, in which case the rows are expected to have no padding (width * 4 bytes).<br/>
+        /// <strong>Possible Status Codes:</strong><br/>
+        /// <see cref="STATUS_SUCCESS"/> - No error.<br/>
+        /// <see cref="STATUS_NULLPTR"/> - <paramref name="bufferPtr"/> is <see cref="IntPtr.Zero"/> (null pointer).<br/>
+        /// <see cref="STATUS_INVALIDARG"/> - <paramref name="width"/> and/or <paramref name="height"/> is less than or equal to 0 and/or
+        /// does not match the save image, <paramref name="stride"/> is less than width * 4, <paramref name="bufferLength"/> is too small,
+        /// and/or <paramref name="channelOrder"/> is not a valid channel order code.<br/>
+        /// <see cref="STATUS_FAILED"/> - Failed initializing or setting the image. See: <see cref="GetLastInteropError(IntPtr, bool)"/>
+        /// </summary>
+        /// <param name="width">The width of the image in the buffer</param>
+        /// <param name="height">The height of the image in the buffer</param>
+        /// <param name="bufferPtr">A pointer to a byte buffer for which the pixels can be read from</param>
+        /// <param name="bufferLength">The length of the byte buffer in bytes</param>
+        /// <param name="stride">The length of a row in the byte buffer in bytes, can be 0</param>
+        /// <param name="channelOrder">The order of the color components of a pixel in the byte buffer. See: <see cref="CHANNELORDER_BGRA"/> and <see cref="CHANNELORDER_RGBA"/></param>
+        /// <returns>The status code of whether the method succeeded or not. See: <see cref="GetLastInteropError(IntPtr, bool)"/></returns>
+        [Description("Sets all of the pixels of the save image from a buffer in one call.")]
+        [UnmanagedCallersOnly(EntryPoint = nameof(SetImageBuffer), CallConvs = new[] { typeof(CallConvCdecl) })]
+        public static int SetImageBuffer(int width, int height, IntPtr bufferPtr, int bufferLength, int stride, int channelOrder)
+        {
+            if (stride == 0)
+                stride = width * 4;
+            if (bufferPtr != IntPtr.Zero && width > 0 && height > 0 && stride >= width * 4
+                && (long)stride * (height - 1) + width * 4 <= bufferLength
+                && (channelOrder == CHANNELORDER_BGRA || channelOrder == CHANNELORDER_RGBA)
+                && (saveImage == null || (saveImage.Width == width && saveImage.Height == height)))
+            {
+                try
+                {
+                    if (saveImage == null)
+                        saveImage = new Image<Bgra32>(width, height);
+                    CopyBufferToImage(saveImage, bufferPtr, bufferLength, stride, channelOrder);
+                }
+                catch (Exception e)
+                {
+                    lastErrorMsg.Clear();
+                    lastErrorMsg.AppendLine("Exception occurred while setting the save image. Stacktrace:");
+                    lastErrorMsg.Append(e);
+                    lastErrorMsg.AppendLine();
+                    lastErrorMsg.AppendLine("==== DEBUG INFO ====");
+                    lastErrorMsg.Append("Method name = ");
+                    lastErrorMsg.Append(nameof(SetImageBuffer));
+                    lastErrorMsg.AppendLine();
+                    lastErrorMsg.Append("Width = ");
+                    lastErrorMsg.Append(width);
+                    lastErrorMsg.AppendLine();
+                    lastErrorMsg.Append("Height = ");
+                    lastErrorMsg.Append(height);
+                    lastErrorMsg.AppendLine();
+                    lastErrorMsg.Append("Buffer pointer = ");
+                    lastErrorMsg.Append(bufferPtr);
+                    lastErrorMsg.AppendLine();
+                    lastErrorMsg.Append("Buffer length = ");
+                    lastErrorMsg.Append(bufferLength);
+                    lastErrorMsg.AppendLine();
+                    lastErrorMsg.Append("Stride = ");
+                    lastErrorMsg.Append(stride);
+                    lastErrorMsg.AppendLine();
+                    lastErrorMsg.Append("Channel order = ");
+                    lastErrorMsg.Append(channelOrder);
+                    lastErrorMsg.AppendLine();
+                    lastErrorMsg.Append("Save image = ");
+                    lastErrorMsg.Append(saveImage?.ToString() ?? "null");
+                    return STATUS_FAILED;
+                }
+
+                lastErrorMsg.Clear();
+                lastErrorMsg.Append("No error");
+                return STATUS_SUCCESS;
+            }
+            else
+            {
+                lastErrorMsg.Clear();
+                if (bufferPtr == IntPtr.Zero)
+                {
+                    lastErrorMsg.Append("The input pointer to the buffer is null");
+                    return STATUS_NULLPTR;
+                }
+                else if (width <= 0 || height <= 0)
+                {
+                    lastErrorMsg.Append("The input ");
+                    if (width <= 0)
+                        lastErrorMsg.Append("width");
+                    else
+                        lastErrorMsg.Append("height");
+                    lastErrorMsg.Append(" must be greater than 0");
+                    return STATUS_INVALIDARG;
+                }
+                else if (saveImage != null && (saveImage.Width != width || saveImage.Height != height))
+                {
+                    lastErrorMsg.Append("The input dimensions (");
+                    lastErrorMsg.Append(width);
+                    lastErrorMsg.Append('x');
+                    lastErrorMsg.Append(height);
+                    lastErrorMsg.Append(") do not match the save image dimensions (");
+                    lastErrorMsg.Append(saveImage.Width);
+                    lastErrorMsg.Append('x');
+                    lastErrorMsg.Append(saveImage.Height);
+                    lastErrorMsg.Append(')');
+                    return STATUS_INVALIDARG;
+                }
+                else if (stride < width * 4)
+                {
+                    lastErrorMsg.Append("The input stride (");
+                    lastErrorMsg.Append(stride);
+                    lastErrorMsg.Append(") is less than the length of a row (");
+                    lastErrorMsg.Append(width * 4);
+                    lastErrorMsg.Append(')');
+                    return STATUS_INVALIDARG;
+                }
+                else if (channelOrder != CHANNELORDER_BGRA && channelOrder != CHANNELORDER_RGBA)
+                {
+                    lastErrorMsg.Append("Invalid channel order value: ");
+                    lastErrorMsg.Append(channelOrder);
+                    return STATUS_INVALIDARG;
+                }
+                else
+                {
+                    lastErrorMsg.Append("The input buffer length (");
+                    lastErrorMsg.Append(bufferLength);
+                    lastErrorMsg.Append(") is less than the length required by the image (");
+                    lastErrorMsg.Append((long)stride * (height - 1) + width * 4);
+                    lastErrorMsg.Append(')');
+                    return STATUS_INVALIDARG;
+                }
+            }
+        }
+
         /// <summary>
         /// Gets whether there are any loaded images.<br/>
         /// See: <see cref="Open(IntPtr, bool, IntPtr)"/>
@@ -725,10 +997,148 @@ namespace libtxtr
             }
         }
 
+        /// <summary>
+        /// Copies all of the pixels of a loaded image to a buffer in one call.<br/>
+        /// <strong>Note:</strong><br/>
+        /// The pixels are written to the buffer as BGRA bytes (4 bytes per pixel), row by row from the top row,
+        /// with no padding between rows.<br/>
+        /// <paramref name="bufferLength"/> must be at least width * height * 4 bytes. See: <see cref="GetImageDimensions(int, IntPtr, IntPtr)"/><br/>
+        /// <strong>Possible Status Codes:</strong><br/>
+        /// <see cref="STATUS_SUCCESS"/> - No error.<br/>
+        /// <see cref="STATUS_NULLPTR"/> - <paramref name="bufferPtr"/> is <see cref="IntPtr.Zero"/> (null pointer).<br/>
+        /// <see cref="STATUS_NOLOADEDIMGS"/> - There are no images loaded. See: <see cref="Open(IntPtr, bool, IntPtr)"/> and <see cref="IsImagesLoaded"/><br/>
+        /// <see cref="STATUS_IDXOUTOFRANGE"/> - <paramref name="index"/> is out of range of the loaded images.<br/>
+        /// <see cref="STATUS_INVALIDARG"/> - <paramref name="bufferLength"/> is too small to hold the pixels of the loaded image.
+        /// </summary>
+        /// <param name="index">The loaded image index</param>
+        /// <param name="bufferPtr">A pointer to a byte buffer for which the pixels can be written to</param>
+        /// <param name="bufferLength">The length of the byte buffer in bytes</param>
+        /// <returns>The status code of whether the method succeeded or not. See: <see cref="GetLastInteropError(IntPtr, bool)"/></returns>
+        [Description("Copies all of the pixels of a loaded image to a buffer in one call.")]
+        [UnmanagedCallersOnly(EntryPoint = nameof(GetImageBuffer), CallConvs = new[] { typeof(CallConvCdecl) })]
+        public static int GetImageBuffer(int index, IntPtr bufferPtr, int bufferLength)
+        {
+            if (bufferPtr != IntPtr.Zero && images.Count != 0 && index >= 0 && index < images.Count
+                && bufferLength >= images[index].Width * images[index].Height * 4)
+            {
+                CopyImageToBuffer(images[index], bufferPtr, bufferLength);
+
+                lastErrorMsg.Clear();
+                lastErrorMsg.Append("No error");
+                return STATUS_SUCCESS;
+            }
+            else
+            {
+                lastErrorMsg.Clear();
+                if (bufferPtr == IntPtr.Zero)
+                {
+                    lastErrorMsg.Append("The input pointer to the output buffer is null");
+                    return STATUS_NULLPTR;
+                }
+                else if (images.Count == 0)
+                {
+                    lastErrorMsg.Append("There are no images loaded");
+                    return STATUS_NOLOADEDIMGS;
+                }
+                else if (index < 0 || index >= images.Count)
+                {
+                    lastErrorMsg.Append("The specified index ");
+                    lastErrorMsg.Append(index);
+                    lastErrorMsg.Append(" is out of range of the loaded images");
+                    return STATUS_IDXOUTOFRANGE;
+                }
+                else
+                {
+                    lastErrorMsg.Append("The input buffer length (");
+                    lastErrorMsg.Append(bufferLength);
+                    lastErrorMsg.Append(") is less than the length required by the image (");
+                    lastErrorMsg.Append(images[index].Width * images[index].Height * 4);
+                    lastErrorMsg.Append(')');
+                    return STATUS_INVALIDARG;
+                }
+            }
+        }
+
+        /// <summary>
+        /// Gets a pointer to the pixels of a loaded image without copying them.<br/>
+        /// <strong>Note:</strong><br/>
+        /// The pixels are stored as BGRA bytes (4 bytes per pixel), row by row from the top row.<br/>
+        /// The pixels are pinned in memory, so the pointer stays valid until <see cref="DisposeLoadedImages"/> is called.
+        /// The pixels must not be written to through the pointer.<br/>
+        /// The pointer is written to <paramref name="pointerPtr"/> as a pointer sized integer. The length of the pixels in bytes and
+        /// the length of a row in bytes are written to <paramref name="lengthPtr"/> and <paramref name="stridePtr"/> as signed 32bit integers.<br/>
+        /// <strong>Possible Status Codes:</strong><br/>
+        /// <see cref="STATUS_SUCCESS"/> - No error.<br/>
+        /// <see cref="STATUS_NULLPTR"/> - <paramref name="pointerPtr"/>, <paramref name="lengthPtr"/>, and/or <paramref name="stridePtr"/> is <see cref="IntPtr.Zero"/> (null pointer).<br/>
+        /// <see cref="STATUS_NOLOADEDIMGS"/> - There are no images loaded. See: <see cref="Open(IntPtr, bool, IntPtr)"/> and <see cref="IsImagesLoaded"/><br/>
+        /// <see cref="STATUS_IDXOUTOFRANGE"/> - <paramref name="index"/> is out of range of the loaded images.<br/>
+        /// <see cref="STATUS_FAILED"/> - The pixels of the loaded image are not stored in one contiguous block of memory. See: <see cref="GetImageBuffer(int, IntPtr, int)"/>
+        /// </summary>
+        /// <param name="index">The loaded image index</param>
+        /// <param name="pointerPtr">A pointer to a pointer for which the pointer to the pixels can be written to</param>
+        /// <param name="lengthPtr">A pointer to an int for which the length of the pixels in bytes can be written to</param>
+        /// <param name="stridePtr">A pointer to an int for which the length of a row in bytes can be written to</param>
+        /// <returns>The status code of whether the method succeeded or not. See: <see cref="GetLastInteropError(IntPtr, bool)"/></returns>
+        [Description("Gets a pointer to the pixels of a loaded image without copying them.")]
+        [UnmanagedCallersOnly(EntryPoint = nameof(GetImagePointer), CallConvs = new[] { typeof(CallConvCdecl) })]
+        public static unsafe int GetImagePointer(int index, IntPtr pointerPtr, IntPtr lengthPtr, IntPtr stridePtr)
+        {
+            if (pointerPtr != IntPtr.Zero && lengthPtr != IntPtr.Zero && stridePtr != IntPtr.Zero
+                && images.Count != 0 && index >= 0 && index < images.Count)
+            {
+                if (!TryPinImage(images[index], index, pinnedImages, out MemoryHandle pinnedImage))
+                {
+                    lastErrorMsg.Clear();
+                    lastErrorMsg.Append("The pixels of the image at the specified index ");
+                    lastErrorMsg.Append(index);
+                    lastErrorMsg.Append(" are not stored in one contiguous block of memory. Please use the \"");
+                    lastErrorMsg.Append(nameof(GetImageBuffer));
+                    lastErrorMsg.Append("\" method to copy the pixels instead.");
+                    return STATUS_FAILED;
+                }
+                Marshal.WriteIntPtr(pointerPtr, (IntPtr)pinnedImage.Pointer);
+                Marshal.WriteInt32(lengthPtr, images[index].Width * images[index].Height * 4);
+                Marshal.WriteInt32(stridePtr, images[index].Width * 4);
+
+                lastErrorMsg.Clear();
+                lastErrorMsg.Append("No error");
+                return STATUS_SUCCESS;
+            }
+            else
+            {
+                lastErrorMsg.Clear();
+                if (pointerPtr == IntPtr.Zero || lengthPtr == IntPtr.Zero || stridePtr == IntPtr.Zero)
+                {
+                    lastErrorMsg.Append("The input pointer to the output ");
+                    if (pointerPtr == IntPtr.Zero)
+                        lastErrorMsg.Append("pointer");
+                    else if (lengthPtr == IntPtr.Zero)
+                        lastErrorMsg.Append("length");
+                    else
+                        lastErrorMsg.Append("stride");
+                    lastErrorMsg.Append(" is null");
+                    return STATUS_NULLPTR;
+                }
+                else if (images.Count == 0)
+                {
+                    lastErrorMsg.Append("There are no images loaded");
+                    return STATUS_NOLOADEDIMGS;
+                }
+                else
+                {
+                    lastErrorMsg.Append("The specified index ");
+                    lastErrorMsg.Append(index);
+                    lastErrorMsg.Append(" is out of range of the loaded images");
+                    return STATUS_IDXOUTOFRANGE;
+                }
+            }
+        }
+
         /// <summary>
         /// Get the last error message.<br/>
         /// <strong>Note:</strong><br/>
         /// The last error message is not modified by this method.<br/>
+        /// The last error message is stored per thread, so this must be called on the thread that called the failed method.<br/>
         /// The last error message is written to the pointer as ASCII bytes.<br/>
         /// The last error message will not be null terminated unless <paramref name="nullTerminated"/>
         /// is <see langword="true"/>.<br/>
@@ -771,6 +1181,9 @@ namespace libtxtr
         {
             if (images.Count != 0)
             {
+                foreach (MemoryHandle pinnedImage in pinnedImages.Values)
+                    pinnedImage.Dispose();
+                pinnedImages.Clear();
                 for (int i = 0; i < images.Count; i++)
                     images[i].Dispose();
                 images.Clear();
@@ -883,5 +1296,89 @@ namespace libtxtr
                 return STATUS_NULLPTR;
             }
         }
+
+        /// <summary>
+        /// Gets the number of bytes the .NET runtime allocated on the managed heap so far, on all of its threads.<br/>
+        /// <strong>Note:</strong><br/>
+        /// The difference of two calls is what was allocated in between, e.g. by <see cref="SaveHandle(int, IntPtr, uint, uint, uint, bool, int, int, IntPtr)"/>.
+        /// All threads are counted because the tile rows of a texture are encoded in parallel.
+        /// </summary>
+        /// <returns>The number of allocated bytes</returns>
+        [Description("Gets the number of bytes the .NET runtime allocated on the managed heap so far.")]
+        [UnmanagedCallersOnly(EntryPoint = nameof(GetAllocatedBytes), CallConvs = new[] { typeof(CallConvCdecl) })]
+        public static long GetAllocatedBytes() => GC.GetTotalAllocatedBytes(true);
+
+        private static TXTRFileTypeLibAPI.UpdateProgressDelegate? GetProgressCallback(IntPtr progressCallbackPtr)
+            => progressCallbackPtr != IntPtr.Zero
+            ? Marshal.GetDelegateForFunctionPointer<TXTRFileTypeLibAPI.UpdateProgressDelegate>(progressCallbackPtr)
+            : null;
+
+        private static bool IsValidMipmapLevel(int mipmapLevel, int minWidth, int minHeight)
+            => mipmapLevel >= 0 || (mipmapLevel == MIPMAPLEVEL_FORSIZE && minWidth >= 0 && minHeight >= 0);
+
+        private static void AppendInvalidMipmapLevel(int mipmapLevel, int minWidth, int minHeight)
+        {
+            if (mipmapLevel < MIPMAPLEVEL_FORSIZE)
+            {
+                lastErrorMsg.Append("The mipmap level is less than ");
+                lastErrorMsg.Append(MIPMAPLEVEL_FORSIZE);
+                lastErrorMsg.Append(": ");
+                lastErrorMsg.Append(mipmapLevel);
+            }
+            else
+            {
+                lastErrorMsg.Append("The min width and/or min height is less than 0: ");
+                lastErrorMsg.Append(minWidth);
+                lastErrorMsg.Append('x');
+                lastErrorMsg.Append(minHeight);
+            }
+        }
+
+        private static Image<Bgra32> ReadMipmapFile(string filePath, int mipmapLevel, int minWidth, int minHeight,
+            IntPtr progressCallbackPtr)
+            => mipmapLevel != MIPMAPLEVEL_FORSIZE
+            ? TXTRFileTypeLibAPI.ReadMipmap(filePath, mipmapLevel, GetProgressCallback(progressCallbackPtr))
+            : TXTRFileTypeLibAPI.ReadMipmapForSize(filePath, minWidth, minHeight, GetProgressCallback(progressCallbackPtr));
+
+        private static unsafe void CopyImageToBuffer(Image<Bgra32> image, IntPtr bufferPtr, int bufferLength)
+        {
+            Span<byte> buffer = new Span<byte>((void*)bufferPtr, bufferLength);
+            if (image.TryGetSinglePixelSpan(out Span<Bgra32> pixelSpan))
+                MemoryMarshal.AsBytes(pixelSpan).CopyTo(buffer);
+            else
+            {
+                int rowLength = image.Width * 4;
+                for (int y = 0; y < image.Height; y++)
+                    MemoryMarshal.AsBytes(image.GetPixelRowSpan(y)).CopyTo(buffer.Slice(y * rowLength, rowLength));
+            }
+        }
+
+        private static unsafe void CopyBufferToImage(Image<Bgra32> image, IntPtr bufferPtr, int bufferLength, int stride, int channelOrder)
+        {
+            ReadOnlySpan<byte> buffer = new ReadOnlySpan<byte>((void*)bufferPtr, bufferLength);
+            int rowLength = image.Width * 4;
+            for (int y = 0; y < image.Height; y++)
+            {
+                ReadOnlySpan<byte> row = buffer.Slice(y * stride, rowLength);
+                if (channelOrder == CHANNELORDER_BGRA)
+                    row.CopyTo(MemoryMarshal.AsBytes(image.GetPixelRowSpan(y)));
+                else
+                    PixelOperations<Bgra32>.Instance.FromRgba32Bytes(Configuration.Default, row, image.GetPixelRowSpan(y), image.Width);
+            }
+        }
+
+        private static bool TryPinImage(Image<Bgra32> image, int index, Dictionary<int, MemoryHandle> pinnedImages,
+            out MemoryHandle pinnedImage)
+        {
+            if (!pinnedImages.TryGetValue(index, out pinnedImage))
+            {
+                IMemoryGroup<Bgra32> memoryGroup = image.GetPixelMemoryGroup();
+                if (memoryGroup.Count != 1)
+                    return false;
+                pinnedImage = memoryGroup[0].Pin();
+                pinnedImages.Add(index, pinnedImage);
+            }
+            return true;
+        }
     }
 }
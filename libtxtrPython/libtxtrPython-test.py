@@ -26,6 +26,7 @@ from pathlib import Path
 from platform import system as get_osname
 from timeit import default_timer as time
 from PIL import Image
+import numpy
 
 CWD: str
 CWD  = None
@@ -37,7 +38,7 @@ CWD = os.fspath(Path(CWD).resolve().parent)
 if (CWD not in sys.path):
     sys.path.append(CWD)
 
-from libtxtrPython import libtxtr, TextureFormat, PaletteFormat, CopyPaletteSize
+from libtxtrPython import libtxtr, TxtrImage, pytxtr, TxtrDecodeCache, TextureFormat, PaletteFormat, CopyPaletteSize, ChannelOrder
 
 start_time = 0.0
 end_time = 0.0
@@ -131,6 +132,115 @@ def test_libtxtr_GetPixel(*args):
     else:
         test_failure()
 
+def test_libtxtr_GetImageBuffer(*args):
+    global start_time
+    global end_time
+    start_time = time()
+    buffer = libtxtr.GetImageBuffer(args[0])
+    end_time = time()
+    width, height = libtxtr.GetImageDimensions(args[0])
+    offset = (args[2] * width + args[1]) * 4
+    print(f'len(buffer) = {len(buffer)}, buffer[{offset}:{offset + 4}] = {list(buffer[offset:offset + 4])}')
+    # The buffer is BGRA, GetPixel is RGBA
+    pixel = libtxtr.GetPixel(args[0], args[1], args[2])
+    if (len(buffer) == width * height * 4 and buffer[offset] == pixel[2] and buffer[offset + 1] == pixel[1]
+        and buffer[offset + 2] == pixel[0] and buffer[offset + 3] == pixel[3]):
+        test_success()
+    else:
+        test_failure()
+
+def test_libtxtr_GetImageView(*args):
+    global start_time
+    global end_time
+    start_time = time()
+    imageView = libtxtr.GetImageView(args[0])
+    end_time = time()
+    pixel = [imageView[args[2], args[1], c] for c in range(0, 4)]
+    print(f'imageView.shape = {imageView.shape}, imageView[{args[2]}, {args[1]}] = {pixel}')
+    buffer = libtxtr.GetImageBuffer(args[0])
+    if imageView.shape == (32, 32, 4) and imageView.tobytes() == bytes(buffer):
+        test_success()
+    else:
+        test_failure()
+
+def test_pytxtr_Read(*args):
+    global start_time
+    global end_time
+    start_time = time()
+    mipmaps = pytxtr.Read(args[0], args[1])
+    end_time = time()
+    print(f'len(mipmaps) = {len(mipmaps)}')
+    # Must be bit-identical to the images decoded by the libtxtr library
+    if len(mipmaps) == libtxtr.GetImageCount() and all(mipmaps[i].tobytes() == bytes(libtxtr.GetImageBuffer(i))
+                                                       for i in range(0, len(mipmaps))):
+        test_success()
+    else:
+        test_failure()
+
+def test_libtxtr_ReadHeader(*args):
+    global start_time
+    global end_time
+    start_time = time()
+    header = libtxtr.ReadHeader(args[0])
+    end_time = time()
+    print(f'header = {header}')
+    # Must match the header read by pytxtr
+    if header.mipmapCount == 4 and header.width == 32 and header.height == 32 and header == pytxtr.ReadHeader(args[0]):
+        test_success()
+    else:
+        test_failure()
+
+def test_TxtrImage_OpenBuffer(*args):
+    global start_time
+    global end_time
+    with open(args[0], 'rb') as inputFile:
+        data = inputFile.read()
+    start_time = time()
+    with TxtrImage.OpenBuffer(data, True) as txtrImage:
+        end_time = time()
+        imageCount = txtrImage.GetImageCount()
+        print(f'imageCount = {imageCount}')
+        # Must match the images read from the file
+        mipmaps = pytxtr.Read(args[0], True)
+        if imageCount == 4 and all(bytes(txtrImage.GetImageBuffer(i)) == mipmaps[i].tobytes() for i in range(0, imageCount)):
+            test_success()
+        else:
+            test_failure()
+
+def test_pytxtr_ReadBands(*args):
+    global start_time
+    global end_time
+    start_time = time()
+    bands = list(pytxtr.ReadBands(args[0], args[1]))
+    end_time = time()
+    print(f'len(bands) = {len(bands)}')
+    # The bands put together must match the mipmap read as a whole
+    mipmap = pytxtr.ReadMipmap(args[0], args[1])
+    image = mipmap.copy()
+    image[...] = 0
+    for y, band in bands:
+        image[y:y + band.shape[0]] = band
+    if len(bands) > 1 and image.tobytes() == mipmap.tobytes():
+        test_success()
+    else:
+        test_failure()
+
+def test_TxtrDecodeCache(*args):
+    global start_time
+    global end_time
+    decodeCache = TxtrDecodeCache()
+    mipmaps = decodeCache.Read(args[0], args[1])
+    start_time = time()
+    cachedMipmaps = decodeCache.Read(args[0], args[1])
+    end_time = time()
+    print(f'len(cachedMipmaps) = {len(cachedMipmaps)}')
+    # An unchanged file must not be decoded again
+    if cachedMipmaps is mipmaps and all(mipmaps[i].tobytes() == pytxtr.Read(args[0], args[1])[i].tobytes()
+                                        for i in range(0, len(mipmaps))):
+        test_success()
+    else:
+        test_failure()
+
 def test_libtxtr_InitializeSaveImage(*args):
     global start_time
     global end_time
@@ -152,6 +262,14 @@ def test_libtxtr_SetPixel(*args):
     end_time = time()
     test_success()
 
+def test_libtxtr_SetImageBuffer(*args):
+    global start_time
+    global end_time
+    start_time = time()
+    libtxtr.SetImageBuffer(args[0], args[1], args[2], args[3], args[4])
+    end_time = time()
+    test_success()
+
 def test_libtxtr_Save(*args):
     global start_time
     global end_time
@@ -163,6 +281,115 @@ def test_libtxtr_Save(*args):
 def test_libtxtr_Save_progress(progressValue, maxValue):
     print(f'progress = {progressValue}, max = {maxValue}')
 
+def test_pytxtr_Write(*args):
+    global start_time
+    global end_time
+    start_time = time()
+    data = pytxtr.Write(args[0], None, args[2], False, channelOrder=args[3])
+    end_time = time()
+    print(f'len(data) = {len(data)}')
+    # The first mipmap must be bit-identical to the one encoded by the libtxtr library
+    with open(args[1], 'rb') as txtrFile:
+        txtrData = txtrFile.read()
+    mipmapSize = pytxtr.GetTextureSize(args[2], args[0].width, args[0].height)
+    if data[:8] == txtrData[:8] and data[12:12 + mipmapSize] == txtrData[12:12 + mipmapSize]:
+        test_success()
+    else:
+        test_failure()
+
+def test_libtxtr_Save_streamed(*args):
+    global start_time
+    global end_time
+    # libtxtr streams each mipmap to the file a few tile rows at a time and reads the first one flipped in place, which
+    # must give the same TXTR as encoding the flipped mipmaps as a whole like pytxtr. Odd sizes have partial tiles and
+    # odd I4 rows, and the tall ones have more tile rows than are encoded at once.
+    random = numpy.random.default_rng(0x54585452)
+    start_time = time()
+    for width, height in args[1]:
+        pixels = random.integers(0, 256, (height, width, 4), numpy.uint8)
+        with TxtrImage.Create(width, height) as txtrImage:
+            txtrImage.SetImageBuffer(pixels.tobytes(), width * 4, ChannelOrder.BGRA)
+            for textureFormat in (TextureFormat.I4, TextureFormat.I8, TextureFormat.IA4, TextureFormat.IA8,
+                                  TextureFormat.RGB565, TextureFormat.RGB5A3, TextureFormat.RGBA32):
+                txtrImage.Save(args[0], textureFormat, PaletteFormat.IA8, CopyPaletteSize.ToWidth, True, 1, 1)
+                with open(args[0], 'rb') as txtrFile:
+                    txtrData = txtrFile.read()
+                data = pytxtr.Write(pixels, None, textureFormat, True, 1, 1)
+                # The first mipmap is bit-identical, the generated ones can rarely differ by one in a color channel
+                # (see: pytxtr.Write), which is at most one step of the texture format
+                mipmapSize = pytxtr.GetTextureSize(textureFormat, width, height)
+                mipmaps = pytxtr.Read(txtrData, True)
+                expectedMipmaps = pytxtr.Read(data, True)
+                if txtrData[:12 + mipmapSize] != data[:12 + mipmapSize] or len(mipmaps) != len(expectedMipmaps) or \
+                   any(numpy.abs(mipmap.astype(numpy.int16) - expectedMipmap).max() > 17
+                       for mipmap, expectedMipmap in zip(mipmaps, expectedMipmaps)):
+                    end_time = time()
+                    print(f'{textureFormat} {width}x{height} does not match pytxtr.Write')
+                    test_failure()
+                    return
+
+        # CMPR is not written by pytxtr, but 4x4 blocks of a single RGB565 color (as they are stored, flipped) are
+        # encoded without loss, so a misplaced row shows up in the decoded image
+        blockColors = random.integers(0, 65536, ((height + 3) // 4, (width + 3) // 4), numpy.uint16)
+        blockPixels = numpy.empty(blockColors.shape + (4,), numpy.uint8)
+        blockPixels[..., 0] = (blockColors & 0x1F) << 3 | (blockColors & 0x1F) >> 2
+        blockPixels[..., 1] = (blockColors >> 5 & 0x3F) << 2 | (blockColors >> 5 & 0x3F) >> 4
+        blockPixels[..., 2] = (blockColors >> 11) << 3 | (blockColors >> 11) >> 2
+        blockPixels[..., 3] = 255
+        pixels = numpy.ascontiguousarray(blockPixels.repeat(4, 0).repeat(4, 1)[:height, :width][::-1])
+        with TxtrImage.Create(width, height) as txtrImage:
+            txtrImage.SetImageBuffer(pixels.tobytes(), width * 4, ChannelOrder.BGRA)
+            txtrImage.Save(args[0], TextureFormat.CMPR, PaletteFormat.IA8, CopyPaletteSize.ToWidth, True, 1, 1)
+        if pytxtr.Read(args[0])[0].tobytes() != pixels.tobytes():
+            end_time = time()
+            print(f'{TextureFormat.CMPR} {width}x{height} does not match the image')
+            test_failure()
+            return
+    end_time = time()
+    test_success()
+
+def test_libtxtr_GetAllocatedBytes(*args):
+    global start_time
+    global end_time
+    # The texture buffers are pooled and the CMPR codecs are kept per thread, so once the pools are warm an encode only
+    # allocates small objects (streams, closures, tasks), far less than a texture the size of the image
+    pixels = numpy.random.default_rng(0x54585452).integers(0, 256, (args[1], args[1], 4), numpy.uint8)
+    start_time = time()
+    with TxtrImage.Create(args[1], args[1]) as txtrImage:
+        txtrImage.SetImageBuffer(pixels.tobytes(), args[1] * 4, ChannelOrder.BGRA)
+        for textureFormat in (TextureFormat.CMPR, TextureFormat.I8):
+            txtrImage.Save(args[0], textureFormat, PaletteFormat.IA8, CopyPaletteSize.ToWidth)
+            allocatedBytes = libtxtr.GetAllocatedBytes()
+            txtrImage.Save(args[0], textureFormat, PaletteFormat.IA8, CopyPaletteSize.ToWidth)
+            allocatedBytes = libtxtr.GetAllocatedBytes() - allocatedBytes
+            textureSize = pytxtr.GetTextureSize(textureFormat, args[1], args[1])
+            print(f'{textureFormat}: allocatedBytes = {allocatedBytes}, textureSize = {textureSize}')
+            if allocatedBytes >= textureSize:
+                end_time = time()
+                test_failure()
+                return
+    end_time = time()
+    test_success()
+
+def test_TxtrImage(*args):
+    global start_time
+    global end_time
+    start_time = time()
+    # Two sessions open at the same time must not affect each other
+    with TxtrImage.Open(args[0], True) as first, TxtrImage.Create(args[1].width, args[1].height) as second:
+        second.SetImageBuffer(args[1].tobytes(), args[1].width * 4, ChannelOrder.RGBA)
+        imageCount = first.GetImageCount()
+        buffer = first.GetImageBuffer(0)
+        end_time = time()
+        print(f'imageCount = {imageCount}, second.GetImageDimensions() = {second.GetImageDimensions()}')
+        if imageCount == 4 and second.GetImageDimensions() == (args[1].width, args[1].height) and \
+           first.GetImageView(0).tobytes() == bytes(buffer):
+            test_success()
+        else:
+            test_failure()
+    if not first.IsDisposed() or not second.IsDisposed():
+        test_failure()
+
 def main():
     issupported: bool
     issupported = libtxtr.is_supported()
@@ -209,6 +436,41 @@ def main():
         return
     print('')
     
+    if not test_start('libtxtr.GetImageBuffer', 'No exception, len(buffer) = 4096, buffer matches libtxtr.GetPixel',
+                      test_libtxtr_GetImageBuffer, 0, 16, 4):
+        return
+    print('')
+    
+    if not test_start('libtxtr.GetImageView', 'No exception, imageView.shape = (32, 32, 4), imageView matches libtxtr.GetImageBuffer',
+                      test_libtxtr_GetImageView, 0, 16, 4):
+        return
+    print('')
+    
+    if not test_start('pytxtr.Read', 'No exception, len(mipmaps) = 4, mipmaps match libtxtr.GetImageBuffer',
+                      test_pytxtr_Read, r'D:\From Desktop\TXTRSearch\MP1Paks\NoARAM-pak\46434ed3.TXTR', True):
+        return
+    print('')
+    
+    if not test_start('libtxtr.ReadHeader', 'No exception, mipmapCount = 4, width = 32, height = 32, header matches pytxtr.ReadHeader',
+                      test_libtxtr_ReadHeader, r'D:\From Desktop\TXTRSearch\MP1Paks\NoARAM-pak\46434ed3.TXTR'):
+        return
+    print('')
+    
+    if not test_start('TxtrImage.OpenBuffer', 'No exception, imageCount = 4, images match pytxtr.Read', test_TxtrImage_OpenBuffer,
+                      r'D:\From Desktop\TXTRSearch\MP1Paks\NoARAM-pak\46434ed3.TXTR'):
+        return
+    print('')
+    
+    if not test_start('pytxtr.ReadBands', 'No exception, len(bands) > 1, bands match pytxtr.ReadMipmap', test_pytxtr_ReadBands,
+                      r'D:\From Desktop\TXTRSearch\MP1Paks\NoARAM-pak\46434ed3.TXTR', 0):
+        return
+    print('')
+    
+    if not test_start('TxtrDecodeCache.Read', 'No exception, len(cachedMipmaps) = 4, cachedMipmaps match pytxtr.Read',
+                      test_TxtrDecodeCache, r'D:\From Desktop\TXTRSearch\MP1Paks\NoARAM-pak\46434ed3.TXTR', True):
+        return
+    print('')
+    
     if libtxtr.IsImagesLoaded():
         libtxtr.DisposeLoadedImages()
 
@@ -220,6 +482,11 @@ def main():
         return
     print('')
 
+    if not test_start('libtxtr.SetImageBuffer', 'No exception', test_libtxtr_SetImageBuffer,
+                      image.width, image.height, image.tobytes(), image.width * 4, ChannelOrder.RGBA):
+        return
+    print('')
+
     failed = False
     for x in range(0, image.width):
         for y in range(0, image.height):
@@ -243,5 +510,26 @@ def main():
     if libtxtr.IsSaveImageInitialized():
         libtxtr.DisposeSaveImage()
 
+    if not test_start('pytxtr.Write', 'No exception, first mipmap matches libtxtr.Save', test_pytxtr_Write,
+                      image, r'D:\From Desktop\TXTRSearch\SAVETESTS\test.TXTR', TextureFormat.RGBA32, ChannelOrder.RGBA):
+        return
+    print('')
+
+    if not test_start('libtxtr.Save (streamed)', 'No exception, every format at odd sizes matches pytxtr.Write',
+                      test_libtxtr_Save_streamed, r'D:\From Desktop\TXTRSearch\SAVETESTS\streamed.TXTR',
+                      [(1, 1), (13, 7), (5, 37), (67, 131), (131, 9)]):
+        return
+    print('')
+
+    if not test_start('libtxtr.GetAllocatedBytes', 'No exception, a CMPR and an I8 save allocate less than their texture size',
+                      test_libtxtr_GetAllocatedBytes, r'D:\From Desktop\TXTRSearch\SAVETESTS\allocations.TXTR', 1024):
+        return
+    print('')
+
+    if not test_start('TxtrImage', 'No exception, imageCount = 4, sessions are disposed after the with block', test_TxtrImage,
+                      r'D:\From Desktop\TXTRSearch\MP1Paks\NoARAM-pak\46434ed3.TXTR', image):
+        return
+    print('')
+
 if __name__ == '__main__':
     main()
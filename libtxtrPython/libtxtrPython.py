@@ -17,15 +17,30 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-__all__ = ['libtxtr', 'TextureFormat', 'PaletteFormat', 'CopyPaletteSize']
+__all__ = ['libtxtr', 'TxtrImage', 'pytxtr', 'TxtrDecodeCache', 'TxtrHeader', 'TxtrMipmapInfo', 'TextureFormat',
+           'PaletteFormat', 'CopyPaletteSize', 'ChannelOrder']
 
 import sys
 import os
 import ctypes
+import struct
+import hashlib
+import re
+import tempfile
+import threading
+import warnings
+import weakref
+from collections import OrderedDict
 from pathlib import Path
 from platform import system as get_osname, python_version_tuple as get_pyver, machine as get_machinearch
-from typing import Callable, Tuple
+from typing import Any, Callable, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum, EnumMeta
+try:
+    import numpy
+except ImportError:
+    # numpy is optional, it is only required by pytxtr and libtxtr.GetImageArray
+    numpy = None
 
 CWD: str
 CWD  = None
@@ -50,9 +65,15 @@ class libtxtr:
     through its implementation in this interface (fit the python language).
 
     The libtxtr library will be loaded as a ctypes.CDLL library, so it expects cdecl calling convention.
+    ctypes.CDLL releases the GIL for the duration of every call, so the methods for handles can be called
+    from multiple threads at the same time (one handle by one thread at a time). The loaded images and
+    the save image are shared by all threads. See: TxtrImage.OpenMany and TxtrImage.SaveMany
     """
 
     __libtxtr = None
+    __imageViews = []
+    __handleImageViews = {}
+    __pendingHandleDisposals = {}
     __UpdateProgressDelegate = ctypes.CFUNCTYPE(ctypes.c_void_p, ctypes.c_double, ctypes.c_double)
 
     __STATUS_SUCCESS = 0
@@ -64,11 +85,19 @@ class libtxtr:
     __STATUS_INVALIDARG = 6
     __STATUS_IMGALRINIT = 7
     __STATUS_IMGNOTINIT = 8
+    __STATUS_INVALIDHANDLE = 9
 
     __ENUMTYPE_TEXTUREFORMAT = 1
     __ENUMTYPE_PALETTEFORMAT = 2
     __ENUMTYPE_COPYPALETTESIZE = 3
 
+    __MIPMAPLEVEL_FORSIZE = -1
+
+    __HEADER_FIELDCOUNT = 10
+    __HEADER_MIPMAPFIELDCOUNT = 4
+    # The dimensions halve on every mipmap, so a TXTR never has more mipmaps than this
+    __HEADER_MAXMIPMAPCOUNT = 16
+
     @classmethod
     def load_lib(cls: 'libtxtr', file_path: str) -> None:
         """Load the libtxtr library from the specified file.
@@ -93,6 +122,11 @@ class libtxtr:
             cls.__libtxtr = ctypes.CDLL(file_path)
             cls.__libtxtr.Open.restype = ctypes.c_int
             cls.__libtxtr.Open.argtypes = [ctypes.c_char_p, ctypes.c_bool, cls.__UpdateProgressDelegate]
+            cls.__libtxtr.OpenMipmap.restype = ctypes.c_int
+            cls.__libtxtr.OpenMipmap.argtypes = [ctypes.c_char_p, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+                                                   cls.__UpdateProgressDelegate]
+            cls.__libtxtr.OpenBuffer.restype = ctypes.c_int
+            cls.__libtxtr.OpenBuffer.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_bool, cls.__UpdateProgressDelegate]
             cls.__libtxtr.Save.restype = ctypes.c_int
             cls.__libtxtr.Save.argtypes = [ctypes.c_char_p, ctypes.c_uint, ctypes.c_uint, ctypes.c_uint,
                                              ctypes.c_bool, ctypes.c_int, ctypes.c_int, cls.__UpdateProgressDelegate]
@@ -103,6 +137,9 @@ class libtxtr:
             cls.__libtxtr.SetPixel.restype = ctypes.c_int
             cls.__libtxtr.SetPixel.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_ubyte, ctypes.c_ubyte,
                                                  ctypes.c_ubyte, ctypes.c_ubyte]
+            cls.__libtxtr.SetImageBuffer.restype = ctypes.c_int
+            cls.__libtxtr.SetImageBuffer.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_void_p, ctypes.c_int,
+                                                       ctypes.c_int, ctypes.c_int]
             cls.__libtxtr.IsImagesLoaded.restype = ctypes.c_bool;
             cls.__libtxtr.IsImagesLoaded.argtypes = []
             cls.__libtxtr.InitializeSaveImage.restype = ctypes.c_int
@@ -114,6 +151,53 @@ class libtxtr:
             cls.__libtxtr.GetImageDimensions.restype = ctypes.c_int
             cls.__libtxtr.GetImageDimensions.argtypes = [ctypes.c_int, ctypes.POINTER(ctypes.c_int),
                                                            ctypes.POINTER(ctypes.c_int)]
+            cls.__libtxtr.GetImageBuffer.restype = ctypes.c_int
+            cls.__libtxtr.GetImageBuffer.argtypes = [ctypes.c_int, ctypes.POINTER(ctypes.c_ubyte), ctypes.c_int]
+            cls.__libtxtr.GetImagePointer.restype = ctypes.c_int
+            cls.__libtxtr.GetImagePointer.argtypes = [ctypes.c_int, ctypes.POINTER(ctypes.c_void_p),
+                                                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_int)]
+            cls.__libtxtr.ReadHeader.restype = ctypes.c_int
+            cls.__libtxtr.ReadHeader.argtypes = [ctypes.c_char_p, ctypes.POINTER(ctypes.c_int),
+                                                   ctypes.POINTER(ctypes.c_longlong), ctypes.c_int]
+            cls.__libtxtr.OpenHandle.restype = ctypes.c_int
+            cls.__libtxtr.OpenHandle.argtypes = [ctypes.c_char_p, ctypes.c_bool, cls.__UpdateProgressDelegate,
+                                                   ctypes.POINTER(ctypes.c_int)]
+            cls.__libtxtr.OpenMipmapHandle.restype = ctypes.c_int
+            cls.__libtxtr.OpenMipmapHandle.argtypes = [ctypes.c_char_p, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+                                                         cls.__UpdateProgressDelegate, ctypes.POINTER(ctypes.c_int)]
+            cls.__libtxtr.OpenBufferHandle.restype = ctypes.c_int
+            cls.__libtxtr.OpenBufferHandle.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_bool,
+                                                         cls.__UpdateProgressDelegate, ctypes.POINTER(ctypes.c_int)]
+            cls.__libtxtr.CreateHandle.restype = ctypes.c_int
+            cls.__libtxtr.CreateHandle.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.POINTER(ctypes.c_int)]
+            cls.__libtxtr.SaveHandle.restype = ctypes.c_int
+            cls.__libtxtr.SaveHandle.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint, ctypes.c_uint, ctypes.c_uint,
+                                                   ctypes.c_bool, ctypes.c_int, ctypes.c_int, cls.__UpdateProgressDelegate]
+            cls.__libtxtr.GetHandleImageCount.restype = ctypes.c_int
+            cls.__libtxtr.GetHandleImageCount.argtypes = [ctypes.c_int, ctypes.POINTER(ctypes.c_int)]
+            cls.__libtxtr.GetHandleImageDimensions.restype = ctypes.c_int
+            cls.__libtxtr.GetHandleImageDimensions.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.POINTER(ctypes.c_int),
+                                                                 ctypes.POINTER(ctypes.c_int)]
+            cls.__libtxtr.GetHandlePixel.restype = ctypes.c_int
+            cls.__libtxtr.GetHandlePixel.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+                                                       ctypes.POINTER(ctypes.c_ubyte), ctypes.POINTER(ctypes.c_ubyte),
+                                                       ctypes.POINTER(ctypes.c_ubyte), ctypes.POINTER(ctypes.c_ubyte)]
+            cls.__libtxtr.SetHandlePixel.restype = ctypes.c_int
+            cls.__libtxtr.SetHandlePixel.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_ubyte,
+                                                       ctypes.c_ubyte, ctypes.c_ubyte, ctypes.c_ubyte]
+            cls.__libtxtr.GetHandleImageBuffer.restype = ctypes.c_int
+            cls.__libtxtr.GetHandleImageBuffer.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.POINTER(ctypes.c_ubyte),
+                                                             ctypes.c_int]
+            cls.__libtxtr.SetHandleImageBuffer.restype = ctypes.c_int
+            cls.__libtxtr.SetHandleImageBuffer.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.c_int, ctypes.c_int,
+                                                             ctypes.c_int]
+            cls.__libtxtr.GetHandleImagePointer.restype = ctypes.c_int
+            cls.__libtxtr.GetHandleImagePointer.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.POINTER(ctypes.c_void_p),
+                                                              ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_int)]
+            cls.__libtxtr.IsHandleValid.restype = ctypes.c_bool
+            cls.__libtxtr.IsHandleValid.argtypes = [ctypes.c_int]
+            cls.__libtxtr.DisposeHandle.restype = ctypes.c_int
+            cls.__libtxtr.DisposeHandle.argtypes = [ctypes.c_int]
             cls.__libtxtr.GetLastInteropError.restype = ctypes.c_int
             cls.__libtxtr.GetLastInteropError.argtypes = [ctypes.c_char_p, ctypes.c_bool]
             cls.__libtxtr.DisposeLoadedImages.restype = ctypes.c_int
@@ -123,6 +207,8 @@ class libtxtr:
             cls.__libtxtr.GetEnumDescription.restype = ctypes.c_int
             cls.__libtxtr.GetEnumDescription.argtypes = [ctypes.c_int, ctypes.c_uint,
                                                            ctypes.c_char_p, ctypes.c_bool]
+            cls.__libtxtr.GetAllocatedBytes.restype = ctypes.c_int64
+            cls.__libtxtr.GetAllocatedBytes.argtypes = []
         else:
             raise Exception('The libtxtr library is already loaded')
 
@@ -188,7 +274,8 @@ class libtxtr:
         return (issupported, reasonStr)
 
     @classmethod
-    def Open(cls: 'libtxtr', filePath: str, readMipmaps: bool = False, progressCallback: Callable[[float, float], None] = None) -> None:
+    def Open(cls: 'libtxtr', filePath: str, readMipmaps: bool = False, progressCallback: Callable[[float, float], None] = None,
+             mipmapLevel: int = None, minWidth: int = None, minHeight: int = None) -> None:
         """Reads a TXTR from a file.
 
         The texture will be stored as image(s) in the memory of the libtxtr library.
@@ -196,13 +283,20 @@ class libtxtr:
         points of your code's control flow or else memory leaks will ensue.
         See: libtxtr.IsImagesLoaded and libtxtr.DisposeLoadedImages
 
+        If mipmapLevel, minWidth, or minHeight is specified, only that one mipmap is read and the mipmaps before it
+        are skipped without being read. See: TxtrHeader.FindMipmapLevel
+
         Args:
             filePath (str): A path to a TXTR file
             readMipmaps (bool): Whether all mipmaps should be read or only the first mipmap
             progressCallback (Callable[[float, float], None]): A function where mipmap read progress will be reported to
+            mipmapLevel (int): The index of the only mipmap to read (0 is the first mipmap)
+            minWidth (int): Read only the smallest mipmap that is at least this wide (and at least minHeight high)
+            minHeight (int): Read only the smallest mipmap that is at least this high (and at least minWidth wide)
 
         Raises:
-            ValueError: If filePath is None/not a str, readMipmaps is None/not a bool, or progressCallback is NOT None AND is not callable
+            ValueError: If filePath is None/not a str, readMipmaps is None/not a bool, progressCallback is NOT None AND is not callable,
+                        or mipmapLevel, minWidth, and minHeight are invalid
             Exception: If the libtxtr library is not loaded or an error occurs in the libtxtr library
         """
 
@@ -214,6 +308,8 @@ class libtxtr:
             raise ValueError('Parameter "readMipmaps" must be a bool')
         if progressCallback is not None and not callable(progressCallback):
             raise ValueError('Parameter "progressCallback" must be a function')
+        mipmapArgs: Tuple[int, int, int]
+        mipmapArgs = cls.__get_mipmap_level_args(readMipmaps, mipmapLevel, minWidth, minHeight)
         
         if cls.__libtxtr is not None:
             filePathC: ctypes.c_char_p
@@ -227,7 +323,53 @@ class libtxtr:
             if (progressCallback is not None):
                 progressCallbackC = cls.__UpdateProgressDelegate(progressCallback)
             status: int
-            status = cls.__libtxtr.Open(filePathC, readMipmapsC, progressCallbackC)
+            if mipmapArgs is not None:
+                status = cls.__libtxtr.OpenMipmap(filePathC, *mipmapArgs, progressCallbackC)
+            else:
+                status = cls.__libtxtr.Open(filePathC, readMipmapsC, progressCallbackC)
+            if status != cls.__STATUS_SUCCESS:
+                raise Exception(cls.__get_errstr_withstatus(status))
+        else:
+            raise Exception('The libtxtr library is not loaded')
+
+    @classmethod
+    def OpenBuffer(cls: 'libtxtr', buffer: Any, readMipmaps: bool = False,
+                   progressCallback: Callable[[float, float], None] = None) -> None:
+        """Reads a TXTR from a buffer, such as the bytes of a TXTR read from an archive or a mmap of a TXTR file.
+
+        The TXTR is decoded directly from the buffer without writing it to a file. Writable buffers (bytearray, mmap)
+        and bytes are never copied, other read-only buffers are only copied if numpy is not installed.
+        The texture will be stored as image(s) in the memory of the libtxtr library, the same as by libtxtr.Open.
+        See: libtxtr.IsImagesLoaded and libtxtr.DisposeLoadedImages
+
+        Args:
+            buffer (Any): The bytes of a TXTR (bytes, bytearray, memoryview, mmap.mmap, etc.)
+            readMipmaps (bool): Whether all mipmaps should be read or only the first mipmap
+            progressCallback (Callable[[float, float], None]): A function where mipmap read progress will be reported to
+
+        Raises:
+            ValueError: If buffer is None/does not support the buffer protocol, readMipmaps is None/not a bool,
+                        or progressCallback is NOT None AND is not callable
+            Exception: If the libtxtr library is not loaded or an error occurs in the libtxtr library
+        """
+
+        if buffer is None:
+            raise ValueError('Parameter "buffer" is required')
+        if not isinstance(readMipmaps, bool):
+            raise ValueError('Parameter "readMipmaps" must be a bool')
+        if progressCallback is not None and not callable(progressCallback):
+            raise ValueError('Parameter "progressCallback" must be a function')
+
+        if cls.__libtxtr is not None:
+            bufferC, bufferLength = cls.__get_readable_buffer(buffer)
+            progressCallbackC: cls.__UpdateProgressDelegate
+            progressCallbackC = ctypes.cast(None, cls.__UpdateProgressDelegate)
+            if (progressCallback is not None):
+                progressCallbackC = cls.__UpdateProgressDelegate(progressCallback)
+            status: int
+            status = cls.__libtxtr.OpenBuffer(bufferC, bufferLength, readMipmaps, progressCallbackC)
+            # Release the buffer so a mmap can be closed
+            del bufferC
             if status != cls.__STATUS_SUCCESS:
                 raise Exception(cls.__get_errstr_withstatus(status))
         else:
@@ -424,6 +566,65 @@ class libtxtr:
         else:
             raise Exception('The libtxtr library is not loaded')
 
+    @classmethod
+    def SetImageBuffer(cls: 'libtxtr', width: int, height: int, buffer: Any, stride: int = 0,
+                       channelOrder: 'ChannelOrder' = None) -> None:
+        """Sets all of the pixels of the save image stored in the memory of the libtxtr library from a buffer in one call
+
+        The save image is initialized with the specified width and height if it is not initialized yet,
+        otherwise its dimensions must match the specified width and height.
+        It is strongly advised that you call libtxtr.DisposeSaveImage at all possible
+        points of your code's control flow or else memory leaks will ensue.
+        See: libtxtr.InitializeSaveImage, libtxtr.IsSaveImageInitialized, and libtxtr.DisposeSaveImage
+
+        The buffer must hold 4 bytes per pixel in the specified channel order, row by row from the top row.
+        This is much faster than calling libtxtr.SetPixel for each pixel.
+
+        Args:
+            width (int): The width of the image in the buffer
+            height (int): The height of the image in the buffer
+            buffer (Any): A buffer (bytes, bytearray, memoryview, numpy.ndarray, etc.) that holds the pixels
+            stride (int): The length of a row in the buffer in bytes. If 0, the rows have no padding (width * 4)
+            channelOrder (libtxtr.ChannelOrder): The order of the color components of a pixel in the buffer.
+                                                 If None, ChannelOrder.BGRA is used. See: libtxtr.ChannelOrder
+
+        Raises:
+            ValueError: If width is None/not a int, height is None/not a int, buffer is None/not a buffer,
+                        stride is NOT None AND is not a int, or channelOrder is NOT None AND is not a ChannelOrder/not valid
+            Exception: If the libtxtr library is not loaded or an error occurs in the libtxtr library
+        """
+
+        if width is None:
+            raise ValueError('Parameter "width" is required')
+        elif not isinstance(width, int):
+            raise ValueError('Parameter "width" must be a int')
+        if height is None:
+            raise ValueError('Parameter "height" is required')
+        elif not isinstance(height, int):
+            raise ValueError('Parameter "height" must be a int')
+        if buffer is None:
+            raise ValueError('Parameter "buffer" is required')
+        if stride is not None and not isinstance(stride, int):
+            raise ValueError('Parameter "stride" must be a int')
+        if channelOrder is not None and not isinstance(channelOrder, ChannelOrder):
+            raise ValueError('Parameter "channelOrder" must be a ChannelOrder')
+        elif channelOrder is not None and not channelOrder in ChannelOrder:
+            raise ValueError('Parameter "channelOrder" is not a valid ChannelOrder enumeration')
+
+        if cls.__libtxtr is not None:
+            if stride is None:
+                stride = 0
+            if channelOrder is None:
+                channelOrder = ChannelOrder.BGRA
+            bufferC, bufferLength = cls.__get_readable_buffer(buffer)
+            status: int
+            status = cls.__libtxtr.SetImageBuffer(width, height, bufferC, bufferLength, stride, channelOrder.value)
+            del bufferC
+            if status != cls.__STATUS_SUCCESS:
+                raise Exception(cls.__get_errstr_withstatus(status))
+        else:
+            raise Exception('The libtxtr library is not loaded')
+
     @classmethod
     def IsImagesLoaded(cls: 'libtxtr') -> bool:
         """Gets whether if there are any loaded images in the memory of the libtxtr library
@@ -547,15 +748,138 @@ class libtxtr:
         else:
             raise Exception('The libtxtr library is not loaded')
 
+    @classmethod
+    def GetImageBuffer(cls: 'libtxtr', index: int, buffer: Any = None) -> Any:
+        """Copies all of the pixels of a loaded image in the memory of the libtxtr library to a buffer in one call.
+
+        The pixels are written as BGRA bytes (4 bytes per pixel), row by row from the top row, with no padding
+        between rows. This is much faster than calling libtxtr.GetPixel for each pixel.
+        See: libtxtr.GetImageDimensions
+
+        Args:
+            index (int): The index of the loaded image
+            buffer (Any): A writable buffer (bytearray, memoryview, array, etc.) of at least width * height * 4 bytes
+                          to copy the pixels to. If None, a new bytearray is created.
+
+        Returns:
+            Any: The buffer the pixels were copied to
+
+        Raises:
+            ValueError: If index is None/not a int or buffer is NOT None AND is not a writable buffer/too small
+            Exception: If the libtxtr library is not loaded or an error occurs in the libtxtr library
+        """
+
+        if index is None:
+            raise ValueError('Parameter "index" is required')
+        elif not isinstance(index, int):
+            raise ValueError('Parameter "index" must be a int')
+
+        if cls.__libtxtr is not None:
+            width, height = cls.GetImageDimensions(index)
+            if buffer is None:
+                buffer = bytearray(width * height * 4)
+            bufferC, bufferLength = cls.__get_writable_buffer(buffer, width * height * 4)
+            status: int
+            status = cls.__libtxtr.GetImageBuffer(index, bufferC, bufferLength)
+            del bufferC
+            if status == cls.__STATUS_SUCCESS:
+                return buffer
+            else:
+                raise Exception(cls.__get_errstr_withstatus(status))
+        else:
+            raise Exception('The libtxtr library is not loaded')
+
+    @classmethod
+    def GetImageView(cls: 'libtxtr', index: int) -> memoryview:
+        """Gets a read-only view of the pixels of a loaded image in the memory of the libtxtr library without copying them.
+
+        The view has the shape (height, width, 4) and holds the pixels as BGRA bytes.
+        The view is only valid until libtxtr.DisposeLoadedImages is called, which releases it. While an object
+        created from it without copying (e.g. a numpy array) is still alive, libtxtr.DisposeLoadedImages raises instead.
+        On python versions older than 3.8 the view is not read-only but must not be written to.
+        See: libtxtr.GetImageArray and libtxtr.GetImageBuffer
+
+        Args:
+            index (int): The index of the loaded image
+
+        Returns:
+            memoryview: A view of the pixels of the loaded image
+
+        Raises:
+            ValueError: If index is None/not a int
+            Exception: If the libtxtr library is not loaded or an error occurs in the libtxtr library
+        """
+
+        if index is None:
+            raise ValueError('Parameter "index" is required')
+        elif not isinstance(index, int):
+            raise ValueError('Parameter "index" must be a int')
+
+        if cls.__libtxtr is not None:
+            pointerC: ctypes.c_void_p
+            pointerC = ctypes.c_void_p(None)
+            lengthC: ctypes.c_int
+            lengthC = ctypes.c_int(0)
+            strideC: ctypes.c_int
+            strideC = ctypes.c_int(0)
+            status: int
+            status = cls.__libtxtr.GetImagePointer(index, ctypes.byref(pointerC), ctypes.byref(lengthC),
+                                                 ctypes.byref(strideC))
+            if status == cls.__STATUS_SUCCESS:
+                imageView: memoryview
+                imagePixels: weakref.ref
+                imageView, imagePixels = cls.__get_image_view(pointerC.value, lengthC.value, strideC.value)
+                cls.__imageViews.append((imageView, imagePixels))
+                return imageView
+            else:
+                raise Exception(cls.__get_errstr_withstatus(status))
+        else:
+            raise Exception('The libtxtr library is not loaded')
+
+    @classmethod
+    def GetImageArray(cls: 'libtxtr', index: int) -> Any:
+        """Gets a read-only numpy array of the pixels of a loaded image in the memory of the libtxtr library without copying them.
+
+        The array has the shape (height, width, 4) and the dtype uint8 and holds the pixels as BGRA bytes.
+        libtxtr.DisposeLoadedImages raises while the array is still alive, so delete it (or copy it with numpy.array(arr)
+        to keep the pixels) before disposing the loaded images.
+        numpy is required for this method.
+        See: libtxtr.GetImageView
+
+        Args:
+            index (int): The index of the loaded image
+
+        Returns:
+            numpy.ndarray: An array of the pixels of the loaded image
+
+        Raises:
+            ValueError: If index is None/not a int
+            ImportError: If numpy is not installed
+            Exception: If the libtxtr library is not loaded or an error occurs in the libtxtr library
+        """
+
+        if numpy is None:
+            raise ImportError('numpy is required to use libtxtr.GetImageArray')
+
+        imageView: memoryview
+        imageView = cls.GetImageView(index)
+        imageArray: numpy.ndarray
+        imageArray = numpy.frombuffer(imageView, dtype=numpy.uint8).reshape(imageView.shape)
+        imageArray.flags.writeable = False
+        return imageArray
+
     @classmethod
     def DisposeLoadedImages(cls: 'libtxtr') -> None:
         """Disposes the loaded images stored in the memory of the libtxtr library.
 
         Raises:
+            BufferError: If a view from libtxtr.GetImageView or an array from libtxtr.GetImageArray is still in use,
+                         the loaded images are not disposed then
             Exception: If the libtxtr library is not loaded or an error occurs in the libtxtr library
         """
 
         if cls.__libtxtr is not None:
+            cls.__release_image_views(cls.__imageViews)
             status: int
             status = cls.__libtxtr.DisposeLoadedImages()
             if status != cls.__STATUS_SUCCESS:
@@ -580,108 +904,2599 @@ class libtxtr:
             raise Exception('The libtxtr library is not loaded')
 
     @classmethod
-    def GetEnumDescription(cls: 'libtxtr', enum: Enum) -> str:
-        """Gets the description of an enum supported by the libtxtr library.
+    def ReadHeader(cls: 'libtxtr', filePath: str) -> 'TxtrHeader':
+        """Reads only the header of a TXTR file, without decoding any pixels.
+
+        The header is validated the same as by libtxtr.Open. The palette and the mipmaps are located by their
+        sizes, their offsets are counted in bytes from the start of the file. See: pytxtr.ReadHeader
 
         Args:
-            enum (Enum): An enum instance
+            filePath (str): A path to a TXTR file
 
         Returns:
-            str: The description of the passed enum
+            TxtrHeader: The header of the TXTR
 
         Raises:
-            ValueError: If enum is None/not a Enum/not supported by this library
+            ValueError: If filePath is None/not a str
             Exception: If the libtxtr library is not loaded or an error occurs in the libtxtr library
         """
 
-        if enum is None:
-            raise ValueError('Parameter "enum" is required')
-        elif not isinstance(enum, Enum):
-            raise ValueError('Parameter "enum" must be a Enum')
-        
+        if filePath is None:
+            raise ValueError('Parameter "filePath" is required')
+        elif not isinstance(filePath, str):
+            raise ValueError('Parameter "filePath" must be a str')
+
         if cls.__libtxtr is not None:
-            enumTypeC: int
-            enumTypeC = None
-            if isinstance(enum, TextureFormat):
-                enumTypeC = cls.__ENUMTYPE_TEXTUREFORMAT
-            elif isinstance(enum, PaletteFormat):
-                enumTypeC = cls.__ENUMTYPE_PALETTEFORMAT
-            elif isinstance(enum, CopyPaletteSize):
-                enumTypeC = cls.__ENUMTYPE_COPYPALETTESIZE
-            else:
-                raise ValueError('Parameter "enum" is of an enum type that is not supported by this method)')
-            enumDescriptionC: ctypes.Array[ctypes.c_char]
-            enumDescriptionC = ctypes.create_string_buffer(128)
+            filePathC: ctypes.c_char_p
+            filePathC = ctypes.c_char_p(filePath.encode('ascii'))
+            headerC: ctypes.Array
+            headerC = (ctypes.c_int * cls.__HEADER_FIELDCOUNT)()
+            mipmapsC: ctypes.Array
+            mipmapsC = (ctypes.c_longlong * (cls.__HEADER_MAXMIPMAPCOUNT * cls.__HEADER_MIPMAPFIELDCOUNT))()
             status: int
-            status = cls.__libtxtr.GetEnumDescription(enumTypeC, enum.value, enumDescriptionC, False)
+            status = cls.__libtxtr.ReadHeader(filePathC, headerC, mipmapsC, cls.__HEADER_MAXMIPMAPCOUNT)
             if status == cls.__STATUS_SUCCESS:
-                try:
-                    return enumDescriptionC.raw.decode('ascii').strip('\x00')
-                except:
-                    return enumDescriptionC.value.strip('\x00')
+                mipmaps: List[TxtrMipmapInfo]
+                mipmaps = []
+                for i in range(0, min(headerC[3], cls.__HEADER_MAXMIPMAPCOUNT)):
+                    mipmaps.append(TxtrMipmapInfo(*mipmapsC[i * cls.__HEADER_MIPMAPFIELDCOUNT:
+                                                            (i + 1) * cls.__HEADER_MIPMAPFIELDCOUNT]))
+                return TxtrHeader(TextureFormat(headerC[0] & 0xFFFFFFFF), headerC[1], headerC[2], headerC[3],
+                                  PaletteFormat(headerC[5] & 0xFFFFFFFF) if headerC[4] != 0 else None,
+                                  headerC[6], headerC[7], headerC[8], headerC[9], tuple(mipmaps))
             else:
-                raise Exception(cls.__get_errstr_fromstatus(status))
+                raise Exception(cls.__get_errstr_withstatus(status))
         else:
             raise Exception('The libtxtr library is not loaded')
 
     @classmethod
-    def __GetLastInteropError(cls: 'libtxtr') -> str:
+    def OpenHandle(cls: 'libtxtr', filePath: str, readMipmaps: bool = False,
+                   progressCallback: Callable[[float, float], None] = None, mipmapLevel: int = None,
+                   minWidth: int = None, minHeight: int = None) -> int:
+        """Reads a TXTR from a file to the images of a new handle.
+
+        Unlike libtxtr.Open, any number of handles can exist at the same time.
+        It is strongly advised that you call libtxtr.DisposeHandle at all possible
+        points of your code's control flow or else memory leaks will ensue.
+        See: TxtrImage, which does this for you
+
+        If mipmapLevel, minWidth, or minHeight is specified, only that one mipmap is read and the mipmaps before it
+        are skipped without being read. See: libtxtr.Open
+
+        Args:
+            filePath (str): A path to a TXTR file
+            readMipmaps (bool): Whether all mipmaps should be read or only the first mipmap
+            progressCallback (Callable[[float, float], None]): A function where mipmap read progress will be reported to
+            mipmapLevel (int): The index of the only mipmap to read (0 is the first mipmap)
+            minWidth (int): Read only the smallest mipmap that is at least this wide (and at least minHeight high)
+            minHeight (int): Read only the smallest mipmap that is at least this high (and at least minWidth wide)
+
+        Returns:
+            int: The handle
+
+        Raises:
+            ValueError: If filePath is None/not a str, readMipmaps is None/not a bool, progressCallback is NOT None AND is not callable,
+                        or mipmapLevel, minWidth, and minHeight are invalid
+            Exception: If the libtxtr library is not loaded or an error occurs in the libtxtr library
+        """
+
+        if filePath is None:
+            raise ValueError('Parameter "filePath" is required')
+        elif not isinstance(filePath, str):
+            raise ValueError('Parameter "filePath" must be a str')
+        if readMipmaps is not None and not isinstance(readMipmaps, bool):
+            raise ValueError('Parameter "readMipmaps" must be a bool')
+        if progressCallback is not None and not callable(progressCallback):
+            raise ValueError('Parameter "progressCallback" must be a function')
+        mipmapArgs: Tuple[int, int, int]
+        mipmapArgs = cls.__get_mipmap_level_args(readMipmaps, mipmapLevel, minWidth, minHeight)
+
         if cls.__libtxtr is not None:
-            errMsgC: ctypes.Array[ctypes.c_char]
-            errMsgC = ctypes.create_string_buffer(4096)
+            filePathC: ctypes.c_char_p
+            filePathC = ctypes.c_char_p(filePath.encode('ascii'))
+            readMipmapsC: bool
+            readMipmapsC = False
+            if (readMipmaps is not None):
+                readMipmapsC = readMipmaps
+            progressCallbackC: cls.__UpdateProgressDelegate
+            progressCallbackC = ctypes.cast(None, cls.__UpdateProgressDelegate)
+            if (progressCallback is not None):
+                progressCallbackC = cls.__UpdateProgressDelegate(progressCallback)
+            handleC: ctypes.c_int
+            handleC = ctypes.c_int(0)
             status: int
-            status = cls.__libtxtr.GetLastInteropError(errMsgC, False)
+            if mipmapArgs is not None:
+                status = cls.__libtxtr.OpenMipmapHandle(filePathC, *mipmapArgs, progressCallbackC, ctypes.byref(handleC))
+            else:
+                status = cls.__libtxtr.OpenHandle(filePathC, readMipmapsC, progressCallbackC, ctypes.byref(handleC))
             if status == cls.__STATUS_SUCCESS:
-                try:
-                    return errMsgC.raw.decode('ascii').strip('\x00')
-                except:
-                    return errMsgC.value
+                return handleC.value
             else:
-                raise Exception(cls.__get_errstr_fromstatus(status))
+                raise Exception(cls.__get_errstr_withstatus(status))
         else:
             raise Exception('The libtxtr library is not loaded')
 
     @classmethod
-    def __status_to_str(cls: 'libtxtr', status: int) -> str:
-        if status == cls.__STATUS_SUCCESS:
-            return 'STATUS_SUCCESS'
-        elif status == cls.__STATUS_FAILED:
-            return 'STATUS_FAILED'
-        elif status == cls.__STATUS_IDXOUTOFRANGE:
-            return 'STATUS_IDXOUTOFRANGE'
-        elif status == cls.__STATUS_NOLOADEDIMGS:
-            return 'STATUS_NOLOADEDIMGS'
-        elif status == cls.__STATUS_MARSHALFAIL:
-            return 'STATUS_MARSHALFAIL'
-        elif status == cls.__STATUS_NULLPTR:
-            return 'STATUS_NULLPTR'
-        elif status == cls.__STATUS_INVALIDARG:
-            return 'STATUS_INVALIDARG'
-        elif status == cls.__STATUS_IMGALRINIT:
-            return 'STATUS_IMGALRINIT'
-        elif status == cls.__STATUS_IMGNOTINIT:
-            return 'STATUS_IMGNOTINIT'
-        else:
-            raise ValueError(f'Invalid status code: {status}')
+    def OpenBufferHandle(cls: 'libtxtr', buffer: Any, readMipmaps: bool = False,
+                         progressCallback: Callable[[float, float], None] = None) -> int:
+        """Reads a TXTR from a buffer to the images of a new handle. See: libtxtr.OpenBuffer and libtxtr.OpenHandle
 
-    @classmethod
-    def __get_errstr_fromstatus(cls: 'libtxtr', status: int) -> str:
-        return f'An error occurred{os.linesep}Status return code: {status} ({cls.__status_to_str(status)})'
+        Args:
+            buffer (Any): The bytes of a TXTR (bytes, bytearray, memoryview, mmap.mmap, etc.)
+            readMipmaps (bool): Whether all mipmaps should be read or only the first mipmap
+            progressCallback (Callable[[float, float], None]): A function where mipmap read progress will be reported to
 
-    @classmethod
-    def __get_errstr_withstatus(cls: 'libtxtr', status: int) -> str:
-        return f'{cls.__get_errstr_fromstatus(status)}{os.linesep}Error: {cls.__GetLastInteropError()}'
+        Returns:
+            int: The handle
 
-class __TextureFormatMeta(EnumMeta):
-    # Allow checking if an enum value is defined
-    # in this enum via 'if val in MyEnum:'
-    def __contains__(cls, item): 
-        try:
-            cls(item)
-        except ValueError:
-            return False
-        else:
-            return True
+        Raises:
+            ValueError: If buffer is None/does not support the buffer protocol, readMipmaps is None/not a bool,
+                        or progressCallback is NOT None AND is not callable
+            Exception: If the libtxtr library is not loaded or an error occurs in the libtxtr library
+        """
+
+        if buffer is None:
+            raise ValueError('Parameter "buffer" is required')
+        if not isinstance(readMipmaps, bool):
+            raise ValueError('Parameter "readMipmaps" must be a bool')
+        if progressCallback is not None and not callable(progressCallback):
+            raise ValueError('Parameter "progressCallback" must be a function')
+
+        if cls.__libtxtr is not None:
+            bufferC, bufferLength = cls.__get_readable_buffer(buffer)
+            progressCallbackC: cls.__UpdateProgressDelegate
+            progressCallbackC = ctypes.cast(None, cls.__UpdateProgressDelegate)
+            if (progressCallback is not None):
+                progressCallbackC = cls.__UpdateProgressDelegate(progressCallback)
+            handleC: ctypes.c_int
+            handleC = ctypes.c_int(0)
+            status: int
+            status = cls.__libtxtr.OpenBufferHandle(bufferC, bufferLength, readMipmaps, progressCallbackC,
+                                                    ctypes.byref(handleC))
+            # Release the buffer so a mmap can be closed
+            del bufferC
+            if status == cls.__STATUS_SUCCESS:
+                return handleC.value
+            else:
+                raise Exception(cls.__get_errstr_withstatus(status))
+        else:
+            raise Exception('The libtxtr library is not loaded')
+
+    @classmethod
+    def CreateHandle(cls: 'libtxtr', width: int, height: int) -> int:
+        """Creates a new handle with one blank image of the specified width and height.
+
+        Unlike the save image, any number of handles can exist at the same time.
+        It is strongly advised that you call libtxtr.DisposeHandle at all possible
+        points of your code's control flow or else memory leaks will ensue.
+        See: TxtrImage, which does this for you
+
+        Args:
+            width (int): The image width
+            height (int): The image height
+
+        Returns:
+            int: The handle
+
+        Raises:
+            ValueError: If width is None/not a int or height is None/not a int
+            Exception: If the libtxtr library is not loaded or an error occurs in the libtxtr library
+        """
+
+        if width is None:
+            raise ValueError('Parameter "width" is required')
+        elif not isinstance(width, int):
+            raise ValueError('Parameter "width" must be a int')
+        if height is None:
+            raise ValueError('Parameter "height" is required')
+        elif not isinstance(height, int):
+            raise ValueError('Parameter "height" must be a int')
+
+        if cls.__libtxtr is not None:
+            handleC: ctypes.c_int
+            handleC = ctypes.c_int(0)
+            status: int
+            status = cls.__libtxtr.CreateHandle(width, height, ctypes.byref(handleC))
+            if status == cls.__STATUS_SUCCESS:
+                return handleC.value
+            else:
+                raise Exception(cls.__get_errstr_withstatus(status))
+        else:
+            raise Exception('The libtxtr library is not loaded')
+
+    @classmethod
+    def SaveHandle(cls: 'libtxtr', handle: int, filePath: str, textureFormat: 'TextureFormat', paletteFormat: 'PaletteFormat',
+                   copyPaletteSize: 'CopyPaletteSize', generateMipmaps: bool = False, mipmapWidthLimit: int = 4,
+                   mipmapHeightLimit: int = 4, progressCallback: Callable[[float, float], None] = None) -> None:
+        """Writes the first image of a handle to a TXTR file.
+
+        The image of the handle is not modified, so a handle can be written multiple times.
+
+        Args:
+            handle (int): The handle
+            filePath (str): A path to a TXTR file
+            textureFormat (libtxtr.TextureFormat): The texture format of the TXTR. See: libtxtr.TextureFormat
+            paletteFormat (libtxtr.PaletteFormat): The palette format of the TXTR. See: libtxtr.PaletteFormat
+            copyPaletteSize (libtxtr.CopyPaletteSize): The location to copy the palette length to in the TXTR. See: libtxtr.CopyPaletteSize
+            generateMipmaps (bool): Whether mipmaps should be generated in the TXTR
+            mipmapWidthLimit (int): The width limit for the TXTR mipmap generation
+            mipmapHeightLimit (int): The height limit for the TXTR mipmap generation
+            progressCallback (Callable[[float, float], None]): A function where mipmap write progress will be reported to
+
+        Raises:
+            ValueError: If handle is None/not a int, filePath is None/not a str,
+                        textureFormat is None/not a Enum/not valid,
+                        paletteFormat is None/not a Enum/not valid,
+                        copyPaletteSize is None/not a Enum/not valid,
+                        generateMipmaps is None/not a bool,
+                        mipmapWidthLimit is None/not a int,
+                        mipmapHeightLimit is None/not a int,
+                        or progressCallback is NOT None AND is not callable
+            Exception: If the libtxtr library is not loaded or an error occurs in the libtxtr library
+        """
+
+        if handle is None:
+            raise ValueError('Parameter "handle" is required')
+        elif not isinstance(handle, int):
+            raise ValueError('Parameter "handle" must be a int')
+        if filePath is None:
+            raise ValueError('Parameter "filePath" is required')
+        elif not isinstance(filePath, str):
+            raise ValueError('Parameter "filePath" must be a str')
+        if textureFormat is None:
+            raise ValueError('Parameter "textureFormat" is required')
+        elif not isinstance(textureFormat, TextureFormat):
+            raise ValueError('Parameter "textureFormat" must be a TextureFormat')
+        elif not textureFormat in TextureFormat:
+            raise ValueError('Parameter "textureFormat" is not a valid TextureFormat enumeration')
+        if paletteFormat is None:
+            raise ValueError('Parameter "paletteFormat" is required')
+        elif not isinstance(paletteFormat, PaletteFormat):
+            raise ValueError('Parameter "paletteFormat" must be a PaletteFormat')
+        elif not paletteFormat in PaletteFormat:
+            raise ValueError('Parameter "paletteFormat" is not a valid PaletteFormat enumeration')
+        if copyPaletteSize is None:
+            raise ValueError('Parameter "copyPaletteSize" is required')
+        elif not isinstance(copyPaletteSize, CopyPaletteSize):
+            raise ValueError('Parameter "copyPaletteSize" must be a CopyPaletteSize')
+        elif not copyPaletteSize in CopyPaletteSize:
+            raise ValueError('Parameter "copyPaletteSize" is not a valid CopyPaletteSize enumeration')
+        if generateMipmaps is not None and not isinstance(generateMipmaps, bool):
+            raise ValueError('Parameter "generateMipmaps" must be a bool')
+        if mipmapWidthLimit is not None and not isinstance(mipmapWidthLimit, int):
+            raise ValueError('Parameter "mipmapWidthLimit" must be a int')
+        if mipmapHeightLimit is not None and not isinstance(mipmapHeightLimit, int):
+            raise ValueError('Parameter "mipmapHeightLimit" must be a int')
+        if progressCallback is not None and not callable(progressCallback):
+            raise ValueError('Parameter "progressCallback" must be a function')
+
+        if cls.__libtxtr is not None:
+            filePathC: ctypes.c_char_p
+            filePathC = ctypes.c_char_p(filePath.encode('ascii'))
+            progressCallbackC: cls.__UpdateProgressDelegate
+            progressCallbackC = ctypes.cast(None, cls.__UpdateProgressDelegate)
+            if (generateMipmaps is None):
+                generateMipmaps = False
+            if (mipmapWidthLimit is None):
+                mipmapWidthLimit = 4
+            if (mipmapHeightLimit is None):
+                mipmapHeightLimit = 4
+            if (progressCallback is not None):
+                progressCallbackC = cls.__UpdateProgressDelegate(progressCallback)
+            status: int
+            status = cls.__libtxtr.SaveHandle(handle, filePathC, textureFormat.value, paletteFormat.value,
+                                            copyPaletteSize.value, generateMipmaps, mipmapWidthLimit,
+                                            mipmapHeightLimit, progressCallbackC)
+            if status != cls.__STATUS_SUCCESS:
+                raise Exception(cls.__get_errstr_withstatus(status))
+        else:
+            raise Exception('The libtxtr library is not loaded')
+
+    @classmethod
+    def GetHandleImageCount(cls: 'libtxtr', handle: int) -> int:
+        """Gets the count of images of a handle.
+
+        Args:
+            handle (int): The handle
+
+        Returns:
+            int: The count of images of the handle
+
+        Raises:
+            ValueError: If handle is None/not a int
+            Exception: If the libtxtr library is not loaded or an error occurs in the libtxtr library
+        """
+
+        if handle is None:
+            raise ValueError('Parameter "handle" is required')
+        elif not isinstance(handle, int):
+            raise ValueError('Parameter "handle" must be a int')
+
+        if cls.__libtxtr is not None:
+            imageCountC: ctypes.c_int
+            imageCountC = ctypes.c_int(0)
+            status: int
+            status = cls.__libtxtr.GetHandleImageCount(handle, ctypes.byref(imageCountC))
+            if status == cls.__STATUS_SUCCESS:
+                return imageCountC.value
+            else:
+                raise Exception(cls.__get_errstr_withstatus(status))
+        else:
+            raise Exception('The libtxtr library is not loaded')
+
+    @classmethod
+    def GetHandleImageDimensions(cls: 'libtxtr', handle: int, index: int) -> Tuple[int, int]:
+        """Gets the dimensions (width and height) of an image of a handle.
+
+        Args:
+            handle (int): The handle
+            index (int): The index of the image
+
+        Returns:
+            Tuple[int, int]: (image_width, image_height)
+
+        Raises:
+            ValueError: If handle is None/not a int or index is None/not a int
+            Exception: If the libtxtr library is not loaded or an error occurs in the libtxtr library
+        """
+
+        if handle is None:
+            raise ValueError('Parameter "handle" is required')
+        elif not isinstance(handle, int):
+            raise ValueError('Parameter "handle" must be a int')
+        if index is None:
+            raise ValueError('Parameter "index" is required')
+        elif not isinstance(index, int):
+            raise ValueError('Parameter "index" must be a int')
+
+        if cls.__libtxtr is not None:
+            widthC: ctypes.c_int
+            widthC = ctypes.c_int(0)
+            heightC: ctypes.c_int
+            heightC = ctypes.c_int(0)
+            status: int
+            status = cls.__libtxtr.GetHandleImageDimensions(handle, index, ctypes.byref(widthC), ctypes.byref(heightC))
+            if status == cls.__STATUS_SUCCESS:
+                return (widthC.value, heightC.value)
+            else:
+                raise Exception(cls.__get_errstr_withstatus(status))
+        else:
+            raise Exception('The libtxtr library is not loaded')
+
+    @classmethod
+    def GetHandlePixel(cls: 'libtxtr', handle: int, index: int, x: int, y: int) -> bytearray:
+        """Gets the RGBA color components of a pixel on an image of a handle
+
+        Args:
+            handle (int): The handle
+            index (int): The index of the image
+            x (int): The x coordinate of the target pixel
+            y (int): The y coordinate of the target pixel
+
+        Returns:
+            bytearray: The RGBA color components of the target pixel
+
+        Raises:
+            ValueError: If handle is None/not a int, index is None/not a int, x is None/not a int, or y is None/not a int
+            Exception: If the libtxtr library is not loaded or an error occurs in the libtxtr library
+        """
+
+        if handle is None:
+            raise ValueError('Parameter "handle" is required')
+        elif not isinstance(handle, int):
+            raise ValueError('Parameter "handle" must be a int')
+        if index is None:
+            raise ValueError('Parameter "index" is required')
+        elif not isinstance(index, int):
+            raise ValueError('Parameter "index" must be a int')
+        if x is None:
+            raise ValueError('Parameter "x" is required')
+        elif not isinstance(x, int):
+            raise ValueError('Parameter "x" must be a int')
+        if y is None:
+            raise ValueError('Parameter "y" is required')
+        elif not isinstance(y, int):
+            raise ValueError('Parameter "y" must be a int')
+
+        if cls.__libtxtr is not None:
+            rC: ctypes.c_ubyte
+            rC = ctypes.c_ubyte(0)
+            gC: ctypes.c_ubyte
+            gC = ctypes.c_ubyte(0)
+            bC: ctypes.c_ubyte
+            bC = ctypes.c_ubyte(0)
+            aC: ctypes.c_ubyte
+            aC = ctypes.c_ubyte(0)
+            status = cls.__libtxtr.GetHandlePixel(handle, index, x, y, ctypes.byref(rC), ctypes.byref(gC),
+                                                ctypes.byref(bC), ctypes.byref(aC))
+            if status == cls.__STATUS_SUCCESS:
+                return bytearray((rC.value, gC.value, bC.value, aC.value))
+            else:
+                raise Exception(cls.__get_errstr_withstatus(status))
+        else:
+            raise Exception('The libtxtr library is not loaded')
+
+    @classmethod
+    def SetHandlePixel(cls: 'libtxtr', handle: int, x: int, y: int, pixel: bytearray) -> None:
+        """Sets a pixel to the specified RGBA color components on the first image of a handle
+
+        The passed byte array must be a length of 4 in the format of [r, g, b, a]
+
+        Args:
+            handle (int): The handle
+            x (int): The x coordinate of the target pixel
+            y (int): The y coordinate of the target pixel
+            pixel (bytearray): The RGBA color components to set on target pixel
+
+        Raises:
+            ValueError: If handle is None/not a int, x is None/not a int, y is None/not a int, pixel is None/not a bytearray/not of the length 4
+            Exception: If the libtxtr library is not loaded or an error occurs in the libtxtr library
+        """
+
+        if handle is None:
+            raise ValueError('Parameter "handle" is required')
+        elif not isinstance(handle, int):
+            raise ValueError('Parameter "handle" must be a int')
+        if x is None:
+            raise ValueError('Parameter "x" is required')
+        elif not isinstance(x, int):
+            raise ValueError('Parameter "x" must be a int')
+        if y is None:
+            raise ValueError('Parameter "y" is required')
+        elif not isinstance(y, int):
+            raise ValueError('Parameter "y" must be a int')
+        if pixel is None:
+            raise ValueError('Parameter "pixel" is required')
+        elif not isinstance(pixel, bytearray):
+            raise ValueError('Parameter "pixel" must be a bytearray')
+        elif not len(pixel) == 4:
+            raise ValueError('Parameter "pixel" must have a length of 4')
+
+        if cls.__libtxtr is not None:
+            status: int
+            status = cls.__libtxtr.SetHandlePixel(handle, x, y, pixel[0], pixel[1], pixel[2], pixel[3])
+            if status != cls.__STATUS_SUCCESS:
+                raise Exception(cls.__get_errstr_withstatus(status))
+        else:
+            raise Exception('The libtxtr library is not loaded')
+
+    @classmethod
+    def GetHandleImageBuffer(cls: 'libtxtr', handle: int, index: int, buffer: Any = None) -> Any:
+        """Copies all of the pixels of an image of a handle to a buffer in one call.
+
+        The pixels are written as BGRA bytes (4 bytes per pixel), row by row from the top row, with no padding
+        between rows. See: libtxtr.GetHandleImageDimensions
+
+        Args:
+            handle (int): The handle
+            index (int): The index of the image
+            buffer (Any): A writable buffer (bytearray, memoryview, array, etc.) of at least width * height * 4 bytes
+                          to copy the pixels to. If None, a new bytearray is created.
+
+        Returns:
+            Any: The buffer the pixels were copied to
+
+        Raises:
+            ValueError: If handle is None/not a int, index is None/not a int, or buffer is NOT None AND is not a writable buffer/too small
+            Exception: If the libtxtr library is not loaded or an error occurs in the libtxtr library
+        """
+
+        if handle is None:
+            raise ValueError('Parameter "handle" is required')
+        elif not isinstance(handle, int):
+            raise ValueError('Parameter "handle" must be a int')
+        if index is None:
+            raise ValueError('Parameter "index" is required')
+        elif not isinstance(index, int):
+            raise ValueError('Parameter "index" must be a int')
+
+        if cls.__libtxtr is not None:
+            width, height = cls.GetHandleImageDimensions(handle, index)
+            if buffer is None:
+                buffer = bytearray(width * height * 4)
+            bufferC, bufferLength = cls.__get_writable_buffer(buffer, width * height * 4)
+            status: int
+            status = cls.__libtxtr.GetHandleImageBuffer(handle, index, bufferC, bufferLength)
+            del bufferC
+            if status == cls.__STATUS_SUCCESS:
+                return buffer
+            else:
+                raise Exception(cls.__get_errstr_withstatus(status))
+        else:
+            raise Exception('The libtxtr library is not loaded')
+
+    @classmethod
+    def SetHandleImageBuffer(cls: 'libtxtr', handle: int, buffer: Any, stride: int = 0,
+                             channelOrder: 'ChannelOrder' = None) -> None:
+        """Sets all of the pixels of the first image of a handle from a buffer in one call
+
+        The buffer must hold 4 bytes per pixel in the specified channel order, row by row from the top row,
+        with the width and height of the image. See: libtxtr.GetHandleImageDimensions
+
+        Args:
+            handle (int): The handle
+            buffer (Any): A buffer (bytes, bytearray, memoryview, numpy.ndarray, etc.) that holds the pixels
+            stride (int): The length of a row in the buffer in bytes. If 0, the rows have no padding (width * 4)
+            channelOrder (libtxtr.ChannelOrder): The order of the color components of a pixel in the buffer.
+                                                 If None, ChannelOrder.BGRA is used. See: libtxtr.ChannelOrder
+
+        Raises:
+            ValueError: If handle is None/not a int, buffer is None/not a buffer, stride is NOT None AND is not a int,
+                        or channelOrder is NOT None AND is not a ChannelOrder/not valid
+            Exception: If the libtxtr library is not loaded or an error occurs in the libtxtr library
+        """
+
+        if handle is None:
+            raise ValueError('Parameter "handle" is required')
+        elif not isinstance(handle, int):
+            raise ValueError('Parameter "handle" must be a int')
+        if buffer is None:
+            raise ValueError('Parameter "buffer" is required')
+        if stride is not None and not isinstance(stride, int):
+            raise ValueError('Parameter "stride" must be a int')
+        if channelOrder is not None and not isinstance(channelOrder, ChannelOrder):
+            raise ValueError('Parameter "channelOrder" must be a ChannelOrder')
+        elif channelOrder is not None and not channelOrder in ChannelOrder:
+            raise ValueError('Parameter "channelOrder" is not a valid ChannelOrder enumeration')
+
+        if cls.__libtxtr is not None:
+            if stride is None:
+                stride = 0
+            if channelOrder is None:
+                channelOrder = ChannelOrder.BGRA
+            bufferC, bufferLength = cls.__get_readable_buffer(buffer)
+            status: int
+            status = cls.__libtxtr.SetHandleImageBuffer(handle, bufferC, bufferLength, stride, channelOrder.value)
+            del bufferC
+            if status != cls.__STATUS_SUCCESS:
+                raise Exception(cls.__get_errstr_withstatus(status))
+        else:
+            raise Exception('The libtxtr library is not loaded')
+
+    @classmethod
+    def GetHandleImageView(cls: 'libtxtr', handle: int, index: int) -> memoryview:
+        """Gets a read-only view of the pixels of an image of a handle without copying them.
+
+        The view has the shape (height, width, 4) and holds the pixels as BGRA bytes.
+        The view is only valid until libtxtr.DisposeHandle is called for the handle, which releases it.
+        See: libtxtr.GetImageView
+
+        Args:
+            handle (int): The handle
+            index (int): The index of the image
+
+        Returns:
+            memoryview: A view of the pixels of the image
+
+        Raises:
+            ValueError: If handle is None/not a int or index is None/not a int
+            Exception: If the libtxtr library is not loaded or an error occurs in the libtxtr library
+        """
+
+        if handle is None:
+            raise ValueError('Parameter "handle" is required')
+        elif not isinstance(handle, int):
+            raise ValueError('Parameter "handle" must be a int')
+        if index is None:
+            raise ValueError('Parameter "index" is required')
+        elif not isinstance(index, int):
+            raise ValueError('Parameter "index" must be a int')
+
+        if cls.__libtxtr is not None:
+            pointerC: ctypes.c_void_p
+            pointerC = ctypes.c_void_p(None)
+            lengthC: ctypes.c_int
+            lengthC = ctypes.c_int(0)
+            strideC: ctypes.c_int
+            strideC = ctypes.c_int(0)
+            status: int
+            status = cls.__libtxtr.GetHandleImagePointer(handle, index, ctypes.byref(pointerC), ctypes.byref(lengthC),
+                                                       ctypes.byref(strideC))
+            if status == cls.__STATUS_SUCCESS:
+                imageView: memoryview
+                imagePixels: weakref.ref
+                imageView, imagePixels = cls.__get_image_view(pointerC.value, lengthC.value, strideC.value)
+                cls.__handleImageViews.setdefault(handle, []).append((imageView, imagePixels))
+                return imageView
+            else:
+                raise Exception(cls.__get_errstr_withstatus(status))
+        else:
+            raise Exception('The libtxtr library is not loaded')
+
+    @classmethod
+    def IsHandleValid(cls: 'libtxtr', handle: int) -> bool:
+        """Gets whether a handle exists (was opened or created and is not disposed yet)
+
+        Args:
+            handle (int): The handle
+
+        Returns:
+            bool: True if the handle exists else False
+
+        Raises:
+            ValueError: If handle is None/not a int
+            Exception: If the libtxtr library is not loaded
+        """
+
+        if handle is None:
+            raise ValueError('Parameter "handle" is required')
+        elif not isinstance(handle, int):
+            raise ValueError('Parameter "handle" must be a int')
+
+        if cls.__libtxtr is not None:
+            return cls.__libtxtr.IsHandleValid(handle)
+        else:
+            raise Exception('The libtxtr library is not loaded')
+
+    @classmethod
+    def DisposeHandle(cls: 'libtxtr', handle: int) -> None:
+        """Disposes the images of a handle and the handle itself.
+
+        Args:
+            handle (int): The handle
+
+        Raises:
+            ValueError: If handle is None/not a int
+            BufferError: If a view from libtxtr.GetHandleImageView or an array made from it is still in use,
+                         the handle is not disposed then (see: libtxtr.DisposeHandleWhenUnused)
+            Exception: If the libtxtr library is not loaded or an error occurs in the libtxtr library
+        """
+
+        if handle is None:
+            raise ValueError('Parameter "handle" is required')
+        elif not isinstance(handle, int):
+            raise ValueError('Parameter "handle" must be a int')
+
+        if cls.__libtxtr is not None:
+            cls.__release_image_views(cls.__handleImageViews.get(handle, []))
+            cls.__handleImageViews.pop(handle, None)
+            # Disposed now, so it is no longer disposed when its pixels are deleted (see: libtxtr.DisposeHandleWhenUnused)
+            cls.__pendingHandleDisposals.pop(handle, None)
+            status: int
+            status = cls.__libtxtr.DisposeHandle(handle)
+            if status != cls.__STATUS_SUCCESS:
+                raise Exception(cls.__get_errstr_withstatus(status))
+        else:
+            raise Exception('The libtxtr library is not loaded')
+
+    @classmethod
+    def DisposeHandleWhenUnused(cls: 'libtxtr', handle: int) -> bool:
+        """Disposes the images of a handle and the handle itself, now or as soon as they are no longer in use.
+
+        Unlike libtxtr.DisposeHandle, a handle whose images are still in use by a view from libtxtr.GetHandleImageView
+        or an array made from it is not kept, it is disposed once the last of them is deleted.
+
+        Args:
+            handle (int): The handle
+
+        Returns:
+            bool: True if the handle was disposed now, False if it is disposed once its images are no longer in use
+
+        Raises:
+            ValueError: If handle is None/not a int
+            Exception: If the libtxtr library is not loaded or an error occurs in the libtxtr library
+        """
+
+        if handle is None:
+            raise ValueError('Parameter "handle" is required')
+        elif not isinstance(handle, int):
+            raise ValueError('Parameter "handle" must be a int')
+
+        try:
+            cls.DisposeHandle(handle)
+            return True
+        except BufferError:
+            pass
+
+        def Retry(_: weakref.ref) -> None:
+            # Called when one of the pixels in use is deleted, nothing can be raised here
+            if handle in cls.__pendingHandleDisposals and cls.is_lib_loaded():
+                try:
+                    cls.DisposeHandleWhenUnused(handle)
+                except Exception as e:
+                    cls.__pendingHandleDisposals.pop(handle, None)
+                    warnings.warn(f'Failed to dispose handle {handle}: {e}', ResourceWarning)
+
+        # The weak references of the views have no callback, so the pixels still in use get ones that retry
+        pendingPixels: List[weakref.ref]
+        pendingPixels = []
+        for _, imagePixels in cls.__handleImageViews.get(handle, []):
+            pixels = imagePixels()
+            if pixels is not None:
+                pendingPixels.append(weakref.ref(pixels, Retry))
+            del pixels
+        cls.__pendingHandleDisposals[handle] = pendingPixels
+        return False
+
+    @classmethod
+    def GetEnumDescription(cls: 'libtxtr', enum: Enum) -> str:
+        """Gets the description of an enum supported by the libtxtr library.
+
+        Args:
+            enum (Enum): An enum instance
+
+        Returns:
+            str: The description of the passed enum
+
+        Raises:
+            ValueError: If enum is None/not a Enum/not supported by this library
+            Exception: If the libtxtr library is not loaded or an error occurs in the libtxtr library
+        """
+
+        if enum is None:
+            raise ValueError('Parameter "enum" is required')
+        elif not isinstance(enum, Enum):
+            raise ValueError('Parameter "enum" must be a Enum')
+        
+        if cls.__libtxtr is not None:
+            enumTypeC: int
+            enumTypeC = None
+            if isinstance(enum, TextureFormat):
+                enumTypeC = cls.__ENUMTYPE_TEXTUREFORMAT
+            elif isinstance(enum, PaletteFormat):
+                enumTypeC = cls.__ENUMTYPE_PALETTEFORMAT
+            elif isinstance(enum, CopyPaletteSize):
+                enumTypeC = cls.__ENUMTYPE_COPYPALETTESIZE
+            else:
+                raise ValueError('Parameter "enum" is of an enum type that is not supported by this method)')
+            enumDescriptionC: ctypes.Array[ctypes.c_char]
+            enumDescriptionC = ctypes.create_string_buffer(128)
+            status: int
+            status = cls.__libtxtr.GetEnumDescription(enumTypeC, enum.value, enumDescriptionC, False)
+            if status == cls.__STATUS_SUCCESS:
+                try:
+                    return enumDescriptionC.raw.decode('ascii').strip('\x00')
+                except:
+                    return enumDescriptionC.value.strip('\x00')
+            else:
+                raise Exception(cls.__get_errstr_fromstatus(status))
+        else:
+            raise Exception('The libtxtr library is not loaded')
+
+    @classmethod
+    def GetAllocatedBytes(cls: 'libtxtr') -> int:
+        """Gets the number of bytes the .NET runtime of the libtxtr library allocated so far, on all of its threads
+
+        The difference of two calls is what was allocated in between, e.g. by SaveHandle.
+
+        Returns:
+            int: The number of allocated bytes
+
+        Raises:
+            Exception: If the libtxtr library is not loaded
+        """
+
+        if cls.__libtxtr is not None:
+            return cls.__libtxtr.GetAllocatedBytes()
+        else:
+            raise Exception('The libtxtr library is not loaded')
+
+    @classmethod
+    def __GetLastInteropError(cls: 'libtxtr') -> str:
+        if cls.__libtxtr is not None:
+            errMsgC: ctypes.Array[ctypes.c_char]
+            errMsgC = ctypes.create_string_buffer(4096)
+            status: int
+            status = cls.__libtxtr.GetLastInteropError(errMsgC, False)
+            if status == cls.__STATUS_SUCCESS:
+                try:
+                    return errMsgC.raw.decode('ascii').strip('\x00')
+                except:
+                    return errMsgC.value
+            else:
+                raise Exception(cls.__get_errstr_fromstatus(status))
+        else:
+            raise Exception('The libtxtr library is not loaded')
+
+    @classmethod
+    def __status_to_str(cls: 'libtxtr', status: int) -> str:
+        if status == cls.__STATUS_SUCCESS:
+            return 'STATUS_SUCCESS'
+        elif status == cls.__STATUS_FAILED:
+            return 'STATUS_FAILED'
+        elif status == cls.__STATUS_IDXOUTOFRANGE:
+            return 'STATUS_IDXOUTOFRANGE'
+        elif status == cls.__STATUS_NOLOADEDIMGS:
+            return 'STATUS_NOLOADEDIMGS'
+        elif status == cls.__STATUS_MARSHALFAIL:
+            return 'STATUS_MARSHALFAIL'
+        elif status == cls.__STATUS_NULLPTR:
+            return 'STATUS_NULLPTR'
+        elif status == cls.__STATUS_INVALIDARG:
+            return 'STATUS_INVALIDARG'
+        elif status == cls.__STATUS_IMGALRINIT:
+            return 'STATUS_IMGALRINIT'
+        elif status == cls.__STATUS_IMGNOTINIT:
+            return 'STATUS_IMGNOTINIT'
+        elif status == cls.__STATUS_INVALIDHANDLE:
+            return 'STATUS_INVALIDHANDLE'
+        else:
+            raise ValueError(f'Invalid status code: {status}')
+
+    @classmethod
+    def __get_errstr_fromstatus(cls: 'libtxtr', status: int) -> str:
+        return f'An error occurred{os.linesep}Status return code: {status} ({cls.__status_to_str(status)})'
+
+    @classmethod
+    def __get_errstr_withstatus(cls: 'libtxtr', status: int) -> str:
+        return f'{cls.__get_errstr_fromstatus(status)}{os.linesep}Error: {cls.__GetLastInteropError()}'
+
+    @classmethod
+    def __get_mipmap_level_args(cls: 'libtxtr', readMipmaps: bool, mipmapLevel: int, minWidth: int,
+                                minHeight: int) -> Tuple[int, int, int]:
+        # Returns None to read the TXTR as usual, else the mipmap level, min width, and min height for OpenMipmap
+        if mipmapLevel is None and minWidth is None and minHeight is None:
+            return None
+        if readMipmaps:
+            raise ValueError('Parameter "readMipmaps" must be False when reading only one mipmap')
+        if mipmapLevel is not None:
+            if minWidth is not None or minHeight is not None:
+                raise ValueError('Parameter "mipmapLevel" cannot be used with "minWidth" or "minHeight"')
+            elif not isinstance(mipmapLevel, int):
+                raise ValueError('Parameter "mipmapLevel" must be a int')
+            elif mipmapLevel < 0:
+                raise ValueError('Parameter "mipmapLevel" must be 0 or greater')
+            return (mipmapLevel, 0, 0)
+        if minWidth is not None and (not isinstance(minWidth, int) or minWidth < 0):
+            raise ValueError('Parameter "minWidth" must be a int of 0 or greater')
+        if minHeight is not None and (not isinstance(minHeight, int) or minHeight < 0):
+            raise ValueError('Parameter "minHeight" must be a int of 0 or greater')
+        return (cls.__MIPMAPLEVEL_FORSIZE, minWidth or 0, minHeight or 0)
+
+    @staticmethod
+    def __get_readable_buffer(buffer: Any) -> Tuple[Any, int]:
+        if isinstance(buffer, bytes):
+            # bytes can be passed to the library as is
+            return (buffer, len(buffer))
+        try:
+            with memoryview(buffer) as bufferView:
+                bufferLength: int
+                bufferLength = bufferView.nbytes
+                if bufferView.readonly and bufferView.c_contiguous and numpy is not None:
+                    # Read-only buffers (e.g. a memoryview of bytes or a mmap opened with ACCESS_READ) are passed
+                    # without copying them, the pointer keeps a reference to the array
+                    return (numpy.frombuffer(buffer, dtype=numpy.uint8).ctypes.data_as(ctypes.c_void_p), bufferLength)
+                elif bufferView.readonly or not bufferView.c_contiguous:
+                    return (bufferView.tobytes(), bufferLength)
+                else:
+                    return ((ctypes.c_ubyte * bufferLength).from_buffer(buffer), bufferLength)
+        except TypeError:
+            raise ValueError('Parameter "buffer" must support the buffer protocol')
+
+    @staticmethod
+    def __get_writable_buffer(buffer: Any, length: int) -> Tuple[Any, int]:
+        bufferLength: int
+        try:
+            with memoryview(buffer) as bufferView:
+                if bufferView.readonly:
+                    raise ValueError('Parameter "buffer" must be a writable buffer')
+                bufferLength = bufferView.nbytes
+        except TypeError:
+            raise ValueError('Parameter "buffer" must support the buffer protocol')
+        if bufferLength < length:
+            raise ValueError(f'Parameter "buffer" must have a length of at least {length} bytes')
+        return ((ctypes.c_ubyte * bufferLength).from_buffer(buffer), bufferLength)
+
+    @staticmethod
+    def __get_image_view(pointer: int, length: int, stride: int) -> Tuple[memoryview, weakref.ref]:
+        # Every view and numpy array made from the view keeps the ctypes array alive, so a weak reference to it
+        # tells whether the pixels are still in use
+        imagePixels: ctypes.Array
+        imagePixels = (ctypes.c_ubyte * length).from_address(pointer)
+        imageView: memoryview
+        imageView = memoryview(imagePixels)
+        imageView = imageView.cast('B').cast('B', (length // stride, stride // 4, 4))
+        if hasattr(imageView, 'toreadonly'):
+            imageView = imageView.toreadonly()
+        return (imageView, weakref.ref(imagePixels))
+
+    @staticmethod
+    def __release_image_views(imageViews: List[Tuple[memoryview, weakref.ref]]) -> None:
+        # The images must not be disposed while their pixels are still in use (e.g. by a numpy array from
+        # GetImageArray, which does not keep the view itself exported), the array would point to freed memory.
+        # The views that are still in use are kept so it can be tried again.
+        usedViews: List[Tuple[memoryview, weakref.ref]]
+        usedViews = []
+        for imageView, imagePixels in imageViews:
+            try:
+                imageView.release()
+            except BufferError:
+                # Still exported, which the check below catches
+                pass
+            if imagePixels() is not None:
+                usedViews.append((imageView, imagePixels))
+        imageViews[:] = usedViews
+        if usedViews:
+            raise BufferError(f'The pixels of {len(usedViews)} image(s) are still in use (e.g. by numpy arrays), '
+                              'delete them or copy the pixels before disposing the images')
+
+class TxtrImage:
+    """An image session of the libtxtr library
+
+    Wraps a handle of the libtxtr library so multiple TXTRs can be opened and written at the same time,
+    unlike the loaded images and the save image of libtxtr which exist only once.
+    The first image is the image written by TxtrImage.Save and set by TxtrImage.SetPixel/SetImageBuffer,
+    the other images are the mipmaps read by TxtrImage.Open.
+
+    The handle is disposed when leaving a with block, when TxtrImage.Dispose is called, or when the TxtrImage
+    is collected by python. Prefer the with block as python does not guarantee when an object is collected.
+    """
+
+    def __init__(self: 'TxtrImage', handle: int) -> None:
+        """Wraps an existing handle. See: TxtrImage.Open and TxtrImage.Create
+
+        Args:
+            handle (int): A handle from libtxtr.OpenHandle or libtxtr.CreateHandle
+
+        Raises:
+            ValueError: If handle is None/not a int
+        """
+
+        if handle is None:
+            raise ValueError('Parameter "handle" is required')
+        elif not isinstance(handle, int):
+            raise ValueError('Parameter "handle" must be a int')
+
+        self.__handle = handle
+
+    @classmethod
+    def Open(cls: 'TxtrImage', filePath: str, readMipmaps: bool = False,
+             progressCallback: Callable[[float, float], None] = None, mipmapLevel: int = None,
+             minWidth: int = None, minHeight: int = None) -> 'TxtrImage':
+        """Reads a TXTR from a file to a new image session. See: libtxtr.OpenHandle
+
+        Args:
+            filePath (str): A path to a TXTR file
+            readMipmaps (bool): Whether all mipmaps should be read or only the first mipmap
+            progressCallback (Callable[[float, float], None]): A function where mipmap read progress will be reported to
+            mipmapLevel (int): The index of the only mipmap to read (0 is the first mipmap)
+            minWidth (int): Read only the smallest mipmap that is at least this wide (and at least minHeight high)
+            minHeight (int): Read only the smallest mipmap that is at least this high (and at least minWidth wide)
+
+        Returns:
+            TxtrImage: The image session
+        """
+
+        return cls(libtxtr.OpenHandle(filePath, readMipmaps, progressCallback, mipmapLevel, minWidth, minHeight))
+
+    @classmethod
+    def OpenBuffer(cls: 'TxtrImage', buffer: Any, readMipmaps: bool = False,
+                   progressCallback: Callable[[float, float], None] = None) -> 'TxtrImage':
+        """Reads a TXTR from a buffer to a new image session. See: libtxtr.OpenBufferHandle
+
+        Args:
+            buffer (Any): The bytes of a TXTR (bytes, bytearray, memoryview, mmap.mmap, etc.)
+            readMipmaps (bool): Whether all mipmaps should be read or only the first mipmap
+            progressCallback (Callable[[float, float], None]): A function where mipmap read progress will be reported to
+
+        Returns:
+            TxtrImage: The image session
+        """
+
+        return cls(libtxtr.OpenBufferHandle(buffer, readMipmaps, progressCallback))
+
+    @classmethod
+    def Create(cls: 'TxtrImage', width: int, height: int) -> 'TxtrImage':
+        """Creates a new image session with one blank image. See: libtxtr.CreateHandle
+
+        Args:
+            width (int): The image width
+            height (int): The image height
+
+        Returns:
+            TxtrImage: The image session
+        """
+
+        return cls(libtxtr.CreateHandle(width, height))
+
+    @classmethod
+    def OpenMany(cls: 'TxtrImage', filePaths: Iterable[str], readMipmaps: bool = False,
+                 maxWorkers: int = None) -> List['TxtrImage']:
+        """Reads TXTRs from files to new image sessions in parallel.
+
+        If any TXTR fails to be read, the image sessions that were read are disposed and the exception is raised.
+
+        Args:
+            filePaths (Iterable[str]): Paths to TXTR files
+            readMipmaps (bool): Whether all mipmaps should be read or only the first mipmap
+            maxWorkers (int): The maximum count of threads. If None, the default of ThreadPoolExecutor is used
+
+        Returns:
+            List[TxtrImage]: The image sessions in the order of filePaths
+
+        Raises:
+            ValueError: If filePaths is None or maxWorkers is NOT None AND is not a int
+            Exception: If the libtxtr library is not loaded or an error occurs in the libtxtr library
+        """
+
+        if filePaths is None:
+            raise ValueError('Parameter "filePaths" is required')
+        if maxWorkers is not None and not isinstance(maxWorkers, int):
+            raise ValueError('Parameter "maxWorkers" must be a int')
+
+        txtrImages: List[TxtrImage]
+        txtrImages = []
+        with ThreadPoolExecutor(maxWorkers) as executor:
+            futures = [executor.submit(cls.Open, filePath, readMipmaps) for filePath in filePaths]
+            error: Exception
+            error = None
+            for future in futures:
+                try:
+                    txtrImages.append(future.result())
+                except Exception as e:
+                    if error is None:
+                        error = e
+        if error is not None:
+            for txtrImage in txtrImages:
+                txtrImage.Dispose()
+            raise error
+        return txtrImages
+
+    @staticmethod
+    def SaveMany(txtrImages: Iterable['TxtrImage'], filePaths: Iterable[str], textureFormat: 'TextureFormat',
+                 paletteFormat: 'PaletteFormat', copyPaletteSize: 'CopyPaletteSize', generateMipmaps: bool = False,
+                 mipmapWidthLimit: int = 4, mipmapHeightLimit: int = 4, maxWorkers: int = None) -> None:
+        """Writes the first image of image sessions to TXTR files in parallel.
+
+        Every TXTR is written even if others fail, then the first exception is raised.
+
+        Args:
+            txtrImages (Iterable[TxtrImage]): The image sessions
+            filePaths (Iterable[str]): Paths to TXTR files, one for each image session
+            textureFormat (libtxtr.TextureFormat): The texture format of the TXTRs. See: libtxtr.TextureFormat
+            paletteFormat (libtxtr.PaletteFormat): The palette format of the TXTRs. See: libtxtr.PaletteFormat
+            copyPaletteSize (libtxtr.CopyPaletteSize): The location to copy the palette length to in the TXTRs. See: libtxtr.CopyPaletteSize
+            generateMipmaps (bool): Whether mipmaps should be generated in the TXTRs
+            mipmapWidthLimit (int): The width limit for the TXTR mipmap generation
+            mipmapHeightLimit (int): The height limit for the TXTR mipmap generation
+            maxWorkers (int): The maximum count of threads. If None, the default of ThreadPoolExecutor is used
+
+        Raises:
+            ValueError: If txtrImages is None, filePaths is None/not of the same length as txtrImages,
+                        or maxWorkers is NOT None AND is not a int
+            Exception: If the libtxtr library is not loaded or an error occurs in the libtxtr library
+        """
+
+        if txtrImages is None:
+            raise ValueError('Parameter "txtrImages" is required')
+        if filePaths is None:
+            raise ValueError('Parameter "filePaths" is required')
+        if maxWorkers is not None and not isinstance(maxWorkers, int):
+            raise ValueError('Parameter "maxWorkers" must be a int')
+        txtrImages = list(txtrImages)
+        filePaths = list(filePaths)
+        if len(txtrImages) != len(filePaths):
+            raise ValueError('Parameter "filePaths" must have the same length as parameter "txtrImages"')
+
+        with ThreadPoolExecutor(maxWorkers) as executor:
+            futures = [executor.submit(txtrImage.Save, filePath, textureFormat, paletteFormat, copyPaletteSize,
+                                       generateMipmaps, mipmapWidthLimit, mipmapHeightLimit)
+                       for txtrImage, filePath in zip(txtrImages, filePaths)]
+            for future in futures:
+                # Raises the first exception after all of the TXTRs were written
+                future.result()
+
+    @property
+    def handle(self: 'TxtrImage') -> int:
+        """int: The handle of the image session, or None if it is disposed"""
+
+        return self.__handle
+
+    def IsDisposed(self: 'TxtrImage') -> bool:
+        """Gets whether the image session is disposed
+
+        Returns:
+            bool: True if the image session is disposed else False
+        """
+
+        return self.__handle is None
+
+    def GetImageCount(self: 'TxtrImage') -> int:
+        """Gets the count of images. See: libtxtr.GetHandleImageCount"""
+
+        return libtxtr.GetHandleImageCount(self.__get_handle())
+
+    def GetImageDimensions(self: 'TxtrImage', index: int = 0) -> Tuple[int, int]:
+        """Gets the dimensions (width and height) of an image. See: libtxtr.GetHandleImageDimensions"""
+
+        return libtxtr.GetHandleImageDimensions(self.__get_handle(), index)
+
+    def GetPixel(self: 'TxtrImage', x: int, y: int, index: int = 0) -> bytearray:
+        """Gets the RGBA color components of a pixel on an image. See: libtxtr.GetHandlePixel"""
+
+        return libtxtr.GetHandlePixel(self.__get_handle(), index, x, y)
+
+    def SetPixel(self: 'TxtrImage', x: int, y: int, pixel: bytearray) -> None:
+        """Sets a pixel to the specified RGBA color components on the first image. See: libtxtr.SetHandlePixel"""
+
+        libtxtr.SetHandlePixel(self.__get_handle(), x, y, pixel)
+
+    def GetImageBuffer(self: 'TxtrImage', index: int = 0, buffer: Any = None) -> Any:
+        """Copies all of the pixels of an image to a buffer. See: libtxtr.GetHandleImageBuffer"""
+
+        return libtxtr.GetHandleImageBuffer(self.__get_handle(), index, buffer)
+
+    def SetImageBuffer(self: 'TxtrImage', buffer: Any, stride: int = 0, channelOrder: 'ChannelOrder' = None) -> None:
+        """Sets all of the pixels of the first image from a buffer. See: libtxtr.SetHandleImageBuffer"""
+
+        libtxtr.SetHandleImageBuffer(self.__get_handle(), buffer, stride, channelOrder)
+
+    def GetImageView(self: 'TxtrImage', index: int = 0) -> memoryview:
+        """Gets a read-only view of the pixels of an image, valid until the image session is disposed.
+        See: libtxtr.GetHandleImageView
+        """
+
+        return libtxtr.GetHandleImageView(self.__get_handle(), index)
+
+    def GetImageArray(self: 'TxtrImage', index: int = 0) -> Any:
+        """Gets a read-only numpy array of the pixels of an image, valid until the image session is disposed.
+        The image session cannot be disposed while the array is alive. See: libtxtr.GetImageArray
+
+        Raises:
+            ImportError: If numpy is not installed
+        """
+
+        if numpy is None:
+            raise ImportError('numpy is required to use TxtrImage.GetImageArray')
+
+        imageView: memoryview
+        imageView = self.GetImageView(index)
+        imageArray: numpy.ndarray
+        imageArray = numpy.frombuffer(imageView, dtype=numpy.uint8).reshape(imageView.shape)
+        imageArray.flags.writeable = False
+        return imageArray
+
+    def Save(self: 'TxtrImage', filePath: str, textureFormat: 'TextureFormat', paletteFormat: 'PaletteFormat',
+             copyPaletteSize: 'CopyPaletteSize', generateMipmaps: bool = False, mipmapWidthLimit: int = 4,
+             mipmapHeightLimit: int = 4, progressCallback: Callable[[float, float], None] = None) -> None:
+        """Writes the first image to a TXTR file. The image is not modified. See: libtxtr.SaveHandle"""
+
+        libtxtr.SaveHandle(self.__get_handle(), filePath, textureFormat, paletteFormat, copyPaletteSize,
+                           generateMipmaps, mipmapWidthLimit, mipmapHeightLimit, progressCallback)
+
+    def Dispose(self: 'TxtrImage') -> None:
+        """Disposes the image session. Does nothing if it is already disposed. See: libtxtr.DisposeHandle"""
+
+        if self.__handle is not None:
+            # Kept if the handle cannot be disposed yet (see: libtxtr.DisposeHandle)
+            libtxtr.DisposeHandle(self.__handle)
+            self.__handle = None
+
+    def __enter__(self: 'TxtrImage') -> 'TxtrImage':
+        return self
+
+    def __exit__(self: 'TxtrImage', exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        self.Dispose()
+
+    def __del__(self: 'TxtrImage') -> None:
+        # Not set if __init__ raised
+        handle: Optional[int]
+        handle = getattr(self, '_TxtrImage__handle', None)
+        if handle is None or not libtxtr.is_lib_loaded():
+            return
+        self.__handle = None
+        try:
+            # Disposed later if its pixels are still in use, which can outlive the TxtrImage
+            libtxtr.DisposeHandleWhenUnused(handle)
+        except Exception as e:
+            # Nothing can be raised while being collected
+            warnings.warn(f'Failed to dispose the TxtrImage of handle {handle}: {e}', ResourceWarning)
+
+    def __get_handle(self: 'TxtrImage') -> int:
+        if self.__handle is None:
+            raise Exception('The TxtrImage is disposed')
+        return self.__handle
+
+
+class pytxtr:
+    """Pure python interface to read and write TXTR files (no libtxtr library required)
+
+    The TXTR is read/decoded and written/encoded with numpy, so the .NET runtime of the libtxtr
+    library is never loaded. This is useful for scripts that only read textures or batch convert them.
+    Writing supports the non-indexed formats except CMPR, use the libtxtr library for the other formats.
+
+    The decoded images are numpy arrays of the shape (height, width, 4) and the dtype uint8 that
+    hold the pixels as BGRA bytes, the same as the images in the memory of the libtxtr library.
+    They are bit-identical to the images decoded by TXTRFileTypeLib (CMPR is decoded the same way
+    as the BC1 decoder of BCnEncoder.Net, with truncating color interpolation).
+
+    numpy is required for this class.
+    """
+
+    __pixelTables = {}
+
+    @classmethod
+    def Read(cls: 'pytxtr', input: Any, readMipmaps: bool = False,
+             progressCallback: Callable[[float, float], None] = None) -> List[Any]:
+        """Reads a TXTR from a file or from bytes.
+
+        Args:
+            input (Any): A path to a TXTR file (str or os.PathLike) or the bytes of a TXTR (bytes, bytearray, memoryview, etc.)
+            readMipmaps (bool): Whether all mipmaps should be read or only the first mipmap
+            progressCallback (Callable[[float, float], None]): A function where mipmap read progress will be reported to
+
+        Returns:
+            List[numpy.ndarray]: The decoded mipmaps, each of the shape (height, width, 4) holding BGRA bytes
+
+        Raises:
+            ValueError: If input is None/not a path or bytes, readMipmaps is None/not a bool, progressCallback is NOT None AND
+                        is not callable, or the TXTR data is invalid
+            ImportError: If numpy is not installed
+        """
+
+        if input is None:
+            raise ValueError('Parameter "input" is required')
+        if readMipmaps is not None and not isinstance(readMipmaps, bool):
+            raise ValueError('Parameter "readMipmaps" must be a bool')
+        if progressCallback is not None and not callable(progressCallback):
+            raise ValueError('Parameter "progressCallback" must be a function')
+        if numpy is None:
+            raise ImportError('numpy is required to use pytxtr')
+
+        data: memoryview
+        if isinstance(input, (str, os.PathLike)):
+            with open(input, 'rb') as inputFile:
+                data = memoryview(inputFile.read())
+        else:
+            try:
+                data = memoryview(input).cast('B')
+            except TypeError:
+                raise ValueError('Parameter "input" must be a path or support the buffer protocol')
+
+        def UpdateProgress(progress: float, max: float) -> None:
+            if progressCallback is not None:
+                progressCallback(progress, max)
+
+        textureFormat, textureWidth, textureHeight, mipmapCount = cls.__unpack(data, 0, '>IHHI')
+        if not textureFormat in TextureFormat:
+            raise ValueError(f"Texture format '{textureFormat}' (0x{textureFormat:08X}) is not supported")
+        textureFormat = TextureFormat(textureFormat)
+        isIndexed: bool
+        isIndexed = textureFormat in (TextureFormat.CI4, TextureFormat.CI8, TextureFormat.CI14X2)
+        if textureWidth < 1:
+            raise ValueError(f'Texture width must be greater than 0: {textureWidth}')
+        if textureHeight < 1:
+            raise ValueError(f'Texture height must be greater than 0: {textureHeight}')
+        if mipmapCount < 1:
+            raise ValueError(f'Mipmap count must be greater than 0: {mipmapCount}')
+        elif mipmapCount > 1 and isIndexed:
+            raise ValueError(f'Mipmap count must not be greater than 1 on indexed formats: {mipmapCount}')
+        if not readMipmaps:
+            mipmapCount = 1
+        offset: int
+        offset = 12
+
+        mipmaps: List[Any]
+        mipmaps = []
+        if isIndexed:
+            paletteFormat, paletteWidth, paletteHeight = cls.__unpack(data, offset, '>IHH')
+            offset += 8
+            if not paletteFormat in PaletteFormat:
+                raise ValueError(f"Palette format '{paletteFormat}' (0x{paletteFormat:08X}) is not supported")
+            paletteFormat = PaletteFormat(paletteFormat)
+            if paletteWidth < 1:
+                raise ValueError(f'Palette width must be greater than 0: {paletteWidth}')
+            if paletteHeight < 1:
+                raise ValueError(f'Palette height must be greater than 0: {paletteHeight}')
+
+            paletteSize: int
+            paletteSize = cls.GetPaletteSize(paletteFormat, paletteWidth, paletteHeight)
+            maxPaletteSize: int
+            maxPaletteSize = cls.GetPaletteSize(paletteFormat, {TextureFormat.CI4: 16, TextureFormat.CI8: 256,
+                                                                TextureFormat.CI14X2: 16384}[textureFormat], 1)
+            if paletteSize > maxPaletteSize:
+                raise ValueError(f'Palette size exceeds maximum palette size: {paletteSize} > {maxPaletteSize}')
+            paletteData: memoryview
+            paletteData = cls.__read(data, offset, paletteSize)
+            offset += paletteSize
+
+            mipmapSize: int
+            mipmapSize = cls.GetTextureSize(textureFormat, textureWidth, textureHeight)
+            # Do not flip indexed formats, TXTRFileTypeLib does not flip them either
+            mipmaps.append(cls.DecodeIndexedTexture(cls.__read(data, offset, mipmapSize), paletteData,
+                                                    textureWidth, textureHeight, textureFormat, paletteFormat))
+            UpdateProgress(len(mipmaps), mipmapCount)
+        else:
+            mipmapWidth: int
+            mipmapWidth = textureWidth
+            mipmapHeight: int
+            mipmapHeight = textureHeight
+            for mipmapLevel in range(0, mipmapCount):
+                # Checked before every mipmap, the same as pytxtr.ReadHeader and TXTRFileTypeLib
+                if mipmapWidth < 1:
+                    raise ValueError(f'Mipmap {mipmapLevel + 1} width must be greater than 0: {mipmapWidth}')
+                if mipmapHeight < 1:
+                    raise ValueError(f'Mipmap {mipmapLevel + 1} height must be greater than 0: {mipmapHeight}')
+                mipmapSize = cls.GetTextureSize(textureFormat, mipmapWidth, mipmapHeight)
+                mipmaps.append(cls.DecodeTexture(cls.__read(data, offset, mipmapSize), mipmapWidth, mipmapHeight,
+                                                 textureFormat)[::-1])
+                offset += mipmapSize
+                UpdateProgress(len(mipmaps), mipmapCount)
+
+                mipmapWidth //= 2
+                mipmapHeight //= 2
+
+        return mipmaps
+
+    @classmethod
+    def ReadHeader(cls: 'pytxtr', input: Any) -> 'TxtrHeader':
+        """Reads only the header of a TXTR from a file or from bytes, without decoding any pixels.
+
+        The header is validated the same as by pytxtr.Read. The palette and the mipmaps are located by their
+        sizes, their offsets are counted in bytes from the start of the TXTR. Only the first 20 bytes of a file
+        are read. See: libtxtr.ReadHeader
+
+        Args:
+            input (Any): A path to a TXTR file (str or os.PathLike) or the bytes of a TXTR (bytes, bytearray, memoryview, etc.)
+
+        Returns:
+            TxtrHeader: The header of the TXTR
+
+        Raises:
+            ValueError: If input is None/not a path or bytes, or the TXTR header is invalid
+        """
+
+        if input is None:
+            raise ValueError('Parameter "input" is required')
+
+        data: memoryview
+        if isinstance(input, (str, os.PathLike)):
+            with open(input, 'rb') as inputFile:
+                # The header is 12 bytes, plus 8 bytes for indexed formats
+                data = memoryview(inputFile.read(20))
+        else:
+            try:
+                data = memoryview(input).cast('B')
+            except TypeError:
+                raise ValueError('Parameter "input" must be a path or support the buffer protocol')
+
+        textureFormat, textureWidth, textureHeight, mipmapCount = cls.__unpack(data, 0, '>IHHI')
+        if not textureFormat in TextureFormat:
+            raise ValueError(f"Texture format '{textureFormat}' (0x{textureFormat:08X}) is not supported")
+        textureFormat = TextureFormat(textureFormat)
+        isIndexed: bool
+        isIndexed = textureFormat in (TextureFormat.CI4, TextureFormat.CI8, TextureFormat.CI14X2)
+        if textureWidth < 1:
+            raise ValueError(f'Texture width must be greater than 0: {textureWidth}')
+        if textureHeight < 1:
+            raise ValueError(f'Texture height must be greater than 0: {textureHeight}')
+        if mipmapCount < 1:
+            raise ValueError(f'Mipmap count must be greater than 0: {mipmapCount}')
+        elif mipmapCount > 1 and isIndexed:
+            raise ValueError(f'Mipmap count must not be greater than 1 on indexed formats: {mipmapCount}')
+        offset: int
+        offset = 12
+
+        paletteFormat: Optional[PaletteFormat]
+        paletteFormat = None
+        paletteWidth: int
+        paletteWidth = 0
+        paletteHeight: int
+        paletteHeight = 0
+        paletteOffset: int
+        paletteOffset = 0
+        paletteSize: int
+        paletteSize = 0
+        if isIndexed:
+            paletteFormat, paletteWidth, paletteHeight = cls.__unpack(data, offset, '>IHH')
+            offset += 8
+            if not paletteFormat in PaletteFormat:
+                raise ValueError(f"Palette format '{paletteFormat}' (0x{paletteFormat:08X}) is not supported")
+            paletteFormat = PaletteFormat(paletteFormat)
+            if paletteWidth < 1:
+                raise ValueError(f'Palette width must be greater than 0: {paletteWidth}')
+            if paletteHeight < 1:
+                raise ValueError(f'Palette height must be greater than 0: {paletteHeight}')
+
+            paletteSize = cls.GetPaletteSize(paletteFormat, paletteWidth, paletteHeight)
+            maxPaletteSize: int
+            maxPaletteSize = cls.GetPaletteSize(paletteFormat, {TextureFormat.CI4: 16, TextureFormat.CI8: 256,
+                                                                TextureFormat.CI14X2: 16384}[textureFormat], 1)
+            if paletteSize > maxPaletteSize:
+                raise ValueError(f'Palette size exceeds maximum palette size: {paletteSize} > {maxPaletteSize}')
+            paletteOffset = offset
+            offset += paletteSize
+
+        mipmaps: List[TxtrMipmapInfo]
+        mipmaps = []
+        mipmapWidth: int
+        mipmapWidth = textureWidth
+        mipmapHeight: int
+        mipmapHeight = textureHeight
+        for mipmapLevel in range(0, mipmapCount):
+            # Checked before every mipmap, which also ends the loop for a corrupt mipmap count
+            if mipmapWidth < 1:
+                raise ValueError(f'Mipmap {mipmapLevel + 1} width must be greater than 0: {mipmapWidth}')
+            if mipmapHeight < 1:
+                raise ValueError(f'Mipmap {mipmapLevel + 1} height must be greater than 0: {mipmapHeight}')
+            mipmapSize: int
+            mipmapSize = cls.GetTextureSize(textureFormat, mipmapWidth, mipmapHeight)
+            mipmaps.append(TxtrMipmapInfo(mipmapWidth, mipmapHeight, offset, mipmapSize))
+            offset += mipmapSize
+            mipmapWidth //= 2
+            mipmapHeight //= 2
+
+        return TxtrHeader(textureFormat, textureWidth, textureHeight, mipmapCount, paletteFormat, paletteWidth,
+                          paletteHeight, paletteOffset, paletteSize, tuple(mipmaps))
+
+    @classmethod
+    def ReadMipmap(cls: 'pytxtr', input: Any, mipmapLevel: int = None, minWidth: int = None,
+                   minHeight: int = None) -> Any:
+        """Reads one mipmap of a TXTR from a file or from bytes, skipping the mipmaps before it without reading them.
+
+        The mipmap is either mipmapLevel or the smallest mipmap that is at least minWidth x minHeight
+        (see: TxtrHeader.FindMipmapLevel). If neither is specified, the first mipmap is read.
+
+        Args:
+            input (Any): A path to a TXTR file (str or os.PathLike) or the bytes of a TXTR (bytes, bytearray, memoryview, etc.)
+            mipmapLevel (int): The index of the mipmap to read (0 is the first mipmap)
+            minWidth (int): Read the smallest mipmap that is at least this wide (and at least minHeight high)
+            minHeight (int): Read the smallest mipmap that is at least this high (and at least minWidth wide)
+
+        Returns:
+            numpy.ndarray: The decoded mipmap of the shape (height, width, 4) holding BGRA bytes
+
+        Raises:
+            ValueError: If input is None/not a path or bytes, mipmapLevel is NOT None AND is not a int/less than 0/not a mipmap
+                        of the TXTR, mipmapLevel is used with minWidth or minHeight, or the TXTR data is invalid
+            ImportError: If numpy is not installed
+        """
+
+        if input is None:
+            raise ValueError('Parameter "input" is required')
+        if mipmapLevel is not None:
+            if minWidth is not None or minHeight is not None:
+                raise ValueError('Parameter "mipmapLevel" cannot be used with "minWidth" or "minHeight"')
+            elif not isinstance(mipmapLevel, int):
+                raise ValueError('Parameter "mipmapLevel" must be a int')
+            elif mipmapLevel < 0:
+                raise ValueError('Parameter "mipmapLevel" must be 0 or greater')
+        if numpy is None:
+            raise ImportError('numpy is required to use pytxtr')
+
+        def GetMipmap(header: TxtrHeader) -> TxtrMipmapInfo:
+            level: int
+            if mipmapLevel is not None:
+                level = mipmapLevel
+            elif minWidth is None and minHeight is None:
+                level = 0
+            else:
+                level = header.FindMipmapLevel(minWidth or 0, minHeight or 0)
+            if level >= len(header.mipmaps):
+                raise ValueError(f'Mipmap level must be less than the mipmap count ({len(header.mipmaps)}): {level}')
+            return header.mipmaps[level]
+
+        header: TxtrHeader
+        mipmap: TxtrMipmapInfo
+        paletteData: memoryview
+        paletteData = None
+        textureData: memoryview
+        if isinstance(input, (str, os.PathLike)):
+            with open(input, 'rb') as inputFile:
+                # The header is 12 bytes, plus 8 bytes for indexed formats
+                header = cls.ReadHeader(inputFile.read(20))
+                mipmap = GetMipmap(header)
+                if header.isIndexed:
+                    inputFile.seek(header.paletteOffset)
+                    paletteData = cls.__read(memoryview(inputFile.read(header.paletteSize)), 0, header.paletteSize)
+                inputFile.seek(mipmap.offset)
+                textureData = cls.__read(memoryview(inputFile.read(mipmap.size)), 0, mipmap.size)
+        else:
+            data: memoryview
+            try:
+                data = memoryview(input).cast('B')
+            except TypeError:
+                raise ValueError('Parameter "input" must be a path or support the buffer protocol')
+            header = cls.ReadHeader(data)
+            mipmap = GetMipmap(header)
+            if header.isIndexed:
+                paletteData = cls.__read(data, header.paletteOffset, header.paletteSize)
+            textureData = cls.__read(data, mipmap.offset, mipmap.size)
+
+        if header.isIndexed:
+            # Do not flip indexed formats, TXTRFileTypeLib does not flip them either
+            return cls.DecodeIndexedTexture(textureData, paletteData, mipmap.width, mipmap.height,
+                                            header.textureFormat, header.paletteFormat)
+        else:
+            return cls.DecodeTexture(textureData, mipmap.width, mipmap.height, header.textureFormat)[::-1]
+
+    @classmethod
+    def ReadBands(cls: 'pytxtr', input: Any, mipmapLevel: int = 0,
+                  tileRowsPerBand: int = 1) -> Iterator[Tuple[int, Any]]:
+        """Reads one mipmap of a TXTR from a file or from bytes as horizontal bands of decoded rows, one band at a time.
+
+        Only one band is read and decoded at a time, so a mipmap of any size can be processed in constant memory.
+        The bands are read in the order they are stored in: from the bottom of the mipmap to the top for non-indexed
+        formats, and from the top to the bottom for indexed formats. A file is opened when the iteration starts and
+        closed when it ends or the generator is closed. See: TXTRFileTypeLibAPI.ReadBands
+
+        Args:
+            input (Any): A path to a TXTR file (str or os.PathLike) or the bytes of a TXTR (bytes, bytearray, memoryview, etc.)
+            mipmapLevel (int): The index of the mipmap to read (0 is the first mipmap)
+            tileRowsPerBand (int): The count of GX tile rows (4 or 8 pixel rows depending on the texture format) in a band
+
+        Returns:
+            Iterator[Tuple[int, numpy.ndarray]]: The row of the mipmap where each band starts and the decoded band of the
+                                                 shape (rows, width, 4) holding BGRA bytes, the same rows as in the mipmap
+                                                 read by pytxtr.ReadMipmap
+
+        Raises:
+            ValueError: If input is None/not a path or bytes, mipmapLevel is not a int/less than 0/(once iterated) not a
+                        mipmap of the TXTR, tileRowsPerBand is not a int/less than 1, or (once iterated) the TXTR data
+                        is invalid
+            ImportError: If numpy is not installed
+        """
+
+        if input is None:
+            raise ValueError('Parameter "input" is required')
+        if not isinstance(mipmapLevel, int):
+            raise ValueError('Parameter "mipmapLevel" must be a int')
+        elif mipmapLevel < 0:
+            raise ValueError('Parameter "mipmapLevel" must be 0 or greater')
+        if not isinstance(tileRowsPerBand, int):
+            raise ValueError('Parameter "tileRowsPerBand" must be a int')
+        elif tileRowsPerBand < 1:
+            raise ValueError('Parameter "tileRowsPerBand" must be 1 or greater')
+        if numpy is None:
+            raise ImportError('numpy is required to use pytxtr')
+
+        if isinstance(input, (str, os.PathLike)):
+            return cls.__read_bands_from_file(input, mipmapLevel, tileRowsPerBand)
+        else:
+            data: memoryview
+            try:
+                data = memoryview(input).cast('B')
+            except TypeError:
+                raise ValueError('Parameter "input" must be a path or support the buffer protocol')
+            return cls.__read_bands(lambda offset, size: cls.__read(data, offset, size), mipmapLevel, tileRowsPerBand)
+
+    @classmethod
+    def __read_bands_from_file(cls: 'pytxtr', filePath: Any, mipmapLevel: int,
+                               tileRowsPerBand: int) -> Iterator[Tuple[int, Any]]:
+        with open(filePath, 'rb') as inputFile:
+            def ReadAt(offset: int, size: int) -> memoryview:
+                inputFile.seek(offset)
+                return cls.__read(memoryview(inputFile.read(size)), 0, size)
+
+            yield from cls.__read_bands(ReadAt, mipmapLevel, tileRowsPerBand)
+
+    @classmethod
+    def __read_bands(cls: 'pytxtr', readAt: Callable[[int, int], memoryview], mipmapLevel: int,
+                     tileRowsPerBand: int) -> Iterator[Tuple[int, Any]]:
+        # The header is 12 bytes, plus 8 bytes for indexed formats
+        header: TxtrHeader
+        header = cls.ReadHeader(readAt(0, 20))
+        if mipmapLevel >= len(header.mipmaps):
+            raise ValueError(f'Mipmap level must be less than the mipmap count ({len(header.mipmaps)}): {mipmapLevel}')
+        mipmap: TxtrMipmapInfo
+        mipmap = header.mipmaps[mipmapLevel]
+        textureFormat: TextureFormat
+        textureFormat = header.textureFormat
+
+        paletteData: memoryview
+        paletteData = None
+        if header.isIndexed:
+            paletteData = readAt(header.paletteOffset, header.paletteSize)
+        tileHeight: int
+        tileHeight = 8 if textureFormat in (TextureFormat.I4, TextureFormat.CI4, TextureFormat.CMPR) else 4
+        # Only CMPR is decoded by whole tiles, the other formats are read row after row without the padding of the
+        # tiles, like TXTRFileTypeLib
+        rowSize: int
+        rowSize = {TextureFormat.I4: (mipmap.width + 1) // 2, TextureFormat.CI4: (mipmap.width + 1) // 2,
+                   TextureFormat.I8: mipmap.width, TextureFormat.IA4: mipmap.width, TextureFormat.CI8: mipmap.width,
+                   TextureFormat.IA8: mipmap.width * 2, TextureFormat.RGB565: mipmap.width * 2,
+                   TextureFormat.RGB5A3: mipmap.width * 2, TextureFormat.CI14X2: mipmap.width * 2,
+                   TextureFormat.RGBA32: mipmap.width * 4, TextureFormat.CMPR: 0}[textureFormat]
+
+        bandHeight: int
+        bandHeight = min(tileHeight * tileRowsPerBand, mipmap.height)
+        offset: int
+        offset = mipmap.offset
+        for storedY in range(0, mipmap.height, bandHeight):
+            rows: int
+            rows = min(bandHeight, mipmap.height - storedY)
+            bandSize: int
+            bandSize = cls.GetTextureSize(textureFormat, mipmap.width, rows) if textureFormat == TextureFormat.CMPR \
+                else rows * rowSize
+            # The decoders expect the whole texture size, the rest is 0
+            bandData: bytes
+            bandData = bytes(readAt(offset, bandSize)).ljust(cls.GetTextureSize(textureFormat, mipmap.width, rows),
+                                                              b'\x00')
+            if header.isIndexed:
+                # Do not flip indexed formats, TXTRFileTypeLib does not flip them either
+                yield (storedY, cls.DecodeIndexedTexture(bandData, paletteData, mipmap.width, rows, textureFormat,
+                                                         header.paletteFormat))
+            else:
+                yield (mipmap.height - storedY - rows,
+                       cls.DecodeTexture(bandData, mipmap.width, rows, textureFormat)[::-1])
+            offset += bandSize
+
+    @classmethod
+    def DecodeTexture(cls: 'pytxtr', textureData: Any, width: int, height: int, textureFormat: 'TextureFormat') -> Any:
+        """Decodes the data of a mipmap of a non-indexed texture.
+
+        The decoded image is not flipped (pytxtr.Read flips it vertically like TXTRFileTypeLib).
+
+        Args:
+            textureData (Any): The texture data (bytes-like) of at least pytxtr.GetTextureSize bytes
+            width (int): The width of the mipmap
+            height (int): The height of the mipmap
+            textureFormat (TextureFormat): The texture format of the mipmap, must not be an indexed format
+
+        Returns:
+            numpy.ndarray: The decoded mipmap of the shape (height, width, 4) holding BGRA bytes
+
+        Raises:
+            ValueError: If textureFormat is an indexed format or textureData is too small
+        """
+
+        data: Any
+        data = cls.__frombuffer(textureData, cls.GetTextureSize(textureFormat, width, height))
+        if textureFormat == TextureFormat.I4:
+            return cls.__from_i4(data, width, height)
+        elif textureFormat == TextureFormat.I8:
+            return cls.__intensity_to_bgra(cls.__detile(data, width, height, 8, 4))
+        elif textureFormat == TextureFormat.IA4:
+            pixels = cls.__detile(data, width, height, 8, 4)
+            return cls.__intensity_to_bgra((pixels & 0x0F) * 17, (pixels >> 4) * 17)
+        elif textureFormat in (TextureFormat.IA8, TextureFormat.RGB565, TextureFormat.RGB5A3):
+            return cls.GetPixelTable(textureFormat)[cls.__detile(data.view('>u2'), width, height, 4, 4)]
+        elif textureFormat == TextureFormat.RGBA32:
+            return cls.__from_rgba32(data, width, height)
+        elif textureFormat == TextureFormat.CMPR:
+            return cls.__from_cmpr(data, width, height)
+        else:
+            raise ValueError(f'Use {cls.__name__}.DecodeIndexedTexture instead for indexed textures')
+
+    @classmethod
+    def DecodeIndexedTexture(cls: 'pytxtr', textureData: Any, paletteData: Any, width: int, height: int,
+                             textureFormat: 'TextureFormat', paletteFormat: 'PaletteFormat') -> Any:
+        """Decodes the data of an indexed texture.
+
+        Args:
+            textureData (Any): The texture data (bytes-like) of at least pytxtr.GetTextureSize bytes
+            paletteData (Any): The palette data (bytes-like)
+            width (int): The width of the texture
+            height (int): The height of the texture
+            textureFormat (TextureFormat): The texture format of the texture, must be an indexed format
+            paletteFormat (PaletteFormat): The palette format of the palette
+
+        Returns:
+            numpy.ndarray: The decoded texture of the shape (height, width, 4) holding BGRA bytes
+
+        Raises:
+            ValueError: If textureFormat is not an indexed format, textureData is too small, or an index exceeds the palette
+        """
+
+        data: Any
+        data = cls.__frombuffer(textureData, cls.GetTextureSize(textureFormat, width, height))
+        palette: Any
+        palette = numpy.frombuffer(paletteData, dtype=numpy.uint8)
+        palette = cls.GetPixelTable(paletteFormat)[palette[:len(palette) // 2 * 2].view('>u2')]
+
+        indices: Any
+        if textureFormat == TextureFormat.CI4:
+            if width % 2 == 0:
+                indices = cls.__detile(cls.__split_nibbles(data), width, height, 8, 8)
+            else:
+                indices = cls.__detile_odd_nibbles(data, width, height)
+        elif textureFormat == TextureFormat.CI8:
+            indices = cls.__detile(data, width, height, 8, 4)
+        elif textureFormat == TextureFormat.CI14X2:
+            indices = cls.__detile(data.view('>u2'), width, height, 4, 4) & 0x3FFF
+        else:
+            raise ValueError(f'Use {cls.__name__}.DecodeTexture instead for normal textures')
+        if indices.size != 0 and int(indices.max()) >= len(palette):
+            raise ValueError(f'Palette index {int(indices.max())} exceeds the palette length ({len(palette)})')
+        return palette[indices]
+
+    @classmethod
+    def Write(cls: 'pytxtr', image: Any, output: Any, textureFormat: 'TextureFormat', generateMipmaps: bool = False,
+              mipmapWidthLimit: int = 4, mipmapHeightLimit: int = 4,
+              progressCallback: Callable[[float, float], None] = None,
+              channelOrder: 'ChannelOrder' = None) -> bytes:
+        """Writes an image to a TXTR file or to bytes.
+
+        Only the non-indexed formats I4, I8, IA4, IA8, RGB565, RGB5A3, and RGBA32 are supported. Use the
+        libtxtr library for the indexed formats and CMPR. The image is not modified.
+
+        The texture data of every mipmap is bit-identical to the texture data encoded by TXTRFileTypeLib. The
+        mipmaps are generated with the same 2x2 box filter with sRGB companding and rounding as TXTRFileTypeLib, but
+        in double instead of single precision, so a color channel of a generated mipmap can rarely differ by one
+        (alpha is always the same).
+
+        Args:
+            image (Any): The image (numpy.ndarray or anything numpy.asarray accepts) of the shape (height, width, 4) and the dtype uint8
+            output (Any): A path to a TXTR file (str or os.PathLike) to write to, or None to only return the bytes
+            textureFormat (TextureFormat): The texture format of the TXTR. See: TextureFormat
+            generateMipmaps (bool): Whether mipmaps should be generated in the TXTR
+            mipmapWidthLimit (int): The width limit for the TXTR mipmap generation
+            mipmapHeightLimit (int): The height limit for the TXTR mipmap generation
+            progressCallback (Callable[[float, float], None]): A function where mipmap write progress will be reported to
+            channelOrder (ChannelOrder): The order of the color components of a pixel in the image.
+                                         If None, ChannelOrder.BGRA is used. See: ChannelOrder
+
+        Returns:
+            bytes: The TXTR data
+
+        Raises:
+            ValueError: If image is None/not of the shape (height, width, 4), textureFormat is None/not a TextureFormat/not supported,
+                        generateMipmaps is None/not a bool, mipmapWidthLimit is None/not a int, mipmapHeightLimit is None/not a int,
+                        progressCallback is NOT None AND is not callable, or channelOrder is NOT None AND is not a ChannelOrder
+            ImportError: If numpy is not installed
+        """
+
+        if image is None:
+            raise ValueError('Parameter "image" is required')
+        if textureFormat is None:
+            raise ValueError('Parameter "textureFormat" is required')
+        elif not isinstance(textureFormat, TextureFormat):
+            raise ValueError('Parameter "textureFormat" must be a TextureFormat')
+        elif textureFormat in (TextureFormat.CI4, TextureFormat.CI8, TextureFormat.CI14X2, TextureFormat.CMPR):
+            raise ValueError(f'Texture format {textureFormat} is not supported by pytxtr, use the libtxtr library instead')
+        if generateMipmaps is not None and not isinstance(generateMipmaps, bool):
+            raise ValueError('Parameter "generateMipmaps" must be a bool')
+        if mipmapWidthLimit is not None and not isinstance(mipmapWidthLimit, int):
+            raise ValueError('Parameter "mipmapWidthLimit" must be a int')
+        if mipmapHeightLimit is not None and not isinstance(mipmapHeightLimit, int):
+            raise ValueError('Parameter "mipmapHeightLimit" must be a int')
+        if progressCallback is not None and not callable(progressCallback):
+            raise ValueError('Parameter "progressCallback" must be a function')
+        if channelOrder is not None and not isinstance(channelOrder, ChannelOrder):
+            raise ValueError('Parameter "channelOrder" must be a ChannelOrder')
+        if numpy is None:
+            raise ImportError('numpy is required to use pytxtr')
+
+        if mipmapWidthLimit is None:
+            mipmapWidthLimit = 4
+        if mipmapHeightLimit is None:
+            mipmapHeightLimit = 4
+        pixels = cls.__tobgra(image, channelOrder)
+        height: int
+        width: int
+        height, width = pixels.shape[:2]
+        if width < 1:
+            raise ValueError(f'Texture width must be greater than 0: {width}')
+        elif width > 0xFFFF:
+            raise ValueError(f'Texture width exceeds the max size of an unsigned short: {width} > {0xFFFF}')
+        if height < 1:
+            raise ValueError(f'Texture height must be greater than 0: {height}')
+        elif height > 0xFFFF:
+            raise ValueError(f'Texture height exceeds the max size of an unsigned short: {height} > {0xFFFF}')
+
+        mipmapCount: int
+        mipmapCount = 1
+        if generateMipmaps:
+            # Mipmap count is of the base texture + all the mipmaps and must not exceed the minimum size
+            mipmapCount = min(cls.__count_mipmaps(width, height, mipmapWidthLimit, mipmapHeightLimit),
+                              cls.__count_mipmaps(width, height, 1, 1))
+
+        chunks: List[bytes]
+        chunks = [struct.pack('>IHHI', textureFormat.value, width, height, mipmapCount)]
+        mipmap = pixels[::-1]
+        for mipmapLevel in range(0, mipmapCount):
+            if mipmapLevel > 0:
+                mipmap = cls.__downsample_mipmap(mipmap)
+            chunks.append(cls.EncodeTexture(mipmap, textureFormat))
+            if progressCallback is not None:
+                progressCallback(mipmapLevel + 1, mipmapCount)
+
+        data: bytes
+        data = b''.join(chunks)
+        if output is not None:
+            with open(output, 'wb') as outputFile:
+                outputFile.write(data)
+        return data
+
+    @classmethod
+    def EncodeTexture(cls: 'pytxtr', image: Any, textureFormat: 'TextureFormat') -> bytes:
+        """Encodes an image to the data of a mipmap of a non-indexed texture.
+
+        The image is not flipped (pytxtr.Write flips it vertically like TXTRFileTypeLib).
+
+        Args:
+            image (Any): The image of the shape (height, width, 4) and the dtype uint8 holding BGRA bytes
+            textureFormat (TextureFormat): The texture format of the mipmap (I4, I8, IA4, IA8, RGB565, RGB5A3, or RGBA32)
+
+        Returns:
+            bytes: The encoded mipmap data of pytxtr.GetTextureSize bytes
+
+        Raises:
+            ValueError: If textureFormat is not supported
+        """
+
+        pixels = numpy.asarray(image, dtype=numpy.uint8)
+        height: int
+        width: int
+        height, width = pixels.shape[:2]
+        b = pixels[..., 0].astype(numpy.int32)
+        g = pixels[..., 1].astype(numpy.int32)
+        r = pixels[..., 2].astype(numpy.int32)
+        a = pixels[..., 3].astype(numpy.int32)
+        data: bytes
+        if textureFormat == TextureFormat.I4:
+            data = cls.__to_i4((r + g + b) // 3, width, height)
+        elif textureFormat == TextureFormat.I8:
+            data = cls.__tile((r + g + b) // 3, 8, 4, numpy.uint8)
+        elif textureFormat == TextureFormat.IA4:
+            data = cls.__tile(((r + g + b) // 3 * 15 // 255) | ((a * 15 // 255) << 4), 8, 4, numpy.uint8)
+        elif textureFormat == TextureFormat.IA8:
+            data = cls.__tile((a << 8) | ((r + g + b) // 3), 4, 4, '>u2')
+        elif textureFormat == TextureFormat.RGB565:
+            data = cls.__tile(((r >> 3) << 11) | ((g >> 2) << 5) | (b >> 3), 4, 4, '>u2')
+        elif textureFormat == TextureFormat.RGB5A3:
+            data = cls.__tile(numpy.where(a <= 0xDA,
+                                          ((a * 7 // 255) << 12) | ((r * 15 // 255) << 8) | ((g * 15 // 255) << 4) | (b * 15 // 255),
+                                          0x8000 | ((r * 31 // 255) << 10) | ((g * 31 // 255) << 5) | (b * 31 // 255)),
+                              4, 4, '>u2')
+        elif textureFormat == TextureFormat.RGBA32:
+            # Every 4x4 block stores its AR pairs first then its GB pairs
+            ar = cls.__pad((a << 8) | r, 4, 4)
+            gb = cls.__pad((g << 8) | b, 4, 4)
+            tilesY: int
+            tilesY = ar.shape[0] // 4
+            tilesX: int
+            tilesX = ar.shape[1] // 4
+            blocks = numpy.stack((ar, gb)).reshape(2, tilesY, 4, tilesX, 4).transpose(1, 3, 0, 2, 4)
+            data = blocks.astype('>u2').tobytes()
+        else:
+            raise ValueError(f'Texture format {textureFormat} is not supported by pytxtr, use the libtxtr library instead')
+        # The texture size can be larger than the tiles (I8 and IA4), the rest is 0
+        return data.ljust(cls.GetTextureSize(textureFormat, width, height), b'\x00')
+
+    @staticmethod
+    def GetTextureSize(textureFormat: 'TextureFormat', width: int, height: int) -> int:
+        """Gets the size in bytes of the data of a mipmap.
+
+        Args:
+            textureFormat (TextureFormat): The texture format of the mipmap
+            width (int): The width of the mipmap
+            height (int): The height of the mipmap
+
+        Returns:
+            int: The size in bytes of the data of the mipmap
+        """
+
+        if textureFormat in (TextureFormat.I4, TextureFormat.CI4, TextureFormat.CMPR):
+            return ((width + 7) >> 3) * ((height + 7) >> 3) * 32
+        elif textureFormat in (TextureFormat.I8, TextureFormat.IA4, TextureFormat.CI8):
+            # Same as TXTRFileTypeLib, which reserves twice the rows of blocks
+            return ((width + 7) >> 3) * ((height + 7) >> 2) * 32
+        elif textureFormat in (TextureFormat.IA8, TextureFormat.RGB565, TextureFormat.RGB5A3, TextureFormat.CI14X2):
+            return ((width + 3) >> 2) * ((height + 3) >> 2) * 32
+        elif textureFormat == TextureFormat.RGBA32:
+            return ((width + 3) >> 2) * ((height + 3) >> 2) * 64
+        else:
+            raise ValueError(f'Texture format {textureFormat} is not supported')
+
+    @classmethod
+    def GetPixelTable(cls: 'pytxtr', pixelFormat: Any) -> Any:
+        """Gets the lookup table of a 16 bit pixel format, to decode pixels with table[pixels].
+
+        The table is built the first time it is requested and shared afterwards. It holds the same
+        BGRA bytes as the lookup tables of TXTRFileTypeLib.
+
+        Args:
+            pixelFormat (Any): The pixel format, TextureFormat or PaletteFormat IA8, RGB565, or RGB5A3
+
+        Returns:
+            numpy.ndarray: A read-only table of the shape (65536, 4) holding BGRA bytes, indexed by the
+                           16 bit pixel values (pixel data is big endian, e.g. data.view('>u2'))
+
+        Raises:
+            ValueError: If pixelFormat is not a 16 bit pixel format
+        """
+
+        if not isinstance(pixelFormat, (TextureFormat, PaletteFormat)) or \
+           pixelFormat.name not in ('IA8', 'RGB565', 'RGB5A3'):
+            raise ValueError(f'Pixel format {pixelFormat} is not a 16 bit pixel format')
+        table: Any
+        table = cls.__pixelTables.get(pixelFormat.name)
+        if table is None:
+            pixels: Any
+            pixels = numpy.arange(0x10000, dtype=numpy.uint16)
+            if pixelFormat.name == 'IA8':
+                table = cls.__ia8_to_bgra(pixels)
+            elif pixelFormat.name == 'RGB565':
+                table = cls.__rgb565_to_bgra(pixels)
+            else:
+                table = cls.__rgb5a3_to_bgra(pixels)
+            table.flags.writeable = False
+            # Building a table twice from two threads is harmless, both are the same
+            cls.__pixelTables[pixelFormat.name] = table
+        return table
+
+    @staticmethod
+    def GetPaletteSize(paletteFormat: 'PaletteFormat', width: int, height: int) -> int:
+        """Gets the size in bytes of the data of a palette.
+
+        Args:
+            paletteFormat (PaletteFormat): The palette format of the palette
+            width (int): The width of the palette
+            height (int): The height of the palette
+
+        Returns:
+            int: The size in bytes of the data of the palette
+        """
+
+        if paletteFormat in (PaletteFormat.IA8, PaletteFormat.RGB565, PaletteFormat.RGB5A3):
+            return width * height * 2
+        else:
+            raise ValueError(f'Palette format {paletteFormat} is not supported')
+
+    @staticmethod
+    def __unpack(data: memoryview, offset: int, format: str) -> Tuple[int, ...]:
+        if offset + struct.calcsize(format) > len(data):
+            raise ValueError('Unexpected end of TXTR data')
+        return struct.unpack_from(format, data, offset)
+
+    @staticmethod
+    def __read(data: memoryview, offset: int, size: int) -> memoryview:
+        if size <= 0:
+            raise ValueError('Mipmap data is empty')
+        if offset + size > len(data):
+            raise ValueError('Unexpected end of TXTR data')
+        return data[offset:offset + size]
+
+    @staticmethod
+    def __frombuffer(data: Any, size: int) -> Any:
+        array: Any
+        array = numpy.frombuffer(data, dtype=numpy.uint8)
+        if len(array) < size:
+            raise ValueError(f'Texture data is too small: {len(array)} < {size}')
+        return array[:size]
+
+    @staticmethod
+    def __traverse(width: int, height: int, blockWidth: int, blockHeight: int, step: int = 1) -> Tuple[Any, Any]:
+        # The coordinates of every pixel in the order the blocks store them. Pixels outside of the
+        # image are skipped without consuming data, exactly like the libWiiSharp decoders do.
+        tilesY: int
+        tilesY = (height + blockHeight - 1) // blockHeight
+        tilesX: int
+        tilesX = (width + blockWidth - 1) // blockWidth
+        shape: Tuple[int, ...]
+        shape = (tilesY, tilesX, blockHeight, blockWidth // step)
+        ys = numpy.broadcast_to((numpy.arange(tilesY) * blockHeight)[:, None, None, None]
+                                + numpy.arange(blockHeight)[None, None, :, None], shape).ravel()
+        xs = numpy.broadcast_to((numpy.arange(tilesX) * blockWidth)[None, :, None, None]
+                                + numpy.arange(0, blockWidth, step)[None, None, None, :], shape).ravel()
+        valid = (ys < height) & (xs < width)
+        return ys[valid], xs[valid]
+
+    @classmethod
+    def __detile(cls: 'pytxtr', units: Any, width: int, height: int, blockWidth: int, blockHeight: int) -> Any:
+        if width % blockWidth == 0 and height % blockHeight == 0:
+            tilesY: int
+            tilesY = height // blockHeight
+            tilesX: int
+            tilesX = width // blockWidth
+            return (units[:tilesY * tilesX * blockHeight * blockWidth]
+                    .reshape(tilesY, tilesX, blockHeight, blockWidth).transpose(0, 2, 1, 3).reshape(height, width))
+        ys, xs = cls.__traverse(width, height, blockWidth, blockHeight)
+        output = numpy.zeros((height, width), dtype=units.dtype)
+        output[ys, xs] = units[:len(ys)]
+        return output
+
+    @staticmethod
+    def __split_nibbles(data: Any) -> Any:
+        nibbles = numpy.empty(len(data) * 2, dtype=numpy.uint8)
+        nibbles[0::2] = data >> 4
+        nibbles[1::2] = data & 0x0F
+        return nibbles
+
+    @classmethod
+    def __detile_odd_nibbles(cls: 'pytxtr', data: Any, width: int, height: int) -> Any:
+        # With an odd width, the second pixel of the last byte of a row is written to the first pixel of
+        # the next row (if any), and whichever write comes last in block order wins.
+        ys, xs = cls.__traverse(width, height, 8, 8, 2)
+        first = ys * width + xs
+        indices = numpy.empty(len(first) * 2, dtype=first.dtype)
+        indices[0::2] = first
+        indices[1::2] = first + 1
+        values = cls.__split_nibbles(data[:len(first)])
+        inRange = indices < width * height
+        indices = indices[inRange]
+        values = values[inRange]
+        _, lastWrite = numpy.unique(indices[::-1], return_index=True)
+        lastWrite = len(indices) - 1 - lastWrite
+        output = numpy.zeros(width * height, dtype=numpy.uint8)
+        output[indices[lastWrite]] = values[lastWrite]
+        return output.reshape(height, width)
+
+    @classmethod
+    def __from_i4(cls: 'pytxtr', data: Any, width: int, height: int) -> Any:
+        intensities: Any
+        if width % 2 == 0:
+            intensities = cls.__detile(cls.__split_nibbles(data), width, height, 8, 8)
+        else:
+            intensities = cls.__detile_odd_nibbles(data, width, height)
+        return cls.__intensity_to_bgra(intensities * 17)
+
+    @classmethod
+    def __from_rgba32(cls: 'pytxtr', data: Any, width: int, height: int) -> Any:
+        # Every 4x4 block stores its AR pairs first then its GB pairs
+        units = data.view('>u2')
+        output = numpy.empty((height, width, 4), dtype=numpy.uint8)
+        if width % 4 == 0 and height % 4 == 0:
+            blocks = units.reshape(height // 4, width // 4, 2, 4, 4).transpose(2, 0, 3, 1, 4).reshape(2, height, width)
+            ar = blocks[0]
+            gb = blocks[1]
+        else:
+            tilesY: int
+            tilesY = (height + 3) // 4
+            tilesX: int
+            tilesX = (width + 3) // 4
+            shape: Tuple[int, ...]
+            shape = (tilesY, tilesX, 2, 4, 4)
+            ys = numpy.broadcast_to((numpy.arange(tilesY) * 4)[:, None, None, None, None]
+                                    + numpy.arange(4)[None, None, None, :, None], shape).ravel()
+            xs = numpy.broadcast_to((numpy.arange(tilesX) * 4)[None, :, None, None, None]
+                                    + numpy.arange(4)[None, None, None, None, :], shape).ravel()
+            passes = numpy.broadcast_to(numpy.arange(2)[None, None, :, None, None], shape).ravel()
+            valid = (ys < height) & (xs < width)
+            ys = ys[valid]
+            xs = xs[valid]
+            passes = passes[valid]
+            values = units[:len(ys)]
+            ar = numpy.zeros((height, width), dtype=numpy.uint16)
+            gb = numpy.zeros((height, width), dtype=numpy.uint16)
+            ar[ys[passes == 0], xs[passes == 0]] = values[passes == 0]
+            gb[ys[passes == 1], xs[passes == 1]] = values[passes == 1]
+        output[..., 0] = gb & 0xFF
+        output[..., 1] = gb >> 8
+        output[..., 2] = ar & 0xFF
+        output[..., 3] = ar >> 8
+        return output
+
+    @staticmethod
+    def __from_cmpr(data: Any, width: int, height: int) -> Any:
+        tilesY: int
+        tilesY = (height + 7) // 8
+        tilesX: int
+        tilesX = (width + 7) // 8
+        # (tile y, tile x, block y, block x, 8 bytes); every block is BC1 with big endian endpoints
+        blocks = data[:tilesY * tilesX * 32].reshape(tilesY, tilesX, 2, 2, 8)
+        color0 = blocks[..., 0:2].copy().view('>u2')[..., 0].astype(numpy.int32)
+        color1 = blocks[..., 2:4].copy().view('>u2')[..., 0].astype(numpy.int32)
+
+        def expand(color: Any) -> Any:
+            r = (color >> 11) & 0x1F
+            g = (color >> 5) & 0x3F
+            b = color & 0x1F
+            return numpy.stack(((b << 3) | (b >> 2), (g << 2) | (g >> 4), (r << 3) | (r >> 2),
+                                numpy.full_like(color, 255)), axis=-1)
+
+        rgba0 = expand(color0)
+        rgba1 = expand(color1)
+        opaque = (color0 > color1)[..., None]
+        colors = numpy.empty(blocks.shape[:4] + (4, 4), dtype=numpy.int32)
+        colors[..., 0, :] = rgba0
+        colors[..., 1, :] = rgba1
+        colors[..., 2, :] = numpy.where(opaque, (2 * rgba0 + rgba1) // 3, (rgba0 + rgba1) // 2)
+        colors[..., 3, :] = numpy.where(opaque, (rgba0 + 2 * rgba1) // 3, 0)
+
+        # Index of pixel x of row y is in bits 7-6 (x = 0) to 1-0 (x = 3) of line byte y
+        lines = blocks[..., 4:8].astype(numpy.int32)
+        indices = (lines[..., :, None] >> numpy.array([6, 4, 2, 0])) & 3
+        pixels = numpy.take_along_axis(colors, indices.reshape(blocks.shape[:4] + (16, 1)), axis=4)
+        pixels = pixels.reshape(tilesY, tilesX, 2, 2, 4, 4, 4).transpose(0, 2, 4, 1, 3, 5, 6)
+        return pixels.reshape(tilesY * 8, tilesX * 8, 4)[:height, :width].astype(numpy.uint8)
+
+    @staticmethod
+    def __intensity_to_bgra(intensity: Any, alpha: Any = 255) -> Any:
+        output = numpy.empty(intensity.shape + (4,), dtype=numpy.uint8)
+        output[..., 0] = intensity
+        output[..., 1] = intensity
+        output[..., 2] = intensity
+        output[..., 3] = alpha
+        return output
+
+    @classmethod
+    def __ia8_to_bgra(cls: 'pytxtr', pixels: Any) -> Any:
+        return cls.__intensity_to_bgra(pixels & 0xFF, pixels >> 8)
+
+    @staticmethod
+    def __rgb565_to_bgra(pixels: Any) -> Any:
+        output = numpy.empty(pixels.shape + (4,), dtype=numpy.uint8)
+        output[..., 0] = (pixels & 0x1F) << 3
+        output[..., 1] = ((pixels >> 5) & 0x3F) << 2
+        output[..., 2] = ((pixels >> 11) & 0x1F) << 3
+        output[..., 3] = 255
+        return output
+
+    @staticmethod
+    def __rgb5a3_to_bgra(pixels: Any) -> Any:
+        pixels = pixels.astype(numpy.int32)
+        isRgb555 = (pixels & 0x8000) != 0
+        output = numpy.empty(pixels.shape + (4,), dtype=numpy.uint8)
+        output[..., 0] = numpy.where(isRgb555, (pixels & 0x1F) * 255 // 31, (pixels & 0x0F) * 255 // 15)
+        output[..., 1] = numpy.where(isRgb555, ((pixels >> 5) & 0x1F) * 255 // 31, ((pixels >> 4) & 0x0F) * 255 // 15)
+        output[..., 2] = numpy.where(isRgb555, ((pixels >> 10) & 0x1F) * 255 // 31, ((pixels >> 8) & 0x0F) * 255 // 15)
+        output[..., 3] = numpy.where(isRgb555, 255, ((pixels >> 12) & 0x07) * 255 // 7)
+        return output
+
+    @staticmethod
+    def __tobgra(image: Any, channelOrder: 'ChannelOrder') -> Any:
+        pixels = numpy.asarray(image)
+        if pixels.ndim != 3 or pixels.shape[2] != 4:
+            raise ValueError('Parameter "image" must be of the shape (height, width, 4)')
+        pixels = pixels.astype(numpy.uint8, copy=False)
+        if channelOrder == ChannelOrder.RGBA:
+            pixels = pixels[..., [2, 1, 0, 3]]
+        return pixels
+
+    @staticmethod
+    def __count_mipmaps(width: int, height: int, widthLimit: int, heightLimit: int) -> int:
+        # Same as ImageUtil.CountMipmaps with the base image counted
+        widthCount: int
+        widthCount = 1
+        heightCount: int
+        heightCount = 1
+        while width > widthLimit or height > heightLimit:
+            if width > widthLimit:
+                width //= 2
+                widthCount += 1
+            if height > heightLimit:
+                height //= 2
+                heightCount += 1
+        return max(min(widthCount, heightCount), 0)
+
+    @staticmethod
+    def __downsample_mipmap(image: Any) -> Any:
+        # 2x2 box filter in linear light (sRGB companding) like TXTRFileTypeLib, alpha is not premultiplied.
+        # An odd last column or row is averaged into the last column or row of the mipmap.
+        # Like TXTRFileTypeLib the pixels are summed and then divided by their count once, and rounded half away
+        # from zero.
+        def sum_axis(pixels: Any, axis: int) -> Tuple[Any, Any]:
+            sourceSize: int
+            sourceSize = pixels.shape[axis]
+            starts = numpy.arange(max(sourceSize // 2, 1)) * 2
+            return numpy.add.reduceat(pixels, starts, axis=axis), numpy.diff(numpy.append(starts, sourceSize))
+
+        pixels = image.astype(numpy.float64)
+        color = pixels[..., :3] / 255
+        pixels[..., :3] = numpy.where(color <= 0.04045, color / 12.92, ((color + 0.055) / 1.055) ** 2.4)
+        pixels, rowCounts = sum_axis(pixels, 0)
+        pixels, columnCounts = sum_axis(pixels, 1)
+        pixels /= numpy.outer(rowCounts, columnCounts)[..., numpy.newaxis]
+        color = pixels[..., :3]
+        pixels[..., :3] = numpy.where(color <= 0.0031308, color * 12.92, 1.055 * color ** (1 / 2.4) - 0.055) * 255
+        return numpy.floor(pixels + 0.5).clip(0, 255).astype(numpy.uint8)
+
+    @staticmethod
+    def __pad(values: Any, blockWidth: int, blockHeight: int) -> Any:
+        # Pixels outside of the image are encoded as 0
+        height: int
+        width: int
+        height, width = values.shape
+        return numpy.pad(values, ((0, -height % blockHeight), (0, -width % blockWidth)))
+
+    @classmethod
+    def __tile(cls: 'pytxtr', values: Any, blockWidth: int, blockHeight: int, dtype: Any) -> bytes:
+        values = cls.__pad(values, blockWidth, blockHeight)
+        tilesY: int
+        tilesY = values.shape[0] // blockHeight
+        tilesX: int
+        tilesX = values.shape[1] // blockWidth
+        return (values.reshape(tilesY, blockHeight, tilesX, blockWidth).transpose(0, 2, 1, 3)
+                .astype(dtype).tobytes())
+
+    @classmethod
+    def __to_i4(cls: 'pytxtr', intensity: Any, width: int, height: int) -> bytes:
+        # The second pixel of a byte is read from the flat pixel index + 1, so with an odd width
+        # the last byte of a row takes the first pixel of the next row (or 0 after the last row)
+        flat = numpy.append((intensity * 15 // 255).ravel(), 0)
+        ys = numpy.arange(height)[:, None]
+        xs = numpy.arange(0, width, 2)[None, :]
+        first = flat[ys * width + xs]
+        second = flat[ys * width + xs + 1]
+        return cls.__tile((first << 4) | second, 4, 8, numpy.uint8)
+
+
+class TxtrDecodeCache:
+    """A cache of decoded TXTRs for pytxtr, so reading an unchanged TXTR again does not decode it again
+
+    The decoded mipmaps are stored by the hash of the bytes of the TXTR plus the read options (readMipmaps or
+    the mipmap level), so the same TXTR at different paths or from bytes is only decoded once. They are kept in
+    memory up to maxBytes, the least recently used mipmaps are evicted first. If cacheDirectory is set, they are
+    also stored there as .npy files, so they outlive the cache and evicted mipmaps are loaded instead of decoded.
+
+    A file whose size, modification time and inode are unchanged since it was last read is not read again,
+    so reading it is nearly free when its mipmaps are still in memory.
+
+    The cached mipmaps are shared by every read of the same TXTR, so the returned numpy arrays are read-only.
+    Copy them (numpy.ndarray.copy) to modify them. The cache can be used by multiple threads at the same time.
+
+    Only reads through the cache are cached, which decode with pytxtr. libtxtr.Open and TxtrImage.Open decode
+    with the libtxtr library to images in its own memory and are never cached, use the cache instead of them
+    where numpy arrays of the pixels are enough.
+
+    numpy is required for this class.
+    """
+
+    # Part of the names of the files in cacheDirectory, increase it when the decoded pixels or the files change so
+    # the files of older versions are not loaded
+    __CACHE_VERSION = 1
+    # The files in cacheDirectory, which are the only files removed by TxtrDecodeCache.Clear
+    __CACHE_FILE_PATTERN = re.compile(r'[0-9a-f]{32}-v[0-9]+-(?:all|[0-9]+)(?:-[0-9]+)?\.npy|txtrcache-\w+\.tmp')
+    __TEMP_FILE_PREFIX = 'txtrcache-'
+
+    def __init__(self: 'TxtrDecodeCache', maxBytes: int = 256 * 1024 * 1024, cacheDirectory: Any = None) -> None:
+        """Creates an empty cache.
+
+        Args:
+            maxBytes (int): The maximum size in bytes of the decoded mipmaps kept in memory, 0 to keep nothing in memory
+            cacheDirectory (Any): A path to a directory (str or os.PathLike) to also store the decoded mipmaps in,
+                                  or None to only keep them in memory. It is created if it does not exist
+
+        Raises:
+            ValueError: If maxBytes is None/not a int/less than 0 or cacheDirectory is NOT None AND is not a path
+            ImportError: If numpy is not installed
+        """
+
+        if maxBytes is None:
+            raise ValueError('Parameter "maxBytes" is required')
+        elif not isinstance(maxBytes, int):
+            raise ValueError('Parameter "maxBytes" must be a int')
+        elif maxBytes < 0:
+            raise ValueError('Parameter "maxBytes" must be 0 or greater')
+        if cacheDirectory is not None:
+            if not isinstance(cacheDirectory, (str, os.PathLike)):
+                raise ValueError('Parameter "cacheDirectory" must be a path')
+            os.makedirs(cacheDirectory, exist_ok=True)
+        if numpy is None:
+            raise ImportError('numpy is required to use TxtrDecodeCache')
+
+        self.__maxBytes = maxBytes
+        self.__cacheDirectory = os.fspath(cacheDirectory) if cacheDirectory is not None else None
+        self.__entries = OrderedDict()
+        self.__size = 0
+        self.__fileDigests = {}
+        self.__lock = threading.Lock()
+
+    @property
+    def maxBytes(self: 'TxtrDecodeCache') -> int:
+        """int: The maximum size in bytes of the decoded mipmaps kept in memory"""
+
+        return self.__maxBytes
+
+    @property
+    def size(self: 'TxtrDecodeCache') -> int:
+        """int: The size in bytes of the decoded mipmaps kept in memory"""
+
+        return self.__size
+
+    @property
+    def cacheDirectory(self: 'TxtrDecodeCache') -> Optional[str]:
+        """Optional[str]: The directory the decoded mipmaps are also stored in, or None"""
+
+        return self.__cacheDirectory
+
+    def Read(self: 'TxtrDecodeCache', input: Any, readMipmaps: bool = False,
+             progressCallback: Callable[[float, float], None] = None) -> List[Any]:
+        """Reads a TXTR from a file or from bytes, or gets its mipmaps from the cache. See: pytxtr.Read
+
+        Args:
+            input (Any): A path to a TXTR file (str or os.PathLike) or the bytes of a TXTR (bytes, bytearray, memoryview, etc.)
+            readMipmaps (bool): Whether all mipmaps should be read or only the first mipmap
+            progressCallback (Callable[[float, float], None]): A function where mipmap read progress will be reported to
+
+        Returns:
+            List[numpy.ndarray]: The decoded mipmaps (read-only), each of the shape (height, width, 4) holding BGRA bytes
+
+        Raises:
+            ValueError: If input is None/not a path or bytes, readMipmaps is None/not a bool, progressCallback is NOT None AND
+                        is not callable, or the TXTR data is invalid
+        """
+
+        if input is None:
+            raise ValueError('Parameter "input" is required')
+        if not isinstance(readMipmaps, bool):
+            raise ValueError('Parameter "readMipmaps" must be a bool')
+        if progressCallback is not None and not callable(progressCallback):
+            raise ValueError('Parameter "progressCallback" must be a function')
+
+        decoded: List[bool]
+        decoded = [False]
+
+        def Decode(data: memoryview) -> List[Any]:
+            decoded[0] = True
+            return pytxtr.Read(data, readMipmaps, progressCallback)
+
+        mipmaps: List[Any]
+        mipmaps = self.__get(input, 'all' if readMipmaps else '0', Decode)
+        if progressCallback is not None and not decoded[0]:
+            # Decoded mipmaps already reported their progress, cached mipmaps are reported all at once
+            progressCallback(len(mipmaps), len(mipmaps))
+        return mipmaps
+
+    def ReadMipmap(self: 'TxtrDecodeCache', input: Any, mipmapLevel: int = None, minWidth: int = None,
+                   minHeight: int = None) -> Any:
+        """Reads one mipmap of a TXTR from a file or from bytes, or gets it from the cache. See: pytxtr.ReadMipmap
+
+        Args:
+            input (Any): A path to a TXTR file (str or os.PathLike) or the bytes of a TXTR (bytes, bytearray, memoryview, etc.)
+            mipmapLevel (int): The index of the mipmap to read (0 is the first mipmap)
+            minWidth (int): Read the smallest mipmap that is at least this wide (and at least minHeight high)
+            minHeight (int): Read the smallest mipmap that is at least this high (and at least minWidth wide)
+
+        Returns:
+            numpy.ndarray: The decoded mipmap (read-only) of the shape (height, width, 4) holding BGRA bytes
+
+        Raises:
+            ValueError: If input is None/not a path or bytes, mipmapLevel is NOT None AND is not a int/less than 0/not a mipmap
+                        of the TXTR, mipmapLevel is used with minWidth or minHeight, or the TXTR data is invalid
+        """
+
+        if input is None:
+            raise ValueError('Parameter "input" is required')
+        if mipmapLevel is not None:
+            if minWidth is not None or minHeight is not None:
+                raise ValueError('Parameter "mipmapLevel" cannot be used with "minWidth" or "minHeight"')
+            elif not isinstance(mipmapLevel, int):
+                raise ValueError('Parameter "mipmapLevel" must be a int')
+            elif mipmapLevel < 0:
+                raise ValueError('Parameter "mipmapLevel" must be 0 or greater')
+            return self.__get(input, str(mipmapLevel), lambda data: [pytxtr.ReadMipmap(data, mipmapLevel)])[0]
+        elif minWidth is None and minHeight is None:
+            return self.__get(input, '0', lambda data: [pytxtr.ReadMipmap(data, 0)])[0]
+        else:
+            # The level depends on the header, so it is found before the cache is looked up
+            digest: str
+            data: Optional[memoryview]
+            digest, data = self.__get_digest(input)
+            if data is not None:
+                input = data
+            level: int
+            level = pytxtr.ReadHeader(input).FindMipmapLevel(minWidth or 0, minHeight or 0)
+            return self.__get(input, str(level), lambda data: [pytxtr.ReadMipmap(data, level)], digest)[0]
+
+    def Clear(self: 'TxtrDecodeCache', clearDirectory: bool = False) -> None:
+        """Removes all mipmaps from memory and forgets all files read.
+
+        Args:
+            clearDirectory (bool): Whether the files of the cache in cacheDirectory (of any cache version) should also
+                                   be deleted, other files in cacheDirectory are kept
+        """
+
+        with self.__lock:
+            self.__entries.clear()
+            self.__size = 0
+            self.__fileDigests.clear()
+            if clearDirectory and self.__cacheDirectory is not None:
+                for entry in os.scandir(self.__cacheDirectory):
+                    if entry.is_file() and self.__CACHE_FILE_PATTERN.fullmatch(entry.name):
+                        try:
+                            os.remove(entry.path)
+                        except FileNotFoundError:
+                            # Removed by another cache in the same directory
+                            pass
+
+    def __get(self: 'TxtrDecodeCache', input: Any, option: str, decode: Callable[[memoryview], List[Any]],
+              digest: str = None) -> List[Any]:
+        data: Optional[memoryview]
+        data = None
+        if digest is None:
+            digest, data = self.__get_digest(input)
+        key: Tuple[str, str]
+        key = (digest, option)
+
+        mipmaps: Optional[List[Any]]
+        with self.__lock:
+            mipmaps = self.__entries.get(key)
+            if mipmaps is not None:
+                self.__entries.move_to_end(key)
+                return mipmaps
+
+        mipmaps = self.__load(key)
+        if mipmaps is None:
+            if data is None:
+                data = self.__read_input(input)
+            mipmaps = decode(data)
+            for mipmap in mipmaps:
+                mipmap.flags.writeable = False
+            self.__store(key, mipmaps)
+        self.__put(key, mipmaps)
+        return mipmaps
+
+    def __get_digest(self: 'TxtrDecodeCache', input: Any) -> Tuple[str, Optional[memoryview]]:
+        # Returns the hash of the TXTR and its bytes, or None instead of the bytes if the file is unchanged
+        fileKey: str
+        fileKey = None
+        fileStat: Tuple[int, int, int]
+        fileStat = None
+        if isinstance(input, (str, os.PathLike)):
+            fileKey = os.path.abspath(input)
+            stat = os.stat(fileKey)
+            fileStat = (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+            with self.__lock:
+                fileDigest: Optional[Tuple[Tuple[int, int, int], str]]
+                fileDigest = self.__fileDigests.get(fileKey)
+                if fileDigest is not None and fileDigest[0] == fileStat:
+                    return (fileDigest[1], None)
+
+        data: memoryview
+        data = self.__read_input(input)
+        digest: str
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        if fileKey is not None:
+            with self.__lock:
+                self.__fileDigests[fileKey] = (fileStat, digest)
+        return (digest, data)
+
+    @staticmethod
+    def __read_input(input: Any) -> memoryview:
+        if isinstance(input, (str, os.PathLike)):
+            with open(input, 'rb') as inputFile:
+                return memoryview(inputFile.read())
+        try:
+            return memoryview(input).cast('B')
+        except TypeError:
+            raise ValueError('Parameter "input" must be a path or support the buffer protocol')
+
+    def __put(self: 'TxtrDecodeCache', key: Tuple[str, str], mipmaps: List[Any]) -> None:
+        entrySize: int
+        entrySize = sum(mipmap.nbytes for mipmap in mipmaps)
+        if entrySize > self.__maxBytes:
+            # Would evict everything else and still not fit
+            return
+        with self.__lock:
+            if key in self.__entries:
+                self.__entries.move_to_end(key)
+                return
+            self.__entries[key] = mipmaps
+            self.__size += entrySize
+            while self.__size > self.__maxBytes:
+                evictedMipmaps: List[Any]
+                _, evictedMipmaps = self.__entries.popitem(last=False)
+                self.__size -= sum(mipmap.nbytes for mipmap in evictedMipmaps)
+
+    def __get_count_path(self: 'TxtrDecodeCache', key: Tuple[str, str]) -> str:
+        return os.path.join(self.__cacheDirectory, f'{key[0]}-v{self.__CACHE_VERSION}-{key[1]}.npy')
+
+    def __get_paths(self: 'TxtrDecodeCache', key: Tuple[str, str], count: int) -> List[str]:
+        return [os.path.join(self.__cacheDirectory, f'{key[0]}-v{self.__CACHE_VERSION}-{key[1]}-{index}.npy')
+                for index in range(0, count)]
+
+    def __load(self: 'TxtrDecodeCache', key: Tuple[str, str]) -> Optional[List[Any]]:
+        if self.__cacheDirectory is None:
+            return None
+        # The first file holds the count of the mipmaps of an entry so a partly stored entry is never loaded
+        mipmaps: List[Any]
+        mipmaps = []
+        try:
+            count: int
+            count = int(numpy.load(self.__get_count_path(key), allow_pickle=False))
+            for mipmapPath in self.__get_paths(key, count):
+                mipmap = numpy.load(mipmapPath, allow_pickle=False)
+                if mipmap.dtype != numpy.uint8 or mipmap.ndim != 3 or mipmap.shape[2] != 4:
+                    return None
+                mipmap.flags.writeable = False
+                mipmaps.append(mipmap)
+        except (OSError, ValueError):
+            # Missing or damaged, decoded again
+            return None
+        return mipmaps
+
+    def __store(self: 'TxtrDecodeCache', key: Tuple[str, str], mipmaps: List[Any]) -> None:
+        if self.__cacheDirectory is None:
+            return
+
+        def Save(path: str, array: Any) -> None:
+            # Written to a temporary file first so a file is never seen partly written
+            fd: int
+            tempPath: str
+            fd, tempPath = tempfile.mkstemp(suffix='.tmp', prefix=self.__TEMP_FILE_PREFIX, dir=self.__cacheDirectory)
+            try:
+                with os.fdopen(fd, 'wb') as tempFile:
+                    numpy.save(tempFile, array, allow_pickle=False)
+                os.replace(tempPath, path)
+            except:
+                os.remove(tempPath)
+                raise
+
+        try:
+            for mipmapPath, mipmap in zip(self.__get_paths(key, len(mipmaps)), mipmaps):
+                Save(mipmapPath, mipmap)
+            Save(self.__get_count_path(key), numpy.array(len(mipmaps)))
+        except OSError:
+            # The directory is only a cache, the mipmaps are still returned
+            pass
+
+
+class TxtrMipmapInfo(NamedTuple):
+    """The dimensions and the location of a mipmap of a TXTR. See: TxtrHeader.mipmaps"""
+
+    width: int
+    """The width of the mipmap"""
+
+    height: int
+    """The height of the mipmap"""
+
+    offset: int
+    """The offset of the mipmap data in bytes from the start of the TXTR"""
+
+    size: int
+    """The size of the mipmap data in bytes"""
+
+class TxtrHeader(NamedTuple):
+    """The header of a TXTR and the location of its palette and mipmaps. See: libtxtr.ReadHeader and pytxtr.ReadHeader"""
+
+    textureFormat: 'TextureFormat'
+    """The texture format"""
+
+    width: int
+    """The width of the first mipmap"""
+
+    height: int
+    """The height of the first mipmap"""
+
+    mipmapCount: int
+    """The count of mipmaps, including the first mipmap"""
+
+    paletteFormat: Optional['PaletteFormat']
+    """The palette format, or None if the texture format is not an indexed format"""
+
+    paletteWidth: int
+    """The palette width, or 0 if the texture format is not an indexed format"""
+
+    paletteHeight: int
+    """The palette height, or 0 if the texture format is not an indexed format"""
+
+    paletteOffset: int
+    """The offset of the palette data in bytes from the start of the TXTR, or 0 if the texture format is not an indexed format"""
+
+    paletteSize: int
+    """The size of the palette data in bytes, or 0 if the texture format is not an indexed format"""
+
+    mipmaps: Tuple[TxtrMipmapInfo, ...]
+    """The dimensions and the location of every mipmap, from the first (largest) mipmap to the last"""
+
+    @property
+    def isIndexed(self: 'TxtrHeader') -> bool:
+        """bool: Whether the texture format is an indexed format (CI4, CI8, or CI14X2)"""
+
+        return self.paletteFormat is not None
+
+    def FindMipmapLevel(self: 'TxtrHeader', minWidth: int, minHeight: int) -> int:
+        """Finds the smallest mipmap that is at least of the specified dimensions.
+
+        If even the first mipmap is smaller than the specified dimensions, the first mipmap (0) is returned.
+
+        Args:
+            minWidth (int): The minimum width of the mipmap
+            minHeight (int): The minimum height of the mipmap
+
+        Returns:
+            int: The index of the mipmap in TxtrHeader.mipmaps
+
+        Raises:
+            ValueError: If minWidth or minHeight is None/not a int/less than 0
+        """
+
+        if minWidth is None or not isinstance(minWidth, int) or minWidth < 0:
+            raise ValueError('Parameter "minWidth" must be a int of 0 or greater')
+        if minHeight is None or not isinstance(minHeight, int) or minHeight < 0:
+            raise ValueError('Parameter "minHeight" must be a int of 0 or greater')
+
+        # The mipmaps only get smaller, so stop at the first mipmap that is too small
+        mipmapLevel: int
+        mipmapLevel = 0
+        while (mipmapLevel + 1 < len(self.mipmaps) and self.mipmaps[mipmapLevel + 1].width >= minWidth
+               and self.mipmaps[mipmapLevel + 1].height >= minHeight):
+            mipmapLevel += 1
+        return mipmapLevel
+
+class __TextureFormatMeta(EnumMeta):
+    # Allow checking if an enum value is defined
+    # in this enum via 'if val in MyEnum:'
+    def __contains__(cls, item): 
+        try:
+            cls(item)
+        except ValueError:
+            return False
+        else:
+            return True
 
 class TextureFormat(Enum, metaclass=__TextureFormatMeta):
     """
@@ -802,3 +3617,30 @@ class CopyPaletteSize(Enum, metaclass=__CopyPaletteSizeMeta):
     """
     Copy palette length to height.
     """
+
+class __ChannelOrderMeta(EnumMeta):
+    # Allow checking if an enum value is defined
+    # in this enum via 'if val in MyEnum:'
+    def __contains__(cls, item): 
+        try:
+            cls(item)
+        except ValueError:
+            return False
+        else:
+            return True
+
+class ChannelOrder(Enum, metaclass=__ChannelOrderMeta):
+    """
+    This enum specifies the order of the color components of a pixel in a buffer
+    passed to libtxtr.SetImageBuffer
+    """
+
+    BGRA = 0
+    """
+    Blue, green, red, alpha (the same as the images in the memory of the libtxtr library and Krita layers).
+    """
+
+    RGBA = 1
+    """
+    Red, green, blue, alpha (such as PIL RGBA images and QImage.Format_RGBA8888).
+    """